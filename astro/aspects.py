@@ -1,8 +1,12 @@
 import os
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Literal, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
 
 from astro.utils import angle_diff
 
+AspectMode = Literal["natal", "transit", "synastry"]
+
 ASPECTS_LEGACY: Dict[str, dict] = {
     "conjunction": {"angle": 0, "orb": 6, "influence": "intense"},
     "opposition": {"angle": 180, "orb": 6, "influence": "challenging"},
@@ -131,40 +135,130 @@ def resolve_aspects(
     return aspects
 
 
+class CompiledAspects:
+    """Perfis de aspectos achatados em vetores (ângulo, orbe) para avaliação em lote."""
+
+    def __init__(self, profiles: Mapping[str, Dict[str, dict]]) -> None:
+        self.profiles = tuple(profiles)
+        self.entries: List[Tuple[str, str, dict]] = [
+            (profile, name, info) for profile, aspects in profiles.items() for name, info in aspects.items()
+        ]
+        self.angles = np.array([float(info["angle"]) for _, _, info in self.entries])
+        self.orbs = np.array([float(info["orb"]) for _, _, info in self.entries])
+
+
+# margem da pré-seleção vetorizada; cada candidato é confirmado com ``angle_diff``
+_MATRIX_SLACK_DEG = 1e-3
+
+
+def aspect_matrix(
+    lons_a: Sequence[float],
+    lons_b: Optional[Sequence[float]],
+    compiled: CompiledAspects,
+    mode: AspectMode = "transit",
+) -> Dict[str, List[Tuple[int, int, str, dict, float, float]]]:
+    """Aspectos entre ``lons_a`` e ``lons_b`` para cada perfil de ``compiled``.
+
+    Retorna ``{perfil: [(i, j, aspecto, info, separação, orbe)]}`` na ordem do
+    laço (i, j, aspecto). ``mode="natal"`` compara ``lons_a`` consigo mesma e
+    mantém só pares i < j; ``transit`` e ``synastry`` usam todos os pares.
+    """
+    a = np.asarray(lons_a, dtype=float)
+    b = a if mode == "natal" or lons_b is None else np.asarray(lons_b, dtype=float)
+    hits: Dict[str, List[Tuple[int, int, str, dict, float, float]]] = {p: [] for p in compiled.profiles}
+    if not len(a) or not len(b) or not compiled.entries:
+        return hits
+
+    diff = np.abs(a[:, None] - b[None, :]) % 360.0
+    separation = np.round(np.where(diff > 180.0, 360.0 - diff, diff), 4)
+    orb = np.abs(separation[:, :, None] - compiled.angles[None, None, :])
+    mask = orb <= compiled.orbs + _MATRIX_SLACK_DEG
+    if mode == "natal":
+        mask &= np.triu(np.ones((len(a), len(b)), dtype=bool), k=1)[:, :, None]
+
+    for i, j, k in zip(*np.nonzero(mask)):
+        profile, name, info = compiled.entries[k]
+        sep = angle_diff(float(a[i]), float(b[j]))
+        exact_orb = abs(sep - info["angle"])
+        if exact_orb <= info["orb"]:
+            hits[profile].append((int(i), int(j), name, info, sep, exact_orb))
+    return hits
+
+
+def aspect_tensor(
+    lons_a: Sequence[float],
+    lons_many: np.ndarray,
+    compiled: CompiledAspects,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Aspectos de vários mapas contra ``lons_a`` numa única operação.
+
+    ``lons_many`` tem forma (n, q); retorna ``(orbe, máscara)`` com forma
+    (n, q, len(lons_a), len(compiled.entries)), com a mesma separação
+    arredondada de ``aspect_matrix``.
+    """
+    a = np.asarray(lons_a, dtype=float)
+    many = np.asarray(lons_many, dtype=float)
+    diff = np.abs(many[:, :, None] - a[None, None, :]) % 360.0
+    separation = np.round(np.where(diff > 180.0, 360.0 - diff, diff), 4)
+    orb = np.abs(separation[..., None] - compiled.angles)
+    return orb, orb <= compiled.orbs
+
+
 def compute_transit_aspects(
     transit_planets: Dict[str, dict],
     natal_planets: Dict[str, dict],
     aspects: Optional[Dict[str, dict]] = None,
+    compiled: Optional[CompiledAspects] = None,
 ) -> List[dict]:
-    aspects_found = []
-    if aspects is None:
-        _, aspects = get_aspects_profile()
-    
-    for t_name, t_data in transit_planets.items():
-        t_lon = t_data["lon"]
-        
-        for n_name, n_data in natal_planets.items():
-            n_lon = n_data["lon"]
-            
-            separation = angle_diff(t_lon, n_lon)
-            
-            for aspect_name, aspect_info in aspects.items():
-                target_angle = aspect_info["angle"]
-                max_orb = aspect_info["orb"]
-                
-                orb = abs(separation - target_angle)
-                
-                if orb <= max_orb:
-                    aspects_found.append({
-                        "transit_planet": t_name,
-                        "natal_planet": n_name,
-                        "aspect": aspect_name,
-                        "exact_angle": target_angle,
-                        "actual_angle": round(separation, 4),
-                        "orb": round(orb, 4),
-                        "influence": aspect_info["influence"],
-                    })
-    
+    """Aspectos trânsito x natal ordenados por orbe; ``compiled`` evita recompilar ``aspects``."""
+    if compiled is None:
+        if aspects is None:
+            _, aspects = get_aspects_profile()
+        compiled = CompiledAspects({"": aspects})
+
+    t_names, n_names = list(transit_planets), list(natal_planets)
+    hits = aspect_matrix(
+        [transit_planets[name]["lon"] for name in t_names],
+        [natal_planets[name]["lon"] for name in n_names],
+        compiled,
+    )[compiled.profiles[0]]
+    aspects_found = [
+        {
+            "transit_planet": t_names[i],
+            "natal_planet": n_names[j],
+            "aspect": aspect_name,
+            "exact_angle": aspect_info["angle"],
+            "actual_angle": round(separation, 4),
+            "orb": round(orb, 4),
+            "influence": aspect_info["influence"],
+        }
+        for i, j, aspect_name, aspect_info, separation, orb in hits
+    ]
     aspects_found.sort(key=lambda x: x["orb"])
-    
     return aspects_found
+
+
+def compute_natal_aspects(
+    planets: Dict[str, dict],
+    aspects: Optional[Dict[str, dict]] = None,
+) -> List[dict]:
+    """Aspectos entre os planetas de um mapa (cada par uma vez, nomes em ordem alfabética)."""
+    if aspects is None:
+        _, aspects = get_aspects_profile()
+
+    names = list(planets)
+    hits = aspect_matrix([planets[name]["lon"] for name in names], None, CompiledAspects({"": aspects}), "natal")[""]
+    found = []
+    for i, j, aspect_name, aspect_info, separation, orb in hits:
+        planet1, planet2 = sorted((names[i], names[j]))
+        found.append({
+            "planet1": planet1,
+            "planet2": planet2,
+            "aspect": aspect_name,
+            "exact_angle": aspect_info["angle"],
+            "actual_angle": round(separation, 4),
+            "orb": round(orb, 4),
+            "influence": aspect_info["influence"],
+        })
+    found.sort(key=lambda x: x["orb"])
+    return found
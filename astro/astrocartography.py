@@ -0,0 +1,191 @@
+"""Linhas de astrocartografia: onde cada planeta está no ASC, DSC, MC ou IC.
+
+As linhas dependem só do instante natal. A geometria é a do tempo sideral:
+com a ascensão reta α e a declinação δ de cada planeta e o tempo sideral de
+Greenwich θ, o planeta culmina (MC) na longitude ``α - θ`` e nasce ou se põe
+onde o ângulo horário vale ``∓H0``, com ``cos H0 = -tan φ · tan δ``. Tudo é
+resolvido em arrays (planetas × latitudes) a partir de uma chamada
+``swe.calc_ut`` por planeta, sem calcular casas em nenhum ponto do mapa.
+
+``method="mundo"`` usa a posição real do planeta (com latitude eclíptica),
+como na astrocartografia clássica; ``"zodiacal"`` usa o grau da eclíptica,
+e a linha ASC passa onde o Ascendente do mapa local é a longitude do planeta.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import List, Literal, Sequence, Tuple
+
+import numpy as np
+import swisseph as swe
+
+from astro.ephemeris import PLANETS
+from astro.ephemeris_tables import calc_position
+
+AstroMethod = Literal["mundo", "zodiacal"]
+
+LINE_KINDS = ("MC", "IC", "ASC", "DSC")
+DEFAULT_LAT_LIMIT = 80.0
+DEFAULT_LAT_STEP = 1.0
+POLYLINE_PRECISION = 5
+
+Point = Tuple[float, float]  # (lat, lng)
+
+
+@dataclass(frozen=True)
+class AstroLine:
+    planet: str
+    kind: str  # MC | IC | ASC | DSC
+    segments: Tuple[Tuple[Point, ...], ...]
+
+    @property
+    def point_count(self) -> int:
+        return sum(len(segment) for segment in self.segments)
+
+
+@dataclass(frozen=True)
+class AstroMap:
+    jd_ut: float
+    gst: float  # tempo sideral aparente de Greenwich, em graus
+    method: str
+    lines: Tuple[AstroLine, ...]
+
+
+def _wrap180(values: np.ndarray) -> np.ndarray:
+    return (values + 180.0) % 360.0 - 180.0
+
+
+def equatorial_positions(jd_ut: float, names: Sequence[str], method: AstroMethod = "mundo") -> Tuple[np.ndarray, np.ndarray]:
+    """(ascensão reta, declinação) em graus de cada planeta, na data verdadeira."""
+    if method == "mundo":
+        rows = [swe.calc_ut(jd_ut, PLANETS[name], swe.FLG_SWIEPH | swe.FLG_EQUATORIAL)[0] for name in names]
+        return np.array([row[0] for row in rows]), np.array([row[1] for row in rows])
+
+    eps = swe.calc_ut(jd_ut, swe.ECL_NUT)[0][0]
+    lon = np.radians([calc_position(jd_ut, PLANETS[name], exact=True)[0] for name in names])
+    e = np.radians(eps)
+    ra = np.degrees(np.arctan2(np.sin(lon) * np.cos(e), np.cos(lon))) % 360.0
+    decl = np.degrees(np.arcsin(np.sin(lon) * np.sin(e)))
+    return ra, decl
+
+
+def _horizon_samples(decl: np.ndarray, lat_step: float, lat_limit: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Latitudes (p, m) da grade mais os limites circumpolares de cada planeta, e o H0 de cada uma.
+
+    Acima de ``90 - |δ|`` o planeta não nasce nem se põe (H0 = NaN); incluir o
+    limite exato faz as linhas ASC e DSC se encontrarem ali.
+    """
+    grid = np.arange(-lat_limit, lat_limit + lat_step / 2.0, lat_step)
+    edge = np.clip(90.0 - np.abs(decl), 0.0, lat_limit)
+    lats = np.sort(np.column_stack([np.broadcast_to(grid, (len(decl), len(grid))), -edge, edge]), axis=1)
+    x = -np.tan(np.radians(lats)) * np.tan(np.radians(decl))[:, None]
+    x = np.where(np.abs(x) <= 1.0 + 1e-9, np.clip(x, -1.0, 1.0), np.nan)
+    return lats, np.degrees(np.arccos(x))
+
+
+def _split_antimeridian(lats: np.ndarray, lngs: np.ndarray) -> List[Tuple[Point, ...]]:
+    """Quebra uma polilinha contínua onde ela cruza ±180°, com o ponto de corte nas duas bordas."""
+    segments: List[Tuple[Point, ...]] = []
+    current: List[Point] = [(float(lats[0]), float(lngs[0]))]
+    for k in range(1, len(lats)):
+        step = float(_wrap180(np.array(lngs[k] - lngs[k - 1])))
+        end = float(lngs[k - 1]) + step
+        if abs(end) > 180.0:
+            edge = 180.0 if end > 0 else -180.0
+            t = (edge - float(lngs[k - 1])) / step
+            lat_cut = float(lats[k - 1] + t * (lats[k] - lats[k - 1]))
+            current.append((lat_cut, edge))
+            segments.append(tuple(current))
+            current = [(lat_cut, -edge)]
+        current.append((float(lats[k]), float(lngs[k])))
+    segments.append(tuple(current))
+    return [segment for segment in segments if len(segment) > 1]
+
+
+def _horizon_segments(lats: np.ndarray, lngs: np.ndarray) -> Tuple[Tuple[Point, ...], ...]:
+    valid = ~np.isnan(lngs)
+    segments: List[Tuple[Point, ...]] = []
+    start = None
+    for k in range(len(lats) + 1):
+        if k < len(lats) and valid[k]:
+            if start is None:
+                start = k
+            continue
+        if start is not None and k - start > 1:
+            segments.extend(_split_antimeridian(lats[start:k], lngs[start:k]))
+        start = None
+    return tuple(segments)
+
+
+def compute_astrocartography(
+    jd_ut: float,
+    names: Sequence[str] = tuple(PLANETS),
+    method: AstroMethod = "mundo",
+    lat_step: float = DEFAULT_LAT_STEP,
+    lat_limit: float = DEFAULT_LAT_LIMIT,
+) -> AstroMap:
+    """Linhas MC, IC, ASC e DSC de ``names`` entre ±``lat_limit`` graus de latitude.
+
+    MC e IC são meridianos (dois pontos); ASC e DSC são amostrados a cada
+    ``lat_step`` graus e cortados nos limites circumpolares e em ±180°.
+    """
+    names = tuple(names)
+    gst = swe.sidtime(jd_ut) * 15.0
+    ra, decl = equatorial_positions(jd_ut, names, method)
+
+    mc_lng = _wrap180(ra - gst)
+    ic_lng = _wrap180(mc_lng + 180.0)
+    lats, h0 = _horizon_samples(decl, lat_step, lat_limit)
+    asc_lng = _wrap180(mc_lng[:, None] - h0)
+    dsc_lng = _wrap180(mc_lng[:, None] + h0)
+
+    lines: List[AstroLine] = []
+    for p, name in enumerate(names):
+        for kind, lng in (("MC", mc_lng[p]), ("IC", ic_lng[p])):
+            meridian = ((-lat_limit, float(lng)), (lat_limit, float(lng)))
+            lines.append(AstroLine(name, kind, (meridian,)))
+        lines.append(AstroLine(name, "ASC", _horizon_segments(lats[p], asc_lng[p])))
+        lines.append(AstroLine(name, "DSC", _horizon_segments(lats[p], dsc_lng[p])))
+    return AstroMap(jd_ut=jd_ut, gst=gst % 360.0, method=method, lines=tuple(lines))
+
+
+def encode_polyline(points: Sequence[Point], precision: int = POLYLINE_PRECISION) -> str:
+    """Codifica (lat, lng) no formato Encoded Polyline (Google)."""
+    factor = 10 ** precision
+    chars: List[str] = []
+    prev_lat = prev_lng = 0
+    for lat, lng in points:
+        ilat, ilng = int(round(lat * factor)), int(round(lng * factor))
+        for delta in (ilat - prev_lat, ilng - prev_lng):
+            value = ~(delta << 1) if delta < 0 else delta << 1
+            while value >= 0x20:
+                chars.append(chr((0x20 | (value & 0x1F)) + 63))
+                value >>= 5
+            chars.append(chr(value + 63))
+        prev_lat, prev_lng = ilat, ilng
+    return "".join(chars)
+
+
+def decode_polyline(encoded: str, precision: int = POLYLINE_PRECISION) -> List[Point]:
+    """Inverso de ``encode_polyline``."""
+    factor = 10 ** precision
+    points: List[Point] = []
+    index = lat = lng = 0
+    while index < len(encoded):
+        deltas = []
+        for _ in range(2):
+            shift = result = 0
+            while True:
+                byte = ord(encoded[index]) - 63
+                index += 1
+                result |= (byte & 0x1F) << shift
+                shift += 5
+                if byte < 0x20:
+                    break
+            deltas.append(~(result >> 1) if result & 1 else result >> 1)
+        lat += deltas[0]
+        lng += deltas[1]
+        points.append((lat / factor, lng / factor))
+    return points
+
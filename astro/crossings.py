@@ -0,0 +1,230 @@
+"""Exact longitude crossings of a moving body.
+
+A crossing is an instant where a body's ecliptic longitude passes a target
+longitude. Crossings are bracketed on a coarse sample grid (one evaluation
+per grid point, shared by every target) and then refined with a Newton step
+that uses the body's speed, kept inside the bracket by bisection. A crossing
+usually converges in 2-4 evaluations.
+
+Grid intervals where the speed changes sign hold a station: they are split at
+the station (found by regula falsi on the speed), so a retrograde re-pass
+inside one grid step is still seen. The grid step must stay shorter than the
+body's shortest direct or retrograde run.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+PositionFn = Callable[[float], Tuple[float, float]]
+
+DEFAULT_TOLERANCE_DAYS = 1.0 / 86400.0  # 1 segundo
+STATION_TOLERANCE_DAYS = 1.0 / 1440.0  # 1 minuto
+
+
+def wrap180(value):
+    """Normaliza ângulos para [-180, 180); aceita float ou ndarray."""
+    return (value + 180.0) % 360.0 - 180.0
+
+
+@dataclass(frozen=True)
+class Crossing:
+    jd_ut: float
+    target_index: int
+    target: float
+    direction: int  # +1 direto, -1 retrógrado
+
+
+def refine_crossing(
+    position: PositionFn,
+    target: float,
+    jd_a: float,
+    jd_b: float,
+    tolerance_days: float = DEFAULT_TOLERANCE_DAYS,
+    max_iter: int = 40,
+) -> float:
+    """Instante em [jd_a, jd_b] em que a longitude cruza ``target``.
+
+    O intervalo precisa conter exatamente uma troca de sinal de
+    ``wrap180(lon - target)``.
+    """
+    f_a = wrap180(position(jd_a)[0] - target)
+    if f_a == 0.0:
+        return jd_a
+    low, high = jd_a, jd_b
+    jd = (low + high) / 2.0
+    for _ in range(max_iter):
+        lon, speed = position(jd)
+        f = wrap180(lon - target)
+        if f == 0.0:
+            return jd
+        if (f < 0) == (f_a < 0):
+            low = jd
+        else:
+            high = jd
+        if high - low <= tolerance_days:
+            break
+        candidate = jd - f / speed if speed else math.nan
+        if not (low < candidate < high):
+            candidate = (low + high) / 2.0
+        elif abs(candidate - jd) <= tolerance_days / 2.0:
+            return candidate
+        jd = candidate
+    return (low + high) / 2.0
+
+
+def refine_station(
+    speed: Callable[[float], float],
+    jd_a: float,
+    jd_b: float,
+    tolerance_days: float = STATION_TOLERANCE_DAYS,
+) -> float:
+    """Raiz da velocidade em [jd_a, jd_b] (regula falsi, variante Illinois)."""
+    f_a, f_b = speed(jd_a), speed(jd_b)
+    side = 0
+    jd = jd_a
+    for _ in range(60):
+        if f_b == f_a:
+            break
+        jd = (jd_a * f_b - jd_b * f_a) / (f_b - f_a)
+        f = speed(jd)
+        if f == 0.0 or jd_b - jd_a <= tolerance_days:
+            break
+        if (f < 0) == (f_b < 0):
+            jd_b, f_b = jd, f
+            if side == -1:
+                f_a /= 2.0
+            side = -1
+        else:
+            jd_a, f_a = jd, f
+            if side == 1:
+                f_b /= 2.0
+            side = 1
+        if abs(f) < 1e-9:
+            break
+    return jd
+
+
+def minimize_separation(
+    position: PositionFn,
+    target: float,
+    jd_a: float,
+    jd_b: float,
+    tolerance_days: float = 1.0 / 1440.0,
+) -> float:
+    """Instante de menor distância a ``target`` em [jd_a, jd_b] (seção áurea)."""
+    ratio = (math.sqrt(5.0) - 1.0) / 2.0
+
+    def distance(jd: float) -> float:
+        return abs(wrap180(position(jd)[0] - target))
+
+    low, high = jd_a, jd_b
+    c = high - ratio * (high - low)
+    d = low + ratio * (high - low)
+    f_c, f_d = distance(c), distance(d)
+    while high - low > tolerance_days:
+        if f_c < f_d:
+            high, d, f_d = d, c, f_c
+            c = high - ratio * (high - low)
+            f_c = distance(c)
+        else:
+            low, c, f_c = c, d, f_d
+            d = low + ratio * (high - low)
+            f_d = distance(d)
+    return (low + high) / 2.0
+
+
+class LongitudeTrack:
+    """Amostras de longitude de um corpo numa grade regular, calculadas sob demanda.
+
+    A grade é alinhada em ``origin`` e cada amostra (e cada estação entre duas
+    amostras) é calculada uma única vez, então buscas sucessivas (intervalo
+    pedido, extensões para trás e para a frente) reaproveitam o trabalho anterior.
+    """
+
+    def __init__(self, position: PositionFn, step_days: float, origin: float = 0.0) -> None:
+        self.position = position
+        self.step_days = step_days
+        self.origin = origin
+        self._samples: Dict[int, Tuple[float, float]] = {}
+        self._stations: Dict[int, Tuple[float, float]] = {}
+
+    def _sample(self, k: int) -> Tuple[float, float]:
+        sample = self._samples.get(k)
+        if sample is None:
+            sample = self.position(self.origin + k * self.step_days)
+            self._samples[k] = sample
+        return sample
+
+    def _station(self, k: int) -> Tuple[float, float]:
+        """(jd, lon) da estação entre as amostras ``k`` e ``k + 1``."""
+        station = self._stations.get(k)
+        if station is None:
+            jd_a = self.origin + k * self.step_days
+            jd = refine_station(lambda t: self.position(t)[1], jd_a, jd_a + self.step_days)
+            station = (jd, self.position(jd)[0])
+            self._stations[k] = station
+        return station
+
+    def _grid(self, jd_start: float, jd_end: float) -> Tuple[np.ndarray, np.ndarray]:
+        first = math.floor((jd_start - self.origin) / self.step_days)
+        last = math.ceil((jd_end - self.origin) / self.step_days)
+        samples = np.array([self._sample(k) for k in range(first, last + 1)], dtype=float)
+        jds = self.origin + np.arange(first, last + 1) * self.step_days
+        lons, speeds = samples[:, 0], samples[:, 1]
+
+        turning = np.nonzero(np.signbit(speeds[:-1]) != np.signbit(speeds[1:]))[0]
+        if len(turning):
+            stations = np.array([self._station(first + int(i)) for i in turning])
+            jds = np.insert(jds, turning + 1, stations[:, 0])
+            lons = np.insert(lons, turning + 1, stations[:, 1])
+        return jds, lons
+
+    def longitude(self, jd_ut: float) -> float:
+        return self.position(jd_ut)[0]
+
+    def crossings(
+        self,
+        targets: Sequence[float],
+        jd_start: float,
+        jd_end: float,
+        tolerance_days: float = DEFAULT_TOLERANCE_DAYS,
+    ) -> List[Crossing]:
+        """Todos os cruzamentos de ``targets`` em [jd_start, jd_end], em ordem temporal."""
+        if jd_end <= jd_start or not len(targets):
+            return []
+        jds, lons = self._grid(jd_start, jd_end)
+        target_arr = np.asarray(targets, dtype=float)
+        diff = wrap180(lons[:, None] - target_arr[None, :])
+        before, after = diff[:-1], diff[1:]
+        # troca de sinal perto de zero; o salto de ±180 não é cruzamento
+        mask = (np.signbit(before) != np.signbit(after)) & (np.abs(after - before) < 180.0)
+
+        found: List[Crossing] = []
+        for sample_idx, target_idx in zip(*np.nonzero(mask)):
+            target = float(target_arr[target_idx])
+            jd = refine_crossing(
+                self.position, target, float(jds[sample_idx]), float(jds[sample_idx + 1]), tolerance_days
+            )
+            if jd_start <= jd <= jd_end:
+                direction = 1 if after[sample_idx, target_idx] > before[sample_idx, target_idx] else -1
+                found.append(Crossing(jd_ut=jd, target_index=int(target_idx), target=target, direction=direction))
+        found.sort(key=lambda item: (item.jd_ut, item.target_index))
+        return found
+
+
+def find_crossings(
+    position: PositionFn,
+    targets: Sequence[float],
+    jd_start: float,
+    jd_end: float,
+    step_days: float = 1.0,
+    tolerance_days: float = DEFAULT_TOLERANCE_DAYS,
+) -> List[Crossing]:
+    """Atalho para uma busca única, sem reaproveitar amostras."""
+    track = LongitudeTrack(position, step_days, origin=jd_start)
+    return track.crossings(targets, jd_start, jd_end, tolerance_days)
@@ -0,0 +1,216 @@
+"""Solar and lunar eclipse catalog (1800-2100).
+
+Eclipses come from the Swiss Ephemeris global searches
+(``sol_eclipse_when_glob`` and ``lun_eclipse_when``), one call per eclipse.
+Each entry keeps the instant of maximum, the type, the tropical longitude of
+the eclipsed luminary (Sun for solar, Moon for lunar), the magnitude and the
+Saros series.
+
+``EclipseIndex`` keeps the catalog in a ``ChunkedEventIndex``: eclipses are
+computed lazily one year at a time, or loaded in one go from a file written
+by ``scripts/build_event_index.py eclipses`` (``ECLIPSE_INDEX_PATH``).
+``natal_contacts`` checks eclipse degrees against natal points with the
+aspect engine.
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import swisseph as swe
+
+from astro.aspects import CompiledAspects, aspect_matrix
+from astro.ephemeris_tables import calc_position
+from astro.event_index import ChunkedEventIndex, SharedIndex
+from astro.utils import deg_to_sign, from_julian_day, sign_to_pt
+
+ECLIPSE_KINDS = ("solar", "lunar")
+ECLIPSE_TYPES = ("total", "annular", "hybrid", "partial", "penumbral")
+ECLIPSE_LABELS_PT = {
+    ("solar", "total"): "Eclipse Solar Total",
+    ("solar", "annular"): "Eclipse Solar Anular",
+    ("solar", "hybrid"): "Eclipse Solar Híbrido",
+    ("solar", "partial"): "Eclipse Solar Parcial",
+    ("lunar", "total"): "Eclipse Lunar Total",
+    ("lunar", "partial"): "Eclipse Lunar Parcial",
+    ("lunar", "penumbral"): "Eclipse Lunar Penumbral",
+}
+# ordem importa: o híbrido também marca ECL_TOTAL/ECL_ANNULAR em algumas versões
+_SOLAR_TYPE_FLAGS = (
+    (swe.ECL_ANNULAR_TOTAL, "hybrid"),
+    (swe.ECL_TOTAL, "total"),
+    (swe.ECL_ANNULAR, "annular"),
+    (swe.ECL_PARTIAL, "partial"),
+)
+_LUNAR_TYPE_FLAGS = (
+    (swe.ECL_TOTAL, "total"),
+    (swe.ECL_PARTIAL, "partial"),
+    (swe.ECL_PENUMBRAL, "penumbral"),
+)
+
+# dois eclipses do mesmo tipo ficam ao menos ~29 dias separados
+SEARCH_SKIP_DAYS = 1.0
+_SEARCH_FLAGS = swe.FLG_SWIEPH
+
+DEFAULT_INDEX_PATH = os.path.join("data", "eclipses_1800_2100.npz")
+
+
+@dataclass(frozen=True)
+class EclipseEvent:
+    jd_ut: float  # instante do máximo
+    kind_index: int  # posição em ECLIPSE_KINDS
+    type_index: int  # posição em ECLIPSE_TYPES
+    lon: float  # longitude tropical do luminar eclipsado
+    magnitude: float
+    saros_series: int
+    saros_member: int
+
+    @property
+    def kind(self) -> str:
+        return ECLIPSE_KINDS[self.kind_index]
+
+    @property
+    def eclipse_type(self) -> str:
+        return ECLIPSE_TYPES[self.type_index]
+
+    @property
+    def label_pt(self) -> str:
+        return ECLIPSE_LABELS_PT[(self.kind, self.eclipse_type)]
+
+    @property
+    def sign(self) -> str:
+        return deg_to_sign(self.lon)["sign"]
+
+    @property
+    def sign_pt(self) -> str:
+        return sign_to_pt(self.sign)
+
+    @property
+    def deg_in_sign(self) -> float:
+        return self.lon % 30.0
+
+    @property
+    def utc_datetime(self) -> datetime:
+        return from_julian_day(self.jd_ut)
+
+
+def _eclipse_type(retflag: int, flags: Sequence[Tuple[int, str]]) -> int:
+    for flag, name in flags:
+        if retflag & flag:
+            return ECLIPSE_TYPES.index(name)
+    return ECLIPSE_TYPES.index("partial")
+
+
+def _scan(search, jd_start: float, jd_end: float) -> Iterator[Tuple[int, float]]:
+    jd = jd_start
+    while True:
+        retflag, tret = search(jd, _SEARCH_FLAGS, 0, False)
+        if tret[0] >= jd_end:
+            return
+        yield retflag, tret[0]
+        jd = tret[0] + SEARCH_SKIP_DAYS
+
+
+def _solar_eclipse(retflag: int, jd_ut: float) -> EclipseEvent:
+    attr = swe.sol_eclipse_where(jd_ut, _SEARCH_FLAGS)[2]
+    return EclipseEvent(
+        jd_ut, 0, _eclipse_type(retflag, _SOLAR_TYPE_FLAGS), calc_position(jd_ut, swe.SUN)[0],
+        float(attr[0]), int(attr[9]), int(attr[10]),
+    )
+
+
+def _lunar_eclipse(retflag: int, jd_ut: float) -> EclipseEvent:
+    attr = swe.lun_eclipse_how(jd_ut, (0.0, 0.0, 0.0), _SEARCH_FLAGS)[1]
+    type_index = _eclipse_type(retflag, _LUNAR_TYPE_FLAGS)
+    # penumbral: a magnitude umbral é negativa, usa-se a penumbral
+    magnitude = attr[1] if ECLIPSE_TYPES[type_index] == "penumbral" else attr[0]
+    return EclipseEvent(
+        jd_ut, 1, type_index, calc_position(jd_ut, swe.MOON)[0],
+        float(magnitude), int(attr[9]), int(attr[10]),
+    )
+
+
+def compute_eclipses(jd_start: float, jd_end: float) -> List[EclipseEvent]:
+    """Eclipses solares e lunares com máximo em [jd_start, jd_end), em ordem temporal."""
+    events = [_solar_eclipse(flag, jd) for flag, jd in _scan(swe.sol_eclipse_when_glob, jd_start, jd_end)]
+    events += [_lunar_eclipse(flag, jd) for flag, jd in _scan(swe.lun_eclipse_when, jd_start, jd_end)]
+    events.sort(key=lambda e: e.jd_ut)
+    return events
+
+
+class EclipseIndex(ChunkedEventIndex[EclipseEvent]):
+    """Catálogo de eclipses ordenado; consultas por busca binária."""
+
+    def compute_chunk(self, jd_start: float, jd_end: float) -> List[EclipseEvent]:
+        return compute_eclipses(jd_start, jd_end)
+
+    def between(self, jd_start: float, jd_end: float, kinds: Optional[Iterable[str]] = None) -> List[EclipseEvent]:
+        """Eclipses em [jd_start, jd_end), opcionalmente só de ``kinds`` (solar, lunar)."""
+        found = super().between(jd_start, jd_end)
+        if kinds is None:
+            return found
+        wanted = set(kinds)
+        return [e for e in found if e.kind in wanted]
+
+    def encode(self, events: List[EclipseEvent]) -> Dict[str, np.ndarray]:
+        return {
+            "jd_ut": np.array([e.jd_ut for e in events], dtype=float),
+            "kind": np.array([e.kind_index for e in events], dtype=np.int8),
+            "type": np.array([e.type_index for e in events], dtype=np.int8),
+            "lon": np.array([e.lon for e in events], dtype=float),
+            "magnitude": np.array([e.magnitude for e in events], dtype=float),
+            "saros": np.array([(e.saros_series, e.saros_member) for e in events], dtype=np.int16).reshape(-1, 2),
+        }
+
+    def decode(self, data: Mapping[str, np.ndarray]) -> List[EclipseEvent]:
+        return [
+            EclipseEvent(float(jd), int(kind), int(kind_type), float(lon), float(mag), int(saros[0]), int(saros[1]))
+            for jd, kind, kind_type, lon, mag, saros in zip(
+                data["jd_ut"], data["kind"], data["type"], data["lon"], data["magnitude"], data["saros"]
+            )
+        ]
+
+
+@dataclass(frozen=True)
+class EclipseContact:
+    eclipse: EclipseEvent
+    point: str  # planeta natal, ASC ou MC
+    aspect: str
+    orb: float
+
+
+def natal_contacts(
+    eclipses: Sequence[EclipseEvent],
+    natal_points: Dict[str, float],
+    compiled: CompiledAspects,
+    ayanamsa: Optional[Sequence[float]] = None,
+) -> List[EclipseContact]:
+    """Aspectos entre o grau de cada eclipse e os pontos natais, por eclipse e orbe.
+
+    ``ayanamsa`` (um valor por eclipse) leva a longitude tropical do catálogo
+    ao zodíaco sideral do mapa natal.
+    """
+    lons = np.array([e.lon for e in eclipses], dtype=float)
+    if ayanamsa is not None and len(lons):
+        lons = (lons - np.asarray(ayanamsa, dtype=float)) % 360.0
+    names = list(natal_points)
+    hits = aspect_matrix(lons, [natal_points[name] for name in names], compiled)[compiled.profiles[0]]
+    contacts = [EclipseContact(eclipses[i], names[j], aspect, round(orb, 4)) for i, j, aspect, _, _, orb in hits]
+    contacts.sort(key=lambda c: (c.eclipse.jd_ut, c.orb))
+    return contacts
+
+
+shared_index = SharedIndex(EclipseIndex, "ECLIPSE_INDEX_PATH", DEFAULT_INDEX_PATH, "eclipse_index")
+
+
+def get_eclipse_index() -> EclipseIndex:
+    """Índice compartilhado; usa o arquivo de ``ECLIPSE_INDEX_PATH`` quando existir."""
+    return shared_index.get()
+
+
+def reset_eclipse_index() -> None:
+    shared_index.reset()
@@ -1,10 +1,17 @@
 import calendar
+import os
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Literal, Optional
+from functools import lru_cache
+from typing import Callable, Dict, List, Literal, NamedTuple, Optional, Sequence, Tuple, Union
 
+import numpy as np
 import swisseph as swe
 
-from astro.utils import angle_diff, to_julian_day, deg_to_sign
+from astro.crossings import LongitudeTrack, minimize_separation
+from astro.ephemeris_session import EphemerisSession, sidereal_offset
+from astro.ephemeris_tables import calc_position
+from astro.utils import ZODIAC_SIGNS, angle_diff, from_julian_day, to_julian_day, deg_to_sign
 
 # garante funcionamento em cloud mesmo sem ephemeris externa
 swe.set_ephe_path(".")
@@ -33,12 +40,130 @@ HOUSE_SYSTEMS = {
 }
 
 
-AYANAMSA_MAP = {
-    "lahiri": swe.SIDM_LAHIRI,
-    "krishnamurti": swe.SIDM_KRISHNAMURTI,
-    "ramey": swe.SIDM_RAMAN,
-    "fagan_bradley": swe.SIDM_FAGAN_BRADLEY,
-}
+SKY_CACHE_SIZE = int(os.getenv("SKY_CACHE_SIZE", "4096"))
+
+
+@dataclass(frozen=True)
+class SkyState:
+    """Posições planetárias de um instante, independentes de local e usuário.
+
+    Instâncias são compartilhadas pelo cache e não devem ser alteradas.
+    """
+
+    jd_ut: float
+    flags: int
+    sid_mode: Optional[int]
+    positions: Dict[str, Tuple[float, float]]
+
+    def lon(self, name: str) -> float:
+        return self.positions[name][0]
+
+    def speed(self, name: str) -> float:
+        return self.positions[name][1]
+
+
+def resolve_zodiac_flags(
+    zodiac_type: Literal['tropical', 'sidereal'] = 'tropical',
+    ayanamsa: Optional[str] = None,
+) -> Tuple[int, Optional[int]]:
+    session = EphemerisSession.create(zodiac_type, ayanamsa)
+    return session.flags, session.sid_mode
+
+
+@lru_cache(maxsize=SKY_CACHE_SIZE)
+def _sky_state_cached(jd_ut: float, flags: int, sid_mode: Optional[int]) -> SkyState:
+    if sid_mode is not None:
+        # sideral = trópico compartilhado - ayanamsa; nada de estado global do swe
+        tropical = _sky_state_cached(jd_ut, flags & ~swe.FLG_SIDEREAL, None)
+        offset, rate = sidereal_offset(jd_ut, sid_mode)
+        positions = {
+            name: ((lon - offset) % 360.0, speed - rate)
+            for name, (lon, speed) in tropical.positions.items()
+        }
+    else:
+        # céu de mapa: sempre ``swe.calc_ut``, nunca a interpolação da tabela
+        positions = {name: calc_position(jd_ut, planet_id, exact=True) for name, planet_id in PLANETS.items()}
+    return SkyState(jd_ut=jd_ut, flags=flags, sid_mode=sid_mode, positions=positions)
+
+
+def compute_sky_state(
+    jd_ut: float,
+    zodiac_type: Literal['tropical', 'sidereal'] = 'tropical',
+    ayanamsa: Optional[str] = None,
+) -> SkyState:
+    """Retorna as posições dos dez corpos para ``jd_ut``, reaproveitando o cache.
+
+    A chave é (jd_ut, flags, ayanamsa): todos os usuários e rotas que pedem o
+    mesmo instante compartilham um único conjunto de chamadas ``swe.calc_ut``.
+    """
+    flags, sid_mode = resolve_zodiac_flags(zodiac_type, ayanamsa)
+    return _sky_state_cached(jd_ut, flags, sid_mode)
+
+
+def compute_sky_track(
+    jd_values: Sequence[float],
+    zodiac_type: Literal['tropical', 'sidereal'] = 'tropical',
+    ayanamsa: Optional[str] = None,
+) -> Tuple[Tuple[str, ...], np.ndarray]:
+    """Longitudes (n, planetas) para muitos instantes, a partir do céu compartilhado de 0h UT.
+
+    Cada dia do intervalo custa um ``SkyState`` do cache; os instantes entre
+    dois dias saem da interpolação cúbica de Hermite com as velocidades, a
+    mesma das tabelas de efemérides (erro abaixo de 0.002°, inclusive a Lua).
+    """
+    flags, sid_mode = resolve_zodiac_flags(zodiac_type, ayanamsa)
+    names = tuple(PLANETS)
+    jd = np.asarray(jd_values, dtype=float)
+    if jd.size == 0:
+        return names, np.empty((0, len(names)))
+    day = np.floor(jd - 0.5) + 0.5
+    knots = np.arange(day.min(), day.max() + 1.5)
+    states = [_sky_state_cached(float(knot), flags, sid_mode) for knot in knots]
+    lon = np.array([[state.lon(name) for name in names] for state in states])
+    speed = np.array([[state.speed(name) for name in names] for state in states])
+
+    idx = np.rint(day - knots[0]).astype(int)
+    s = (jd - day)[:, None]
+    p0, m0, m1 = lon[idx], speed[idx], speed[idx + 1]
+    p1 = p0 + (lon[idx + 1] - p0 + 180.0) % 360.0 - 180.0
+    s2, s3 = s * s, s * s * s
+    track = (2 * s3 - 3 * s2 + 1) * p0 + (s3 - 2 * s2 + s) * m0 + (-2 * s3 + 3 * s2) * p1 + (s3 - s2) * m1
+    return names, track % 360.0
+
+
+def clear_sky_cache() -> None:
+    _sky_state_cached.cache_clear()
+
+
+def sky_cache_info() -> dict:
+    info = _sky_state_cached.cache_info()
+    return {"hits": info.hits, "misses": info.misses, "size": info.currsize, "max_size": info.maxsize}
+
+
+PLACIDUS_FALLBACK_WARNING = "Sistema de casas ajustado automaticamente para Placidus por segurança."
+POLAR_FALLBACK_WARNING = (
+    "Sistema de casas ajustado automaticamente para Porphyrius: Placidus e Koch não existem acima do círculo polar."
+)
+
+
+def _houses_with_fallback(
+    session: EphemerisSession, jd_ut: float, lat: float, lng: float, house_system_code: str
+) -> Tuple[List[float], float, float, str, Optional[str]]:
+    """Casas no sistema pedido; Placidus se ele falhar, Porphyrius onde nem Placidus existe (círculo polar).
+
+    Devolve (cúspides, asc, mc, sistema usado, aviso ou None).
+    """
+    try:
+        cusps, asc, mc = session.houses(jd_ut, lat, lng, house_system_code.encode("ascii"))
+        return cusps, asc, mc, house_system_code, None
+    except Exception:
+        pass
+    try:
+        cusps, asc, mc = session.houses(jd_ut, lat, lng, b'P')
+        return cusps, asc, mc, "P", PLACIDUS_FALLBACK_WARNING
+    except swe.Error:
+        cusps, asc, mc = session.houses(jd_ut, lat, lng, b'O')
+        return cusps, asc, mc, "O", POLAR_FALLBACK_WARNING
 
 
 def compute_chart(
@@ -59,38 +184,24 @@ def compute_chart(
     utc_dt = local_dt - timedelta(minutes=tz_offset_minutes)
 
     jd_ut = to_julian_day(utc_dt)
-    flags = swe.FLG_SWIEPH | swe.FLG_SPEED
-
-    if zodiac_type == "sidereal":
-        swe.set_sid_mode(AYANAMSA_MAP.get((ayanamsa or "lahiri").lower(), swe.SIDM_LAHIRI))
-        flags |= swe.FLG_SIDEREAL
+    session = EphemerisSession.create(zodiac_type, ayanamsa)
 
     # casas: fallback seguro
-    warning = None
     house_system_code = house_system[0].upper() if house_system else "P"
-    house_system_bytes = house_system_code.encode("ascii")
-
-    try:
-        cusps, ascmc = swe.houses_ex(jd_ut, lat, lng, house_system_bytes, flags)
-    except Exception:
-        # fallback para Placidus
-        warning = "Sistema de casas ajustado automaticamente para Placidus por segurança."
-        cusps, ascmc = swe.houses_ex(jd_ut, lat, lng, b'P', flags)
-        house_system_code = "P"
+    cusps, asc, mc, house_system_code, warning = _houses_with_fallback(session, jd_ut, lat, lng, house_system_code)
 
     houses_data = {
         "system": HOUSE_SYSTEMS.get(house_system_code, house_system_code),
         "cusps": [round(c, 6) for c in cusps],  # cusps[0]..cusps[11] (12 valores)
-        "asc": round(ascmc[0], 6),
-        "mc": round(ascmc[1], 6)
+        "asc": round(asc, 6),
+        "mc": round(mc, 6)
     }
 
+    # planetas: camada de céu compartilhada (casas são o único trabalho por local)
+    sky = _sky_state_cached(jd_ut, session.flags, session.sid_mode)
     planets_data = {}
-    for name, planet_id in PLANETS.items():
-        result, _ = swe.calc_ut(jd_ut, planet_id, flags)
-        lon = result[0] % 360.0
+    for name, (lon, speed) in sky.positions.items():
         sign_info = deg_to_sign(lon)
-        speed = result[3] if len(result) > 3 else None
         planets_data[name] = {
             "lon": round(lon, 6),
             "sign": sign_info["sign"],
@@ -111,6 +222,151 @@ def compute_chart(
     return payload
 
 
+class BatchChartInput(NamedTuple):
+    """Uma entrada de ``compute_charts_batch``; ``instant`` é UTC (datetime ingênuo ou JD)."""
+
+    instant: Union[datetime, float]
+    lat: float
+    lng: float
+    house_system: str = 'P'
+    zodiac_type: Literal['tropical', 'sidereal'] = 'tropical'
+    ayanamsa: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class ChartBatch:
+    """Resultado colunar de ``compute_charts_batch``.
+
+    ``lon``/``speed`` têm forma (n, len(planet_names)); ``cusps`` tem forma (n, 12).
+    Os dicts no formato de ``compute_chart`` só são montados em ``to_chart_dict``.
+    """
+
+    utc_datetimes: Tuple[datetime, ...]
+    jd_ut: np.ndarray
+    planet_names: Tuple[str, ...]
+    lon: np.ndarray
+    speed: np.ndarray
+    cusps: np.ndarray
+    asc: np.ndarray
+    mc: np.ndarray
+    house_systems: Tuple[str, ...]
+    warnings: Tuple[Optional[str], ...]
+
+    def __len__(self) -> int:
+        return len(self.utc_datetimes)
+
+    def planet_column(self, name: str) -> np.ndarray:
+        return self.lon[:, self.planet_names.index(name)]
+
+    def sign_index(self) -> np.ndarray:
+        return (self.lon // 30.0).astype(np.int8) % 12
+
+    def to_chart_dict(self, index: int) -> dict:
+        lons = np.round(self.lon[index], 6)
+        speeds = np.round(self.speed[index], 6)
+        deg_in_sign = np.round(self.lon[index] % 30.0, 4)
+        signs = (self.lon[index] // 30.0).astype(np.int8) % 12
+        planets_data = {}
+        for col, name in enumerate(self.planet_names):
+            speed = float(speeds[col])
+            planets_data[name] = {
+                "lon": float(lons[col]),
+                "sign": ZODIAC_SIGNS[int(signs[col])],
+                "deg_in_sign": float(deg_in_sign[col]),
+                "speed": speed,
+                "retrograde": bool(self.speed[index, col] < 0),
+            }
+        house_system_code = self.house_systems[index]
+        payload = {
+            "utc_datetime": self.utc_datetimes[index].isoformat(),
+            "jd_ut": round(float(self.jd_ut[index]), 8),
+            "houses": {
+                "system": HOUSE_SYSTEMS.get(house_system_code, house_system_code),
+                "cusps": [float(c) for c in np.round(self.cusps[index], 6)],
+                "asc": round(float(self.asc[index]), 6),
+                "mc": round(float(self.mc[index]), 6),
+            },
+            "planets": planets_data,
+        }
+        if self.warnings[index]:
+            payload["warning"] = self.warnings[index]
+        return payload
+
+
+def _jd_to_utc_datetime(jd_ut: float) -> datetime:
+    return from_julian_day(jd_ut)
+
+
+def compute_charts_batch(inputs: Sequence[BatchChartInput]) -> ChartBatch:
+    """Calcula vários mapas de uma vez e devolve arrays NumPy em vez de dicts.
+
+    Posições planetárias são consultadas uma vez por instante e zodíaco
+    distintos e copiadas em bloco para as linhas que os compartilham; casas e
+    ângulos dependem do local e vêm do Swiss Ephemeris por entrada, exatos como
+    em ``compute_chart``.
+    """
+    n = len(inputs)
+    names = tuple(PLANETS.keys())
+    jd_values = np.empty(n, dtype=np.float64)
+    lon = np.empty((n, len(names)), dtype=np.float64)
+    speed = np.empty((n, len(names)), dtype=np.float64)
+    cusps = np.empty((n, 12), dtype=np.float64)
+    asc = np.empty(n, dtype=np.float64)
+    mc = np.empty(n, dtype=np.float64)
+    utc_datetimes: List[datetime] = []
+    house_systems: List[str] = []
+    warnings: List[Optional[str]] = []
+    sessions: Dict[Tuple[str, Optional[str]], EphemerisSession] = {}
+    # (jd, flags, sid_mode) -> linhas que compartilham o céu
+    sky_rows: Dict[Tuple[float, int, Optional[int]], List[int]] = {}
+
+    for idx, item in enumerate(inputs):
+        if isinstance(item.instant, datetime):
+            utc_dt = item.instant
+            jd_ut = to_julian_day(utc_dt)
+        else:
+            jd_ut = float(item.instant)
+            utc_dt = _jd_to_utc_datetime(jd_ut)
+
+        session_key = (item.zodiac_type, item.ayanamsa)
+        if session_key not in sessions:
+            sessions[session_key] = EphemerisSession.create(item.zodiac_type, item.ayanamsa)
+        session = sessions[session_key]
+
+        house_system_code = item.house_system[0].upper() if item.house_system else "P"
+        house_cusps, house_asc, house_mc, house_system_code, warning = _houses_with_fallback(
+            session, jd_ut, item.lat, item.lng, house_system_code
+        )
+
+        sky_rows.setdefault((jd_ut, session.flags, session.sid_mode), []).append(idx)
+        jd_values[idx] = jd_ut
+        cusps[idx] = house_cusps
+        asc[idx] = house_asc
+        mc[idx] = house_mc
+        utc_datetimes.append(utc_dt)
+        house_systems.append(house_system_code)
+        warnings.append(warning)
+
+    for (jd_ut, flags, sid_mode), rows in sky_rows.items():
+        sky = _sky_state_cached(jd_ut, flags, sid_mode)
+        positions = np.array([sky.positions[name] for name in names], dtype=np.float64)
+        lon[rows] = positions[:, 0]
+        speed[rows] = positions[:, 1]
+
+    return ChartBatch(
+        utc_datetimes=tuple(utc_datetimes),
+        jd_ut=jd_values,
+        planet_names=names,
+        lon=lon,
+        speed=speed,
+        cusps=cusps,
+        asc=asc,
+        mc=mc,
+        house_systems=tuple(house_systems),
+        warnings=tuple(warnings),
+    )
+
+
 def compute_transits(
     target_year: int,
     target_month: int,
@@ -158,11 +414,9 @@ def compute_moon_only(date_yyyy_mm_dd: str, tz_offset_minutes: int = 0) -> dict:
 
     jd_ut = to_julian_day(utc_dt)
 
-    moon_res, _ = swe.calc_ut(jd_ut, swe.MOON)
-    moon_lon = moon_res[0] % 360.0
-
-    sun_res, _ = swe.calc_ut(jd_ut, swe.SUN)
-    sun_lon = sun_res[0] % 360.0
+    sky = compute_sky_state(jd_ut)
+    moon_lon = sky.lon("Moon")
+    sun_lon = sky.lon("Sun")
 
     phase_angle = (moon_lon - sun_lon) % 360.0
 
@@ -179,8 +433,58 @@ def compute_moon_only(date_yyyy_mm_dd: str, tz_offset_minutes: int = 0) -> dict:
 
 def _planet_longitude(utc_dt: datetime, planet_id: int) -> float:
     jd_ut = to_julian_day(utc_dt)
-    result, _ = swe.calc_ut(jd_ut, planet_id)
-    return result[0] % 360.0
+    return calc_position(jd_ut, planet_id)[0]
+
+
+# passo da grade de busca: menor que a menor fase direta ou retrógrada do corpo
+CROSSING_STEP_DAYS = {
+    swe.SUN: 10.0,
+    swe.MOON: 2.0,
+    swe.MERCURY: 4.0,
+    swe.VENUS: 7.0,
+    swe.MARS: 10.0,
+}
+DEFAULT_CROSSING_STEP_DAYS = 20.0
+
+
+@dataclass(frozen=True)
+class LongitudeCrossing:
+    planet: str
+    target_lon: float
+    jd_ut: float
+    direction: int  # +1 direto, -1 retrógrado
+
+    @property
+    def utc_datetime(self) -> datetime:
+        return from_julian_day(self.jd_ut)
+
+
+def _body_track(body_id: int, session: EphemerisSession, jd_start: float) -> LongitudeTrack:
+    step = CROSSING_STEP_DAYS.get(body_id, DEFAULT_CROSSING_STEP_DAYS)
+    return LongitudeTrack(lambda jd_ut: session.position(jd_ut, body_id), step, origin=jd_start)
+
+
+def find_longitude_crossings(
+    planets: Sequence[str],
+    target_lons: Sequence[float],
+    jd_start: float,
+    jd_end: float,
+    session: Optional[EphemerisSession] = None,
+) -> List[LongitudeCrossing]:
+    """Todas as passagens dos planetas pelas longitudes em [jd_start, jd_end], inclusive as retrógradas."""
+    session = session or EphemerisSession()
+    targets = [float(lon) % 360.0 for lon in target_lons]
+    found = []
+    for name in planets:
+        track = _body_track(PLANETS[name], session, jd_start)
+        for crossing in track.crossings(targets, jd_start, jd_end):
+            found.append(LongitudeCrossing(name, crossing.target, crossing.jd_ut, crossing.direction))
+    found.sort(key=lambda item: (item.jd_ut, item.planet))
+    return found
+
+
+def _round_to_second(dt: datetime) -> datetime:
+    return dt.replace(microsecond=0) + timedelta(seconds=1 if dt.microsecond >= 500000 else 0)
 
 
 def find_longitude_match(
@@ -194,61 +498,47 @@ def find_longitude_match(
     step_minutes: int = 60,
     refine_steps: int = 12,
 ) -> dict:
+    """Primeira passagem do planeta por ``target_lon`` na janela (ou a maior aproximação).
+
+    A busca usa o solver de ``find_longitude_crossings``, exato até a
+    precisão da efeméride.
+
+    Obsoletos: ``tolerance_deg``, ``step_minutes`` e ``refine_steps`` são
+    aceitos só por compatibilidade com chamadas antigas e não têm efeito.
+    """
     if end_local <= start_local:
         raise ValueError("end_local must be after start_local")
 
     start_utc = start_local - timedelta(minutes=tz_offset_minutes)
     end_utc = end_local - timedelta(minutes=tz_offset_minutes)
+    jd_start, jd_end = to_julian_day(start_utc), to_julian_day(end_utc)
+
+    track = _body_track(planet_id, EphemerisSession(), jd_start)
+    crossings = track.crossings([target_lon % 360.0], jd_start, jd_end)
+    if crossings:
+        jd_best = crossings[0].jd_ut
+    else:
+        jds = np.linspace(jd_start, jd_end, 25)
+        distances = [abs(_angle_delta(track.longitude(float(jd)), target_lon)) for jd in jds]
+        idx = int(np.argmin(distances))
+        jd_best = minimize_separation(
+            track.position, target_lon, float(jds[max(idx - 1, 0)]), float(jds[min(idx + 1, len(jds) - 1)])
+        )
 
-    if end_utc <= start_utc:
-        raise ValueError("end_local must be after start_local")
-
-    step_seconds = max(60, int(step_minutes * 60))
-    best_utc = start_utc
-    best_delta = 360.0
-    current = start_utc
-    while current <= end_utc:
-        lon = _planet_longitude(current, planet_id)
-        delta = angle_diff(lon, target_lon)
-        if delta < best_delta:
-            best_delta = delta
-            best_utc = current
-        if best_delta <= tolerance_deg:
-            break
-        current += timedelta(seconds=step_seconds)
-
-    center = best_utc
-    window_seconds = step_seconds
-    for _ in range(refine_steps):
-        if window_seconds <= 1:
-            break
-        half_window = max(1, window_seconds // 2)
-        candidates = [
-            max(start_utc, center - timedelta(seconds=half_window)),
-            center,
-            min(end_utc, center + timedelta(seconds=half_window)),
-        ]
-        for candidate in candidates:
-            lon = _planet_longitude(candidate, planet_id)
-            delta = angle_diff(lon, target_lon)
-            if delta < best_delta:
-                best_delta = delta
-                center = candidate
-        window_seconds = half_window
-
-    center = center.replace(microsecond=0)
+    center = min(max(_round_to_second(from_julian_day(jd_best)), start_utc), end_utc)
     best_lon = _planet_longitude(center, planet_id)
     local_dt = (center + timedelta(minutes=tz_offset_minutes)).replace(microsecond=0)
     return {
         "local_datetime": local_dt.isoformat(),
         "utc_datetime": center.isoformat(),
         "planet_lon": round(best_lon, 6),
-        "delta_deg": round(best_delta, 6),
+        "delta_deg": round(angle_diff(best_lon, target_lon), 6),
     }
+
+
 def _sun_longitude_at(dt: datetime) -> float:
     jd_ut = to_julian_day(dt)
-    result, _ = swe.calc_ut(jd_ut, swe.SUN)
-    return result[0] % 360.0
+    return calc_position(jd_ut, swe.SUN)[0]
 
 
 def sun_longitude_at(utc_dt: datetime) -> float:
@@ -264,74 +554,70 @@ def _target_year_datetime(natal_dt: datetime, target_year: int) -> datetime:
     return natal_dt.replace(year=target_year, day=day)
 
 
+def solve_solar_return(
+    natal_lon: float,
+    approx_jd: float,
+    position: Optional[Callable[[float], Tuple[float, float]]] = None,
+    window_days: float = 3.0,
+    max_iter: int = 20,
+    tolerance_degrees: float = 1e-6,
+) -> Optional[float]:
+    """Instante (jd) em que o Sol volta a ``natal_lon``, a até ``window_days`` de ``approx_jd``.
+
+    Newton com a velocidade diária do Sol (0,95-1,02°/dia, sempre positiva):
+    partindo de poucos dias da raiz converge em 3-4 avaliações.
+    """
+    position = position or (lambda jd_ut: calc_position(jd_ut, swe.SUN))
+    jd_ut = approx_jd
+    for _ in range(max_iter):
+        lon, speed = position(jd_ut)
+        delta = _angle_delta(lon, natal_lon)
+        if speed <= 0:
+            return None
+        jd_ut -= delta / speed
+        if abs(jd_ut - approx_jd) > window_days:
+            return None
+        if abs(delta) <= tolerance_degrees:
+            return jd_ut
+    return None
+
+
 def _solar_return_v1(
     natal_lon: float,
     approx_dt: datetime,
     window_days: int = 2,
     step_hours: int = 1,
 ) -> datetime:
+    """Ponto da grade horária mais próximo do retorno (resultado histórico do v1)."""
     window_start = approx_dt - timedelta(days=window_days)
-    best_dt = window_start
-    best_delta = 360.0
-    total_hours = int((window_days * 2 * 24) / step_hours)
-    for step in range(total_hours + 1):
-        candidate = window_start + timedelta(hours=step * step_hours)
-        delta = abs(_angle_delta(_sun_longitude_at(candidate), natal_lon))
-        if delta < best_delta:
-            best_delta = delta
-            best_dt = candidate
-    return best_dt
+    total_steps = int((window_days * 2 * 24) / step_hours)
+    jd_ut = solve_solar_return(natal_lon, to_julian_day(approx_dt), window_days=window_days)
+    if jd_ut is None:
+        best_step = min(
+            range(total_steps + 1),
+            key=lambda k: abs(_angle_delta(_sun_longitude_at(window_start + timedelta(hours=k * step_hours)), natal_lon)),
+        )
+    else:
+        hours = (jd_ut - to_julian_day(window_start)) * 24.0
+        best_step = min(max(round(hours / step_hours), 0), total_steps)
+    return window_start + timedelta(hours=best_step * step_hours)
 
 
 def _solar_return_v2(
     natal_lon: float,
     approx_dt: datetime,
     window_days: int = 3,
-    step_hours: int = 6,
     max_iter: int = 60,
     tolerance_degrees: float = 1e-6,
 ) -> Optional[datetime]:
-    window_start = approx_dt - timedelta(days=window_days)
-    window_end = approx_dt + timedelta(days=window_days)
-    step = timedelta(hours=step_hours)
-
-    prev_dt = window_start
-    prev_delta = _angle_delta(sun_longitude_at(prev_dt), natal_lon)
-    if prev_delta == 0:
-        return prev_dt
-
-    current = window_start + step
-    bracket = None
-    while current <= window_end:
-        current_delta = _angle_delta(sun_longitude_at(current), natal_lon)
-        if current_delta == 0:
-            return current
-        if prev_delta * current_delta < 0:
-            bracket = (prev_dt, current)
-            break
-        prev_dt, prev_delta = current, current_delta
-        current += step
-
-    if bracket is None:
-        return None
-
-    left_dt, right_dt = bracket
-    left_delta = _angle_delta(sun_longitude_at(left_dt), natal_lon)
-    right_delta = _angle_delta(sun_longitude_at(right_dt), natal_lon)
-
-    for _ in range(max_iter):
-        midpoint = left_dt + (right_dt - left_dt) / 2
-        mid_delta = _angle_delta(sun_longitude_at(midpoint), natal_lon)
-        if abs(mid_delta) < 1e-6 or (right_dt - left_dt).total_seconds() <= 1:
-            return midpoint
-        if left_delta * mid_delta < 0:
-            right_dt = midpoint
-            right_delta = mid_delta
-        else:
-            left_dt = midpoint
-            left_delta = mid_delta
-
-    return left_dt + (right_dt - left_dt) / 2
+    jd_ut = solve_solar_return(
+        natal_lon,
+        to_julian_day(approx_dt),
+        window_days=window_days,
+        max_iter=max_iter,
+        tolerance_degrees=tolerance_degrees,
+    )
+    return from_julian_day(jd_ut) if jd_ut is not None else None
 
 
 def solar_return_datetime(
@@ -354,7 +640,6 @@ def solar_return_datetime(
             natal_lon,
             approx_utc,
             window_days=window_days or 3,
-            step_hours=step_hours or 6,
             max_iter=max_iter or 60,
             tolerance_degrees=tolerance_degrees or 1e-6,
         )
@@ -367,3 +652,29 @@ def solar_return_datetime(
         window_days=window_days or 2,
         step_hours=step_hours or 1,
     )
+
+
+def solar_returns_batch(
+    natal_dt: datetime,
+    start_year: int,
+    end_year: int,
+    tz_offset_minutes: int = 0,
+    zodiac_type: str = "tropical",
+    ayanamsa: Optional[str] = None,
+) -> List[Tuple[int, datetime]]:
+    """Retornos solares (UTC) de ``start_year`` a ``end_year``; a longitude natal é calculada uma vez."""
+    session = EphemerisSession.create(zodiac_type, ayanamsa)
+    natal_utc = natal_dt - timedelta(minutes=tz_offset_minutes)
+    natal_lon = session.longitude(to_julian_day(natal_utc), swe.SUN)
+
+    def position(jd_ut: float) -> Tuple[float, float]:
+        return session.position(jd_ut, swe.SUN)
+
+    results = []
+    for year in range(start_year, end_year + 1):
+        approx_utc = _target_year_datetime(natal_dt, year) - timedelta(minutes=tz_offset_minutes)
+        jd_ut = solve_solar_return(natal_lon, to_julian_day(approx_utc), position=position)
+        if jd_ut is None:
+            raise ValueError(f"Não foi possível localizar o retorno solar de {year}.")
+        results.append((year, from_julian_day(jd_ut)))
+    return results
@@ -0,0 +1,134 @@
+"""Per-computation ephemeris configuration (zodiac and ayanamsa).
+
+Swiss Ephemeris keeps the sidereal mode in process-global state
+(``swe.set_sid_mode``), so two threads computing with different ayanamsas can
+corrupt each other. ``EphemerisSession`` never relies on that state while
+computing: positions and houses are always computed tropically, and sidereal
+sessions subtract the ayanamsa of the instant. For the standard ayanamsas this
+matches ``FLG_SIDEREAL`` to 1e-10°; speeds differ by a few 1e-6 °/day. Houses
+tied to sign boundaries (Whole Sign and the 0° Aries system) are rebuilt from
+the sidereal signs instead of shifted.
+
+Ayanamsa values are cached per (sid_mode, jd). Only a cache miss touches the
+global mode, under a lock. Tropical sessions never take a lock.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
+import swisseph as swe
+
+from astro.ephemeris_tables import calc_position
+
+AYANAMSA_MAP = {
+    "lahiri": swe.SIDM_LAHIRI,
+    "krishnamurti": swe.SIDM_KRISHNAMURTI,
+    "ramey": swe.SIDM_RAMAN,
+    "fagan_bradley": swe.SIDM_FAGAN_BRADLEY,
+}
+
+AYANAMSA_CACHE_SIZE = int(os.getenv("AYANAMSA_CACHE_SIZE", "8192"))
+
+_SID_MODE_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=AYANAMSA_CACHE_SIZE)
+def sidereal_offset(jd_ut: float, sid_mode: int) -> Tuple[float, float]:
+    """(ayanamsa, ayanamsa/dia) em ``jd_ut`` para o modo sideral informado."""
+    with _SID_MODE_LOCK:
+        swe.set_sid_mode(sid_mode)
+        value = swe.get_ayanamsa_ex_ut(jd_ut, swe.FLG_SWIEPH)[1]
+        before = swe.get_ayanamsa_ex_ut(jd_ut - 0.5, swe.FLG_SWIEPH)[1]
+        after = swe.get_ayanamsa_ex_ut(jd_ut + 0.5, swe.FLG_SWIEPH)[1]
+    return value, after - before
+
+
+def sidereal_houses(
+    cusps: np.ndarray,
+    asc: Union[float, np.ndarray],
+    mc: Union[float, np.ndarray],
+    offset: float,
+    house_system: Union[str, bytes] = "P",
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Cúspides (..., 12), asc e mc tropicais levados ao zodíaco sideral.
+
+    Os sistemas de casas por signo ('W' a partir do signo do ASC, 'N' a partir
+    de 0° Áries) começam nas fronteiras dos signos siderais, não nas tropicais
+    deslocadas.
+    """
+    if isinstance(house_system, bytes):
+        house_system = house_system.decode("ascii")
+    system = (house_system or "P")[:1].upper()
+    asc = (np.asarray(asc, dtype=float) - offset) % 360.0
+    mc = (np.asarray(mc, dtype=float) - offset) % 360.0
+    cusps = (np.asarray(cusps, dtype=float) - offset) % 360.0
+    if system == "W":
+        cusps = (np.floor(asc / 30.0)[..., None] * 30.0 + 30.0 * np.arange(12)) % 360.0
+    elif system == "N":
+        cusps = np.broadcast_to(30.0 * np.arange(12), cusps.shape).copy()
+    return cusps, asc, mc
+
+
+@dataclass(frozen=True)
+class EphemerisSession:
+    """Flags e ayanamsa de um cálculo; imutável e seguro entre threads."""
+
+    sid_mode: Optional[int] = None
+
+    @classmethod
+    def create(cls, zodiac_type: str = "tropical", ayanamsa: Optional[str] = None) -> "EphemerisSession":
+        if zodiac_type == "sidereal":
+            return cls(AYANAMSA_MAP.get((ayanamsa or "lahiri").lower(), swe.SIDM_LAHIRI))
+        return cls()
+
+    @property
+    def is_sidereal(self) -> bool:
+        return self.sid_mode is not None
+
+    @property
+    def zodiac_type(self) -> str:
+        return "sidereal" if self.is_sidereal else "tropical"
+
+    @property
+    def flags(self) -> int:
+        """Flags equivalentes do Swiss Ephemeris (usadas em chaves de cache)."""
+        flags = swe.FLG_SWIEPH | swe.FLG_SPEED
+        return flags | swe.FLG_SIDEREAL if self.is_sidereal else flags
+
+    def ayanamsa(self, jd_ut: float) -> float:
+        if self.sid_mode is None:
+            return 0.0
+        return sidereal_offset(jd_ut, self.sid_mode)[0]
+
+    def position(self, jd_ut: float, body_id: int) -> Tuple[float, float]:
+        """(lon, speed) do corpo no zodíaco da sessão."""
+        lon, speed = calc_position(jd_ut, body_id)
+        if self.sid_mode is None:
+            return lon, speed
+        offset, rate = sidereal_offset(jd_ut, self.sid_mode)
+        return (lon - offset) % 360.0, speed - rate
+
+    def longitude(self, jd_ut: float, body_id: int) -> float:
+        return self.position(jd_ut, body_id)[0]
+
+    def houses(
+        self,
+        jd_ut: float,
+        lat: float,
+        lng: float,
+        house_system: bytes = b"P",
+    ) -> Tuple[List[float], float, float]:
+        """(cusps[12], asc, mc) no zodíaco da sessão; propaga erros de ``swe.houses_ex``."""
+        cusps, ascmc = swe.houses_ex(jd_ut, lat, lng, house_system, 0)
+        cusps = list(cusps[:12])
+        asc, mc = ascmc[0], ascmc[1]
+        if self.sid_mode is None:
+            return cusps, asc, mc
+        sid_cusps, sid_asc, sid_mc = sidereal_houses(cusps, asc, mc, self.ayanamsa(jd_ut), house_system)
+        return [float(c) for c in sid_cusps], float(sid_asc), float(sid_mc)
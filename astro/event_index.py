@@ -0,0 +1,184 @@
+"""Chunked, sorted event catalogs shared by the precomputed indexes.
+
+Lunations, sign ingresses, Moon ingresses and eclipses are all lists of
+events sorted by instant. ``ChunkedEventIndex`` keeps such a list and answers
+range queries with ``bisect``. Events are computed lazily one chunk (a year)
+at a time under a lock, and the sorted list is swapped in one assignment so
+readers never take the lock. Subclasses supply the chunk computation, the
+identity key of an event and the npz codec.
+
+``SharedIndex`` holds the process-wide instance of one catalog, loaded from
+its npz file (written by ``scripts/build_event_index.py``) when present.
+"""
+
+from __future__ import annotations
+
+import bisect
+import logging
+import math
+import os
+import threading
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Dict, Generic, Hashable, List, Mapping, Optional, Set, Tuple, Type, TypeVar
+
+import numpy as np
+
+from astro.utils import to_julian_day
+
+logger = logging.getLogger("astro-api")
+
+INDEX_START_YEAR = 1800
+INDEX_END_YEAR = 2100
+INDEX_ORIGIN_JD = to_julian_day(datetime(INDEX_START_YEAR, 1, 1))
+CHUNK_DAYS = 365.25
+
+E = TypeVar("E")
+I = TypeVar("I")
+
+
+class ChunkedEventIndex(ABC, Generic[E]):
+    """Eventos ordenados por ``jd_ut``, calculados por blocos; consultas por busca binária."""
+
+    chunk_days: float = CHUNK_DAYS
+    # janela garantida em memória antes de ``previous`` e depois de ``next``
+    lookback_days: float = CHUNK_DAYS
+    lookahead_days: float = CHUNK_DAYS
+
+    def __init__(self) -> None:
+        # (eventos, chaves de busca) trocados juntos para leitura sem lock
+        self._sorted: Tuple[List[E], List[float]] = ([], [])
+        self._chunks: Set[int] = set()
+        self._lock = threading.Lock()
+
+    @abstractmethod
+    def compute_chunk(self, jd_start: float, jd_end: float) -> List[E]:
+        """Eventos em [jd_start, jd_end)."""
+
+    def event_key(self, event: E) -> Hashable:
+        """Identidade do evento; também define a ordem do catálogo."""
+        return event.jd_ut
+
+    @abstractmethod
+    def encode(self, events: List[E]) -> Dict[str, np.ndarray]:
+        """Colunas do arquivo ``.npz`` para ``events``."""
+
+    @abstractmethod
+    def decode(self, data: Mapping[str, np.ndarray]) -> List[E]:
+        """Inverso de ``encode``."""
+
+    def __len__(self) -> int:
+        return len(self._sorted[0])
+
+    def _add(self, events: List[E]) -> None:
+        merged: Dict[Hashable, E] = {self.event_key(e): e for e in self._sorted[0]}
+        for event in events:
+            merged[self.event_key(event)] = event
+        ordered = [merged[key] for key in sorted(merged)]
+        self._sorted = (ordered, [e.jd_ut for e in ordered])
+
+    def _ensure(self, jd_start: float, jd_end: float) -> None:
+        first = math.floor((jd_start - INDEX_ORIGIN_JD) / self.chunk_days)
+        last = math.floor((jd_end - INDEX_ORIGIN_JD) / self.chunk_days)
+        missing = [k for k in range(first, last + 1) if k not in self._chunks]
+        if not missing:
+            return
+        with self._lock:
+            for chunk in missing:
+                if chunk in self._chunks:
+                    continue
+                chunk_start = INDEX_ORIGIN_JD + chunk * self.chunk_days
+                self._add(self.compute_chunk(chunk_start, chunk_start + self.chunk_days))
+                self._chunks.add(chunk)
+
+    def between(self, jd_start: float, jd_end: float) -> List[E]:
+        """Eventos em [jd_start, jd_end)."""
+        self._ensure(jd_start, jd_end)
+        events, keys = self._sorted
+        return events[bisect.bisect_left(keys, jd_start): bisect.bisect_left(keys, jd_end)]
+
+    def previous(self, jd_ut: float) -> Optional[E]:
+        """Último evento até ``jd_ut`` (inclusive)."""
+        self._ensure(jd_ut - self.lookback_days, jd_ut)
+        events, keys = self._sorted
+        idx = bisect.bisect_right(keys, jd_ut)
+        return events[idx - 1] if idx else None
+
+    def next(self, jd_ut: float) -> Optional[E]:
+        """Primeiro evento depois de ``jd_ut``."""
+        self._ensure(jd_ut, jd_ut + self.lookahead_days)
+        events, keys = self._sorted
+        idx = bisect.bisect_right(keys, jd_ut)
+        return events[idx] if idx < len(events) else None
+
+    def build(self: I, start_year: int = INDEX_START_YEAR, end_year: int = INDEX_END_YEAR) -> I:
+        self._ensure(
+            to_julian_day(datetime(start_year, 1, 1)),
+            to_julian_day(datetime(end_year, 12, 31, 23, 59, 59)),
+        )
+        return self
+
+    def dump(self, prefix: str = "") -> Dict[str, np.ndarray]:
+        """Colunas e blocos calculados, com ``prefix`` nos nomes (vários índices num arquivo)."""
+        arrays = {prefix + name: column for name, column in self.encode(self._sorted[0]).items()}
+        arrays[prefix + "chunks"] = np.array(sorted(self._chunks), dtype=np.int32)
+        return arrays
+
+    def restore(self, data: Mapping[str, np.ndarray], prefix: str = "") -> None:
+        """Inverso de ``dump``."""
+        columns = {name[len(prefix):]: data[name] for name in data if name.startswith(prefix)}
+        self._add(self.decode(columns))
+        self._chunks.update(int(k) for k in columns["chunks"])
+
+    def save(self, path: str) -> str:
+        return save_arrays(path, self.dump())
+
+    @classmethod
+    def load(cls: Type[I], path: str) -> I:
+        index = cls()
+        with np.load(path) as data:
+            index.restore(data)
+        return index
+
+
+def save_arrays(path: str, arrays: Dict[str, np.ndarray]) -> str:
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "wb") as fh:
+        np.savez_compressed(fh, **arrays)
+    return path
+
+
+class SharedIndex(Generic[I]):
+    """Instância do processo de um índice; usa o arquivo de ``env_var`` quando existir.
+
+    ``name`` prefixa o log emitido quando o arquivo existe mas não carrega.
+    """
+
+    def __init__(self, index_cls: Type[I], env_var: str, default_path: str, name: str) -> None:
+        self.index_cls = index_cls
+        self.env_var = env_var
+        self.default_path = default_path
+        self.name = name
+        self._index: Optional[I] = None
+        self._lock = threading.Lock()
+
+    def get(self) -> I:
+        if self._index is not None:
+            return self._index
+        with self._lock:
+            if self._index is None:
+                path = os.getenv(self.env_var, self.default_path)
+                index = None
+                if os.path.exists(path):
+                    try:
+                        index = self.index_cls.load(path)
+                    except Exception as exc:
+                        logger.warning(f"{self.name}_unavailable", extra={"path": path, "error": str(exc)})
+                self._index = index or self.index_cls()
+            return self._index
+
+    def reset(self) -> None:
+        with self._lock:
+            self._index = None
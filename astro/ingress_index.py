@@ -0,0 +1,173 @@
+"""Sign and natal-house ingress instants of the transiting planets.
+
+An ingress is a crossing of the planet's longitude over a sign boundary
+(a multiple of 30°) or over a natal house cusp, found with the crossing
+solver of ``astro.ephemeris.find_longitude_crossings``. A direct crossing
+enters the sign or house that starts at the boundary; a retrograde crossing
+re-enters the previous one.
+
+Tropical sign ingresses are the same for everyone. ``IngressIndex`` keeps them
+in a ``ChunkedEventIndex``: events are computed lazily one year at a time, or
+loaded in one go from a file written by
+``scripts/build_event_index.py ingresses`` (``INGRESS_INDEX_PATH``). Sidereal
+ingresses and natal-house ingresses are computed per request.
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from astro.ephemeris import PLANETS, find_longitude_crossings
+from astro.ephemeris_session import EphemerisSession
+from astro.event_index import ChunkedEventIndex, SharedIndex
+from astro.utils import ZODIAC_SIGNS, from_julian_day, sign_to_pt
+
+INGRESS_PLANETS = tuple(PLANETS)
+SIGN_BOUNDARIES = tuple(float(k * 30) for k in range(12))
+
+DEFAULT_INDEX_PATH = os.path.join("data", "ingresses_1800_2100.npz")
+
+
+@dataclass(frozen=True)
+class IngressEvent:
+    jd_ut: float
+    planet: str
+    sign_index: int  # signo em que o planeta entra
+    direction: int  # +1 direto, -1 retrógrado
+
+    @property
+    def sign(self) -> str:
+        return ZODIAC_SIGNS[self.sign_index]
+
+    @property
+    def sign_pt(self) -> str:
+        return sign_to_pt(self.sign)
+
+    @property
+    def retrograde(self) -> bool:
+        return self.direction < 0
+
+    @property
+    def utc_datetime(self) -> datetime:
+        return from_julian_day(self.jd_ut)
+
+
+@dataclass(frozen=True)
+class HouseIngress:
+    jd_ut: float
+    planet: str
+    house: int  # casa natal (1-12) em que o planeta entra
+    direction: int
+
+    @property
+    def retrograde(self) -> bool:
+        return self.direction < 0
+
+    @property
+    def utc_datetime(self) -> datetime:
+        return from_julian_day(self.jd_ut)
+
+
+def _entered(boundary_index: int, direction: int) -> int:
+    """Índice (0-11) do signo/casa que começa na fronteira, ou do anterior se retrógrado."""
+    return boundary_index if direction > 0 else (boundary_index - 1) % 12
+
+
+def compute_sign_ingresses(
+    jd_start: float,
+    jd_end: float,
+    planets: Sequence[str] = INGRESS_PLANETS,
+    session: Optional[EphemerisSession] = None,
+) -> List[IngressEvent]:
+    """Ingressos em signos em [jd_start, jd_end), em ordem temporal."""
+    return [
+        IngressEvent(crossing.jd_ut, crossing.planet, _entered(int(round(crossing.target_lon / 30.0)) % 12, crossing.direction), crossing.direction)
+        for crossing in find_longitude_crossings(planets, SIGN_BOUNDARIES, jd_start, jd_end, session=session)
+        if crossing.jd_ut < jd_end
+    ]
+
+
+def compute_house_ingresses(
+    cusps: Sequence[float],
+    jd_start: float,
+    jd_end: float,
+    planets: Sequence[str] = INGRESS_PLANETS,
+    session: Optional[EphemerisSession] = None,
+) -> List[HouseIngress]:
+    """Passagens dos planetas pelas cúspides natais em [jd_start, jd_end).
+
+    ``cusps`` são as 12 cúspides do mapa natal no mesmo zodíaco de ``session``.
+    """
+    cusp_lons = [float(c) % 360.0 for c in cusps[:12]]
+    events = []
+    for crossing in find_longitude_crossings(planets, cusp_lons, jd_start, jd_end, session=session):
+        if crossing.jd_ut >= jd_end:
+            continue
+        for idx, lon in enumerate(cusp_lons):
+            if lon == crossing.target_lon:
+                house = _entered(idx, crossing.direction) + 1
+                events.append(HouseIngress(crossing.jd_ut, crossing.planet, house, crossing.direction))
+    return events
+
+
+class IngressIndex(ChunkedEventIndex[IngressEvent]):
+    """Ingressos tropicais em signos ordenados; consultas por busca binária."""
+
+    def compute_chunk(self, jd_start: float, jd_end: float) -> List[IngressEvent]:
+        return compute_sign_ingresses(jd_start, jd_end)
+
+    def event_key(self, event: IngressEvent) -> Tuple[float, str]:
+        return (event.jd_ut, event.planet)
+
+    def between(
+        self, jd_start: float, jd_end: float, planets: Optional[Sequence[str]] = None
+    ) -> List[IngressEvent]:
+        """Ingressos em [jd_start, jd_end), opcionalmente só dos planetas informados."""
+        found = super().between(jd_start, jd_end)
+        if planets is not None:
+            wanted = set(planets)
+            found = [e for e in found if e.planet in wanted]
+        return found
+
+    def encode(self, events: List[IngressEvent]) -> Dict[str, np.ndarray]:
+        return {
+            "jd_ut": np.array([e.jd_ut for e in events], dtype=float),
+            "planet": np.array([INGRESS_PLANETS.index(e.planet) for e in events], dtype=np.int8),
+            "sign": np.array([e.sign_index for e in events], dtype=np.int8),
+            "direction": np.array([e.direction for e in events], dtype=np.int8),
+        }
+
+    def decode(self, data: Mapping[str, np.ndarray]) -> List[IngressEvent]:
+        return [
+            IngressEvent(float(jd), INGRESS_PLANETS[int(planet)], int(sign), int(direction))
+            for jd, planet, sign, direction in zip(data["jd_ut"], data["planet"], data["sign"], data["direction"])
+        ]
+
+
+shared_index = SharedIndex(IngressIndex, "INGRESS_INDEX_PATH", DEFAULT_INDEX_PATH, "ingress_index")
+
+
+def get_ingress_index() -> IngressIndex:
+    """Índice compartilhado; usa o arquivo de ``INGRESS_INDEX_PATH`` quando existir."""
+    return shared_index.get()
+
+
+def reset_ingress_index() -> None:
+    shared_index.reset()
+
+
+def sign_ingresses(
+    jd_start: float,
+    jd_end: float,
+    planets: Optional[Sequence[str]] = None,
+    session: Optional[EphemerisSession] = None,
+) -> List[IngressEvent]:
+    """Ingressos em signos; tropicais vêm do índice, siderais são calculados na hora."""
+    if session is None or session.sid_mode is None:
+        return get_ingress_index().between(jd_start, jd_end, planets)
+    return compute_sign_ingresses(jd_start, jd_end, planets or INGRESS_PLANETS, session)
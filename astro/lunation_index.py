@@ -0,0 +1,119 @@
+"""Exact lunation instants (new moon, quarters and full moon).
+
+A lunation event is a crossing of the Sun-Moon elongation over 0°, 90°, 180°
+or 270°. The elongation always grows (10-15°/day), so a 1-day grid never holds
+two crossings of the same target and each event is refined with the Newton
+step of ``astro.crossings``.
+
+``LunationIndex`` is a ``ChunkedEventIndex``: events are computed lazily one
+year at a time, or loaded in one go from a file written by
+``scripts/build_event_index.py lunations`` (``LUNATION_INDEX_PATH``).
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from typing import Dict, List, Mapping, Tuple
+
+import numpy as np
+import swisseph as swe
+
+from astro.crossings import LongitudeTrack
+from astro.ephemeris_tables import calc_position
+from astro.event_index import CHUNK_DAYS, ChunkedEventIndex, SharedIndex
+from astro.utils import deg_to_sign, sign_to_pt
+
+LUNATION_PHASES = (
+    ("new_moon", 0.0),
+    ("first_quarter", 90.0),
+    ("full_moon", 180.0),
+    ("last_quarter", 270.0),
+)
+PHASE_LABELS_PT = {
+    "new_moon": "Lua Nova",
+    "first_quarter": "Quarto Crescente",
+    "full_moon": "Lua Cheia",
+    "last_quarter": "Quarto Minguante",
+}
+
+SCAN_STEP_DAYS = 1.0
+
+DEFAULT_INDEX_PATH = os.path.join("data", "lunations_1800_2100.npz")
+
+
+@dataclass(frozen=True)
+class LunationEvent:
+    jd_ut: float
+    phase_index: int  # posição em LUNATION_PHASES
+    moon_lon: float
+
+    @property
+    def phase(self) -> str:
+        return LUNATION_PHASES[self.phase_index][0]
+
+    @property
+    def phase_pt(self) -> str:
+        return PHASE_LABELS_PT[self.phase]
+
+    @property
+    def moon_sign(self) -> str:
+        return deg_to_sign(self.moon_lon)["sign"]
+
+    @property
+    def moon_sign_pt(self) -> str:
+        return sign_to_pt(self.moon_sign)
+
+
+def elongation(jd_ut: float) -> Tuple[float, float]:
+    """(Lua - Sol, velocidade relativa) em graus e graus/dia."""
+    moon_lon, moon_speed = calc_position(jd_ut, swe.MOON)
+    sun_lon, sun_speed = calc_position(jd_ut, swe.SUN)
+    return (moon_lon - sun_lon) % 360.0, moon_speed - sun_speed
+
+
+def compute_lunations(jd_start: float, jd_end: float) -> List[LunationEvent]:
+    """Lunações exatas em [jd_start, jd_end), em ordem temporal."""
+    track = LongitudeTrack(elongation, SCAN_STEP_DAYS, origin=jd_start)
+    targets = [angle for _, angle in LUNATION_PHASES]
+    return [
+        LunationEvent(crossing.jd_ut, crossing.target_index, calc_position(crossing.jd_ut, swe.MOON)[0])
+        for crossing in track.crossings(targets, jd_start, jd_end)
+        if crossing.jd_ut < jd_end
+    ]
+
+
+class LunationIndex(ChunkedEventIndex[LunationEvent]):
+    """Lunações exatas ordenadas; consultas por busca binária."""
+
+    # meia volta do ano cobre sempre a lunação anterior e a seguinte
+    lookback_days = CHUNK_DAYS / 2.0
+    lookahead_days = CHUNK_DAYS / 2.0
+
+    def compute_chunk(self, jd_start: float, jd_end: float) -> List[LunationEvent]:
+        return compute_lunations(jd_start, jd_end)
+
+    def encode(self, events: List[LunationEvent]) -> Dict[str, np.ndarray]:
+        return {
+            "jd_ut": np.array([e.jd_ut for e in events], dtype=float),
+            "phase": np.array([e.phase_index for e in events], dtype=np.int8),
+            "moon_lon": np.array([e.moon_lon for e in events], dtype=float),
+        }
+
+    def decode(self, data: Mapping[str, np.ndarray]) -> List[LunationEvent]:
+        return [
+            LunationEvent(float(jd), int(phase), float(lon))
+            for jd, phase, lon in zip(data["jd_ut"], data["phase"], data["moon_lon"])
+        ]
+
+
+shared_index = SharedIndex(LunationIndex, "LUNATION_INDEX_PATH", DEFAULT_INDEX_PATH, "lunation_index")
+
+
+def get_lunation_index() -> LunationIndex:
+    """Índice compartilhado; usa o arquivo de ``LUNATION_INDEX_PATH`` quando existir."""
+    return shared_index.get()
+
+
+def reset_lunation_index() -> None:
+    shared_index.reset()
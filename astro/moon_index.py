@@ -0,0 +1,199 @@
+"""Tabela exata da Lua: ingressos em signos, último aspecto e Lua fora de curso.
+
+A Lua fica fora de curso entre o último aspecto maior (conjunção, sextil,
+quadratura, trígono ou oposição) que ela aperfeiçoa com Sol ou planetas e o
+ingresso no signo seguinte; se não aperfeiçoa nenhum no signo (2002-08-05 a
+2002-08-07, em Câncer), fica fora de curso o signo inteiro. Os ingressos vêm
+do mesmo solver de ``astro.ingress_index``. Os aspectos são cruzamentos da elongação Lua -
+planeta, que sempre cresce (a Lua anda mais que qualquer planeta), então cada
+alvo é achado numa grade de um dia como em ``astro.lunation_index``.
+
+``MoonIndex`` guarda os ingressos num ``ChunkedEventIndex``; ``previous``
+devolve o último ingresso, isto é, o signo em que a Lua está. Os eventos são
+calculados um ano por vez, sob demanda ou no startup para um horizonte móvel
+(``MOON_INDEX_HORIZON_YEARS``), ou carregados de um arquivo de
+``scripts/build_event_index.py moon`` (``MOON_INDEX_PATH``). Só o zodíaco
+tropical é indexado.
+"""
+
+from __future__ import annotations
+
+import bisect
+import os
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
+import swisseph as swe
+
+from astro.crossings import LongitudeTrack
+from astro.ephemeris import PLANETS
+from astro.ephemeris_tables import calc_position
+from astro.event_index import ChunkedEventIndex, SharedIndex
+from astro.ingress_index import compute_sign_ingresses
+from astro.utils import ZODIAC_SIGNS, from_julian_day, sign_to_pt
+
+VOC_PLANETS = ("Sun", "Mercury", "Venus", "Mars", "Jupiter", "Saturn", "Uranus", "Neptune", "Pluto")
+MAJOR_ASPECTS = ("conjunction", "sextile", "square", "trine", "opposition")
+# elongação Lua - planeta em que cada aspecto fica exato (crescente e minguante)
+ELONGATION_TARGETS = (
+    (0.0, 0), (60.0, 1), (90.0, 2), (120.0, 3), (180.0, 4), (240.0, 3), (270.0, 2), (300.0, 1),
+)
+
+SCAN_STEP_DAYS = 1.0
+# mais que a maior permanência da Lua num signo; cobre o ingresso anterior
+LOOKBACK_DAYS = 4.0
+HORIZON_YEARS = int(os.getenv("MOON_INDEX_HORIZON_YEARS", "2"))
+
+DEFAULT_INDEX_PATH = os.path.join("data", "moon_1800_2100.npz")
+
+
+@dataclass(frozen=True)
+class MoonAspect:
+    jd_ut: float
+    planet: str
+    aspect_index: int  # posição em MAJOR_ASPECTS
+
+    @property
+    def aspect(self) -> str:
+        return MAJOR_ASPECTS[self.aspect_index]
+
+
+@dataclass(frozen=True)
+class MoonIngress:
+    jd_ut: float
+    sign_index: int  # signo em que a Lua entra
+    previous_jd: float  # ingresso no signo anterior
+    last_aspect: Optional[MoonAspect]  # último aspecto maior no signo anterior, se houver
+
+    @property
+    def sign(self) -> str:
+        return ZODIAC_SIGNS[self.sign_index]
+
+    @property
+    def sign_pt(self) -> str:
+        return sign_to_pt(self.sign)
+
+    @property
+    def previous_sign(self) -> str:
+        return ZODIAC_SIGNS[(self.sign_index - 1) % 12]
+
+    @property
+    def void_start_jd(self) -> float:
+        return self.last_aspect.jd_ut if self.last_aspect else self.previous_jd
+
+    @property
+    def utc_datetime(self) -> datetime:
+        return from_julian_day(self.jd_ut)
+
+
+def _elongation(planet_id: int) -> Callable[[float], Tuple[float, float]]:
+    def position(jd_ut: float) -> Tuple[float, float]:
+        moon_lon, moon_speed = calc_position(jd_ut, swe.MOON)
+        lon, speed = calc_position(jd_ut, planet_id)
+        return (moon_lon - lon) % 360.0, moon_speed - speed
+
+    return position
+
+
+def compute_moon_aspects(jd_start: float, jd_end: float) -> List[MoonAspect]:
+    """Aspectos maiores exatos da Lua com ``VOC_PLANETS`` em [jd_start, jd_end), em ordem temporal."""
+    targets = [angle for angle, _ in ELONGATION_TARGETS]
+    found = [
+        MoonAspect(crossing.jd_ut, planet, ELONGATION_TARGETS[crossing.target_index][1])
+        for planet in VOC_PLANETS
+        for crossing in LongitudeTrack(_elongation(PLANETS[planet]), SCAN_STEP_DAYS, origin=jd_start).crossings(
+            targets, jd_start, jd_end
+        )
+        if crossing.jd_ut < jd_end
+    ]
+    found.sort(key=lambda aspect: (aspect.jd_ut, aspect.planet))
+    return found
+
+
+def compute_moon_ingresses(jd_start: float, jd_end: float) -> List[MoonIngress]:
+    """Ingressos da Lua em [jd_start, jd_end), cada um com o último aspecto no signo que ela deixa."""
+    ingresses = compute_sign_ingresses(jd_start - LOOKBACK_DAYS, jd_end, planets=("Moon",))
+    aspects = compute_moon_aspects(jd_start - LOOKBACK_DAYS, jd_end)
+    keys = [aspect.jd_ut for aspect in aspects]
+    events = []
+    for previous, ingress in zip(ingresses, ingresses[1:]):
+        if ingress.jd_ut < jd_start:
+            continue
+        idx = bisect.bisect_left(keys, ingress.jd_ut)
+        last = aspects[idx - 1] if idx and keys[idx - 1] >= previous.jd_ut else None
+        events.append(MoonIngress(ingress.jd_ut, ingress.sign_index, previous.jd_ut, last))
+    return events
+
+
+class MoonIndex(ChunkedEventIndex[MoonIngress]):
+    """Ingressos da Lua ordenados, com o fora de curso de cada signo; consultas por busca binária."""
+
+    lookback_days = LOOKBACK_DAYS
+
+    def compute_chunk(self, jd_start: float, jd_end: float) -> List[MoonIngress]:
+        return compute_moon_ingresses(jd_start, jd_end)
+
+    def void_of_course(self, jd_start: float, jd_end: float) -> List[MoonIngress]:
+        """Ingressos cujo período fora de curso (último aspecto → ingresso) toca [jd_start, jd_end)."""
+        return [
+            event
+            for event in self.between(jd_start, jd_end + LOOKBACK_DAYS)
+            if event.void_start_jd < jd_end and event.jd_ut > jd_start
+        ]
+
+    def warm(self, year: int, horizon_years: int = HORIZON_YEARS) -> "MoonIndex":
+        """Garante o ano anterior a ``year`` e os ``horizon_years`` seguintes em memória."""
+        return self.build(year - 1, year + horizon_years)
+
+    def encode(self, events: List[MoonIngress]) -> Dict[str, np.ndarray]:
+        return {
+            "jd_ut": np.array([e.jd_ut for e in events], dtype=float),
+            "sign": np.array([e.sign_index for e in events], dtype=np.int8),
+            "previous_jd": np.array([e.previous_jd for e in events], dtype=float),
+            "aspect_jd": np.array([e.last_aspect.jd_ut if e.last_aspect else np.nan for e in events], dtype=float),
+            "aspect_planet": np.array(
+                [VOC_PLANETS.index(e.last_aspect.planet) if e.last_aspect else -1 for e in events], dtype=np.int8
+            ),
+            "aspect": np.array([e.last_aspect.aspect_index if e.last_aspect else -1 for e in events], dtype=np.int8),
+        }
+
+    def decode(self, data: Mapping[str, np.ndarray]) -> List[MoonIngress]:
+        return [
+            MoonIngress(
+                float(jd),
+                int(sign),
+                float(previous_jd),
+                MoonAspect(float(aspect_jd), VOC_PLANETS[int(planet)], int(aspect)) if planet >= 0 else None,
+            )
+            for jd, sign, previous_jd, aspect_jd, planet, aspect in zip(
+                data["jd_ut"],
+                data["sign"],
+                data["previous_jd"],
+                data["aspect_jd"],
+                data["aspect_planet"],
+                data["aspect"],
+            )
+        ]
+
+
+shared_index = SharedIndex(MoonIndex, "MOON_INDEX_PATH", DEFAULT_INDEX_PATH, "moon_index")
+
+
+def get_moon_index() -> MoonIndex:
+    """Índice compartilhado; usa o arquivo de ``MOON_INDEX_PATH`` quando existir."""
+    return shared_index.get()
+
+
+def reset_moon_index() -> None:
+    shared_index.reset()
+
+
+def warm_moon_index(year: int, horizon_years: int = HORIZON_YEARS) -> int:
+    """Aquece o índice compartilhado em torno de ``year``; devolve o número de ingressos.
+
+    Função de módulo para ``run_compute``: o índice (com seu lock) não sai do
+    processo que o aquece.
+    """
+    return len(get_moon_index().warm(year, horizon_years))
@@ -0,0 +1,344 @@
+"""Retificação do horário de nascimento por varredura do dia inteiro.
+
+Cada minuto candidato do dia de nascimento é pontuado contra eventos de vida
+(data e categoria) por três técnicas clássicas:
+
+- conjunções dos planetas lentos em trânsito com ângulos e cúspides do
+  candidato (o eixo oposto já cobre as oposições) e quadraturas ao ASC e MC;
+- planetas progredidos (progressão secundária, um dia por ano) sobre ângulos
+  e cúspides;
+- direções por arco solar do Ascendente e do Meio do Céu sobre os planetas
+  natais.
+
+Dentro de um dia só o céu local muda depressa. Os planetas (natais,
+progredidos e em trânsito) são calculados poucas vezes e interpolados para
+todos os candidatos; o ARMC avança a uma taxa sideral constante e ângulos e
+cúspides Placidus, Koch e Regiomontanus saem das fórmulas em vetores NumPy.
+Acima do círculo polar (90° menos a obliquidade) Placidus e Koch não
+existem; ali as cúspides são Porphyry, de ``swe.houses_armc`` candidato a
+candidato.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import swisseph as swe
+
+from astro.ephemeris import PLANETS
+from astro.ephemeris_session import EphemerisSession, sidereal_houses
+
+MINUTES_PER_DAY = 1440
+SIDEREAL_RATE_DEG_PER_DAY = 360.98564736629
+# junto ao círculo polar a iteração de Placidus converge devagar
+PLACIDUS_MAX_ITERATIONS = 500
+PLACIDUS_TOLERANCE = 1e-9
+PROGRESSION_DAYS_PER_YEAR = 365.25
+
+TRANSIT_ORB = 2.0
+PROGRESSION_ORB = 1.0
+DIRECTION_ORB = 1.0
+
+# Lua e planetas rápidos andam demais num dia de evento sem horário
+TRANSIT_WEIGHTS = {"Mars": 0.6, "Jupiter": 0.8, "Saturn": 1.0, "Uranus": 1.0, "Neptune": 0.9, "Pluto": 1.0}
+PROGRESSION_WEIGHTS = {"Sun": 1.0, "Moon": 0.8, "Mercury": 0.5, "Venus": 0.7, "Mars": 0.7}
+
+# colunas de pontos sensíveis do candidato: ângulos e cúspides intermediárias
+POINT_NAMES = ("ASC", "MC", "DSC", "IC", "Casa 2", "Casa 3", "Casa 5", "Casa 6", "Casa 8", "Casa 9", "Casa 11", "Casa 12")
+POINT_HOUSES = (1, 10, 7, 4, 2, 3, 5, 6, 8, 9, 11, 12)
+POINT_WEIGHTS = np.array([1.0, 1.0, 1.0, 1.0] + [0.5] * 8)
+
+# casas ligadas a cada categoria de evento valem o dobro
+EVENT_CATEGORY_HOUSES: Dict[str, Tuple[int, ...]] = {
+    "career": (10, 6),
+    "relationship": (7, 5),
+    "marriage": (7,),
+    "divorce": (7, 8),
+    "child": (5, 4),
+    "relocation": (4, 9, 3),
+    "health": (1, 6),
+    "accident": (1, 8),
+    "loss": (8, 4, 12),
+    "education": (9, 3),
+    "finance": (2, 8),
+    "other": (),
+}
+CATEGORY_BOOST = 2.0
+
+
+@dataclass(frozen=True)
+class LifeEvent:
+    jd_ut: float
+    category: str
+    label: str = ""
+
+
+@dataclass(frozen=True)
+class RectificationHit:
+    event_index: int
+    technique: str  # transit | progression | direction
+    planet: str
+    point: str
+    aspect: str
+    orb: float
+    weight: float
+
+
+@dataclass(frozen=True)
+class RectificationCandidate:
+    minute: int  # minutos desde a meia-noite local
+    jd_ut: float
+    score: float
+    asc: float
+    mc: float
+    hits: List[RectificationHit] = field(default_factory=list)
+
+
+def _wrap180(values: np.ndarray) -> np.ndarray:
+    return (values + 180.0) % 360.0 - 180.0
+
+
+def _separation(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    return np.abs(_wrap180(a - b))
+
+
+def _pole_cusp(ra: np.ndarray, tan_pole: np.ndarray | float, eps: float) -> np.ndarray:
+    """Ponto da eclíptica no círculo de posição com ascensão reta ``ra`` e polo ``atan(tan_pole)``."""
+    h, e = np.radians(ra), np.radians(eps)
+    return np.degrees(np.arctan2(np.sin(h), np.cos(h) * np.cos(e) - tan_pole * np.sin(e))) % 360.0
+
+
+def _ra_to_lon(ra: np.ndarray, eps: float) -> np.ndarray:
+    return _pole_cusp(ra, 0.0, eps)
+
+
+def _ascensional_difference(lon: np.ndarray, lat: float, eps: float) -> np.ndarray:
+    decl = np.arcsin(np.sin(np.radians(eps)) * np.sin(np.radians(lon)))
+    return np.degrees(np.arcsin(np.clip(np.tan(np.radians(lat)) * np.tan(decl), -1.0, 1.0)))
+
+
+def _intermediate_cusps(armc: np.ndarray, mc: np.ndarray, lat: float, eps: float, system: str) -> Dict[int, np.ndarray]:
+    """Cúspides 11, 12, 2 e 3 (as demais são opostas) para cada ARMC."""
+    tan_lat = np.tan(np.radians(lat))
+    if system == "R":
+        return {
+            11: _pole_cusp(armc + 30.0, tan_lat * 0.5, eps),
+            12: _pole_cusp(armc + 60.0, tan_lat * np.sqrt(3.0) / 2.0, eps),
+            2: _pole_cusp(armc + 120.0, tan_lat * np.sqrt(3.0) / 2.0, eps),
+            3: _pole_cusp(armc + 150.0, tan_lat * 0.5, eps),
+        }
+    if system == "K":
+        sin_a = np.clip(np.sin(np.radians(mc)) * np.sin(np.radians(eps)) / np.cos(np.radians(lat)), -1.0, 1.0)
+        c = np.arctan(tan_lat / np.sqrt(1.0 - sin_a * sin_a))
+        ad3 = np.degrees(np.arcsin(np.sin(c) * sin_a)) / 3.0
+        return {
+            11: _pole_cusp(armc + 30.0 - 2.0 * ad3, tan_lat, eps),
+            12: _pole_cusp(armc + 60.0 - ad3, tan_lat, eps),
+            2: _pole_cusp(armc + 120.0 + ad3, tan_lat, eps),
+            3: _pole_cusp(armc + 150.0 + 2.0 * ad3, tan_lat, eps),
+        }
+    # Placidus: trissecção dos semiarcos, resolvida por iteração de ponto fixo
+    cusps = {}
+    for house, offset, fraction in ((11, 30.0, 1 / 3), (12, 60.0, 2 / 3), (2, 120.0, 2 / 3), (3, 150.0, 1 / 3)):
+        lon = _ra_to_lon(armc + offset, eps)
+        for _ in range(PLACIDUS_MAX_ITERATIONS):
+            previous = lon
+            lon = _ra_to_lon(armc + offset + fraction * _ascensional_difference(lon, lat, eps), eps)
+            if np.max(_separation(lon, previous)) < PLACIDUS_TOLERANCE:
+                break
+        cusps[house] = lon
+    return cusps
+
+
+def houses_from_armc(
+    armc: np.ndarray, lat: float, eps: float, house_system: str = "P"
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(cúspides (n, 12), asc (n,), mc (n,)) tropicais para um vetor de ARMC."""
+    armc = np.asarray(armc, dtype=float) % 360.0
+    system = (house_system or "P")[0].upper()
+    # o mesmo limite do Swiss Ephemeris: 90° menos a obliquidade
+    if system in ("P", "K") and abs(lat) >= 90.0 - eps:
+        system = "O"
+    if system not in ("P", "K", "R"):
+        rows = [swe.houses_armc(float(a), lat, eps, system.encode("ascii")) for a in armc]
+        cusps = np.array([row[0][:12] for row in rows], dtype=float).reshape(len(armc), 12)
+        asc = np.array([row[1][0] for row in rows], dtype=float)
+        mc = np.array([row[1][1] for row in rows], dtype=float)
+        return cusps, asc, mc
+
+    asc = _pole_cusp(armc + 90.0, np.tan(np.radians(lat)), eps)
+    mc = _ra_to_lon(armc, eps)
+    middle = _intermediate_cusps(armc, mc, lat, eps, system)
+    first_half = np.column_stack([asc, middle[2], middle[3], (mc + 180.0) % 360.0, (middle[11] + 180.0) % 360.0, (middle[12] + 180.0) % 360.0])
+    cusps = np.hstack([first_half, (first_half + 180.0) % 360.0])
+    if abs(lat) >= 90.0 - eps:
+        # como o Swiss Ephemeris: no círculo polar o ASC fica sempre à frente do MC
+        flip = _wrap180(asc - mc) < 0
+        asc, mc = np.where(flip, (asc + 180.0) % 360.0, asc), np.where(flip, (mc + 180.0) % 360.0, mc)
+        cusps[flip] = (cusps[flip] + 180.0) % 360.0
+    return cusps, asc, mc
+
+
+def _interpolated_longitudes(
+    session: EphemerisSession, names: Sequence[str], jd_start: float, jd_end: float, fractions: np.ndarray
+) -> np.ndarray:
+    """Longitudes (n, len(names)) em ``jd_start + f·(jd_end - jd_start)``, por Lagrange em três pontos."""
+    jd_mid = 0.5 * (jd_start + jd_end)
+    out = np.empty((len(fractions), len(names)))
+    for col, name in enumerate(names):
+        l0 = session.longitude(jd_start, PLANETS[name])
+        d1 = float(_wrap180(np.array(session.longitude(jd_mid, PLANETS[name]) - l0)))
+        d2 = float(_wrap180(np.array(session.longitude(jd_end, PLANETS[name]) - l0)))
+        # d(f) passa por (0, 0), (0.5, d1) e (1, d2)
+        b = 4.0 * d1 - d2
+        a = d2 - b
+        out[:, col] = (l0 + fractions * (b + a * fractions)) % 360.0
+    return out
+
+
+def _points(cusps: np.ndarray, asc: np.ndarray, mc: np.ndarray) -> np.ndarray:
+    """Pontos sensíveis (n, 12) na ordem de ``POINT_NAMES``."""
+    middle = cusps[:, [h - 1 for h in POINT_HOUSES[4:]]]
+    return np.column_stack([asc, mc, (asc + 180.0) % 360.0, (mc + 180.0) % 360.0, middle])
+
+
+def _category_weights(category: str) -> np.ndarray:
+    houses = EVENT_CATEGORY_HOUSES.get(category, ())
+    return POINT_WEIGHTS * np.array([CATEGORY_BOOST if h in houses else 1.0 for h in POINT_HOUSES])
+
+
+class _Scan:
+    """Estado vetorizado de uma varredura; ``hits_for`` explica um candidato."""
+
+    def __init__(
+        self,
+        jd_candidates: np.ndarray,
+        points: np.ndarray,
+        asc: np.ndarray,
+        mc: np.ndarray,
+        natal_lons: np.ndarray,
+        events: Sequence[LifeEvent],
+        session: EphemerisSession,
+    ) -> None:
+        self.events = events
+        self.points = points
+        self.score = np.zeros(len(jd_candidates))
+        self._terms: List[Tuple[int, str, Tuple[str, ...], Tuple[str, ...], np.ndarray, np.ndarray, float, np.ndarray]] = []
+
+        transit_names = tuple(TRANSIT_WEIGHTS)
+        progressed_names = tuple(PROGRESSION_WEIGHTS)
+        natal_names = tuple(PLANETS)
+        fractions = (jd_candidates - jd_candidates[0]) / max(jd_candidates[-1] - jd_candidates[0], 1e-9)
+        transit_weights = np.array([TRANSIT_WEIGHTS[n] for n in transit_names])
+        progressed_weights = np.array([PROGRESSION_WEIGHTS[n] for n in progressed_names])
+        sun_col = natal_names.index("Sun")
+
+        for idx, event in enumerate(events):
+            point_weights = _category_weights(event.category)
+
+            transit = np.array([session.longitude(event.jd_ut, PLANETS[n]) for n in transit_names])
+            separation = _separation(points[:, :, None], transit[None, None, :])
+            weight = point_weights[:, None, None] * transit_weights[None, :, None]
+            self._add(idx, "transit", POINT_NAMES, transit_names, ("conjunction",), separation[..., None], TRANSIT_ORB, weight)
+            # quadraturas só ao ASC e ao MC; a do eixo oposto seria a mesma
+            orb = np.abs(separation[:, :2, :, None] - 90.0)
+            self._add(idx, "transit", POINT_NAMES[:2], transit_names, ("square",), orb, TRANSIT_ORB, weight[:2])
+
+            prog_start = jd_candidates[0] + (event.jd_ut - jd_candidates[0]) / PROGRESSION_DAYS_PER_YEAR
+            prog_end = jd_candidates[-1] + (event.jd_ut - jd_candidates[-1]) / PROGRESSION_DAYS_PER_YEAR
+            progressed = _interpolated_longitudes(session, natal_names, prog_start, prog_end, fractions)
+            prog_cols = [natal_names.index(n) for n in progressed_names]
+            orb = _separation(points[:, :, None], progressed[:, None, prog_cols])[..., None]
+            weight = point_weights[:, None, None] * progressed_weights[None, :, None]
+            self._add(idx, "progression", POINT_NAMES, progressed_names, ("conjunction",), orb, PROGRESSION_ORB, weight)
+
+            arc = _wrap180(progressed[:, sun_col] - natal_lons[:, sun_col])
+            directed = np.column_stack([(asc + arc) % 360.0, (mc + arc) % 360.0])
+            orb = _separation(directed[:, :, None], natal_lons[:, None, :])[..., None]
+            weight = point_weights[[0, 1]][:, None, None] * np.ones((1, len(natal_names), 1))
+            self._add(idx, "direction", ("ASC", "MC"), natal_names, ("conjunction",), orb, DIRECTION_ORB, weight)
+
+    def _add(self, idx, technique, point_names, planet_names, aspect_names, orb, max_orb, weight) -> None:
+        contribution = np.where(orb <= max_orb, (1.0 - orb / max_orb) * weight, 0.0)
+        self.score += contribution.sum(axis=(1, 2, 3))
+        self._terms.append((idx, technique, point_names, planet_names, aspect_names, orb, max_orb, contribution))
+
+    def hits_for(self, row: int) -> List[RectificationHit]:
+        hits = []
+        for idx, technique, point_names, planet_names, aspect_names, orb, max_orb, contribution in self._terms:
+            for p, q, k in zip(*np.nonzero(contribution[row])):
+                hits.append(RectificationHit(
+                    event_index=idx,
+                    technique=technique,
+                    planet=planet_names[q],
+                    point=point_names[p],
+                    aspect=aspect_names[k],
+                    orb=round(float(orb[row, p, q, k]), 3),
+                    weight=round(float(contribution[row, p, q, k]), 4),
+                ))
+        hits.sort(key=lambda hit: hit.weight, reverse=True)
+        return hits
+
+
+def candidate_houses(
+    jd: np.ndarray, lat: float, lng: float, house_system: str = "P", session: Optional[EphemerisSession] = None
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(cúspides (n, 12), asc (n,), mc (n,)) no zodíaco da sessão para instantes do mesmo dia."""
+    session = session or EphemerisSession()
+    _, ascmc = swe.houses_ex(float(jd[0]), lat, lng, b"O", 0)
+    armc = ascmc[2] + SIDEREAL_RATE_DEG_PER_DAY * (jd - jd[0])
+    eps = swe.calc_ut(float(jd[len(jd) // 2]), swe.ECL_NUT)[0][0]
+    cusps, asc, mc = houses_from_armc(armc, lat, eps, house_system)
+    if not session.is_sidereal:
+        return cusps, asc, mc
+    return sidereal_houses(cusps, asc, mc, session.ayanamsa(float(jd[len(jd) // 2])), house_system)
+
+
+def rectify_birth_time(
+    jd_midnight_ut: float,
+    lat: float,
+    lng: float,
+    events: Sequence[LifeEvent],
+    house_system: str = "P",
+    session: Optional[EphemerisSession] = None,
+    step_minutes: int = 1,
+    start_minute: int = 0,
+    end_minute: int = MINUTES_PER_DAY,
+    top: int = 5,
+    min_separation_minutes: int = 15,
+) -> List[RectificationCandidate]:
+    """Melhores horários de nascimento entre ``start_minute`` e ``end_minute`` do dia local.
+
+    ``jd_midnight_ut`` é a meia-noite local em UT. Candidatos vizinhos têm
+    scores quase iguais, então o resultado guarda só o melhor de cada janela
+    de ``min_separation_minutes``.
+    """
+    session = session or EphemerisSession()
+    minutes = np.arange(start_minute, end_minute, step_minutes)
+    jd = jd_midnight_ut + minutes / MINUTES_PER_DAY
+    cusps, asc, mc = candidate_houses(jd, lat, lng, house_system, session)
+
+    fractions = (jd - jd[0]) / max(jd[-1] - jd[0], 1e-9)
+    natal_lons = _interpolated_longitudes(session, tuple(PLANETS), float(jd[0]), float(jd[-1]), fractions)
+    scan = _Scan(jd, _points(cusps, asc, mc), asc, mc, natal_lons, events, session)
+
+    chosen: List[int] = []
+    for row in np.argsort(-scan.score, kind="stable"):
+        if all(abs(int(minutes[row]) - int(minutes[other])) >= min_separation_minutes for other in chosen):
+            chosen.append(int(row))
+            if len(chosen) >= top:
+                break
+
+    return [
+        RectificationCandidate(
+            minute=int(minutes[row]),
+            jd_ut=float(jd[row]),
+            score=round(float(scan.score[row]), 4),
+            asc=round(float(asc[row]), 6),
+            mc=round(float(mc[row]), 6),
+            hits=scan.hits_for(row),
+        )
+        for row in chosen
+    ]
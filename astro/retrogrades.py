@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Dict, List, Optional
 
 import swisseph as swe
 
-from astro.utils import to_julian_day
+from astro.stations import get_station_index
+from astro.utils import from_julian_day, to_julian_day
 
 swe.set_ephe_path(".")
 
@@ -32,46 +33,38 @@ MEANINGS_PT = {
 }
 
 
-def _speed_at(dt: datetime, planet_id: int) -> float:
-    jd_ut = to_julian_day(dt)
-    result, _ = swe.calc_ut(jd_ut, planet_id)
-    return result[3]
+def retrograde_window(date_utc: datetime, planet_id: int) -> Dict[str, Optional[datetime]]:
+    """Período retrógrado (estações e sombras, em UTC) ativo em ``date_utc``."""
+    period = get_station_index().period_at(planet_id, to_julian_day(date_utc))
+    if period is None:
+        return {"is_active": False, "start": None, "end": None, "shadow_start": None, "shadow_end": None}
+    return {
+        "is_active": True,
+        "start": from_julian_day(period.station_retrograde),
+        "end": from_julian_day(period.station_direct),
+        "shadow_start": from_julian_day(period.shadow_start),
+        "shadow_end": from_julian_day(period.shadow_end),
+    }
 
 
-def _station_search(start: datetime, planet_id: int, direction: int, max_days: int = 400) -> datetime:
-    current = start
-    for _ in range(max_days):
-        speed = _speed_at(current, planet_id)
-        if speed >= 0:
-            return current
-        current += timedelta(days=direction)
-    return current
+def _date_or_none(value: Optional[datetime]) -> Optional[str]:
+    return value.strftime("%Y-%m-%d") if value else None
 
 
-def retrograde_window(date_local: datetime, planet_id: int) -> Dict[str, Optional[datetime]]:
-    speed = _speed_at(date_local, planet_id)
-    if speed >= 0:
-        return {"is_active": False, "start": None, "end": None}
-
-    start = _station_search(date_local, planet_id, direction=-1)
-    end = _station_search(date_local, planet_id, direction=1)
-    return {"is_active": True, "start": start, "end": end}
-
-
-def retrograde_alerts(date_local: datetime) -> List[Dict[str, Optional[str]]]:
+def retrograde_alerts(date_utc: datetime) -> List[Dict[str, Optional[str]]]:
     alerts = []
     for planet, planet_id in PLANET_CODES.items():
-        window = retrograde_window(date_local, planet_id)
+        window = retrograde_window(date_utc, planet_id)
         if not window["is_active"]:
             continue
         alerts.append(
             {
                 "planet": planet,
                 "is_active": True,
-                "start_date": window["start"].strftime("%Y-%m-%d") if window["start"] else None,
-                "end_date": window["end"].strftime("%Y-%m-%d") if window["end"] else None,
-                "shadow_start": None,
-                "shadow_end": None,
+                "start_date": _date_or_none(window["start"]),
+                "end_date": _date_or_none(window["end"]),
+                "shadow_start": _date_or_none(window["shadow_start"]),
+                "shadow_end": _date_or_none(window["shadow_end"]),
                 "meaning": MEANINGS_PT.get(planet, "Período de revisão e ajustes."),
             }
         )
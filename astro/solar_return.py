@@ -9,8 +9,10 @@ from core.timezone_utils import TimezoneResolutionError, resolve_timezone_offset
 
 import swisseph as swe
 
-from astro.aspects import ASPECTS, resolve_aspects
-from astro.ephemeris import AYANAMSA_MAP, compute_chart, solar_return_datetime, sun_longitude_at
+from astro.aspects import ASPECTS, compute_transit_aspects, resolve_aspects
+from astro.ephemeris import compute_chart, solar_return_datetime, solve_solar_return, sun_longitude_at
+from astro.ephemeris_session import EphemerisSession
+from astro.transit_events import AspectEvent, find_aspect_events
 from astro.i18n_ptbr import (
     aspect_to_ptbr,
     build_aspects_ptbr,
@@ -21,7 +23,7 @@ from astro.i18n_ptbr import (
     planet_key_to_ptbr,
     sign_to_ptbr,
 )
-from astro.utils import angle_diff, deg_to_sign, to_julian_day
+from astro.utils import angle_diff, deg_to_sign, from_julian_day, to_julian_day
 from services.time_utils import localize_with_zoneinfo, parse_local_datetime, to_utc
 
 
@@ -86,19 +88,13 @@ class SolarReturnInputs:
     request_id: Optional[str] = None
 
 
-def _resolve_zodiac(config: SolarReturnConfig) -> tuple[ZodiacType, int]:
+def _resolve_zodiac(config: SolarReturnConfig) -> tuple[ZodiacType, EphemerisSession]:
     zodiac_type = config.zodiac_type if config.allow_sidereal else "tropical"
-    if zodiac_type == "sidereal":
-        swe.set_sid_mode(
-            AYANAMSA_MAP.get((config.ayanamsa or "lahiri").lower(), swe.SIDM_LAHIRI)
-        )
-        return zodiac_type, swe.FLG_SIDEREAL
-    return zodiac_type, 0
+    return zodiac_type, EphemerisSession.create(zodiac_type, config.ayanamsa)
 
 
-def _sun_longitude(jd_ut: float, flags: int) -> float:
-    result, _ = swe.calc_ut(jd_ut, swe.SUN, flags)
-    return result[0] % 360.0
+def _sun_longitude(jd_ut: float, session: EphemerisSession) -> float:
+    return session.longitude(jd_ut, swe.SUN)
 
 
 def compute_natal_sun_longitude(
@@ -130,8 +126,8 @@ def compute_natal_sun_longitude(
         ayanamsa=ayanamsa,
         allow_sidereal=allow_sidereal,
     )
-    _, flags = _resolve_zodiac(config)
-    lon = _sun_longitude(jd_ut, flags)
+    _, session = _resolve_zodiac(config)
+    lon = _sun_longitude(jd_ut, session)
     sign_info = deg_to_sign(lon)
 
     return {
@@ -157,12 +153,13 @@ def find_solar_return_instant(
     max_iter: int = 60,
     tolerance_degrees: float = 1e-6,
 ) -> dict:
+    """Retorno solar perto do aniversário; ``step_hours`` é mantido só por compatibilidade."""
     config = SolarReturnConfig(
         zodiac_type=zodiac_type,
         ayanamsa=ayanamsa,
         allow_sidereal=allow_sidereal,
     )
-    _, flags = _resolve_zodiac(config)
+    _, session = _resolve_zodiac(config)
 
     base_local_dt = parse_local_datetime(
         year=target_year,
@@ -175,62 +172,19 @@ def find_solar_return_instant(
     base_localized = localize_with_zoneinfo(base_local_dt, None, tz_offset_minutes)
     base_utc_dt = to_utc(base_localized.datetime_local, base_localized.tz_offset_minutes)
 
-    start_dt = base_utc_dt - timedelta(days=window_days)
-    end_dt = base_utc_dt + timedelta(days=window_days)
-
-    start_jd = to_julian_day(start_dt)
-    end_jd = to_julian_day(end_dt)
-
-    def delta(jd_ut: float) -> float:
-        lon = _sun_longitude(jd_ut, flags)
-        return (lon - natal_sun_lon + 540.0) % 360.0 - 180.0
-
-    bracket_start = start_jd
-    bracket_end = start_jd
-    step_days = step_hours / 24.0
-    prev_jd = start_jd
-    prev_delta = delta(prev_jd)
-
-    found = False
-    current_jd = start_jd + step_days
-    while current_jd <= end_jd + 1e-9:
-        current_delta = delta(current_jd)
-        if prev_delta == 0:
-            bracket_start = prev_jd
-            bracket_end = prev_jd
-            found = True
-            break
-        if (prev_delta < 0 <= current_delta) or (prev_delta > 0 >= current_delta):
-            bracket_start = prev_jd
-            bracket_end = current_jd
-            found = True
-            break
-        prev_jd = current_jd
-        prev_delta = current_delta
-        current_jd += step_days
-
-    if not found:
+    jd_ut = solve_solar_return(
+        natal_sun_lon,
+        to_julian_day(base_utc_dt),
+        position=lambda jd: session.position(jd, swe.SUN),
+        window_days=window_days,
+        max_iter=max_iter,
+        tolerance_degrees=tolerance_degrees,
+    )
+    if jd_ut is None:
         raise ValueError("Não foi possível localizar o retorno solar na janela informada.")
 
-    if bracket_start == bracket_end:
-        jd_ut = bracket_start
-    else:
-        low = bracket_start
-        high = bracket_end
-        for _ in range(max_iter):
-            mid = (low + high) / 2.0
-            mid_delta = delta(mid)
-            if abs(mid_delta) <= tolerance_degrees:
-                low = high = mid
-                break
-            if (delta(low) < 0 <= mid_delta) or (delta(low) > 0 >= mid_delta):
-                high = mid
-            else:
-                low = mid
-        jd_ut = (low + high) / 2.0
-
-    utc_dt = datetime(2000, 1, 1) + timedelta(days=jd_ut - 2451544.5)
-    lon = _sun_longitude(jd_ut, flags)
+    utc_dt = from_julian_day(jd_ut)
+    lon = _sun_longitude(jd_ut, session)
     sign_info = deg_to_sign(lon)
 
     return {
@@ -310,34 +264,34 @@ def compute_aspects(
     natal_planets: Dict[str, dict],
     aspects: Optional[Dict[str, dict]] = None,
 ) -> List[dict]:
-    aspects_found: List[dict] = []
-    aspects = aspects or resolve_aspects()
-
-    for t_name, t_data in transit_planets.items():
-        t_lon = t_data["lon"]
-
-        for n_name, n_data in natal_planets.items():
-            n_lon = n_data["lon"]
-            separation = angle_diff(t_lon, n_lon)
-
-            for aspect_name, aspect_info in aspects.items():
-                target_angle = aspect_info["angle"]
-                max_orb = aspect_info["orb"]
-                orb = abs(separation - target_angle)
-
-                if orb <= max_orb:
-                    aspects_found.append({
-                        "transit_planet": t_name,
-                        "natal_planet": n_name,
-                        "aspect": aspect_name,
-                        "exact_angle": target_angle,
-                        "actual_angle": round(separation, 4),
-                        "orb": round(orb, 4),
-                        "influence": aspect_info["influence"],
-                    })
-
-    aspects_found.sort(key=lambda x: x["orb"])
-    return aspects_found
+    return compute_transit_aspects(transit_planets, natal_planets, aspects or resolve_aspects())
+
+
+SUN_SCAN_STEP_DAYS = 10.0
+
+
+def sun_aspect_events(
+    natal_points: Dict[str, float],
+    aspects: Dict[str, dict],
+    jd_start: float,
+    jd_end: float,
+    session: Optional[EphemerisSession] = None,
+) -> List[AspectEvent]:
+    """Aspectos do Sol em trânsito aos pontos natais com pico em [jd_start, jd_end).
+
+    O Sol é sempre direto: o pico é o cruzamento de ``ponto ± ângulo`` e a
+    entrada e a saída do orbe são os cruzamentos de ``ponto ± ângulo ∓ orbe``.
+    """
+    found = find_aspect_events(
+        natal_points,
+        aspects,
+        jd_start,
+        jd_end,
+        session=session,
+        transit_planets={"Sun": swe.SUN},
+        step_days={"Sun": SUN_SCAN_STEP_DAYS},
+    )
+    return [event for event in found if jd_start <= event.peak_jd < jd_end]
 
 
 def build_interpretation_ptbr(
@@ -0,0 +1,249 @@
+"""Station and retrograde-shadow index for Mercury through Pluto.
+
+A retrograde period runs from the station retrograde (speed crosses zero going
+down) to the station direct (speed crosses zero going up). Stations are roots
+of the longitudinal speed, bracketed on a coarse grid and refined by regula
+falsi (``astro.crossings.refine_station``). The shadow runs from the last
+direct pass over the station-direct degree (shadow start) to the first direct
+pass over the station-retrograde degree after the station direct (shadow end).
+
+``StationIndex`` keeps one ``ChunkedEventIndex`` per planet, sorted by station
+retrograde, and answers point queries with ``bisect``. Periods are computed
+lazily in 10-year chunks, or loaded in one go from a file written by
+``scripts/build_event_index.py stations`` (``STATION_INDEX_PATH``).
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+import os
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
+import swisseph as swe
+
+from astro.crossings import find_crossings, refine_station
+from astro.ephemeris_tables import calc_position
+from astro.event_index import (
+    INDEX_END_YEAR,
+    INDEX_ORIGIN_JD,
+    INDEX_START_YEAR,
+    ChunkedEventIndex,
+    SharedIndex,
+    save_arrays,
+)
+
+STATION_BODIES = (
+    swe.MERCURY,
+    swe.VENUS,
+    swe.MARS,
+    swe.JUPITER,
+    swe.SATURN,
+    swe.URANUS,
+    swe.NEPTUNE,
+    swe.PLUTO,
+)
+
+SCAN_STEP_DAYS = {swe.MERCURY: 2.0, swe.VENUS: 2.0, swe.MARS: 4.0}
+DEFAULT_SCAN_STEP_DAYS = 8.0
+MAX_SHADOW_SEARCH_DAYS = 800.0
+
+CHUNK_DAYS = 3652.5
+CHUNK_MARGIN_DAYS = 400.0
+
+DEFAULT_INDEX_PATH = os.path.join("data", "stations_1800_2100.npz")
+
+
+@dataclass(frozen=True)
+class RetrogradePeriod:
+    body_id: int
+    station_retrograde: float
+    station_direct: float
+    shadow_start: float
+    shadow_end: float
+    lon_retrograde: float
+    lon_direct: float
+
+    @property
+    def jd_ut(self) -> float:
+        return self.station_retrograde
+
+    def is_retrograde(self, jd_ut: float) -> bool:
+        return self.station_retrograde <= jd_ut < self.station_direct
+
+    def in_shadow(self, jd_ut: float) -> bool:
+        return self.shadow_start <= jd_ut <= self.shadow_end
+
+    def as_row(self) -> Tuple[float, ...]:
+        return (
+            self.station_retrograde,
+            self.station_direct,
+            self.shadow_start,
+            self.shadow_end,
+            self.lon_retrograde,
+            self.lon_direct,
+        )
+
+
+def _speed_fn(body_id: int) -> Callable[[float], float]:
+    return lambda jd_ut: calc_position(jd_ut, body_id)[1]
+
+
+def find_stations(body_id: int, jd_start: float, jd_end: float) -> List[Tuple[float, int]]:
+    """Estações em [jd_start, jd_end] como (jd, direção): -1 retrógrada, +1 direta."""
+    step = SCAN_STEP_DAYS.get(body_id, DEFAULT_SCAN_STEP_DAYS)
+    first = math.floor((jd_start - INDEX_ORIGIN_JD) / step)
+    last = math.ceil((jd_end - INDEX_ORIGIN_JD) / step)
+    jds = INDEX_ORIGIN_JD + np.arange(first, last + 1) * step
+    speed = _speed_fn(body_id)
+    speeds = np.array([speed(float(jd)) for jd in jds])
+
+    stations = []
+    for idx in np.nonzero(np.signbit(speeds[:-1]) != np.signbit(speeds[1:]))[0]:
+        jd = refine_station(speed, float(jds[idx]), float(jds[idx + 1]))
+        if jd_start <= jd <= jd_end:
+            stations.append((jd, -1 if speeds[idx] >= 0 else 1))
+    return stations
+
+
+def _shadow_bound(body_id: int, target: float, anchor: float, span: float, before: bool) -> float:
+    position = lambda jd_ut: calc_position(jd_ut, body_id)
+    step = SCAN_STEP_DAYS.get(body_id, DEFAULT_SCAN_STEP_DAYS)
+    while True:
+        if before:
+            crossings = find_crossings(position, [target], anchor - span, anchor, step)
+            direct = [c.jd_ut for c in crossings if c.direction == 1]
+            if direct:
+                return direct[-1]
+        else:
+            crossings = find_crossings(position, [target], anchor, anchor + span, step)
+            direct = [c.jd_ut for c in crossings if c.direction == 1]
+            if direct:
+                return direct[0]
+        if span >= MAX_SHADOW_SEARCH_DAYS:
+            return anchor - span if before else anchor + span
+        span = min(span * 2.0, MAX_SHADOW_SEARCH_DAYS)
+
+
+def compute_retrograde_periods(body_id: int, jd_start: float, jd_end: float) -> List[RetrogradePeriod]:
+    """Períodos retrógrados cuja estação retrógrada cai em [jd_start, jd_end)."""
+    stations = find_stations(body_id, jd_start - CHUNK_MARGIN_DAYS, jd_end + CHUNK_MARGIN_DAYS)
+    periods = []
+    for (jd_sr, kind), following in zip(stations, stations[1:]):
+        if kind != -1 or following[1] != 1 or not (jd_start <= jd_sr < jd_end):
+            continue
+        jd_sd = following[0]
+        lon_sr = calc_position(jd_sr, body_id)[0]
+        lon_sd = calc_position(jd_sd, body_id)[0]
+        span = max(60.0, 3.0 * (jd_sd - jd_sr))
+        periods.append(
+            RetrogradePeriod(
+                body_id=body_id,
+                station_retrograde=jd_sr,
+                station_direct=jd_sd,
+                shadow_start=_shadow_bound(body_id, lon_sd, jd_sr, span, before=True),
+                shadow_end=_shadow_bound(body_id, lon_sr, jd_sd, span, before=False),
+                lon_retrograde=lon_sr,
+                lon_direct=lon_sd,
+            )
+        )
+    return periods
+
+
+class BodyStationIndex(ChunkedEventIndex[RetrogradePeriod]):
+    """Períodos retrógrados de um planeta, em blocos de dez anos."""
+
+    chunk_days = CHUNK_DAYS
+
+    def __init__(self, body_id: int) -> None:
+        super().__init__()
+        self.body_id = body_id
+
+    def compute_chunk(self, jd_start: float, jd_end: float) -> List[RetrogradePeriod]:
+        return compute_retrograde_periods(self.body_id, jd_start, jd_end)
+
+    def encode(self, events: List[RetrogradePeriod]) -> Dict[str, np.ndarray]:
+        return {"periods": np.array([p.as_row() for p in events], dtype=float).reshape(-1, 6)}
+
+    def decode(self, data: Mapping[str, np.ndarray]) -> List[RetrogradePeriod]:
+        return [RetrogradePeriod(self.body_id, *map(float, row)) for row in data["periods"]]
+
+
+class StationIndex:
+    """Períodos retrógrados ordenados por planeta; consultas por busca binária."""
+
+    def __init__(self) -> None:
+        self._bodies: Dict[int, BodyStationIndex] = {body: BodyStationIndex(body) for body in STATION_BODIES}
+
+    def __len__(self) -> int:
+        return sum(len(index) for index in self._bodies.values())
+
+    def _body(self, body_id: int) -> BodyStationIndex:
+        if body_id not in self._bodies:
+            raise ValueError(f"Corpo sem estações indexadas: {body_id}")
+        return self._bodies[body_id]
+
+    def _around(self, body_id: int, jd_ut: float) -> Tuple[List[RetrogradePeriod], int]:
+        index = self._body(body_id)
+        index._ensure(jd_ut - CHUNK_MARGIN_DAYS, jd_ut + CHUNK_MARGIN_DAYS)
+        periods, keys = index._sorted
+        return periods, bisect.bisect_right(keys, jd_ut)
+
+    def period_at(self, body_id: int, jd_ut: float) -> Optional[RetrogradePeriod]:
+        """Período retrógrado ativo em ``jd_ut`` (ou None)."""
+        periods, idx = self._around(body_id, jd_ut)
+        if idx and periods[idx - 1].is_retrograde(jd_ut):
+            return periods[idx - 1]
+        return None
+
+    def shadow_at(self, body_id: int, jd_ut: float) -> Optional[RetrogradePeriod]:
+        """Período cujo intervalo de sombra (pré, retro ou pós) contém ``jd_ut``."""
+        periods, idx = self._around(body_id, jd_ut)
+        for candidate in periods[max(0, idx - 3): idx + 2]:
+            if candidate.in_shadow(jd_ut):
+                return candidate
+        return None
+
+    def next_period(self, body_id: int, jd_ut: float) -> Optional[RetrogradePeriod]:
+        """Próxima estação retrógrada depois de ``jd_ut``."""
+        periods, idx = self._around(body_id, jd_ut)
+        return periods[idx] if idx < len(periods) else None
+
+    def periods_between(self, body_id: int, jd_start: float, jd_end: float) -> List[RetrogradePeriod]:
+        index = self._body(body_id)
+        index._ensure(jd_start, jd_end)
+        periods, keys = index._sorted
+        return periods[bisect.bisect_left(keys, jd_start): bisect.bisect_right(keys, jd_end)]
+
+    def build(self, start_year: int = INDEX_START_YEAR, end_year: int = INDEX_END_YEAR) -> "StationIndex":
+        for index in self._bodies.values():
+            index.build(start_year, end_year)
+        return self
+
+    def save(self, path: str) -> str:
+        arrays: Dict[str, np.ndarray] = {}
+        for body_id, index in self._bodies.items():
+            arrays.update(index.dump(f"body_{body_id}_"))
+        return save_arrays(path, arrays)
+
+    @classmethod
+    def load(cls, path: str) -> "StationIndex":
+        index = cls()
+        with np.load(path) as data:
+            for body_id, body_index in index._bodies.items():
+                body_index.restore(data, f"body_{body_id}_")
+        return index
+
+
+shared_index = SharedIndex(StationIndex, "STATION_INDEX_PATH", DEFAULT_INDEX_PATH, "station_index")
+
+
+def get_station_index() -> StationIndex:
+    """Índice compartilhado; usa o arquivo de ``STATION_INDEX_PATH`` quando existir."""
+    return shared_index.get()
+
+
+def reset_station_index() -> None:
+    shared_index.reset()
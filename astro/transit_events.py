@@ -0,0 +1,210 @@
+"""Exact-time transit aspect events.
+
+For each transiting body and natal point, an aspect of angle ``A`` and orb
+``o`` is active while ``|wrap(lon_t - (lon_n ± A))| <= o``. The edges of that
+window are crossings of ``lon_n ± A ± o`` and the exact moment is the crossing
+of ``lon_n ± A``. So each event comes from a handful of refined crossings
+instead of one chart per day.
+
+Every orb pass is reported once, with its real entry, peak and exit instants.
+A pass already in orb at the start of the requested range, or still in orb at
+its end, is followed outside the range until it closes. The search gives up
+after ``MAX_EXTENSION_DAYS``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from astro.crossings import Crossing, LongitudeTrack, minimize_separation, wrap180
+from astro.ephemeris import PLANETS
+from astro.ephemeris_session import EphemerisSession
+
+SCAN_STEP_DAYS = {"Moon": 0.25}
+DEFAULT_SCAN_STEP_DAYS = 1.0
+EXTENSION_CHUNK_DAYS = 90.0
+MAX_EXTENSION_DAYS = 4 * 365.0
+
+
+@dataclass(frozen=True)
+class AspectEvent:
+    transit_planet: str
+    natal_planet: str
+    aspect: str
+    exact_angle: float
+    influence: str
+    start_jd: float
+    peak_jd: float
+    end_jd: float
+    actual_angle: float
+    orb_at_peak: float
+    max_orb: float
+    exact_hits: Tuple[float, ...] = field(default_factory=tuple)
+
+    @property
+    def exact(self) -> bool:
+        return bool(self.exact_hits)
+
+    def to_aspect_dict(self) -> dict:
+        """Formato de ``compute_transit_aspects`` no instante de pico."""
+        return {
+            "transit_planet": self.transit_planet,
+            "natal_planet": self.natal_planet,
+            "aspect": self.aspect,
+            "exact_angle": self.exact_angle,
+            "actual_angle": round(self.actual_angle, 4),
+            "orb": round(self.orb_at_peak, 4),
+            "influence": self.influence,
+        }
+
+
+@dataclass
+class _Pass:
+    start: Optional[float]
+    end: Optional[float]
+    exacts: List[float]
+
+
+def _centers(natal_lon: float, angle: float) -> List[float]:
+    centers = []
+    for offset in (angle, -angle):
+        center = (natal_lon + offset) % 360.0
+        if not any(abs(wrap180(center - other)) < 1e-9 for other in centers):
+            centers.append(center)
+    return centers
+
+
+def _assemble_passes(
+    track: LongitudeTrack,
+    crossings: List[Crossing],
+    center: float,
+    orb: float,
+    jd_start: float,
+    jd_end: float,
+) -> List[_Pass]:
+    """Agrupa cruzamentos de (centro, centro - orbe, centro + orbe) em passagens."""
+    in_orb = abs(wrap180(track.longitude(jd_start) - center)) <= orb
+
+    passes: List[_Pass] = []
+    current = _Pass(start=None, end=None, exacts=[]) if in_orb else None
+    for crossing in crossings:
+        if crossing.target_index % 3 == 0:
+            if current is not None:
+                current.exacts.append(crossing.jd_ut)
+            continue
+        if current is None:
+            current = _Pass(start=crossing.jd_ut, end=None, exacts=[])
+        else:
+            current.end = crossing.jd_ut
+            passes.append(current)
+            current = None
+    if current is not None:
+        passes.append(current)
+
+    targets = (center, center - orb, center + orb)
+    if passes and passes[0].start is None:
+        _extend_start(track, targets, passes[0], jd_start)
+    if passes and passes[-1].end is None:
+        _extend_end(track, targets, passes[-1], jd_end)
+    return passes
+
+
+def _extend_start(track: LongitudeTrack, targets, open_pass: _Pass, jd_start: float) -> None:
+    hi = jd_start
+    while jd_start - hi < MAX_EXTENSION_DAYS:
+        lo = hi - EXTENSION_CHUNK_DAYS
+        crossings = track.crossings(targets, lo, hi)
+        earlier_exacts: List[float] = []
+        for crossing in reversed(crossings):
+            if crossing.target_index == 0:
+                earlier_exacts.append(crossing.jd_ut)
+                continue
+            open_pass.start = crossing.jd_ut
+            break
+        open_pass.exacts[:0] = sorted(earlier_exacts)
+        if open_pass.start is not None:
+            return
+        hi = lo
+    open_pass.start = hi
+
+
+def _extend_end(track: LongitudeTrack, targets, open_pass: _Pass, jd_end: float) -> None:
+    lo = jd_end
+    while lo - jd_end < MAX_EXTENSION_DAYS:
+        hi = lo + EXTENSION_CHUNK_DAYS
+        for crossing in track.crossings(targets, lo, hi):
+            if crossing.target_index == 0:
+                open_pass.exacts.append(crossing.jd_ut)
+                continue
+            open_pass.end = crossing.jd_ut
+            return
+        lo = hi
+    open_pass.end = lo
+
+
+def find_aspect_events(
+    natal_lons: Mapping[str, float],
+    aspects: Mapping[str, dict],
+    jd_start: float,
+    jd_end: float,
+    session: Optional[EphemerisSession] = None,
+    transit_planets: Optional[Mapping[str, int]] = None,
+    step_days: Optional[Mapping[str, float]] = None,
+) -> List[AspectEvent]:
+    """Eventos de aspecto (um por passagem no orbe) que tocam [jd_start, jd_end].
+
+    ``step_days`` substitui o passo da grade por planeta (ex.: passos largos
+    para os planetas lentos em janelas de décadas).
+    """
+    session = session or EphemerisSession()
+    transit_planets = transit_planets or PLANETS
+    step_days = {**SCAN_STEP_DAYS, **(step_days or {})}
+    events: List[AspectEvent] = []
+
+    for t_name, body_id in transit_planets.items():
+        def position(jd_ut: float, _body_id: int = body_id) -> Tuple[float, float]:
+            return session.position(jd_ut, _body_id)
+
+        step = step_days.get(t_name, DEFAULT_SCAN_STEP_DAYS)
+        track = LongitudeTrack(position, step, origin=jd_start)
+
+        combos = []
+        targets: List[float] = []
+        for n_name, n_lon in natal_lons.items():
+            for aspect_name, aspect_info in aspects.items():
+                orb = float(aspect_info["orb"])
+                for center in _centers(float(n_lon), float(aspect_info["angle"])):
+                    combos.append((n_name, float(n_lon), aspect_name, aspect_info, center, orb))
+                    targets.extend((center, center - orb, center + orb))
+
+        by_combo: Dict[int, List[Crossing]] = {}
+        for crossing in track.crossings(targets, jd_start, jd_end):
+            by_combo.setdefault(crossing.target_index // 3, []).append(crossing)
+
+        for idx, (n_name, n_lon, aspect_name, aspect_info, center, orb) in enumerate(combos):
+            for orb_pass in _assemble_passes(track, by_combo.get(idx, []), center, orb, jd_start, jd_end):
+                if orb_pass.exacts:
+                    peak = orb_pass.exacts[0]
+                else:
+                    peak = minimize_separation(position, center, orb_pass.start, orb_pass.end)
+                peak_lon = track.longitude(peak)
+                events.append(
+                    AspectEvent(
+                        transit_planet=t_name,
+                        natal_planet=n_name,
+                        aspect=aspect_name,
+                        exact_angle=float(aspect_info["angle"]),
+                        influence=aspect_info.get("influence", ""),
+                        start_jd=orb_pass.start,
+                        peak_jd=peak,
+                        end_jd=orb_pass.end,
+                        actual_angle=abs(wrap180(peak_lon - n_lon)),
+                        orb_at_peak=0.0 if orb_pass.exacts else abs(wrap180(peak_lon - center)),
+                        max_orb=orb,
+                        exact_hits=tuple(orb_pass.exacts),
+                    )
+                )
+
+    events.sort(key=lambda item: (item.peak_jd, item.transit_planet, item.natal_planet))
+    return events
@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 
 ZODIAC_SIGNS = [
     "Aries", "Taurus", "Gemini", "Cancer",
@@ -20,7 +20,7 @@ SIGN_PT = dict(zip(ZODIAC_SIGNS, ZODIAC_SIGNS_PT))
 def to_julian_day(dt: datetime) -> float:
     year = dt.year
     month = dt.month
-    day = dt.day + (dt.hour + dt.minute / 60.0 + dt.second / 3600.0) / 24.0
+    day = dt.day + (dt.hour + dt.minute / 60.0 + (dt.second + dt.microsecond / 1e6) / 3600.0) / 24.0
 
     if month <= 2:
         year -= 1
@@ -33,6 +33,11 @@ def to_julian_day(dt: datetime) -> float:
     return jd
 
 
+def from_julian_day(jd_ut: float) -> datetime:
+    """Inverso de ``to_julian_day`` (datetime UTC ingênuo)."""
+    return datetime(2000, 1, 1) + timedelta(days=jd_ut - 2451544.5)
+
+
 def deg_to_sign(lon: float) -> dict:
     lon = lon % 360
     sign_index = int(lon / 30)
@@ -0,0 +1,111 @@
+"""Bounded worker pool for CPU-bound ephemeris work.
+
+Route handlers are ``async``; calling ``compute_chart`` and friends inline
+blocks the event loop for the whole calculation. ``run_compute`` hands the call
+to a shared executor instead, so health checks, cache hits and DB lookups keep
+being served while charts are computed.
+
+The number of jobs admitted at once (running + waiting) is bounded. When the
+pool is saturated the request fails fast with 503 instead of piling up.
+
+Configuration:
+- ``COMPUTE_EXECUTOR``: ``thread`` (default) or ``process``. Processes use every
+  core; threads share the in-process sky cache and ephemeris table mapping.
+
+In ``process`` mode the callable and its arguments are pickled, so every
+``run_compute`` target is a module-level function (no closures or bound
+methods of lock-holding objects) that returns its result; changes it makes to
+objects or caches stay in the worker process.
+- ``COMPUTE_POOL_SIZE``: number of workers (default: CPU count, max 8).
+- ``COMPUTE_QUEUE_SIZE``: extra jobs allowed to wait for a worker (default 32).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+from fastapi import HTTPException
+
+logger = logging.getLogger("astro-api")
+
+T = TypeVar("T")
+
+_executor: Optional[Executor] = None
+_slots: Optional[threading.BoundedSemaphore] = None
+_lock = threading.Lock()
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return max(1, int(os.getenv(name, default)))
+    except (TypeError, ValueError):
+        return default
+
+
+def _executor_kind() -> str:
+    kind = os.getenv("COMPUTE_EXECUTOR", "thread").strip().lower()
+    return kind if kind in {"thread", "process"} else "thread"
+
+
+def _init_process_worker() -> None:
+    from astro.ephemeris_tables import load_ephemeris_table
+
+    load_ephemeris_table()
+
+
+def get_compute_executor() -> Executor:
+    """Create (once) and return the shared executor."""
+    global _executor, _slots
+    with _lock:
+        if _executor is None:
+            workers = _env_int("COMPUTE_POOL_SIZE", min(os.cpu_count() or 1, 8))
+            queue_size = _env_int("COMPUTE_QUEUE_SIZE", 32)
+            kind = _executor_kind()
+            if kind == "process":
+                _executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_process_worker)
+            else:
+                _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="astro-compute")
+            _slots = threading.BoundedSemaphore(workers + queue_size)
+            logger.info(
+                "compute_executor_started",
+                extra={"kind": kind, "workers": workers, "queue_size": queue_size},
+            )
+        return _executor
+
+
+def shutdown_compute_executor(wait: bool = True) -> None:
+    """Stop the executor; the next ``run_compute`` call starts a new one."""
+    global _executor, _slots
+    with _lock:
+        executor, _executor, _slots = _executor, None, None
+    if executor is not None:
+        executor.shutdown(wait=wait, cancel_futures=True)
+
+
+async def run_compute(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run ``fn(*args, **kwargs)`` in the compute pool and await its result.
+
+    ``fn`` must be picklable (module-level) and return everything the caller
+    needs; see the module docstring.
+    """
+    executor = get_compute_executor()
+    slots = _slots
+    if slots is None or not slots.acquire(blocking=False):
+        raise HTTPException(
+            status_code=503,
+            detail="Servidor ocupado com outros cálculos. Tente novamente em instantes.",
+        )
+    try:
+        future = executor.submit(functools.partial(fn, *args, **kwargs))
+    except Exception:
+        slots.release()
+        raise
+    # The slot is held until the worker finishes, even if the client gives up.
+    future.add_done_callback(lambda _: slots.release())
+    return await asyncio.wrap_future(future)
@@ -12,6 +12,7 @@ HTTP_TO_ASTRO_CODE = {
     409: "ASTRO-409",
     422: "ASTRO-422",
     500: "ASTRO-500",
+    503: "ASTRO-503",
 }
 
 
@@ -0,0 +1,92 @@
+"""Streaming responses (NDJSON or SSE) for long date ranges.
+
+Streaming is opt-in through the ``Accept`` header: ``application/x-ndjson``
+or ``text/event-stream``. The route hands over an async iterator of
+``(event, data)`` records and each record is written as soon as it is
+produced, so the time to first byte does not grow with the range and the
+server never holds the whole range in memory.
+
+- NDJSON: one ``{"event": ..., "data": ...}`` object per line.
+- SSE: ``event: <event>`` and ``data: <json>`` blocks.
+
+After the last record an ``end`` record carries the number of ``item``
+records. The status code is already sent when a failure happens mid-stream,
+so the failure becomes an ``error`` record and the stream ends.
+
+Only premium plans may stream ranges longer than the buffered cap of each
+route, up to ``STREAM_MAX_RANGE_DAYS``.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from typing import Any, AsyncIterator, Optional, Tuple
+
+from fastapi import HTTPException, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+
+logger = logging.getLogger("astro-api")
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+SSE_MEDIA_TYPE = "text/event-stream"
+STREAM_MEDIA_TYPES = (NDJSON_MEDIA_TYPE, SSE_MEDIA_TYPE)
+STREAM_MAX_RANGE_DAYS = int(os.getenv("STREAM_MAX_RANGE_DAYS", "366"))
+
+StreamRecord = Tuple[str, Any]
+
+
+def negotiate_stream(request: Request) -> Optional[str]:
+    """Tipo de mídia de streaming pedido no ``Accept`` (ou None para JSON)."""
+    accept = request.headers.get("accept", "")
+    for part in accept.split(","):
+        media_type = part.split(";")[0].strip().lower()
+        if media_type in STREAM_MEDIA_TYPES:
+            return media_type
+    return None
+
+
+def max_range_days(auth: dict, buffered_cap: int, media_type: Optional[str]) -> int:
+    """Limite de dias do intervalo: planos premium ganham ``STREAM_MAX_RANGE_DAYS`` em streaming."""
+    if media_type and auth.get("plan") == "premium":
+        return max(buffered_cap, STREAM_MAX_RANGE_DAYS)
+    return buffered_cap
+
+
+def encode_record(media_type: str, event: str, data: Any) -> str:
+    data = jsonable_encoder(data)
+    if media_type == SSE_MEDIA_TYPE:
+        return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, separators=(',', ':'))}\n\n"
+    return json.dumps({"event": event, "data": data}, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+def stream_response(
+    records: AsyncIterator[StreamRecord],
+    media_type: str,
+    request_id: Optional[str] = None,
+) -> StreamingResponse:
+    """Escreve os registros no formato pedido, um a um, seguidos de ``end``."""
+
+    async def body() -> AsyncIterator[str]:
+        count = 0
+        try:
+            async for event, data in records:
+                if event == "item":
+                    count += 1
+                yield encode_record(media_type, event, data)
+        except HTTPException as exc:
+            yield encode_record(media_type, "error", {"status_code": exc.status_code, "detail": exc.detail})
+            return
+        except Exception:
+            logger.error("stream_error", exc_info=True, extra={"request_id": request_id})
+            yield encode_record(media_type, "error", {"status_code": 500, "detail": "Erro interno durante o streaming."})
+            return
+        yield encode_record(media_type, "end", {"count": count})
+
+    return StreamingResponse(
+        body(),
+        media_type=media_type,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -1,4 +1,5 @@
-﻿import json
+﻿import asyncio
+import json
 import logging
 import os
 import time
@@ -17,6 +18,7 @@ from routes import (
     account,
     ai,
     alerts,
+    batch,
     chart,
     checkin,
     cosmic_decision,
@@ -45,6 +47,13 @@ from services.cache_flags import (
     CACHE_EPHEMERIS_ENABLED,
 )
 from core.db import get_pool_or_none
+from astro.eclipse_index import get_eclipse_index
+from astro.ephemeris_tables import load_ephemeris_table
+from astro.ingress_index import get_ingress_index
+from astro.lunation_index import get_lunation_index
+from astro.moon_index import warm_moon_index
+from astro.stations import get_station_index
+from core.compute import run_compute, shutdown_compute_executor
 
 load_dotenv()
 
@@ -115,9 +124,29 @@ app = FastAPI(
 )
 
 
+async def _warm_moon_index() -> None:
+    """Aquece o horizonte da Lua no pool de cálculo sem segurar o startup."""
+    try:
+        await run_compute(warm_moon_index, datetime.utcnow().year)
+    except Exception as exc:
+        _log("warning", "moon_index_warmup_failed", error=str(exc))
+
+
 @app.on_event("startup")
 async def startup_event() -> None:
     ai.initialize_openai_client(app)
+    table = load_ephemeris_table()
+    _log(
+        "info",
+        "ephemeris_backend",
+        backend="table" if table is not None else "live",
+        table_path=table.path if table is not None else None,
+    )
+    get_station_index()
+    get_lunation_index()
+    get_ingress_index()
+    get_eclipse_index()
+    app.state.moon_index_warmup = asyncio.create_task(_warm_moon_index())
     if CACHE_NATAL_ENABLED or CACHE_SOLAR_RETURN_ENABLED or CACHE_EPHEMERIS_ENABLED:
         pool = await get_pool_or_none()
         if pool is None:
@@ -131,6 +160,10 @@ async def startup_event() -> None:
 @app.on_event("shutdown")
 async def shutdown_event() -> None:
     await ai.shutdown_openai_client(app)
+    warmup = getattr(app.state, "moon_index_warmup", None)
+    if warmup is not None:
+        warmup.cancel()
+    shutdown_compute_executor(wait=False)
 
 
 origins = os.getenv("ALLOWED_ORIGINS", "*")
@@ -264,3 +297,4 @@ app.include_router(i18n.router, tags=["I18N"])
 app.include_router(professional.router, tags=["Professional"])
 app.include_router(synastry.router, tags=["Synastry"])
 app.include_router(forecast.router, tags=["Forecast"])
+app.include_router(batch.router, tags=["Batch"])
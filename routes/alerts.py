@@ -36,7 +36,11 @@ async def system_alerts(
     dt = datetime.strptime(date, "%Y-%m-%d").replace(hour=12, minute=0, second=0)
 
     tz_offset = get_tz_offset_minutes(dt, timezone, tz_offset_minutes, request_id=request.state.request_id)
+    return _system_alerts_payload(date, lat, lng, tz_offset)
 
+
+def _system_alerts_payload(date: str, lat: float, lng: float, tz_offset: int) -> SystemAlertsResponse:
+    """Alertas do sistema para uma data já validada e um offset já resolvido."""
     alerts = []
     mercury = get_mercury_retrograde_alert(date, lat, lng, tz_offset)
     if mercury:
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Callable, Dict, FrozenSet, Optional, Tuple
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+
+from astro.aspects import compute_transit_aspects, get_aspects_profile
+from astro.ephemeris import compute_moon_only
+from core.compute import run_compute
+from core.limits import check_and_inc
+from schemas.batch import BatchItemResult, BatchRequest, BatchResponse, BatchSubRequest
+from services.i18n import is_pt_br
+from services.natal_context import NatalContext
+from services.time_utils import get_tz_offset_minutes, parse_date_yyyy_mm_dd
+
+from .alerts import _system_alerts_payload
+from .common import get_auth
+from .insights import _areas_activated_payload, _care_suggestion_payload, _dominant_theme_payload
+from .transits import _daily_summary_payload
+
+router = APIRouter()
+logger = logging.getLogger("astro-api")
+
+
+class _BatchContext:
+    """Fuso, mapa natal, céu de trânsito e Lua calculados uma vez para todo o lote."""
+
+    def __init__(self, body: BatchRequest, is_pt: bool, tz_offset: int, alerts_tz_offset: Optional[int]) -> None:
+        self.body = body
+        self.is_pt = is_pt
+        self.tz_offset = tz_offset
+        self.alerts_tz_offset = alerts_tz_offset
+        self.natal: Optional[NatalContext] = None
+        self.transit: Optional[Dict[str, Any]] = None
+        self.moon: Optional[Dict[str, Any]] = None
+
+    def insight_aspects(self) -> list:
+        _, aspects_config = get_aspects_profile()
+        return compute_transit_aspects(self.transit["planets"], self.natal.planets, aspects_config)
+
+
+def _dominant_theme(ctx: _BatchContext) -> Dict[str, Any]:
+    return _dominant_theme_payload(ctx.insight_aspects())
+
+
+def _areas_activated(ctx: _BatchContext) -> Dict[str, Any]:
+    return _areas_activated_payload(ctx.insight_aspects())
+
+
+def _care_suggestion(ctx: _BatchContext) -> Dict[str, Any]:
+    return _care_suggestion_payload(ctx.moon)
+
+
+def _daily_summary(ctx: _BatchContext) -> Dict[str, Any]:
+    return _daily_summary_payload(ctx.body.target_date, ctx.natal.with_transits(ctx.transit), ctx.moon)
+
+
+def _system_alerts(ctx: _BatchContext) -> Any:
+    return _system_alerts_payload(ctx.body.target_date, ctx.body.lat, ctx.body.lng, ctx.alerts_tz_offset)
+
+
+# rota -> (partes do contexto compartilhado que usa, função que monta a resposta)
+BATCH_HANDLERS: Dict[str, Tuple[FrozenSet[str], Callable[[_BatchContext], Any]]] = {
+    "/v1/insights/dominant-theme": (frozenset({"sky"}), _dominant_theme),
+    "/v1/insights/areas-activated": (frozenset({"sky"}), _areas_activated),
+    "/v1/insights/care-suggestion": (frozenset({"moon"}), _care_suggestion),
+    "/v1/daily/summary": (frozenset({"sky", "moon"}), _daily_summary),
+    "/v1/alerts/system": (frozenset({"alerts"}), _system_alerts),
+}
+
+
+def _build_shared_sky(body: BatchRequest, tz_offset: int, is_pt: bool) -> Tuple[NatalContext, Dict[str, Any]]:
+    natal = NatalContext.from_request(body, tz_offset, is_pt)
+    return natal, natal.transits_for(body.target_date)
+
+
+def _build_shared_moon(target_date: str, tz_offset: int) -> Dict[str, Any]:
+    return compute_moon_only(target_date, tz_offset_minutes=tz_offset)
+
+
+def _error_result(item: BatchSubRequest, exc: BaseException, request_id: Optional[str]) -> BatchItemResult:
+    if isinstance(exc, HTTPException):
+        return BatchItemResult(id=item.id, path=item.path, status=exc.status_code, error=str(exc.detail))
+    logger.error("batch_item_error", exc_info=exc, extra={"request_id": request_id, "path": item.path})
+    return BatchItemResult(id=item.id, path=item.path, status=500, error="Erro interno ao processar a sub-requisição.")
+
+
+async def _run_item(item: BatchSubRequest, ctx: _BatchContext, request_id: Optional[str]) -> BatchItemResult:
+    _, handler = BATCH_HANDLERS[item.path]
+    try:
+        payload = await run_compute(handler, ctx)
+    except Exception as exc:
+        return _error_result(item, exc, request_id)
+    return BatchItemResult(id=item.id, path=item.path, status=200, body=payload)
+
+
+@router.post("/v1/batch", response_model=BatchResponse)
+async def batch(
+    body: BatchRequest,
+    request: Request,
+    lang: Optional[str] = Query(None, description="Idioma (ex.: pt-BR)"),
+    auth=Depends(get_auth),
+):
+    """Executa várias rotas de leitura diária com os mesmos dados natais.
+
+    O fuso, o mapa natal, o céu de trânsito e a Lua são calculados uma vez e
+    compartilhados; cada sub-requisição conta no limite da própria rota e tem
+    status próprio no resultado. Se uma parte compartilhada falha, só as
+    sub-requisições que dependem dela recebem o erro.
+    """
+    request_id = getattr(request.state, "request_id", None)
+    results: Dict[int, BatchItemResult] = {}
+    accepted = []
+    for position, item in enumerate(body.requests):
+        if item.path not in BATCH_HANDLERS:
+            results[position] = BatchItemResult(
+                id=item.id, path=item.path, status=404, error="Rota não suportada em lote."
+            )
+            continue
+        ok, msg = check_and_inc(auth["user_id"], item.path, auth["plan"])
+        if not ok:
+            results[position] = BatchItemResult(id=item.id, path=item.path, status=429, error=msg)
+            continue
+        accepted.append((position, item))
+
+    needs = frozenset().union(*(BATCH_HANDLERS[item.path][0] for _, item in accepted))
+    if needs:
+        natal_dt = datetime(body.natal_year, body.natal_month, body.natal_day, body.natal_hour, body.natal_minute, body.natal_second)
+        tz_offset = get_tz_offset_minutes(natal_dt, body.timezone, body.tz_offset_minutes, request_id=request_id)
+        alerts_tz_offset = None
+        if "alerts" in needs:
+            y, m, d = parse_date_yyyy_mm_dd(body.target_date)
+            alerts_tz_offset = get_tz_offset_minutes(
+                datetime(y, m, d, 12, 0, 0), body.timezone, body.tz_offset_minutes, request_id=request_id
+            )
+        ctx = _BatchContext(body, is_pt_br(lang), tz_offset, alerts_tz_offset)
+
+        builders = {}
+        if "sky" in needs:
+            builders["sky"] = run_compute(_build_shared_sky, body, tz_offset, ctx.is_pt)
+        if "moon" in needs:
+            builders["moon"] = run_compute(_build_shared_moon, body.target_date, tz_offset)
+        built = await asyncio.gather(*builders.values(), return_exceptions=True)
+        failed: Dict[str, BaseException] = {}
+        for part, value in zip(builders, built):
+            if isinstance(value, BaseException):
+                failed[part] = value
+            elif part == "sky":
+                ctx.natal, ctx.transit = value
+            else:
+                ctx.moon = value
+
+        runnable = []
+        for position, item in accepted:
+            parts = BATCH_HANDLERS[item.path][0]
+            failure = next((failed[part] for part in sorted(parts) if part in failed), None)
+            if failure is not None:
+                results[position] = _error_result(item, failure, request_id)
+            else:
+                runnable.append((position, item))
+        done = await asyncio.gather(*(_run_item(item, ctx, request_id) for _, item in runnable))
+        for (position, _), result in zip(runnable, done):
+            results[position] = result
+
+    return BatchResponse(results=[results[position] for position in range(len(body.requests))])
@@ -1,13 +1,15 @@
 from __future__ import annotations
+import asyncio
 import logging
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Any, Dict, List, Optional
 from fastapi import APIRouter, Depends, Request, Query, HTTPException
 
 from .common import get_auth
-from schemas.chart import NatalChartRequest, RenderDataRequest
+from schemas.chart import AstrocartographyRequest, NatalChartRequest, RectificationRequest, RenderDataRequest
 from schemas.transits import TransitsRequest
 from core.cache import cache
+from core.compute import run_compute
 from services.cache_flags import CACHE_NATAL_ENABLED
 from services.cache_keys import ENGINE_VERSION, compute_input_hash, build_period
 from services.chart_store import (
@@ -19,16 +21,20 @@ from services.chart_store import (
 from core.plans import is_trial_or_premium
 from astro.ephemeris import compute_chart, compute_transits, PLANETS
 from astro.aspects import get_aspects_profile, compute_transit_aspects
+from astro.astrocartography import compute_astrocartography, encode_polyline
+from astro.ephemeris_session import EphemerisSession
+from astro.rectification import LifeEvent, rectify_birth_time
 from astro.i18n_ptbr import (
     build_planets_ptbr,
     build_houses_ptbr,
     build_aspects_ptbr,
+    aspect_to_ptbr,
     planet_key_to_ptbr,
     sign_to_ptbr,
     format_position_ptbr,
     sign_for_longitude
 )
-from astro.utils import ZODIAC_SIGNS, ZODIAC_SIGNS_PT, deg_to_sign
+from astro.utils import ZODIAC_SIGNS, ZODIAC_SIGNS_PT, deg_to_sign, to_julian_day
 from services.time_utils import get_tz_offset_minutes, build_time_metadata, parse_date_yyyy_mm_dd
 from services.astro_logic import (
     apply_sign_localization,
@@ -53,6 +59,7 @@ logger = logging.getLogger("astro-api")
 TTL_NATAL_SECONDS = 30 * 24 * 3600
 TTL_TRANSITS_SECONDS = 6 * 3600
 TTL_RENDER_SECONDS = 30 * 24 * 3600
+TTL_ASTROCARTOGRAPHY_SECONDS = 30 * 24 * 3600
 
 @router.post("/v1/chart/natal")
 async def natal(
@@ -105,7 +112,8 @@ async def natal(
         cached = cache.get(cache_key)
         if cached: return cached
 
-        chart = compute_chart(
+        chart = await run_compute(
+            compute_chart,
             year=body.natal_year, month=body.natal_month, day=body.natal_day,
             hour=body.natal_hour, minute=body.natal_minute, second=body.natal_second,
             lat=body.lat, lng=body.lng, tz_offset_minutes=tz_offset,
@@ -149,6 +157,8 @@ async def natal(
 
         cache.set(cache_key, chart, ttl_seconds=TTL_NATAL_SECONDS)
         return chart
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error("natal_error", exc_info=True, extra={"request_id": request.state.request_id})
         raise HTTPException(status_code=500, detail=f"Erro ao calcular mapa natal: {str(e)}")
@@ -172,17 +182,20 @@ async def transits(
         cached = cache.get(cache_key)
         if cached: return cached
 
-        natal_chart = compute_chart(
-            year=body.natal_year, month=body.natal_month, day=body.natal_day,
-            hour=body.natal_hour, minute=body.natal_minute, second=body.natal_second,
-            lat=body.lat, lng=body.lng, tz_offset_minutes=tz_offset,
-            house_system=body.house_system.value, zodiac_type=body.zodiac_type.value, ayanamsa=body.ayanamsa
-        )
-
-        transit_chart = compute_transits(
-            target_year=y, target_month=m, target_day=d,
-            lat=body.lat, lng=body.lng, tz_offset_minutes=tz_offset,
-            zodiac_type=body.zodiac_type.value, ayanamsa=body.ayanamsa
+        natal_chart, transit_chart = await asyncio.gather(
+            run_compute(
+                compute_chart,
+                year=body.natal_year, month=body.natal_month, day=body.natal_day,
+                hour=body.natal_hour, minute=body.natal_minute, second=body.natal_second,
+                lat=body.lat, lng=body.lng, tz_offset_minutes=tz_offset,
+                house_system=body.house_system.value, zodiac_type=body.zodiac_type.value, ayanamsa=body.ayanamsa
+            ),
+            run_compute(
+                compute_transits,
+                target_year=y, target_month=m, target_day=d,
+                lat=body.lat, lng=body.lng, tz_offset_minutes=tz_offset,
+                zodiac_type=body.zodiac_type.value, ayanamsa=body.ayanamsa
+            ),
         )
 
         is_pt = is_pt_br(lang)
@@ -240,6 +253,8 @@ async def transits(
 
         cache.set(cache_key, response, ttl_seconds=TTL_TRANSITS_SECONDS)
         return response
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error("transits_error", exc_info=True, extra={"request_id": request.state.request_id})
         raise HTTPException(status_code=500, detail=f"Erro ao calcular trânsitos: {str(e)}")
@@ -449,3 +464,145 @@ async def interpretation_natal(
         "summary": composed.get("summary") or " ".join(sintese),
         "sections": composed.get("sections", []),
     }
+
+
+RECTIFICATION_HITS = 8
+
+
+def _rectification_payload(body: RectificationRequest, tz_offset: int) -> Dict[str, Any]:
+    y, m, d = parse_date_yyyy_mm_dd(body.birth_date)
+    midnight_utc = datetime(y, m, d) - timedelta(minutes=tz_offset)
+    events = []
+    for event in body.events:
+        ey, em, ed = parse_date_yyyy_mm_dd(event.date)
+        # eventos sem horário: meio-dia local
+        events.append(LifeEvent(to_julian_day(datetime(ey, em, ed, 12) - timedelta(minutes=tz_offset)), event.category, event.label or ""))
+
+    start, end = body.window_minutes
+    candidates = rectify_birth_time(
+        to_julian_day(midnight_utc),
+        body.lat,
+        body.lng,
+        events,
+        house_system=body.house_system.value,
+        session=EphemerisSession.create(body.zodiac_type.value, body.ayanamsa),
+        step_minutes=body.step_minutes,
+        start_minute=start,
+        end_minute=end + 1,
+        top=body.top,
+    )
+
+    def _angle(lon: float) -> Dict[str, Any]:
+        sign = sign_for_longitude(lon)
+        return {"lon": lon, "sign": sign, "sign_ptbr": sign_to_ptbr(sign), "deg_in_sign": round(lon % 30.0, 4)}
+
+    items = []
+    for candidate in candidates:
+        hits = [
+            {
+                "event_date": body.events[hit.event_index].date,
+                "category": body.events[hit.event_index].category,
+                "label": body.events[hit.event_index].label,
+                "technique": hit.technique,
+                "planet": hit.planet,
+                "planet_ptbr": planet_key_to_ptbr(hit.planet),
+                "point": hit.point,
+                "aspect": hit.aspect,
+                "aspect_ptbr": aspect_to_ptbr(hit.aspect),
+                "orb": hit.orb,
+                "weight": hit.weight,
+            }
+            for hit in candidate.hits[:RECTIFICATION_HITS]
+        ]
+        items.append({
+            "time": f"{candidate.minute // 60:02d}:{candidate.minute % 60:02d}",
+            "score": candidate.score,
+            "asc": _angle(candidate.asc),
+            "mc": _angle(candidate.mc),
+            "hit_count": len(candidate.hits),
+            "hits": hits,
+        })
+
+    return {
+        "birth_date": body.birth_date,
+        "window": {"start": body.window_start, "end": body.window_end, "step_minutes": body.step_minutes},
+        "candidates_scanned": len(range(start, end + 1, body.step_minutes)),
+        "candidates": items,
+        "metadados": build_time_metadata(body.timezone, tz_offset, datetime(y, m, d, 12)),
+    }
+
+
+@router.post("/v1/chart/rectification")
+async def rectification(body: RectificationRequest, request: Request, auth=Depends(get_auth)):
+    """Sugere horários de nascimento a partir de eventos de vida.
+
+    Varre o dia minuto a minuto (ou ``step_minutes``) pontuando trânsitos,
+    progressões e arcos solares sobre ângulos e cúspides de cada candidato.
+    """
+    start, end = body.window_minutes
+    if end < start:
+        raise HTTPException(status_code=422, detail="window_end deve ser posterior a window_start.")
+    y, m, d = parse_date_yyyy_mm_dd(body.birth_date)
+    tz_offset = get_tz_offset_minutes(
+        datetime(y, m, d, 12), body.timezone, body.tz_offset_minutes, request_id=getattr(request.state, "request_id", None)
+    )
+    return await run_compute(_rectification_payload, body, tz_offset)
+
+
+ASTROCARTOGRAPHY_KIND_PTBR = {"MC": "Meio do Céu", "IC": "Fundo do Céu", "ASC": "Ascendente", "DSC": "Descendente"}
+
+
+def _astrocartography_lines(body: AstrocartographyRequest, jd_ut: float, names: List[str]) -> Dict[str, Any]:
+    astro_map = compute_astrocartography(jd_ut, names, body.method, body.lat_step, body.lat_limit)
+    lines = []
+    for line in astro_map.lines:
+        if body.polyline_format == "encoded":
+            segments: List[Any] = [encode_polyline(segment) for segment in line.segments]
+        else:
+            segments = [[[round(lat, 5), round(lng, 5)] for lat, lng in segment] for segment in line.segments]
+        lines.append({
+            "planet": line.planet,
+            "planet_ptbr": planet_key_to_ptbr(line.planet),
+            "kind": line.kind,
+            "kind_ptbr": ASTROCARTOGRAPHY_KIND_PTBR[line.kind],
+            "segments": segments,
+            "point_count": line.point_count,
+        })
+    return {
+        "jd_ut": round(jd_ut, 8),
+        "gst_deg": round(astro_map.gst, 6),
+        "method": body.method,
+        "lat_step": body.lat_step,
+        "lat_limit": body.lat_limit,
+        "polyline_format": body.polyline_format,
+        "lines": lines,
+    }
+
+
+@router.post("/v1/chart/astrocartography")
+async def astrocartography(body: AstrocartographyRequest, request: Request, auth=Depends(get_auth)):
+    """Linhas de astrocartografia (ASC, DSC, MC e IC de cada planeta) do instante natal.
+
+    As linhas só dependem do instante em UT; o cache é compartilhado por essa
+    impressão digital, independente de usuário, local e zodíaco.
+    """
+    names = body.planets or list(PLANETS)
+    unknown = [name for name in names if name not in PLANETS]
+    if unknown:
+        raise HTTPException(status_code=422, detail=f"Planetas desconhecidos: {', '.join(unknown)}.")
+
+    dt = datetime(body.natal_year, body.natal_month, body.natal_day,
+                  body.natal_hour, body.natal_minute, body.natal_second)
+    tz_offset = get_tz_offset_minutes(dt, body.timezone, body.tz_offset_minutes,
+                                      strict=body.strict_timezone, request_id=getattr(request.state, "request_id", None))
+    jd_ut = to_julian_day(dt - timedelta(minutes=tz_offset))
+
+    cache_key = (
+        f"astrocartography:{jd_ut:.8f}:{body.method}:{body.lat_step}:{body.lat_limit}:"
+        f"{body.polyline_format}:{','.join(names)}"
+    )
+    payload = cache.get(cache_key)
+    if payload is None:
+        payload = await run_compute(_astrocartography_lines, body, jd_ut, names)
+        cache.set(cache_key, payload, ttl_seconds=TTL_ASTROCARTOGRAPHY_SECONDS)
+    return {**payload, "metadados": build_time_metadata(body.timezone, tz_offset, dt)}
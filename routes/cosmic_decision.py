@@ -1,15 +1,24 @@
 from __future__ import annotations
 
-from datetime import datetime
+import asyncio
+from datetime import datetime, timedelta
 from typing import Any, Dict, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Request
 
 from astro.ephemeris import compute_chart, compute_transits
-from schemas.cosmic import CosmicDecisionRequest, CosmicDecisionResponse
-from services.cosmic_decision_engine import analyze_context
+from core.compute import run_compute
+from astro.utils import from_julian_day, to_julian_day
+from schemas.cosmic import (
+    CosmicDecisionRequest,
+    CosmicDecisionResponse,
+    CosmicElectionRequest,
+    CosmicElectionResponse,
+    CosmicElectionWindow,
+)
+from services.cosmic_decision_engine import analyze_context, classify_question, search_election_windows
 from services.life_cycles import detect_life_timeline
-from services.time_utils import get_tz_offset_minutes
+from services.time_utils import get_tz_offset_minutes, parse_date_yyyy_mm_dd
 
 from .common import get_auth
 
@@ -87,47 +96,50 @@ async def cosmic_decision(body: CosmicDecisionRequest, request: Request, auth=De
             request_id=getattr(request.state, "request_id", None),
         )
 
-        user_chart = compute_chart(
-            year=body.natal_year,
-            month=body.natal_month,
-            day=body.natal_day,
-            hour=body.natal_hour,
-            minute=body.natal_minute,
-            second=body.natal_second,
-            lat=body.lat,
-            lng=body.lng,
-            tz_offset_minutes=tz_offset,
-            house_system=body.house_system.value,
-            zodiac_type=body.zodiac_type.value,
-            ayanamsa=body.ayanamsa,
-        )
-
         y, m, d = [int(part) for part in body.target_date.split("-")]
-        current_transits = compute_transits(
-            target_year=y,
-            target_month=m,
-            target_day=d,
-            lat=body.lat,
-            lng=body.lng,
-            tz_offset_minutes=tz_offset,
-            zodiac_type=body.zodiac_type.value,
-            ayanamsa=body.ayanamsa,
-        )
-
-        life_cycles = detect_life_timeline(
-            natal_year=body.natal_year,
-            natal_month=body.natal_month,
-            natal_day=body.natal_day,
-            natal_hour=body.natal_hour,
-            natal_minute=body.natal_minute,
-            natal_second=body.natal_second,
-            lat=body.lat,
-            lng=body.lng,
-            tz_offset_minutes=tz_offset,
-            house_system=body.house_system.value,
-            zodiac_type=body.zodiac_type.value,
-            ayanamsa=body.ayanamsa,
-            target_date=body.target_date,
+        user_chart, current_transits, life_cycles = await asyncio.gather(
+            run_compute(
+                compute_chart,
+                year=body.natal_year,
+                month=body.natal_month,
+                day=body.natal_day,
+                hour=body.natal_hour,
+                minute=body.natal_minute,
+                second=body.natal_second,
+                lat=body.lat,
+                lng=body.lng,
+                tz_offset_minutes=tz_offset,
+                house_system=body.house_system.value,
+                zodiac_type=body.zodiac_type.value,
+                ayanamsa=body.ayanamsa,
+            ),
+            run_compute(
+                compute_transits,
+                target_year=y,
+                target_month=m,
+                target_day=d,
+                lat=body.lat,
+                lng=body.lng,
+                tz_offset_minutes=tz_offset,
+                zodiac_type=body.zodiac_type.value,
+                ayanamsa=body.ayanamsa,
+            ),
+            run_compute(
+                detect_life_timeline,
+                natal_year=body.natal_year,
+                natal_month=body.natal_month,
+                natal_day=body.natal_day,
+                natal_hour=body.natal_hour,
+                natal_minute=body.natal_minute,
+                natal_second=body.natal_second,
+                lat=body.lat,
+                lng=body.lng,
+                tz_offset_minutes=tz_offset,
+                house_system=body.house_system.value,
+                zodiac_type=body.zodiac_type.value,
+                ayanamsa=body.ayanamsa,
+                target_date=body.target_date,
+            ),
         )
         synastry_context = _optional_synastry_context(body.optional_person_chart, request)
 
@@ -148,3 +160,69 @@ async def cosmic_decision(body: CosmicDecisionRequest, request: Request, auth=De
         raise
     except Exception as exc:
         raise HTTPException(status_code=422, detail=f"Falha ao calcular orientacao cosmica: {exc}") from exc
+
+
+@router.post("/v1/cosmic/decision/windows", response_model=CosmicElectionResponse)
+async def cosmic_decision_windows(body: CosmicElectionRequest, request: Request, auth=Depends(get_auth)):
+    """Busca eletiva: melhores janelas de horário para a pergunta dentro de ``window_days``."""
+    request_id = getattr(request.state, "request_id", None)
+    natal_dt = datetime(body.natal_year, body.natal_month, body.natal_day, body.natal_hour, body.natal_minute, body.natal_second)
+    tz_offset = get_tz_offset_minutes(natal_dt, body.timezone, body.tz_offset_minutes, strict=body.strict_timezone, request_id=request_id)
+    y, m, d = parse_date_yyyy_mm_dd(body.target_date)
+    window_start = datetime(y, m, d)
+    window_offset = get_tz_offset_minutes(window_start + timedelta(hours=12), body.timezone, body.tz_offset_minutes, request_id=request_id)
+    window_end = window_start + timedelta(days=body.window_days)
+    question_type = classify_question(body.question, body.question_type)
+
+    try:
+        user_chart = await run_compute(
+            compute_chart,
+            year=body.natal_year,
+            month=body.natal_month,
+            day=body.natal_day,
+            hour=body.natal_hour,
+            minute=body.natal_minute,
+            second=body.natal_second,
+            lat=body.lat,
+            lng=body.lng,
+            tz_offset_minutes=tz_offset,
+            house_system=body.house_system.value,
+            zodiac_type=body.zodiac_type.value,
+            ayanamsa=body.ayanamsa,
+        )
+        windows, slots_scanned = await run_compute(
+            search_election_windows,
+            user_chart,
+            question_type,
+            to_julian_day(window_start - timedelta(minutes=window_offset)),
+            to_julian_day(window_end - timedelta(minutes=window_offset)),
+            step_minutes=body.step_minutes,
+            zodiac_type=body.zodiac_type.value,
+            ayanamsa=body.ayanamsa,
+            top=body.top,
+        )
+    except Exception as exc:
+        raise HTTPException(status_code=422, detail=f"Falha ao buscar janelas: {exc}") from exc
+
+    def _local(jd_ut: float) -> str:
+        # horários caem na grade de minutos; arredonda o ruído do JD
+        local = from_julian_day(jd_ut) + timedelta(minutes=window_offset, seconds=30)
+        return local.replace(second=0, microsecond=0).isoformat()
+
+    return CosmicElectionResponse(
+        question_type=question_type,
+        window_start=window_start.isoformat(),
+        window_end=window_end.isoformat(),
+        step_minutes=body.step_minutes,
+        slots_scanned=slots_scanned,
+        windows=[
+            CosmicElectionWindow(
+                start=_local(window.start_jd),
+                end=_local(window.end_jd),
+                peak=_local(window.peak_jd),
+                score=window.score,
+                key_influences=[item.title for item in window.influences],
+            )
+            for window in windows
+        ],
+    )
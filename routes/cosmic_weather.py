@@ -7,7 +7,12 @@ from fastapi import APIRouter, Depends, Request, Query, HTTPException
 from .common import get_auth
 from schemas.cosmic_weather import CosmicWeatherResponse, CosmicWeatherRangeResponse
 from core.cache import cache
+from core.compute import run_compute
+from core.streaming import max_range_days, negotiate_stream, stream_response
 from astro.ephemeris import compute_moon_only
+from astro.eclipse_index import get_eclipse_index
+from astro.moon_index import get_moon_index
+from astro.utils import from_julian_day, to_julian_day
 from services.time_utils import get_tz_offset_minutes, build_time_metadata, parse_date_yyyy_mm_dd
 from services.astro_logic import (
     get_moon_phase_key,
@@ -26,6 +31,74 @@ DEFAULT_DATE = dt_date.today().isoformat()
 DEFAULT_LAT = -23.5505
 DEFAULT_LNG = -46.6333
 DEFAULT_TIMEZONE = "America/Sao_Paulo"
+MAX_RANGE_DAYS = 90
+
+
+def _local_time(jd_ut: float, offset_minutes: int) -> str:
+    local = from_julian_day(jd_ut) + timedelta(minutes=offset_minutes, seconds=30)
+    return local.replace(second=0, microsecond=0).isoformat()
+
+
+def _local_day_jd(date_str: str, offset_minutes: int) -> tuple[float, float]:
+    jd_start = to_julian_day(datetime.strptime(date_str, "%Y-%m-%d") - timedelta(minutes=offset_minutes))
+    return jd_start, jd_start + 1.0
+
+
+def _day_eclipses(date_str: str, offset_minutes: int) -> List[Dict[str, Any]]:
+    """Eclipses com máximo no dia local, a partir do catálogo."""
+    return [
+        {
+            "kind": event.kind,
+            "type": event.eclipse_type,
+            "label_ptbr": event.label_pt,
+            "hora_local": _local_time(event.jd_ut, offset_minutes),
+            "sign": event.sign,
+            "sign_ptbr": event.sign_pt,
+            "deg_in_sign": round(event.deg_in_sign, 2),
+            "magnitude": round(event.magnitude, 4),
+        }
+        for event in get_eclipse_index().between(*_local_day_jd(date_str, offset_minutes))
+    ]
+
+
+def _moon_day(date_str: str, offset_minutes: int) -> Dict[str, Any]:
+    """Ingressos e Lua fora de curso no dia local, a partir do índice lunar."""
+    from astro.i18n_ptbr import aspect_to_ptbr, planet_key_to_ptbr, sign_to_ptbr
+
+    jd_start, jd_end = _local_day_jd(date_str, offset_minutes)
+    index = get_moon_index()
+    start, end = index.previous(jd_start), index.previous(jd_end)
+
+    ingresses = []
+    for event in index.between(jd_start, jd_end):
+        ingresses.append({
+            "hora_local": _local_time(event.jd_ut, offset_minutes),
+            "de_signo": event.previous_sign,
+            "signo": event.sign,
+            "signo_ptbr": sign_to_ptbr(event.sign),
+        })
+    void = []
+    for event in index.void_of_course(jd_start, jd_end):
+        aspect = event.last_aspect
+        void.append({
+            "inicio": _local_time(event.void_start_jd, offset_minutes),
+            "fim": _local_time(event.jd_ut, offset_minutes),
+            "duracao_horas": round((event.jd_ut - event.void_start_jd) * 24.0, 2),
+            # sem aspecto no signo: fora de curso desde o ingresso anterior
+            "ultimo_aspecto": {
+                "planeta": aspect.planet,
+                "planeta_ptbr": planet_key_to_ptbr(aspect.planet),
+                "aspecto": aspect.aspect,
+                "aspecto_ptbr": aspect_to_ptbr(aspect.aspect),
+            } if aspect else None,
+            "signo_seguinte": event.sign,
+        })
+    return {
+        "signo_inicio": start.sign if start else None,
+        "signo_fim": end.sign if end else None,
+        "ingressos": ingresses,
+        "fora_de_curso": void,
+    }
 
 def _get_cosmic_weather_payload(
     date_str: str,
@@ -66,6 +139,8 @@ def _get_cosmic_weather_payload(
         "text": get_cosmic_weather_text(phase_key, sign),
         "top_event": None, "trigger_event": None, "secondary_events": [],
         "summary": build_daily_summary(phase_key, sign),
+        "moon_day": _moon_day(date_str, resolved_offset),
+        "eclipses": _day_eclipses(date_str, resolved_offset),
     }
 
     payload = apply_moon_localization(payload, is_pt)
@@ -102,8 +177,8 @@ async def cosmic_weather(
     if not d:
         d = dt_date.today().isoformat()
     timezone = timezone or DEFAULT_TIMEZONE
-    payload = _get_cosmic_weather_payload(d, timezone, tz_offset_minutes, auth["user_id"], lang,
-                                          request_id=getattr(request.state, "request_id", None), path=request.url.path)
+    payload = await run_compute(_get_cosmic_weather_payload, d, timezone, tz_offset_minutes, auth["user_id"], lang,
+                                request_id=getattr(request.state, "request_id", None), path=request.url.path)
     return CosmicWeatherResponse(**payload)
 
 @router.get("/v1/cosmic-weather/range", response_model=CosmicWeatherRangeResponse)
@@ -116,7 +191,11 @@ async def cosmic_weather_range(
     lang: Optional[str] = Query(None),
     auth=Depends(get_auth),
 ):
-    """Retorna o clima cósmico para um intervalo de datas."""
+    """Retorna o clima cósmico para um intervalo de datas.
+
+    Com ``Accept: application/x-ndjson`` ou ``text/event-stream`` os dias são
+    enviados um a um; planos premium podem pedir até um ano.
+    """
     if not from_:
         from_ = dt_date.today().isoformat()
     if not to:
@@ -140,21 +219,39 @@ async def cosmic_weather_range(
         raise HTTPException(status_code=400, detail="Parâmetro 'from' deve ser anterior ou igual a 'to'.")
 
     interval_days = (end_date - start_date).days + 1
-    if interval_days > 90:
-        raise HTTPException(status_code=422, detail="Range too large. Max 90 days. Use smaller windows.")
+    media_type = negotiate_stream(request)
+    max_days = max_range_days(auth, MAX_RANGE_DAYS, media_type)
+    if interval_days > max_days:
+        raise HTTPException(status_code=422, detail=f"Range too large. Max {max_days} days. Use smaller windows.")
+
+    request_id = getattr(request.state, "request_id", None)
+
+    def _ptbr(payload: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            **payload,
+            "headline_ptbr": payload.get("headline"),
+            "resumo_ptbr": payload.get("text"),
+        }
+
+    if media_type:
+        async def records():
+            yield "meta", {"from": from_, "to": to}
+            for i in range(interval_days):
+                date_str = (start_date + timedelta(days=i)).strftime("%Y-%m-%d")
+                payload = await run_compute(_get_cosmic_weather_payload, date_str, timezone, tz_offset_minutes,
+                                            auth["user_id"], lang, request_id=request_id, path=request.url.path)
+                yield "item", _ptbr(payload)
+
+        return stream_response(records(), media_type, request_id)
 
     items = []
     items_ptbr = []
     for i in range(interval_days):
         date_str = (start_date + timedelta(days=i)).strftime("%Y-%m-%d")
-        payload = _get_cosmic_weather_payload(date_str, timezone, tz_offset_minutes, auth["user_id"], lang,
-                                              request_id=getattr(request.state, "request_id", None), path=request.url.path)
+        payload = await run_compute(_get_cosmic_weather_payload, date_str, timezone, tz_offset_minutes,
+                                    auth["user_id"], lang, request_id=request_id, path=request.url.path)
         items.append(CosmicWeatherResponse(**payload))
-        items_ptbr.append({
-            **payload,
-            "headline_ptbr": payload.get("headline"),
-            "resumo_ptbr": payload.get("text"),
-        })
+        items_ptbr.append(_ptbr(payload))
 
     return CosmicWeatherRangeResponse(from_=from_, to=to, items=items, items_ptbr=items_ptbr)
 
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Optional
+from typing import Literal, Optional
 
 from fastapi import APIRouter, Depends, Query, Request
 
+from core.compute import run_compute
 from schemas.transits import TransitsRequest
 from services.life_cycles import detect_life_timeline
 from services.time_utils import get_tz_offset_minutes
@@ -19,6 +20,7 @@ async def life_timeline(
     body: TransitsRequest,
     request: Request,
     lang: Optional[str] = Query(None),
+    span: Literal["decade", "life"] = Query("decade", description="decade: 5 anos antes e depois; life: do nascimento aos 100 anos"),
     auth=Depends(get_auth),
 ):
     natal_dt = datetime(
@@ -36,7 +38,8 @@ async def life_timeline(
         strict=body.strict_timezone,
         request_id=getattr(request.state, "request_id", None),
     )
-    payload = detect_life_timeline(
+    payload = await run_compute(
+        detect_life_timeline,
         natal_year=body.natal_year,
         natal_month=body.natal_month,
         natal_day=body.natal_day,
@@ -50,5 +53,6 @@ async def life_timeline(
         zodiac_type=body.zodiac_type.value,
         ayanamsa=body.ayanamsa,
         target_date=body.target_date,
+        whole_life=span == "life",
     )
     return payload
@@ -1,18 +1,19 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
-from fastapi import APIRouter, Depends, Request
+from fastapi import APIRouter, Depends, HTTPException, Request
 
-from astro.aspects import compute_transit_aspects, resolve_aspects_config
-from astro.ephemeris import compute_chart, compute_transits
+from core.compute import run_compute
+from core.streaming import max_range_days, negotiate_stream, stream_response
 from schemas.forecast import PersonalForecastRequest, PersonalForecastResponse
 from services.astro_logic import (
     build_transit_event,
     curate_daily_events,
     get_impact_score,
 )
+from services.natal_context import NatalContext
 from services.time_utils import get_tz_offset_minutes
 
 from .common import get_auth
@@ -20,74 +21,48 @@ from .common import get_auth
 router = APIRouter()
 
 
-def _build_context(body: PersonalForecastRequest, date_str: str, tz_offset: int) -> Dict[str, Any]:
-    natal = compute_chart(
-        body.natal_year,
-        body.natal_month,
-        body.natal_day,
-        body.natal_hour,
-        body.natal_minute,
-        body.natal_second,
-        body.lat,
-        body.lng,
-        tz_offset,
-        body.house_system.value,
-        body.zodiac_type.value,
-        body.ayanamsa,
-    )
-    y, m, d = [int(p) for p in date_str.split("-")]
-    transit = compute_transits(y, m, d, body.lat, body.lng, tz_offset, body.zodiac_type.value, body.ayanamsa)
-    aspects_config, _, _ = resolve_aspects_config(body.aspectos_habilitados, body.orbes)
-    aspects = compute_transit_aspects(transit.get("planets", {}), natal.get("planets", {}), aspects_config)
-    return {"natal": natal, "transit": transit, "aspects": aspects}
+MAX_DAYS_AHEAD = 30
+TOP_EVENTS = 5
 
 
-@router.post("/v1/forecast/personal", response_model=PersonalForecastResponse)
-async def forecast_personal(body: PersonalForecastRequest, request: Request, auth=Depends(get_auth)):
-    birth_dt = datetime(
-        body.natal_year,
-        body.natal_month,
-        body.natal_day,
-        body.natal_hour,
-        body.natal_minute,
-        body.natal_second,
-    )
-    tz_offset = get_tz_offset_minutes(
-        birth_dt,
-        body.timezone,
-        body.tz_offset_minutes,
-        strict=body.strict_timezone,
-        request_id=getattr(request.state, "request_id", None),
-    )
-
-    base_date = datetime.strptime(body.target_date, "%Y-%m-%d").date()
-    daily_influences: List[Dict[str, Any]] = []
-    all_events = []
-
-    for i in range(body.days_ahead):
-        current = (base_date + timedelta(days=i)).isoformat()
-        context = _build_context(body, current, tz_offset)
-        events = [build_transit_event(a, current, context["natal"], 8.0) for a in context["aspects"]]
-        all_events.extend(events)
-        curated = curate_daily_events(events)
-        top = curated.get("top_event")
-        daily_influences.append(
+def _daily_influence(natal_context: NatalContext, current: str) -> Tuple[Dict[str, Any], List[Any]]:
+    context = natal_context.for_date(current)
+    events = [build_transit_event(a, current, context["natal"], 8.0) for a in context["aspects"]]
+    curated = curate_daily_events(events)
+    top = curated.get("top_event")
+    influence = {
+        "date": current,
+        "headline": top.copy.headline if top else "Dia de integração e ajustes progressivos.",
+        "summary": curated.get("summary", {}),
+        "highlights": [
             {
-                "date": current,
-                "headline": top.copy.headline if top else "Dia de integração e ajustes progressivos.",
-                "summary": curated.get("summary", {}),
-                "highlights": [
-                    {
-                        "title": e.copy.headline,
-                        "impact_score": e.impact_score,
-                        "severity": e.severidade,
-                    }
-                    for e in events[:4]
-                ],
+                "title": e.copy.headline,
+                "impact_score": e.impact_score,
+                "severity": e.severidade,
             }
-        )
+            for e in events[:4]
+        ],
+    }
+    return influence, events
+
+
+def _top_events(current: List[Any], events: List[Any]) -> List[Any]:
+    """Mantém só os eventos de maior impacto (ordenação estável, como no intervalo inteiro)."""
+    return sorted(current + events, key=lambda x: x.impact_score, reverse=True)[:TOP_EVENTS]
 
-    sorted_events = sorted(all_events, key=lambda x: x.impact_score, reverse=True)
+
+def _forecast_days(natal_context: NatalContext, dates: List[str]) -> Tuple[List[Dict[str, Any]], List[Any]]:
+    """Influências de todos os dias e os eventos de maior impacto do intervalo."""
+    daily_influences: List[Dict[str, Any]] = []
+    top: List[Any] = []
+    for current in dates:
+        influence, events = _daily_influence(natal_context, current)
+        daily_influences.append(influence)
+        top = _top_events(top, events)
+    return daily_influences, top
+
+
+def _forecast_summary(sorted_events: List[Any], first_days: List[Dict[str, Any]]) -> Dict[str, Any]:
     weekly_themes = [
         {
             "theme": e.copy.headline,
@@ -116,12 +91,63 @@ async def forecast_personal(body: PersonalForecastRequest, request: Request, aut
             "window_type": "opportunity" if idx % 2 == 0 else "integration",
             "note": d["headline"],
         }
-        for idx, d in enumerate(daily_influences[:4])
+        for idx, d in enumerate(first_days[:4])
     ]
+    return {
+        "weekly_themes": weekly_themes,
+        "major_cycles": major_cycles,
+        "opportunity_windows": opportunity_windows,
+    }
+
+
+@router.post("/v1/forecast/personal", response_model=PersonalForecastResponse)
+async def forecast_personal(body: PersonalForecastRequest, request: Request, auth=Depends(get_auth)):
+    """Previsão pessoal dia a dia.
+
+    Com ``Accept: application/x-ndjson`` ou ``text/event-stream`` cada dia é
+    enviado assim que calculado e o resumo vem no final; planos premium podem
+    pedir até um ano.
+    """
+    birth_dt = datetime(
+        body.natal_year,
+        body.natal_month,
+        body.natal_day,
+        body.natal_hour,
+        body.natal_minute,
+        body.natal_second,
+    )
+    tz_offset = get_tz_offset_minutes(
+        birth_dt,
+        body.timezone,
+        body.tz_offset_minutes,
+        strict=body.strict_timezone,
+        request_id=getattr(request.state, "request_id", None),
+    )
+    media_type = negotiate_stream(request)
+    max_days = max_range_days(auth, MAX_DAYS_AHEAD, media_type)
+    if body.days_ahead > max_days:
+        raise HTTPException(status_code=422, detail=f"days_ahead maximo de {max_days} dias.")
+
+    base_date = datetime.strptime(body.target_date, "%Y-%m-%d").date()
+    dates = [(base_date + timedelta(days=i)).isoformat() for i in range(body.days_ahead)]
+    natal_context = await run_compute(NatalContext.from_request, body, tz_offset, apply_profile=False)
+
+    if media_type:
+        async def records():
+            top: List[Any] = []
+            first_days: List[Dict[str, Any]] = []
+            for current in dates:
+                influence, events = await run_compute(_daily_influence, natal_context, current)
+                top = _top_events(top, events)
+                if len(first_days) < 4:
+                    first_days.append(influence)
+                yield "item", influence
+            yield "summary", _forecast_summary(top, first_days)
+
+        return stream_response(records(), media_type, getattr(request.state, "request_id", None))
 
+    daily_influences, top = await run_compute(_forecast_days, natal_context, dates)
     return PersonalForecastResponse(
         daily_influences=daily_influences,
-        weekly_themes=weekly_themes,
-        major_cycles=major_cycles,
-        opportunity_windows=opportunity_windows,
+        **_forecast_summary(top, daily_influences),
     )
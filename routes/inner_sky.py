@@ -13,8 +13,11 @@ from openai import OpenAI
 from pydantic import BaseModel
 
 from .common import get_auth
+from astro.aspects import ASPECTS_LEGACY, compute_natal_aspects
 from astro.ephemeris import compute_chart, compute_moon_only, solar_return_datetime
 from astro.i18n_ptbr import aspect_to_ptbr, planet_key_to_ptbr, sign_to_ptbr
+from astro.lunation_index import get_lunation_index
+from astro.utils import from_julian_day, to_julian_day
 from core.cache import cache
 from services.astro_logic import (
     build_daily_summary,
@@ -435,23 +438,16 @@ async def solar_return_api(
                 "deg_in_sign": round(float(deg), 2),
             })
 
-        aspects = []
-        planets = chart.get("planets", {})
-        for t_name, t_data in planets.items():
-            for n_name, n_data in planets.items():
-                if t_name == n_name:
-                    continue
-                t_lon = float(t_data.get("lon", 0.0))
-                n_lon = float(n_data.get("lon", 0.0))
-                separation = abs((t_lon - n_lon + 180) % 360 - 180)
-                if separation <= 6:
-                    aspects.append({
-                        "transit_planet": planet_key_to_ptbr(t_name),
-                        "natal_planet": planet_key_to_ptbr(n_name),
-                        "aspect": aspect_to_ptbr("conjunction"),
-                        "orb": round(separation, 2),
-                    })
-        aspects = sorted(aspects, key=lambda item: item["orb"])[:5]
+        conjunctions = compute_natal_aspects(chart.get("planets", {}), {"conjunction": ASPECTS_LEGACY["conjunction"]})
+        aspects = [
+            {
+                "transit_planet": planet_key_to_ptbr(asp["planet1"]),
+                "natal_planet": planet_key_to_ptbr(asp["planet2"]),
+                "aspect": aspect_to_ptbr("conjunction"),
+                "orb": round(asp["orb"], 2),
+            }
+            for asp in conjunctions[:5]
+        ]
 
         themes = [
             "Revisitar intenções antigas para abrir espaço ao novo.",
@@ -534,10 +530,8 @@ async def lunar_calendar(
         return cached
 
     try:
-        phases: List[Dict[str, Any]] = []
         _, days_in_month = calendar.monthrange(target_year, target_month)
         phases: List[Dict[str, Any]] = []
-        seen_types = set()
         phase_map = {
             "new": ("new_moon", "Lua Nova"),
             "full": ("full_moon", "Lua Cheia"),
@@ -568,22 +562,20 @@ async def lunar_calendar(
                     "interpretation": interpretations.get(phase_type, "O céu pede atenção gentil ao fluxo do dia."),
                 })
         else:
-            for day in range(1, days_in_month + 1):
-                date_obj = datetime(target_year, target_month, day)
-                lunation = calculate_lunation(date_obj, 0, None)
-                phase_key = lunation.phase
-                if phase_key in phase_map and phase_key not in seen_types:
-                    phase_type, phase_name = phase_map[phase_key]
-                    seen_types.add(phase_key)
-                    phases.append({
-                        "date": lunation.date,
-                        "type": phase_type,
-                        "pt_name": phase_name,
-                        "sign": lunation.moon_sign_pt,
-                        "sign_en": lunation.moon_sign,
-                        "pt_sign": lunation.moon_sign_pt,
-                        "interpretation": interpretations.get(phase_type, "O céu pede atenção gentil ao fluxo do dia."),
-                    })
+            month_start = to_julian_day(datetime(target_year, target_month, 1))
+            month_end = month_start + days_in_month
+            for event in get_lunation_index().between(month_start, month_end):
+                exact_utc = from_julian_day(event.jd_ut)
+                phases.append({
+                    "date": exact_utc.date().isoformat(),
+                    "exact_utc": exact_utc.isoformat(timespec="seconds"),
+                    "type": event.phase,
+                    "pt_name": event.phase_pt,
+                    "sign": event.moon_sign_pt,
+                    "sign_en": event.moon_sign,
+                    "pt_sign": event.moon_sign_pt,
+                    "interpretation": interpretations.get(event.phase, "O céu pede atenção gentil ao fluxo do dia."),
+                })
 
         payload = {
             "success": True,
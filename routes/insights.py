@@ -1,17 +1,20 @@
 from __future__ import annotations
 import logging
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import Any, Dict, List, Optional, Tuple
 from fastapi import APIRouter, Depends, Request, Query, HTTPException
 
 from .common import get_auth
+from core.compute import run_compute
 from schemas.insights import MercuryRetrogradeRequest
 from schemas.transits import TransitsRequest
 from schemas.solar_return import SolarReturnResponse
-from astro.ephemeris import compute_transits, compute_moon_only, compute_chart
+from astro.ephemeris import PLANETS, compute_transits, compute_moon_only, compute_chart
 from astro.aspects import get_aspects_profile, compute_transit_aspects
 from astro.i18n_ptbr import planet_key_to_ptbr, sign_to_ptbr, sign_for_longitude, build_aspects_ptbr, aspect_to_ptbr
-from astro.utils import angle_diff
+from astro.ephemeris_session import EphemerisSession
+from astro.stations import RetrogradePeriod, get_station_index
+from astro.utils import angle_diff, from_julian_day, to_julian_day
 from services.time_utils import get_tz_offset_minutes, parse_date_yyyy_mm_dd, build_time_metadata
 from services.astro_logic import (
     apply_sign_localization,
@@ -30,57 +33,25 @@ import os
 router = APIRouter()
 logger = logging.getLogger("astro-api")
 
-@router.post("/v1/insights/mercury-retrograde")
-async def mercury_retrograde(body: MercuryRetrogradeRequest, request: Request, auth=Depends(get_auth)):
-    """Informa se Mercúrio está retrógrado em uma determinada data."""
-    y, m, d = parse_date_yyyy_mm_dd(body.target_date)
-    dt_ref = datetime(y, m, d, 12, 0, 0)
-    tz_offset = get_tz_offset_minutes(dt_ref, body.timezone, body.tz_offset_minutes, request_id=request.state.request_id)
-
-    transit_chart = compute_transits(y, m, d, body.lat, body.lng, tz_offset_minutes=tz_offset,
-                                     zodiac_type=body.zodiac_type.value, ayanamsa=body.ayanamsa)
-
-    mercury = transit_chart["planets"]["Mercury"]
-    retrograde = bool(mercury.get("retrograde"))
-
-    return {
-        "date": body.target_date,
-        "status": "retrograde" if retrograde else "direct",
-        "retrograde": retrograde,
-        "speed": mercury.get("speed"),
-        "planet": "Mercury",
-        "status_ptbr": "Retrógrado" if retrograde else "Direto",
-        "planeta_ptbr": "Mercúrio",
-        "bullets_ptbr": [
-            "Revisões e checagens ganham prioridade.",
-            "Comunicações pedem clareza extra.",
-            "Ajustes de cronograma ajudam a manter o ritmo.",
-        ],
-    }
-
-@router.post("/v1/insights/dominant-theme")
-async def dominant_theme(
-    body: TransitsRequest,
-    request: Request,
-    lang: Optional[str] = Query(None, description="Idioma (ex.: pt-BR)"),
-    auth=Depends(get_auth),
-):
-    """Identifica o tema astrológico dominante para o período."""
-    natal_dt = datetime(body.natal_year, body.natal_month, body.natal_day, body.natal_hour, body.natal_minute, body.natal_second)
-    tz_offset = get_tz_offset_minutes(natal_dt, body.timezone, body.tz_offset_minutes, request_id=request.state.request_id)
-
+def _natal_transit_aspects(
+    body: TransitsRequest, tz_offset: int, is_pt: Optional[bool] = None
+) -> Tuple[Dict[str, Any], List[dict]]:
+    """Mapa natal e aspectos trânsito x natal de ``target_date`` (roda no pool de cálculo)."""
     y, m, d = parse_date_yyyy_mm_dd(body.target_date)
     natal_chart = compute_chart(body.natal_year, body.natal_month, body.natal_day, body.natal_hour, body.natal_minute, body.natal_second,
                                 body.lat, body.lng, tz_offset, body.house_system.value, body.zodiac_type.value, body.ayanamsa)
     transit_chart = compute_transits(y, m, d, body.lat, body.lng, tz_offset, body.zodiac_type.value, body.ayanamsa)
-
-    is_pt = is_pt_br(lang)
-    natal_chart = apply_sign_localization(natal_chart, is_pt)
-    transit_chart = apply_sign_localization(transit_chart, is_pt)
+    if is_pt is not None:
+        natal_chart = apply_sign_localization(natal_chart, is_pt)
+        transit_chart = apply_sign_localization(transit_chart, is_pt)
 
     _, aspects_config = get_aspects_profile()
-    aspects = compute_transit_aspects(transit_chart["planets"], natal_chart["planets"], aspects_config)
+    aspects = compute_transit_aspects(transit_chart.get("planets", {}), natal_chart.get("planets", {}), aspects_config)
+    return natal_chart, aspects
 
+
+def _dominant_theme_payload(aspects: List[dict]) -> Dict[str, Any]:
+    """Tema dominante a partir dos aspectos trânsito x natal do dia."""
     influence_counts: Dict[str, int] = {}
     for asp in aspects:
         inf = asp.get("influence", "Neutral")
@@ -109,20 +80,9 @@ async def dominant_theme(
         "sample_aspects_ptbr": build_aspects_ptbr(aspects[:3])
     }
 
-@router.post("/v1/insights/areas-activated")
-async def areas_activated(body: TransitsRequest, request: Request, auth=Depends(get_auth)):
-    """Analisa quais áreas da vida estão mais ativadas pelos trânsitos atuais."""
-    natal_dt = datetime(body.natal_year, body.natal_month, body.natal_day, body.natal_hour, body.natal_minute, body.natal_second)
-    tz_offset = get_tz_offset_minutes(natal_dt, body.timezone, body.tz_offset_minutes, request_id=request.state.request_id)
-
-    y, m, d = parse_date_yyyy_mm_dd(body.target_date)
-    natal_chart = compute_chart(body.natal_year, body.natal_month, body.natal_day, body.natal_hour, body.natal_minute, body.natal_second,
-                                body.lat, body.lng, tz_offset, body.house_system.value, body.zodiac_type.value, body.ayanamsa)
-    transit_chart = compute_transits(y, m, d, body.lat, body.lng, tz_offset, body.zodiac_type.value, body.ayanamsa)
-
-    _, aspects_config = get_aspects_profile()
-    aspects = compute_transit_aspects(transit_chart["planets"], natal_chart["planets"], aspects_config)
 
+def _areas_activated_payload(aspects: List[dict]) -> Dict[str, Any]:
+    """Áreas da vida mais ativadas pelos aspectos do dia."""
     area_map = {
         "Sun": "Identidade e propósito", "Moon": "Emoções e segurança", "Mercury": "Comunicação e estudos",
         "Venus": "Relacionamentos e afeto", "Mars": "Ação e energia", "Jupiter": "Expansão e visão",
@@ -144,14 +104,9 @@ async def areas_activated(body: TransitsRequest, request: Request, auth=Depends(
     items = sorted(scores.values(), key=lambda x: x["score"], reverse=True)[:5]
     return {"items": items, "bullets_ptbr": ["As áreas com maior score ganham prioridade.", "Busque equilíbrio entre temas ativos."]}
 
-@router.post("/v1/insights/care-suggestion")
-async def care_suggestion(body: TransitsRequest, request: Request, lang: Optional[str] = Query(None), auth=Depends(get_auth)):
-    """Fornece sugestões de autocuidado baseadas no clima astrológico."""
-    y, m, d = parse_date_yyyy_mm_dd(body.target_date)
-    natal_dt = datetime(body.natal_year, body.natal_month, body.natal_day, body.natal_hour, body.natal_minute, body.natal_second)
-    tz_offset = get_tz_offset_minutes(natal_dt, body.timezone, body.tz_offset_minutes, request_id=request.state.request_id)
 
-    moon = compute_moon_only(body.target_date, tz_offset_minutes=tz_offset)
+def _care_suggestion_payload(moon: Dict[str, Any]) -> Dict[str, Any]:
+    """Sugestão de autocuidado a partir da fase da Lua."""
     phase_key = get_moon_phase_key(moon["phase_angle_deg"])
 
     suggestion_map = {
@@ -169,6 +124,83 @@ async def care_suggestion(body: TransitsRequest, request: Request, lang: Optiona
         "bullets_ptbr": ["Respeite seus limites do dia.", "Ajustes pequenos geram consistência."]
     }
 
+
+def _mercury_status(
+    jd_ut: float, zodiac_type: str, ayanamsa: Optional[str]
+) -> Tuple[float, Optional[RetrogradePeriod], Optional[RetrogradePeriod]]:
+    """Velocidade de Mercúrio, período retrógrado e sombra em ``jd_ut`` (roda no pool de cálculo)."""
+    _, speed = EphemerisSession.create(zodiac_type, ayanamsa).position(jd_ut, PLANETS["Mercury"])
+    index = get_station_index()
+    return speed, index.period_at(PLANETS["Mercury"], jd_ut), index.shadow_at(PLANETS["Mercury"], jd_ut)
+
+
+@router.post("/v1/insights/mercury-retrograde")
+async def mercury_retrograde(body: MercuryRetrogradeRequest, request: Request, auth=Depends(get_auth)):
+    """Informa se Mercúrio está retrógrado em uma determinada data."""
+    y, m, d = parse_date_yyyy_mm_dd(body.target_date)
+    dt_ref = datetime(y, m, d, 12, 0, 0)
+    tz_offset = get_tz_offset_minutes(dt_ref, body.timezone, body.tz_offset_minutes, request_id=request.state.request_id)
+
+    jd_ut = to_julian_day(dt_ref - timedelta(minutes=tz_offset))
+    speed, period, shadow = await run_compute(_mercury_status, jd_ut, body.zodiac_type.value, body.ayanamsa)
+    retrograde = period is not None
+
+    def _day(jd: Optional[float]) -> Optional[str]:
+        return from_julian_day(jd).strftime("%Y-%m-%d") if jd is not None else None
+
+    return {
+        "date": body.target_date,
+        "status": "retrograde" if retrograde else "direct",
+        "retrograde": retrograde,
+        "speed": round(speed, 6),
+        "in_shadow": shadow is not None,
+        "start_date": _day(period.station_retrograde if period else None),
+        "end_date": _day(period.station_direct if period else None),
+        "shadow_start": _day(shadow.shadow_start if shadow else None),
+        "shadow_end": _day(shadow.shadow_end if shadow else None),
+        "planet": "Mercury",
+        "status_ptbr": "Retrógrado" if retrograde else "Direto",
+        "planeta_ptbr": "Mercúrio",
+        "bullets_ptbr": [
+            "Revisões e checagens ganham prioridade.",
+            "Comunicações pedem clareza extra.",
+            "Ajustes de cronograma ajudam a manter o ritmo.",
+        ],
+    }
+
+@router.post("/v1/insights/dominant-theme")
+async def dominant_theme(
+    body: TransitsRequest,
+    request: Request,
+    lang: Optional[str] = Query(None, description="Idioma (ex.: pt-BR)"),
+    auth=Depends(get_auth),
+):
+    """Identifica o tema astrológico dominante para o período."""
+    natal_dt = datetime(body.natal_year, body.natal_month, body.natal_day, body.natal_hour, body.natal_minute, body.natal_second)
+    tz_offset = get_tz_offset_minutes(natal_dt, body.timezone, body.tz_offset_minutes, request_id=request.state.request_id)
+
+    _, aspects = await run_compute(_natal_transit_aspects, body, tz_offset, is_pt_br(lang))
+    return _dominant_theme_payload(aspects)
+
+@router.post("/v1/insights/areas-activated")
+async def areas_activated(body: TransitsRequest, request: Request, auth=Depends(get_auth)):
+    """Analisa quais áreas da vida estão mais ativadas pelos trânsitos atuais."""
+    natal_dt = datetime(body.natal_year, body.natal_month, body.natal_day, body.natal_hour, body.natal_minute, body.natal_second)
+    tz_offset = get_tz_offset_minutes(natal_dt, body.timezone, body.tz_offset_minutes, request_id=request.state.request_id)
+
+    _, aspects = await run_compute(_natal_transit_aspects, body, tz_offset)
+    return _areas_activated_payload(aspects)
+
+@router.post("/v1/insights/care-suggestion")
+async def care_suggestion(body: TransitsRequest, request: Request, lang: Optional[str] = Query(None), auth=Depends(get_auth)):
+    """Fornece sugestões de autocuidado baseadas no clima astrológico."""
+    parse_date_yyyy_mm_dd(body.target_date)
+    natal_dt = datetime(body.natal_year, body.natal_month, body.natal_day, body.natal_hour, body.natal_minute, body.natal_second)
+    tz_offset = get_tz_offset_minutes(natal_dt, body.timezone, body.tz_offset_minutes, request_id=request.state.request_id)
+
+    moon = await run_compute(compute_moon_only, body.target_date, tz_offset_minutes=tz_offset)
+    return _care_suggestion_payload(moon)
+
 @router.post("/v1/insights/life-cycles")
 async def life_cycles(body: TransitsRequest, request: Request, auth=Depends(get_auth)):
     """Analisa ciclos de vida importantes (como Retorno de Saturno)."""
@@ -222,24 +254,7 @@ async def psychological_patterns(body: TransitsRequest, request: Request, auth=D
         strict=body.strict_timezone,
         request_id=getattr(request.state, "request_id", None),
     )
-    y, m, d = parse_date_yyyy_mm_dd(body.target_date)
-    chart = compute_chart(
-        body.natal_year,
-        body.natal_month,
-        body.natal_day,
-        body.natal_hour,
-        body.natal_minute,
-        body.natal_second,
-        body.lat,
-        body.lng,
-        tz_offset,
-        body.house_system.value,
-        body.zodiac_type.value,
-        body.ayanamsa,
-    )
-    transit_chart = compute_transits(y, m, d, body.lat, body.lng, tz_offset, body.zodiac_type.value, body.ayanamsa)
-    _, aspects_config = get_aspects_profile()
-    aspects = compute_transit_aspects(transit_chart.get("planets", {}), chart.get("planets", {}), aspects_config)
+    chart, aspects = await run_compute(_natal_transit_aspects, body, tz_offset)
 
     from services.astro_logic import calculate_distributions
     distributions = calculate_distributions(chart)
@@ -9,16 +9,20 @@ from typing import Any, Optional
 from fastapi import APIRouter, Depends, HTTPException, Request
 from pydantic import BaseModel, Field
 
-from astro.ephemeris import compute_chart, compute_moon_only, compute_transits, solar_return_datetime
+from astro.ephemeris import compute_chart, compute_moon_only, compute_transits, solar_return_datetime, solar_returns_batch
 from astro.i18n_ptbr import PLANET_PTBR, format_degree_ptbr, sign_to_ptbr, sign_for_longitude
+from astro.lunation_index import get_lunation_index
+from astro.utils import from_julian_day, to_julian_day
 from core.cache import cache
+from core.compute import run_compute
 from core.rbac import entitlements_for_role, resolve_role
 from routes.common import get_auth
-from services.lunations import calculate_lunation
 from services.progressions import calculate_secondary_progressions
 
 router = APIRouter()
 
+MAX_SOLAR_RETURN_YEARS = 120
+
 I18N_SIGNS = {
     "aries": "Áries",
     "taurus": "Touro",
@@ -119,6 +123,11 @@ class SolarReturnBody(AstroChartBody):
     target_year: int
 
 
+class SolarReturnsBatchBody(AstroChartBody):
+    start_year: int = Field(..., ge=1800, le=2100)
+    end_year: int = Field(..., ge=1800, le=2100)
+
+
 class ProgressionsBody(AstroChartBody):
     target_date: str = Field(..., description="YYYY-MM-DD")
 
@@ -224,6 +233,38 @@ async def astro_solar_return(body: SolarReturnBody, auth=Depends(get_auth)):
         _err("SOLAR_RETURN_COMPUTE_FAILED", "Não foi possível calcular a revolução solar no momento.", details=str(exc), status_code=422)
 
 
+@router.post("/v1/astro/solar-returns")
+async def astro_solar_returns(body: SolarReturnsBatchBody, auth=Depends(get_auth)):
+    if body.end_year < body.start_year:
+        _err("INVALID_YEAR_RANGE", "end_year deve ser maior ou igual a start_year.", status_code=422)
+    if body.end_year - body.start_year + 1 > MAX_SOLAR_RETURN_YEARS:
+        _err("INVALID_YEAR_RANGE", f"Intervalo máximo de {MAX_SOLAR_RETURN_YEARS} anos.", status_code=422)
+    try:
+        natal_dt = datetime(body.year, body.month, body.day, body.hour, body.minute, body.second)
+        returns = await run_compute(
+            solar_returns_batch,
+            natal_dt,
+            body.start_year,
+            body.end_year,
+            tz_offset_minutes=body.tz_offset_minutes,
+            zodiac_type=body.zodiac_type,
+            ayanamsa=body.ayanamsa,
+        )
+    except HTTPException:
+        raise
+    except Exception as exc:
+        _err("SOLAR_RETURN_COMPUTE_FAILED", "Não foi possível calcular as revoluções solares no momento.", details=str(exc), status_code=422)
+    items = [
+        {
+            "year": year,
+            "solar_return_datetime_utc": sr_utc.isoformat(),
+            "solar_return_datetime_local": (sr_utc + timedelta(minutes=body.tz_offset_minutes)).isoformat(),
+        }
+        for year, sr_utc in returns
+    ]
+    return _ok({"zodiac_type": body.zodiac_type, "items": items})
+
+
 @router.post("/v1/astro/progressions")
 async def astro_progressions(body: ProgressionsBody, auth=Depends(get_auth)):
     target = datetime.strptime(body.target_date, "%Y-%m-%d")
@@ -263,17 +304,19 @@ async def astro_lunar_phases(body: DateRangeBody, auth=Depends(get_auth)):
         return _ok(cached, meta={"cache": "hit"})
 
     base = datetime.strptime(body.date, "%Y-%m-%d")
+    jd_start = to_julian_day(base - timedelta(minutes=body.tz_offset_minutes))
     items = []
-    for i in range(30):
-        current = (base + timedelta(days=i)).strftime("%Y-%m-%d")
-        moon = compute_moon_only(current, tz_offset_minutes=body.tz_offset_minutes)
-        lunation = calculate_lunation(datetime.strptime(current, "%Y-%m-%d"), body.tz_offset_minutes, body.timezone)
+    for event in get_lunation_index().between(jd_start, jd_start + 30):
+        exact_utc = from_julian_day(event.jd_ut)
+        exact_local = exact_utc + timedelta(minutes=body.tz_offset_minutes)
         items.append({
-            "date": current,
-            "phase_code": lunation.phase_key,
-            "phase_ptbr": I18N_PHASES.get(lunation.phase_key, lunation.phase_key),
-            "moon_sign_code": str(moon.get("moon_sign", "")).lower(),
-            "moon_sign_ptbr": sign_to_ptbr(str(moon.get("moon_sign", ""))),
+            "date": exact_local.strftime("%Y-%m-%d"),
+            "exact_utc": exact_utc.isoformat(timespec="seconds"),
+            "exact_local": exact_local.isoformat(timespec="seconds"),
+            "phase_code": event.phase,
+            "phase_ptbr": I18N_PHASES.get(event.phase, event.phase),
+            "moon_sign_code": event.moon_sign.lower(),
+            "moon_sign_ptbr": sign_to_ptbr(event.moon_sign),
         })
     payload = {"items": items}
     cache.set(cache_key, payload, ttl_seconds=3600)
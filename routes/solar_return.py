@@ -8,17 +8,21 @@ from fastapi import APIRouter, Depends, Request, HTTPException
 from .common import get_auth
 from schemas.solar_return import (
     SolarReturnRequest, SolarReturnOverlayRequest, SolarReturnTimelineRequest,
-    SolarReturnPreferencias, SolarReturnOverlayReference
+    SolarReturnPreferencias, SolarReturnOverlayReference, SolarReturnRelocationRequest
 )
-from astro.solar_return import SolarReturnInputs, compute_solar_return_payload, solar_return_datetime
-from astro.ephemeris import compute_chart, compute_transits
+from astro.solar_return import SolarReturnInputs, compute_solar_return_payload, solar_return_datetime, sun_aspect_events
+from astro.ephemeris import BatchChartInput, compute_chart, compute_charts_batch, PLANETS
+from astro.ephemeris_session import EphemerisSession
 from astro.aspects import resolve_aspects_config, compute_transit_aspects
-from astro.i18n_ptbr import planet_key_to_ptbr, aspect_to_ptbr, sign_for_longitude
+from astro.i18n_ptbr import planet_key_to_ptbr, aspect_to_ptbr, house_theme_ptbr, sign_for_longitude, sign_to_ptbr
+from astro.utils import ZODIAC_SIGNS, from_julian_day, to_julian_day
+from core.compute import run_compute
 from services.time_utils import (
     get_tz_offset_minutes, build_time_metadata, localize_with_zoneinfo,
     parse_local_datetime_ptbr
 )
 from services.astro_logic import apply_solar_return_profile, get_house_for_lon, get_impact_score, TARGET_WEIGHTS
+from services.solar_return_relocation import RelocationCriteria, score_cities
 from services.cache_flags import CACHE_SOLAR_RETURN_ENABLED
 from services.cache_keys import ENGINE_VERSION, compute_input_hash, build_period
 from services.chart_store import (
@@ -97,7 +101,7 @@ async def solar_return_calculate(body: SolarReturnRequest, request: Request, aut
             except Exception as exc:
                 logger.warning("solar_return_cache_read_failed", extra={"error": str(exc)})
 
-        payload = compute_solar_return_payload(inputs)
+        payload = await run_compute(compute_solar_return_payload, inputs)
         if warnings:
             payload["warnings"] = warnings
 
@@ -123,6 +127,8 @@ async def solar_return_calculate(body: SolarReturnRequest, request: Request, aut
                 logger.warning("solar_return_cache_write_failed", extra={"error": str(exc)})
 
         return payload
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error("solar_return_calculate_error", exc_info=True)
         raise HTTPException(status_code=422, detail=str(e))
@@ -170,8 +176,10 @@ async def solar_return_timeline(body: SolarReturnTimelineRequest, request: Reque
     """Gera uma linha do tempo anual focada nos aspectos do Sol de transito com pontos do mapa natal."""
     natal_dt, warnings, time_missing = parse_local_datetime_ptbr(body.natal.data, body.natal.hora)
     localized = localize_with_zoneinfo(natal_dt, body.natal.timezone, None)
-    natal_offset = localized.tz_offset_minutes
+    return await run_compute(_timeline_payload, body, natal_dt, localized.tz_offset_minutes)
+
 
+def _timeline_payload(body: SolarReturnTimelineRequest, natal_dt: datetime, natal_offset: int) -> dict:
     prefs = body.preferencias or SolarReturnPreferencias(perfil="padrao")
     aspectos_hab, orbes, orb_max, perfil = apply_solar_return_profile(prefs)
 
@@ -192,31 +200,127 @@ async def solar_return_timeline(body: SolarReturnTimelineRequest, request: Reque
         "opposition": {"label": "Oposicao", "angle": 180},
     }
 
-    start_date = datetime(body.year, 1, 1)
-    end_date = datetime(body.year, 12, 31)
-    current = start_date
+    aspects = {key: {"angle": info["angle"], "orb": orb_max} for key, info in aspect_angles.items()}
+    year_start = datetime(body.year, 1, 1) - timedelta(minutes=natal_offset)
+    year_end = datetime(body.year + 1, 1, 1) - timedelta(minutes=natal_offset)
+    events = sun_aspect_events(
+        targets, aspects, to_julian_day(year_start), to_julian_day(year_end),
+        session=EphemerisSession.create(prefs.zodiaco.value, prefs.ayanamsa),
+    )
+
+    def _local_day(jd_ut: float) -> str:
+        return (from_julian_day(jd_ut) + timedelta(minutes=natal_offset)).strftime("%Y-%m-%d")
+
     items = []
-    from astro.utils import angle_diff
-    while current <= end_date:
-        date_str = current.strftime("%Y-%m-%d")
-        transit_chart = compute_transits(current.year, current.month, current.day, body.natal.local.lat, body.natal.local.lon, natal_offset, prefs.zodiaco.value, prefs.ayanamsa)
-        sun_lon = transit_chart["planets"]["Sun"]["lon"]
-        for alvo, natal_lon in targets.items():
-            separation = angle_diff(sun_lon, natal_lon)
-            for aspecto_key, aspect_info in aspect_angles.items():
-                orb = abs(separation - aspect_info["angle"])
-                if orb <= orb_max:
-                    score = get_impact_score("Sun", aspecto_key, alvo if alvo in TARGET_WEIGHTS else "Sun", orb, orb_max)
-                    items.append({
-                        "start": (current - timedelta(days=1)).strftime("%Y-%m-%d"),
-                        "peak": date_str,
-                        "end": (current + timedelta(days=1)).strftime("%Y-%m-%d"),
-                        "method": "solar_aspects",
-                        "trigger": f"Sol em {aspect_info['label']} com {alvo}",
-                        "tags": ["Ano", "Direcao", "Ajuste"],
-                        "score": round(score, 2),
-                    })
-        current += timedelta(days=1)
-
-    items.sort(key=lambda x: x["peak"])
+    for event in events:
+        alvo = event.natal_planet
+        score = get_impact_score("Sun", event.aspect, alvo if alvo in TARGET_WEIGHTS else "Sun", event.orb_at_peak, orb_max)
+        items.append({
+            "start": _local_day(event.start_jd),
+            "peak": _local_day(event.peak_jd),
+            "end": _local_day(event.end_jd),
+            "peak_utc": from_julian_day(event.peak_jd).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "method": "solar_aspects",
+            "trigger": f"Sol em {aspect_angles[event.aspect]['label']} com {alvo}",
+            "tags": ["Ano", "Direcao", "Ajuste"],
+            "score": round(score, 2),
+        })
+
+    items.sort(key=lambda x: x["peak_utc"])
     return {"year_timeline": items, "metadados": {"perfil": perfil, "timezone_usada": body.natal.timezone}}
+
+
+def _relocation_payload(body: SolarReturnRelocationRequest, solar_return_utc: datetime, criteria: RelocationCriteria) -> dict:
+    prefs = body.preferencias or SolarReturnPreferencias(perfil="padrao")
+    # mesmo instante de /calculate, que monta o mapa a partir do horário local em segundos
+    instant = solar_return_utc.replace(microsecond=0)
+    batch = compute_charts_batch([
+        BatchChartInput(instant, city.lat, city.lon, prefs.sistema_casas.value, prefs.zodiaco.value, prefs.ayanamsa)
+        for city in body.cidades
+    ])
+    ranked = score_cities(batch, criteria)
+
+    def _angle(lon: float) -> dict:
+        sign = sign_for_longitude(lon)
+        return {"lon": round(float(lon), 6), "sign": sign, "sign_ptbr": sign_to_ptbr(sign), "deg_in_sign": round(float(lon) % 30.0, 4)}
+
+    ranking = []
+    for rank, item in enumerate(ranked[:body.limit], start=1):
+        city = body.cidades[item.index]
+        local = None
+        if city.timezone:
+            aware = instant.replace(tzinfo=dt_timezone.utc).astimezone(ZoneInfo(city.timezone))
+            local = aware.replace(tzinfo=None).isoformat()
+        entry = {
+            "rank": rank,
+            "index": item.index,
+            "id": city.id,
+            "nome": city.nome,
+            "lat": city.lat,
+            "lon": city.lon,
+            "score": item.score,
+            "solar_return_local": local,
+            "asc": _angle(batch.asc[item.index]),
+            "mc": _angle(batch.mc[item.index]),
+            "casa_sol": item.sun_house,
+            "casa_sol_tema": house_theme_ptbr(item.sun_house),
+            "casa_lua": item.moon_house,
+            "casa_lua_tema": house_theme_ptbr(item.moon_house),
+            "planetas_angulares": [
+                {"planeta": c.planet, "planeta_ptbr": planet_key_to_ptbr(c.planet), "angulo": c.angle, "orbe": c.orb}
+                for c in item.angular
+            ],
+        }
+        # cidades acima do círculo polar saem em Porphyrius, sinalizadas
+        if batch.warnings[item.index]:
+            entry["sistema_casas"] = batch.house_systems[item.index]
+            entry["aviso"] = batch.warnings[item.index]
+        ranking.append(entry)
+
+    return {
+        "ano": body.ano,
+        "solar_return_utc": instant.isoformat(),
+        "total_cidades": len(body.cidades),
+        "ranking": ranking,
+        "criterios": body.criterios.model_dump(),
+    }
+
+
+@router.post("/v1/solar-return/relocation")
+async def solar_return_relocation(body: SolarReturnRelocationRequest, request: Request, auth=Depends(get_auth)):
+    """Compara a revolução solar do ano em várias cidades e ordena pelos critérios.
+
+    O instante do retorno é resolvido uma vez; por cidade só casas e ângulos são calculados.
+    """
+    criterios = body.criterios
+    if any(house < 1 or house > 12 for house in [*criterios.casas_sol, *criterios.casas_lua]):
+        raise HTTPException(status_code=422, detail="Casas devem estar entre 1 e 12.")
+    unknown = [name for name in [*criterios.planetas_angulares, *criterios.evitar_angulares] if name not in PLANETS]
+    if unknown:
+        raise HTTPException(status_code=422, detail=f"Planetas desconhecidos: {', '.join(unknown)}.")
+    sign_index = {sign.lower(): idx for idx, sign in enumerate(ZODIAC_SIGNS)}
+    unknown = [sign for sign in criterios.signos_asc if sign.lower() not in sign_index]
+    if unknown:
+        raise HTTPException(status_code=422, detail=f"Signos desconhecidos: {', '.join(unknown)}.")
+    for timezone_name in [body.natal.timezone, *(city.timezone for city in body.cidades if city.timezone)]:
+        try: ZoneInfo(timezone_name)
+        except (ZoneInfoNotFoundError, ValueError): raise HTTPException(status_code=422, detail=f"Timezone invalido: {timezone_name}.")
+
+    try: natal_dt, warnings, time_missing = parse_local_datetime_ptbr(body.natal.data, body.natal.hora)
+    except Exception: raise HTTPException(status_code=422, detail="Data natal invalida.")
+    natal_offset = localize_with_zoneinfo(natal_dt, body.natal.timezone, None).tz_offset_minutes
+    engine = os.getenv("SOLAR_RETURN_ENGINE", "v1").lower()
+    solar_return_utc = solar_return_datetime(natal_dt, body.ano, natal_offset, engine=engine)
+
+    criteria = RelocationCriteria(
+        sun_houses=tuple(criterios.casas_sol),
+        moon_houses=tuple(criterios.casas_lua),
+        favored_angular=tuple(criterios.planetas_angulares),
+        avoided_angular=tuple(criterios.evitar_angulares),
+        asc_signs=tuple(sign_index[sign.lower()] for sign in criterios.signos_asc),
+        angular_orb=criterios.orbe_angular,
+    )
+    payload = await run_compute(_relocation_payload, body, solar_return_utc, criteria)
+    if warnings:
+        payload["warnings"] = warnings
+    return payload
@@ -3,26 +3,38 @@ from __future__ import annotations
 from datetime import datetime, timedelta
 from typing import Any, Dict, List
 
+import numpy as np
 from fastapi import APIRouter, Depends, HTTPException, Request
 
 from astro.aspects import compute_transit_aspects, get_aspects_profile
-from astro.ephemeris import compute_chart, compute_transits
+from astro.ephemeris import PLANETS, BatchChartInput, compute_chart, compute_charts_batch
+from astro.ephemeris_session import EphemerisSession
 from astro.i18n_ptbr import aspect_to_ptbr, planet_key_to_ptbr
+from astro.utils import from_julian_day, to_julian_day
+from core.compute import run_compute
 from schemas.synastry import (
     SynastryAspectOut,
     SynastryCompareRequest,
     SynastryCompareResponse,
     SynastryHouseOverlayOut,
+    SynastryRankingItem,
+    SynastryRankingRequest,
+    SynastryRankingResponse,
 )
 from services.astro_logic import get_house_for_lon
 from services.interpretation_engine import get_interpretation
-from services.relationship_cycles import detect_relationship_evolution
+from services.relationship_cycles import detect_relationship_evolution, find_relationship_events
+from services.synastry_ranking import score_partners
 from services.time_utils import get_tz_offset_minutes, parse_local_datetime_ptbr
 
 from .common import get_auth
 
 router = APIRouter()
 
+TIMING_HORIZON_DAYS = 28
+# A Lua faria dezenas de passagens por mês; o timing usa do Sol a Plutão
+TIMING_PLANETS = {name: body_id for name, body_id in PLANETS.items() if name != "Moon"}
+
 
 def _normalize_time(time_str: str | None) -> str:
     if not time_str:
@@ -32,7 +44,8 @@ def _normalize_time(time_str: str | None) -> str:
     return time_str
 
 
-def _build_person_chart(person: Any, request: Request) -> Dict[str, Any]:
+def _resolve_person(person: Any, request: Request) -> Dict[str, Any]:
+    """Dados de nascimento normalizados e fuso resolvido, sem calcular o mapa."""
     birth_time = _normalize_time(person.birth_time)
     local_dt, warnings, time_missing = parse_local_datetime_ptbr(person.birth_date, birth_time)
     tz_offset = get_tz_offset_minutes(
@@ -41,8 +54,25 @@ def _build_person_chart(person: Any, request: Request) -> Dict[str, Any]:
         person.tz_offset_minutes,
         request_id=getattr(request.state, "request_id", None),
     )
+    return {
+        "name": person.name or "Pessoa",
+        "birth_date": person.birth_date,
+        "birth_time": birth_time,
+        "birth_time_precise": not time_missing,
+        "timezone": person.timezone,
+        "tz_offset_minutes": tz_offset,
+        "warnings": warnings,
+        "local_dt": local_dt,
+    }
+
+
+async def _build_person_chart(person: Any, request: Request) -> Dict[str, Any]:
+    """Dados resolvidos da pessoa e o mapa natal, calculado no pool."""
+    resolved = _resolve_person(person, request)
+    local_dt = resolved.pop("local_dt")
 
-    chart = compute_chart(
+    chart = await run_compute(
+        compute_chart,
         year=local_dt.year,
         month=local_dt.month,
         day=local_dt.day,
@@ -51,22 +81,16 @@ def _build_person_chart(person: Any, request: Request) -> Dict[str, Any]:
         second=local_dt.second,
         lat=person.lat,
         lng=person.lng,
-        tz_offset_minutes=tz_offset,
+        tz_offset_minutes=resolved["tz_offset_minutes"],
         house_system=person.house_system,
         zodiac_type=person.zodiac_type,
         ayanamsa=person.ayanamsa,
     )
+    return {**resolved, "chart": chart}
 
-    return {
-        "name": person.name or "Pessoa",
-        "birth_date": person.birth_date,
-        "birth_time": birth_time,
-        "birth_time_precise": not time_missing,
-        "timezone": person.timezone,
-        "tz_offset_minutes": tz_offset,
-        "warnings": warnings,
-        "chart": chart,
-    }
+
+def _local_day(jd_ut: float, tz_offset_minutes: int) -> str:
+    return (from_julian_day(jd_ut) + timedelta(minutes=tz_offset_minutes)).strftime("%Y-%m-%d")
 
 
 def _aspect_to_out(item: Dict[str, Any]) -> SynastryAspectOut:
@@ -154,8 +178,8 @@ def _build_compare_payload(person_a: Dict[str, Any], person_b: Dict[str, Any]) -
 @router.post("/v1/synastry/compare", response_model=SynastryCompareResponse)
 async def synastry_compare(body: SynastryCompareRequest, request: Request, auth=Depends(get_auth)):
     try:
-        person_a = _build_person_chart(body.person_a, request)
-        person_b = _build_person_chart(body.person_b, request)
+        person_a = await _build_person_chart(body.person_a, request)
+        person_b = await _build_person_chart(body.person_b, request)
         return _build_compare_payload(person_a, person_b)
     except HTTPException:
         raise
@@ -163,10 +187,81 @@ async def synastry_compare(body: SynastryCompareRequest, request: Request, auth=
         raise HTTPException(status_code=422, detail=f"Falha ao calcular sinastria: {exc}") from exc
 
 
+def _rank_partners(
+    person_a: Dict[str, Any], partners: List[Any], resolved: List[Dict[str, Any]], limit: int
+) -> List[SynastryRankingItem]:
+    """Pontua todos os parceiros de uma vez; só o topo recebe o resumo de ``_build_compare_payload``."""
+    batch = compute_charts_batch([
+        BatchChartInput(
+            instant=info["local_dt"] - timedelta(minutes=info["tz_offset_minutes"]),
+            lat=partner.lat,
+            lng=partner.lng,
+            house_system=partner.house_system,
+            zodiac_type=partner.zodiac_type,
+            ayanamsa=partner.ayanamsa,
+        )
+        for partner, info in zip(partners, resolved)
+    ])
+    planets_a = person_a["chart"]["planets"]
+    _, aspects_profile = get_aspects_profile()
+    ranked = score_partners(
+        [planets_a[name]["lon"] for name in batch.planet_names],
+        np.round(batch.lon, 6),
+        aspects_profile,
+    )
+
+    items: List[SynastryRankingItem] = []
+    for rank, scored in enumerate(ranked[:limit], start=1):
+        info = {k: v for k, v in resolved[scored.index].items() if k != "local_dt"}
+        compare = _build_compare_payload(person_a, {**info, "chart": batch.to_chart_dict(scored.index)})
+        items.append(
+            SynastryRankingItem(
+                rank=rank,
+                index=scored.index,
+                id=partners[scored.index].id,
+                name=info["name"],
+                score=scored.score,
+                harmony=scored.harmony,
+                tension=scored.tension,
+                aspect_count=scored.aspect_count,
+                overview=compare.overview,
+                strengths=compare.strengths,
+                growth_areas=compare.growth_areas,
+                key_aspects=compare.key_aspects or [],
+                warning=batch.warnings[scored.index],
+            )
+        )
+    return items
+
+
+@router.post("/v1/synastry/ranking", response_model=SynastryRankingResponse)
+async def synastry_ranking(body: SynastryRankingRequest, request: Request, auth=Depends(get_auth)):
+    """Compatibilidade de um mapa com muitos parceiros, do mais ao menos compatível.
+
+    Os mapas dos parceiros são calculados em lote e os aspectos cruzados de
+    todos saem de uma única matriz; ``limit`` controla quantos voltam com o
+    resumo de compatibilidade.
+    """
+    person_a = await _build_person_chart(body.person, request)
+    resolved = [_resolve_person(partner, request) for partner in body.partners]
+    try:
+        ranking = await run_compute(_rank_partners, person_a, body.partners, resolved, body.limit)
+    except HTTPException:
+        raise
+    except Exception as exc:
+        raise HTTPException(status_code=422, detail=f"Falha ao calcular ranking de sinastria: {exc}") from exc
+
+    return SynastryRankingResponse(
+        person={k: v for k, v in person_a.items() if k != "chart"},
+        total_partners=len(body.partners),
+        ranking=ranking,
+    )
+
+
 @router.post("/v1/synastry/deep")
 async def synastry_deep(body: SynastryCompareRequest, request: Request, auth=Depends(get_auth)):
-    person_a = _build_person_chart(body.person_a, request)
-    person_b = _build_person_chart(body.person_b, request)
+    person_a = await _build_person_chart(body.person_a, request)
+    person_b = await _build_person_chart(body.person_b, request)
     base = _build_compare_payload(person_a, person_b)
     return {
         "relationship_overview": base.relationship_overview or base.overview,
@@ -180,40 +275,50 @@ async def synastry_deep(body: SynastryCompareRequest, request: Request, auth=Dep
     }
 
 
+def _timing_phase(days_from_start: float) -> str:
+    if days_from_start <= 7:
+        return "ativação"
+    if days_from_start <= 14:
+        return "integração"
+    return "ajuste"
+
+
 @router.post("/v1/synastry/timing")
 async def synastry_timing(body: SynastryCompareRequest, request: Request, auth=Depends(get_auth)):
-    person_a = _build_person_chart(body.person_a, request)
-    person_b = _build_person_chart(body.person_b, request)
+    person_a = await _build_person_chart(body.person_a, request)
+    person_b = await _build_person_chart(body.person_b, request)
 
     local_dt, _, _ = parse_local_datetime_ptbr(person_a["birth_date"], person_a["birth_time"])
     tz_offset = person_a["tz_offset_minutes"]
     base_date = datetime.utcnow().date()
+    jd_start = to_julian_day(datetime.combine(base_date, datetime.min.time()) - timedelta(minutes=tz_offset))
+
+    _, aspects_profile = get_aspects_profile()
+    found = await run_compute(
+        find_relationship_events,
+        person_a["chart"],
+        person_b["chart"],
+        aspects_profile,
+        jd_start,
+        jd_start + TIMING_HORIZON_DAYS,
+        session=EphemerisSession.create(body.person_a.zodiac_type, body.person_a.ayanamsa),
+        transit_planets=TIMING_PLANETS,
+    )
 
     windows: List[Dict[str, Any]] = []
-    for offset in (0, 7, 14, 21):
-        date_ref = (base_date + timedelta(days=offset)).isoformat()
-        transit = compute_transits(
-            target_year=int(date_ref[:4]),
-            target_month=int(date_ref[5:7]),
-            target_day=int(date_ref[8:10]),
-            lat=body.person_a.lat,
-            lng=body.person_a.lng,
-            tz_offset_minutes=tz_offset,
-            zodiac_type=body.person_a.zodiac_type,
-            ayanamsa=body.person_a.ayanamsa,
-        )
-        _, aspects_profile = get_aspects_profile()
-        timing_aspects = compute_transit_aspects(
-            transit_planets=transit.get("planets", {}),
-            natal_planets=person_b["chart"].get("planets", {}),
-            aspects=aspects_profile,
-        )
-        highlights = [_aspect_to_out(a).model_dump() for a in timing_aspects[:4]]
+    for item in found:
+        event = item.event
+        if not jd_start <= event.peak_jd < jd_start + TIMING_HORIZON_DAYS:
+            continue
         windows.append(
             {
-                "date": date_ref,
-                "phase": "ativação" if offset <= 7 else "integração" if offset <= 14 else "ajuste",
-                "highlights": highlights,
+                "date": _local_day(event.peak_jd, tz_offset),
+                "start_date": _local_day(event.start_jd, tz_offset),
+                "end_date": _local_day(event.end_jd, tz_offset),
+                "peak_utc": from_julian_day(event.peak_jd).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "partner": item.partner,
+                "phase": _timing_phase(event.peak_jd - jd_start),
+                "highlights": [_aspect_to_out(event.to_aspect_dict()).model_dump()],
             }
         )
 
@@ -228,10 +333,11 @@ async def synastry_timing(body: SynastryCompareRequest, request: Request, auth=D
 
 @router.post("/v1/synastry/evolution")
 async def synastry_evolution(body: SynastryCompareRequest, request: Request, auth=Depends(get_auth)):
-    person_a = _build_person_chart(body.person_a, request)
-    person_b = _build_person_chart(body.person_b, request)
+    person_a = await _build_person_chart(body.person_a, request)
+    person_b = await _build_person_chart(body.person_b, request)
 
-    payload = detect_relationship_evolution(
+    payload = await run_compute(
+        detect_relationship_evolution,
         chart_a=person_a["chart"],
         chart_b=person_b["chart"],
         lat=body.person_a.lat,
@@ -7,15 +7,24 @@ from fastapi import APIRouter, Depends, Request, Query, HTTPException
 from .common import get_auth
 from schemas.transits import (
     TransitsEventsRequest, TransitEventsResponse, TransitsRequest,
-    PreferenciasPerfil, TransitsLiveRequest, DailyAnalysisPayload, DailyTransitHighlight
+    PreferenciasPerfil, TransitsLiveRequest, DailyAnalysisPayload, DailyTransitHighlight,
+    TransitEventDateRange, TransitsIngressesRequest, TransitsEclipsesRequest,
 )
 from core.cache import cache
-from astro.ephemeris import compute_chart, compute_transits
-from astro.aspects import resolve_aspects_config, compute_transit_aspects, get_aspects_profile
-from services.time_utils import get_tz_offset_minutes, build_time_metadata, parse_date_yyyy_mm_dd
+from core.compute import run_compute
+from core.streaming import max_range_days, negotiate_stream, stream_response
+from astro.ephemeris import PLANETS, compute_moon_only, compute_transits
+from astro.aspects import CompiledAspects, get_aspects_profile, resolve_aspects_config
+from astro.eclipse_index import get_eclipse_index, natal_contacts
+from astro.ephemeris_session import EphemerisSession
+from astro.event_index import INDEX_END_YEAR, INDEX_START_YEAR
+from astro.i18n_ptbr import aspect_to_ptbr, planet_key_to_ptbr
+from astro.ingress_index import compute_house_ingresses, sign_ingresses
+from astro.transit_events import find_aspect_events
+from astro.utils import deg_to_sign, from_julian_day, sign_to_pt, to_julian_day
+from services.natal_context import NatalContext
+from services.time_utils import get_tz_offset_minutes, build_time_metadata
 from services.astro_logic import (
-    apply_profile_defaults,
-    apply_sign_localization,
     build_transit_event,
     curate_daily_events,
     calculate_areas_activated,
@@ -33,6 +42,12 @@ router = APIRouter()
 logger = logging.getLogger("astro-api")
 
 TTL_TRANSITS_SECONDS = 6 * 3600
+MAX_EVENTS_RANGE_DAYS = 366
+STREAM_CHUNK_DAYS = 30
+MAX_INGRESS_RANGE_DAYS = 3660
+DEFAULT_INGRESS_PLANETS = [name for name in PLANETS if name != "Moon"]
+MAX_ECLIPSE_RANGE_DAYS = 36525
+ECLIPSE_DEFAULT_ORBS = {"conj": 3.0, "opos": 3.0}
 DEFAULT_DATE = dt_date.today().isoformat()
 DEFAULT_LAT = -23.5505
 DEFAULT_LNG = -46.6333
@@ -74,34 +89,82 @@ def _build_transits_context(
     date_override: Optional[str] = None,
     preferencias: Optional[PreferenciasPerfil] = None,
 ) -> Dict[str, Any]:
-    """Helper para construir o contexto de transitos (natal, transitos e aspectos)."""
-    target_date = date_override or body.target_date
-    target_y, target_m, target_d = parse_date_yyyy_mm_dd(target_date)
+    """Helper para construir o contexto de transitos (natal, transitos e aspectos) de um dia."""
+    context = NatalContext.from_request(body, tz_offset_minutes, is_pt, preferencias)
+    return context.for_date(date_override or body.target_date)
 
-    aspectos_hab, orbes, orb_max, profile = apply_profile_defaults(
-        body.aspectos_habilitados, body.orbes, preferencias or body.preferencias
-    )
-
-    natal_chart = compute_chart(
-        body.natal_year, body.natal_month, body.natal_day, body.natal_hour, body.natal_minute, body.natal_second,
-        body.lat, body.lng, tz_offset_minutes, body.house_system.value, body.zodiac_type.value, body.ayanamsa
-    )
+def _utc_iso(jd_ut: float) -> str:
+    return from_julian_day(jd_ut).strftime("%Y-%m-%dT%H:%M:%SZ")
 
-    transit_chart = compute_transits(
-        target_y, target_m, target_d, body.lat, body.lng, tz_offset_minutes, body.zodiac_type.value, body.ayanamsa
+def _collect_transit_events(
+    body: TransitsEventsRequest,
+    tz_offset_minutes: int,
+    is_pt: bool,
+    start_date: datetime,
+    interval_days: int,
+    natal: Optional[NatalContext] = None,
+    peak_from: Optional[datetime] = None,
+    peak_to: Optional[datetime] = None,
+) -> tuple[List[Any], Dict[str, Any]]:
+    """Calcula eventos com entrada, pico exato e saída do orbe; roda no pool de computação.
+
+    ``peak_from``/``peak_to`` (horário local) mantêm só os eventos com pico no
+    intervalo, para que blocos consecutivos do streaming não repitam passagens.
+    """
+    natal = natal or NatalContext.from_request(body, tz_offset_minutes, is_pt)
+
+    range_start = start_date - timedelta(minutes=tz_offset_minutes)
+    range_end = range_start + timedelta(days=interval_days, seconds=-1)
+    found = find_aspect_events(
+        {name: float(planet["lon"]) for name, planet in natal.planets.items()},
+        natal.aspects_config,
+        to_julian_day(range_start),
+        to_julian_day(range_end),
+        session=EphemerisSession.create(body.zodiac_type.value, body.ayanamsa),
     )
+    if peak_from is not None:
+        found = [item for item in found if item.peak_jd >= to_julian_day(peak_from - timedelta(minutes=tz_offset_minutes))]
+    if peak_to is not None:
+        found = [item for item in found if item.peak_jd < to_julian_day(peak_to - timedelta(minutes=tz_offset_minutes))]
+
+    events = []
+    for item in found:
+        date_range = TransitEventDateRange(
+            start_utc=_utc_iso(item.start_jd),
+            peak_utc=_utc_iso(item.peak_jd),
+            end_utc=_utc_iso(item.end_jd),
+        )
+        peak_date = from_julian_day(item.peak_jd).strftime("%Y-%m-%d")
+        events.append(build_transit_event(item.to_aspect_dict(), peak_date, natal.natal, natal.orb_max, date_range=date_range))
+    return events, {"profile": natal.profile, "aspectos_usados": natal.aspectos_usados, "orbes_usados": natal.orbes_usados}
 
-    natal_chart = apply_sign_localization(natal_chart, is_pt)
-    transit_chart = apply_sign_localization(transit_chart, is_pt)
-
-    aspects_config, aspectos_usados, orbes_usados = resolve_aspects_config(aspectos_hab, orbes)
-    aspects = compute_transit_aspects(transit_chart["planets"], natal_chart["planets"], aspects_config)
-
-    return {
-        "natal": natal_chart, "transits": transit_chart, "aspects": aspects,
-        "aspectos_usados": aspectos_usados, "orbes_usados": orbes_usados,
-        "orb_max": orb_max, "profile": profile,
+async def _stream_transit_events(
+    body: TransitsEventsRequest,
+    tz_offset_minutes: int,
+    is_pt: bool,
+    start_date: datetime,
+    interval_days: int,
+    metadata: Dict[str, Any],
+):
+    """Eventos em blocos de ``STREAM_CHUNK_DAYS``; cada passagem sai no bloco do seu pico."""
+    natal = await run_compute(NatalContext.from_request, body, tz_offset_minutes, is_pt)
+    yield "meta", {
+        **metadata,
+        "perfil": natal.profile,
+        "aspectos_usados": natal.aspectos_usados,
+        "orbes_usados": natal.orbes_usados,
     }
+    for offset in range(0, interval_days, STREAM_CHUNK_DAYS):
+        days = min(STREAM_CHUNK_DAYS, interval_days - offset)
+        chunk_start = start_date + timedelta(days=offset)
+        events, _ = await run_compute(
+            _collect_transit_events, body, tz_offset_minutes, is_pt, chunk_start, days, natal,
+            chunk_start if offset else None,
+            chunk_start + timedelta(days=days) if offset + days < interval_days else None,
+        )
+        events.sort(key=lambda x: (x.date_range.peak_utc, -x.impact_score))
+        for event in events:
+            yield "item", event.model_dump()
 
 @router.post("/v1/transits/events", response_model=TransitEventsResponse)
 async def transits_events(
@@ -110,7 +173,11 @@ async def transits_events(
     lang: Optional[str] = Query(None, description="Idioma (ex.: pt-BR)"),
     auth=Depends(get_auth),
 ):
-    """Calcula eventos de transito detalhados para um intervalo de ate 30 dias."""
+    """Calcula eventos de transito com horarios exatos (entrada, pico e saida do orbe) para ate 366 dias.
+
+    Com ``Accept: application/x-ndjson`` ou ``text/event-stream`` os eventos
+    saem em blocos de 30 dias, à medida que são calculados.
+    """
     try:
         natal_dt = datetime(body.natal_year, body.natal_month, body.natal_day, body.natal_hour, body.natal_minute, body.natal_second)
         tz_offset = get_tz_offset_minutes(natal_dt, body.timezone, body.tz_offset_minutes, strict=body.strict_timezone, request_id=request.state.request_id)
@@ -118,28 +185,40 @@ async def transits_events(
         start_date = datetime.strptime(body.range.from_, "%Y-%m-%d")
         end_date = datetime.strptime(body.range.to, "%Y-%m-%d")
         interval_days = (end_date - start_date).days + 1
-        if interval_days > 30: raise HTTPException(status_code=400, detail="Intervalo maximo de 30 dias.")
+        if interval_days < 1: raise HTTPException(status_code=400, detail="Intervalo invalido: 'to' anterior a 'from'.")
+        media_type = negotiate_stream(request)
+        max_days = max_range_days(auth, MAX_EVENTS_RANGE_DAYS, media_type)
+        if interval_days > max_days:
+            raise HTTPException(status_code=400, detail=f"Intervalo maximo de {max_days} dias.")
+
+        if media_type:
+            is_pt = is_pt_br(lang)
+            metadata = {
+                "range": {"from": body.range.from_, "to": body.range.to},
+                "birth_time_precise": body.birth_time_precise,
+                **build_time_metadata(body.timezone, tz_offset, natal_dt)
+            }
+            return stream_response(
+                _stream_transit_events(body, tz_offset, is_pt, start_date, interval_days, metadata),
+                media_type,
+                request.state.request_id,
+            )
 
         cache_key = f"transit-events:{auth['user_id']}:{hash(body.model_dump_json())}:{str(lang).lower()}"
         cached = cache.get(cache_key)
         if cached: return cached
 
-        events = []
         is_pt = is_pt_br(lang)
-        first_context = None
-        for i in range(interval_days):
-            date_str = (start_date + timedelta(days=i)).strftime("%Y-%m-%d")
-            context = _build_transits_context(body, tz_offset, is_pt, date_override=date_str, preferencias=body.preferencias)
-            if first_context is None: first_context = context
-            for aspect in context["aspects"]:
-                events.append(build_transit_event(aspect, date_str, context["natal"], context["orb_max"]))
+        events, context = await run_compute(
+            _collect_transit_events, body, tz_offset, is_pt, start_date, interval_days
+        )
 
         events.sort(key=lambda x: (x.date_range.peak_utc, -x.impact_score))
         metadata = {
             "range": {"from": body.range.from_, "to": body.range.to},
-            "perfil": first_context["profile"],
-            "aspectos_usados": first_context["aspectos_usados"],
-            "orbes_usados": first_context["orbes_usados"],
+            "perfil": context["profile"],
+            "aspectos_usados": context["aspectos_usados"],
+            "orbes_usados": context["orbes_usados"],
             "birth_time_precise": body.birth_time_precise,
             **build_time_metadata(body.timezone, tz_offset, natal_dt)
         }
@@ -147,10 +226,302 @@ async def transits_events(
         payload = TransitEventsResponse(events=events, metadados=metadata, avisos=[])
         cache.set(cache_key, payload.model_dump(), ttl_seconds=TTL_TRANSITS_SECONDS)
         return payload
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error("transits_events_error", exc_info=True, extra={"request_id": request.state.request_id})
         raise HTTPException(status_code=500, detail="Erro interno ao calcular eventos de transito.")
 
+def _collect_ingresses(
+    body: TransitsIngressesRequest,
+    tz_offset_minutes: int,
+    is_pt: bool,
+    start_date: datetime,
+    interval_days: int,
+    planets: List[str],
+) -> tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Ingressos em signos (índice global) e nas casas natais; roda no pool de computação."""
+    natal = NatalContext.from_request(body, tz_offset_minutes, apply_profile=False)
+    session = EphemerisSession.create(body.zodiac_type.value, body.ayanamsa)
+    range_start = start_date - timedelta(minutes=tz_offset_minutes)
+    jd_start = to_julian_day(range_start)
+    jd_end = to_julian_day(range_start + timedelta(days=interval_days))
+
+    def _common(event) -> Dict[str, Any]:
+        local = event.utc_datetime + timedelta(minutes=tz_offset_minutes)
+        return {
+            "planet": event.planet,
+            "planet_ptbr": planet_key_to_ptbr(event.planet),
+            "exact_utc": _utc_iso(event.jd_ut),
+            "date": local.strftime("%Y-%m-%d"),
+            "retrograde": event.retrograde,
+        }
+
+    signs = [
+        {**_common(event), "sign": event.sign_pt if is_pt else event.sign, "sign_en": event.sign, "sign_ptbr": event.sign_pt}
+        for event in sign_ingresses(jd_start, jd_end, planets, session)
+    ]
+    houses = [
+        {**_common(event), "house": event.house}
+        for event in compute_house_ingresses(natal.cusps, jd_start, jd_end, planets, session)
+    ]
+    return signs, houses
+
+@router.post("/v1/transits/ingresses")
+async def transits_ingresses(
+    body: TransitsIngressesRequest,
+    request: Request,
+    lang: Optional[str] = Query(None, description="Idioma (ex.: pt-BR)"),
+    auth=Depends(get_auth),
+):
+    """Lista os ingressos dos planetas em trânsito em signos e nas casas natais, com horário exato."""
+    try:
+        natal_dt = datetime(body.natal_year, body.natal_month, body.natal_day, body.natal_hour, body.natal_minute, body.natal_second)
+        tz_offset = get_tz_offset_minutes(natal_dt, body.timezone, body.tz_offset_minutes, strict=body.strict_timezone, request_id=request.state.request_id)
+
+        start_date = datetime.strptime(body.range.from_, "%Y-%m-%d")
+        end_date = datetime.strptime(body.range.to, "%Y-%m-%d")
+        interval_days = (end_date - start_date).days + 1
+        if interval_days < 1: raise HTTPException(status_code=400, detail="Intervalo invalido: 'to' anterior a 'from'.")
+        if interval_days > MAX_INGRESS_RANGE_DAYS:
+            raise HTTPException(status_code=400, detail=f"Intervalo maximo de {MAX_INGRESS_RANGE_DAYS} dias.")
+        planets = body.planets or DEFAULT_INGRESS_PLANETS
+        unknown = [name for name in planets if name not in PLANETS]
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Planetas invalidos: {', '.join(unknown)}.")
+
+        cache_key = f"transit-ingresses:{auth['user_id']}:{hash(body.model_dump_json())}:{str(lang).lower()}"
+        cached = cache.get(cache_key)
+        if cached: return cached
+
+        is_pt = is_pt_br(lang)
+        signs, houses = await run_compute(
+            _collect_ingresses, body, tz_offset, is_pt, start_date, interval_days, planets
+        )
+        payload = {
+            "sign_ingresses": signs,
+            "house_ingresses": houses,
+            "metadados": {
+                "range": {"from": body.range.from_, "to": body.range.to},
+                "planets": planets,
+                "birth_time_precise": body.birth_time_precise,
+                **build_time_metadata(body.timezone, tz_offset, natal_dt)
+            },
+        }
+        cache.set(cache_key, payload, ttl_seconds=TTL_TRANSITS_SECONDS)
+        return payload
+    except HTTPException:
+        raise
+    except Exception:
+        logger.error("transits_ingresses_error", exc_info=True, extra={"request_id": request.state.request_id})
+        raise HTTPException(status_code=500, detail="Erro interno ao calcular ingressos de transito.")
+
+def _eclipse_item(event, session: EphemerisSession, tz_offset_minutes: int, is_pt: bool) -> Dict[str, Any]:
+    lon = (event.lon - session.ayanamsa(event.jd_ut)) % 360.0
+    sign = deg_to_sign(lon)["sign"]
+    local = event.utc_datetime + timedelta(minutes=tz_offset_minutes)
+    return {
+        "kind": event.kind,
+        "type": event.eclipse_type,
+        "label_ptbr": event.label_pt,
+        "exact_utc": _utc_iso(event.jd_ut),
+        "date": local.strftime("%Y-%m-%d"),
+        "lon": round(lon, 4),
+        "deg_in_sign": round(lon % 30.0, 4),
+        "sign": sign_to_pt(sign) if is_pt else sign,
+        "sign_en": sign,
+        "sign_ptbr": sign_to_pt(sign),
+        "magnitude": round(event.magnitude, 4),
+        "saros": {"series": event.saros_series, "member": event.saros_member},
+    }
+
+def _eclipse_range(from_: str, to: str) -> tuple[datetime, int]:
+    try:
+        start_date = datetime.strptime(from_, "%Y-%m-%d")
+        end_date = datetime.strptime(to, "%Y-%m-%d")
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Formato inválido de data. Use YYYY-MM-DD.")
+    interval_days = (end_date - start_date).days + 1
+    if interval_days < 1: raise HTTPException(status_code=400, detail="Intervalo invalido: 'to' anterior a 'from'.")
+    if interval_days > MAX_ECLIPSE_RANGE_DAYS:
+        raise HTTPException(status_code=400, detail=f"Intervalo maximo de {MAX_ECLIPSE_RANGE_DAYS} dias.")
+    if start_date.year < INDEX_START_YEAR or end_date.year > INDEX_END_YEAR:
+        raise HTTPException(status_code=400, detail=f"Catalogo de eclipses cobre {INDEX_START_YEAR}-{INDEX_END_YEAR}.")
+    return start_date, interval_days
+
+def _collect_eclipses(
+    body: TransitsEclipsesRequest,
+    tz_offset_minutes: int,
+    is_pt: bool,
+    start_date: datetime,
+    interval_days: int,
+) -> tuple[List[Dict[str, Any]], List[str], Dict[str, float]]:
+    """Eclipses do catálogo no intervalo, com os contatos no mapa natal; roda no pool de computação."""
+    natal = NatalContext.from_request(body, tz_offset_minutes, apply_profile=False)
+    session = EphemerisSession.create(body.zodiac_type.value, body.ayanamsa)
+    range_start = start_date - timedelta(minutes=tz_offset_minutes)
+    eclipses = get_eclipse_index().between(
+        to_julian_day(range_start), to_julian_day(range_start + timedelta(days=interval_days)), body.kinds
+    )
+    aspects_config, aspectos_usados, orbes_usados = resolve_aspects_config(
+        body.aspectos_habilitados or list(ECLIPSE_DEFAULT_ORBS), body.orbes or ECLIPSE_DEFAULT_ORBS
+    )
+    points = {name: planet["lon"] for name, planet in natal.planets.items()}
+    points.update(ASC=natal.natal["houses"]["asc"], MC=natal.natal["houses"]["mc"])
+    contacts: Dict[float, List[Dict[str, Any]]] = {}
+    for contact in natal_contacts(
+        eclipses, points, CompiledAspects({"": aspects_config}), [session.ayanamsa(e.jd_ut) for e in eclipses]
+    ):
+        contacts.setdefault(contact.eclipse.jd_ut, []).append({
+            "point": contact.point,
+            "point_ptbr": planet_key_to_ptbr(contact.point),
+            "aspect": contact.aspect,
+            "aspect_ptbr": aspect_to_ptbr(contact.aspect),
+            "orb": contact.orb,
+        })
+    items = [
+        {**_eclipse_item(event, session, tz_offset_minutes, is_pt), "natal_contacts": contacts.get(event.jd_ut, [])}
+        for event in eclipses
+    ]
+    return items, aspectos_usados, orbes_usados
+
+def _catalog_eclipses(
+    start_date: datetime,
+    interval_days: int,
+    kind: Optional[str],
+    tz_offset_minutes: int,
+    zodiac_type: str,
+    ayanamsa: Optional[str],
+    is_pt: bool,
+) -> List[Dict[str, Any]]:
+    """Eclipses do catálogo no intervalo local; roda no pool de computação."""
+    session = EphemerisSession.create(zodiac_type, ayanamsa)
+    range_start = start_date - timedelta(minutes=tz_offset_minutes)
+    eclipses = get_eclipse_index().between(
+        to_julian_day(range_start),
+        to_julian_day(range_start + timedelta(days=interval_days)),
+        [kind] if kind else None,
+    )
+    return [_eclipse_item(event, session, tz_offset_minutes, is_pt) for event in eclipses]
+
+@router.post("/v1/transits/eclipses")
+async def transits_eclipses(
+    body: TransitsEclipsesRequest,
+    request: Request,
+    lang: Optional[str] = Query(None, description="Idioma (ex.: pt-BR)"),
+    auth=Depends(get_auth),
+):
+    """Lista os eclipses do intervalo e os que tocam pontos do mapa natal (planetas, ASC e MC)."""
+    try:
+        natal_dt = datetime(body.natal_year, body.natal_month, body.natal_day, body.natal_hour, body.natal_minute, body.natal_second)
+        tz_offset = get_tz_offset_minutes(natal_dt, body.timezone, body.tz_offset_minutes, strict=body.strict_timezone, request_id=request.state.request_id)
+        start_date, interval_days = _eclipse_range(body.range.from_, body.range.to)
+
+        cache_key = f"transit-eclipses:{auth['user_id']}:{hash(body.model_dump_json())}:{str(lang).lower()}"
+        cached = cache.get(cache_key)
+        if cached: return cached
+
+        items, aspectos_usados, orbes_usados = await run_compute(
+            _collect_eclipses, body, tz_offset, is_pt_br(lang), start_date, interval_days
+        )
+        payload = {
+            "eclipses": items,
+            "metadados": {
+                "range": {"from": body.range.from_, "to": body.range.to},
+                "aspectos_usados": aspectos_usados,
+                "orbes_usados": orbes_usados,
+                "birth_time_precise": body.birth_time_precise,
+                **build_time_metadata(body.timezone, tz_offset, natal_dt)
+            },
+        }
+        cache.set(cache_key, payload, ttl_seconds=TTL_TRANSITS_SECONDS)
+        return payload
+    except HTTPException:
+        raise
+    except Exception:
+        logger.error("transits_eclipses_error", exc_info=True, extra={"request_id": request.state.request_id})
+        raise HTTPException(status_code=500, detail="Erro interno ao calcular eclipses.")
+
+@router.get("/v1/eclipses")
+async def eclipses_catalog(
+    request: Request,
+    from_: Optional[str] = Query(None, alias="from"),
+    to: Optional[str] = Query(None),
+    kind: Optional[Literal["solar", "lunar"]] = Query(None),
+    timezone: Optional[str] = Query(None),
+    tz_offset_minutes: Optional[int] = Query(None),
+    zodiac_type: Literal["tropical", "sidereal"] = Query("tropical"),
+    ayanamsa: Optional[str] = Query(None),
+    lang: Optional[str] = Query(None),
+    auth=Depends(get_auth),
+):
+    """Consulta o catálogo de eclipses solares e lunares (1800-2100) em um intervalo de datas."""
+    from_ = from_ or dt_date.today().isoformat()
+    to = to or (dt_date.today() + timedelta(days=365)).isoformat()
+    start_date, interval_days = _eclipse_range(from_, to)
+    tz_offset = get_tz_offset_minutes(start_date.replace(hour=12), timezone, tz_offset_minutes, request_id=request.state.request_id)
+    items = await run_compute(
+        _catalog_eclipses, start_date, interval_days, kind, tz_offset, zodiac_type, ayanamsa, is_pt_br(lang)
+    )
+    return {
+        "eclipses": items,
+        "metadados": {"range": {"from": from_, "to": to}, "zodiac_type": zodiac_type, "ayanamsa": ayanamsa},
+    }
+
+
+def _next_days_items(
+    start_date: dt_date,
+    days: int,
+    natal_context: Optional[NatalContext],
+    timezone: Optional[str],
+    tz_offset_minutes: Optional[int],
+    user_id: str,
+    lang: Optional[str],
+    request_id: Optional[str],
+    path: str,
+) -> List[Dict[str, Any]]:
+    """Tom de cada um dos ``days`` dias: trânsitos pessoais com dados natais, clima cósmico sem eles."""
+    from routes.cosmic_weather import _get_cosmic_weather_payload
+
+    items = []
+    for offset in range(days):
+        current_date = start_date + timedelta(days=offset)
+        date_str = current_date.strftime("%Y-%m-%d")
+
+        headline = "Clima com espaco para pequenos ajustes."
+        tags = []
+        strength = "medium"
+        icon = "âœ¨"
+
+        if natal_context is not None:
+            context = natal_context.for_date(date_str)
+            events = [build_transit_event(asp, date_str, context["natal"], context["orb_max"]) for asp in context["aspects"]]
+            curated = curate_daily_events(events)
+
+            if curated and curated.get("top_event"):
+                event = curated["top_event"]
+                headline = event.copy.headline
+                tags = event.tags or []
+                strength = get_strength_from_score(event.impact_score)
+                icon = get_icon_for_tags(tags)
+        else:
+            cw = _get_cosmic_weather_payload(date_str, timezone, tz_offset_minutes, user_id, lang,
+                                             request_id=request_id, path=path)
+            headline = cw.get("headline")
+            tags = [cw.get("moon_sign")] if cw.get("moon_sign") else []
+            icon = "ðŸŒ™"
+            strength = "low"
+
+        items.append({
+            "date": date_str,
+            "headline": headline,
+            "tags": tags,
+            "icon": icon,
+            "strength": strength,
+        })
+    return items
+
+
 @router.get("/v1/transits/next-days")
 async def transits_next_days(
     request: Request,
@@ -174,62 +545,33 @@ async def transits_next_days(
 ):
     """Retorna um resumo dos prÃ³ximos dias, incluindo o tom dominante de cada dia."""
     try:
-        from routes.cosmic_weather import _get_cosmic_weather_payload
         from schemas.common import HouseSystem, ZodiacType as ZodiacTypeSchema
 
         start_date = datetime.strptime(date or datetime.utcnow().strftime("%Y-%m-%d"), "%Y-%m-%d").date()
-        items = []
         is_pt = is_pt_br(lang)
 
-        for offset in range(days):
-            current_date = start_date + timedelta(days=offset)
-            date_str = current_date.strftime("%Y-%m-%d")
-
-            headline = "Clima com espaco para pequenos ajustes."
-            tags = []
-            strength = "medium"
-            icon = "âœ¨"
-
-            if natal_year and natal_month and natal_day and lat is not None and lng is not None:
-                hour = natal_hour if natal_hour is not None else 12
-                natal_dt = datetime(year=natal_year, month=natal_month, day=natal_day, hour=hour)
-                tz_offset = get_tz_offset_minutes(natal_dt, timezone, tz_offset_minutes, request_id=request.state.request_id)
-
-                transits_body = TransitsRequest(
-                    natal_year=natal_year, natal_month=natal_month, natal_day=natal_day,
-                    natal_hour=hour, natal_minute=natal_minute, natal_second=natal_second,
-                    lat=lat, lng=lng, tz_offset_minutes=tz_offset, timezone=timezone,
-                    target_date=date_str, house_system=HouseSystem(house_system),
-                    zodiac_type=ZodiacTypeSchema(zodiac_type), ayanamsa=ayanamsa
-                )
-
-                context = _build_transits_context(transits_body, tz_offset, is_pt, date_override=date_str)
-                events = [build_transit_event(asp, date_str, context["natal"], context["orb_max"]) for asp in context["aspects"]]
-                curated = curate_daily_events(events)
-
-                if curated and curated.get("top_event"):
-                    event = curated["top_event"]
-                    headline = event.copy.headline
-                    tags = event.tags or []
-                    strength = get_strength_from_score(event.impact_score)
-                    icon = get_icon_for_tags(tags)
-            else:
-                cw = _get_cosmic_weather_payload(date_str, timezone, tz_offset_minutes, auth["user_id"], lang,
-                                                 request_id=request.state.request_id, path=request.url.path)
-                headline = cw.get("headline")
-                tags = [cw.get("moon_sign")] if cw.get("moon_sign") else []
-                icon = "ðŸŒ™"
-                strength = "low"
-
-            items.append({
-                "date": date_str,
-                "headline": headline,
-                "tags": tags,
-                "icon": icon,
-                "strength": strength,
-            })
-
+        natal_context = None
+        if natal_year and natal_month and natal_day and lat is not None and lng is not None:
+            hour = natal_hour if natal_hour is not None else 12
+            natal_dt = datetime(year=natal_year, month=natal_month, day=natal_day, hour=hour)
+            tz_offset = get_tz_offset_minutes(natal_dt, timezone, tz_offset_minutes, request_id=request.state.request_id)
+
+            transits_body = TransitsRequest(
+                natal_year=natal_year, natal_month=natal_month, natal_day=natal_day,
+                natal_hour=hour, natal_minute=natal_minute, natal_second=natal_second,
+                lat=lat, lng=lng, tz_offset_minutes=tz_offset, timezone=timezone,
+                target_date=start_date.isoformat(), house_system=HouseSystem(house_system),
+                zodiac_type=ZodiacTypeSchema(zodiac_type), ayanamsa=ayanamsa
+            )
+            natal_context = await run_compute(NatalContext.from_request, transits_body, tz_offset, is_pt)
+
+        items = await run_compute(
+            _next_days_items, start_date, days, natal_context, timezone, tz_offset_minutes, auth["user_id"], lang,
+            request.state.request_id, request.url.path,
+        )
         return {"days": items}
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error("transits_next_days_error", exc_info=True, extra={"request_id": request.state.request_id})
         raise HTTPException(status_code=500, detail="Erro ao carregar prÃ³ximos dias.")
@@ -274,7 +616,7 @@ async def transits_personal_today(
         target_date=d,
     )
 
-    context = _build_transits_context(transits_body, tz_offset, is_pt, date_override=d)
+    context = await run_compute(_build_transits_context, transits_body, tz_offset, is_pt, date_override=d)
     events = [build_transit_event(aspect, d, context["natal"], context["orb_max"]) for aspect in context["aspects"]]
     events.sort(key=lambda x: x.impact_score, reverse=True)
 
@@ -327,7 +669,8 @@ async def transits_live(body: TransitsLiveRequest, request: Request, auth=Depend
     naive_dt = target_dt.replace(tzinfo=None)
     tz_offset = get_tz_offset_minutes(naive_dt, body.timezone, body.tz_offset_minutes, strict=body.strict_timezone)
 
-    transit_chart = compute_transits(
+    transit_chart = await run_compute(
+        compute_transits,
         target_year=naive_dt.year, target_month=naive_dt.month, target_day=naive_dt.day,
         lat=body.lat, lng=body.lng, tz_offset_minutes=tz_offset,
         zodiac_type=body.zodiac_type.value, ayanamsa=body.ayanamsa
@@ -364,12 +707,8 @@ async def daily_summary(
     timezone = timezone or DEFAULT_TIMEZONE
     is_pt = is_pt_br(lang)
 
-    summary = {"tom": "Dia de estabilidade.", "gatilho": "Lua em fase neutra.", "acao": "Mantenha o ritmo."}
-    headline = "Clima tranquilo."
-    areas = []
-    curated = None
-    events: List[Any] = []
-
+    context = None
+    moon = None
     if natal_year and natal_month and natal_day and lat is not None and lng is not None:
         hour = natal_hour if natal_hour is not None else 12
         natal_dt = datetime(year=natal_year, month=natal_month, day=natal_day, hour=hour)
@@ -386,18 +725,39 @@ async def daily_summary(
             timezone=timezone,
             target_date=d,
         )
-        context = _build_transits_context(transits_body, tz_offset, is_pt, date_override=d)
+        context, moon = await run_compute(_daily_sky, transits_body, tz_offset, is_pt, d)
+
+    return _daily_summary_payload(d, context, moon)
+
+
+def _daily_sky(
+    body: TransitsRequest, tz_offset: int, is_pt: bool, d: str
+) -> tuple[Dict[str, Any], Dict[str, Any]]:
+    """Contexto de trânsitos e Lua do dia ``d``, calculados juntos no pool."""
+    return (
+        _build_transits_context(body, tz_offset, is_pt, date_override=d),
+        compute_moon_only(d, tz_offset_minutes=tz_offset),
+    )
+
+
+def _daily_summary_payload(
+    d: str, context: Optional[Dict[str, Any]] = None, moon: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Resumo diário a partir do contexto do dia (ou o resumo neutro sem dados natais)."""
+    summary = {"tom": "Dia de estabilidade.", "gatilho": "Lua em fase neutra.", "acao": "Mantenha o ritmo."}
+    headline = "Clima tranquilo."
+    areas = []
+    curated = None
+    events: List[Any] = []
+
+    if context is not None:
         events = [build_transit_event(asp, d, context["natal"], context["orb_max"]) for asp in context["aspects"]]
         curated = curate_daily_events(events)
         if curated.get("summary"):
             summary = curated["summary"]
         if curated.get("top_event"):
             headline = curated["top_event"].copy.headline
-
-        from astro.ephemeris import compute_moon_only
-
-        moon = compute_moon_only(d, tz_offset_minutes=tz_offset)
-        phase_key = get_moon_phase_key(moon["phase_angle_deg"])
+        phase_key = get_moon_phase_key(moon["phase_angle_deg"]) if moon else None
         areas = calculate_areas_activated(context["aspects"], phase_key)
 
     canonical = _build_daily_analysis_payload(events, fallback_summary=headline)
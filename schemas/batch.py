@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from typing import Any, List, Optional
+
+from pydantic import BaseModel, Field
+
+from .transits import TransitsRequest
+
+MAX_BATCH_ITEMS = 10
+
+
+class BatchSubRequest(BaseModel):
+    id: str = Field(..., min_length=1, max_length=64, description="Identificador devolvido no resultado.")
+    path: str = Field(..., description="Rota atendida em lote (ex.: /v1/insights/dominant-theme).")
+
+
+class BatchRequest(TransitsRequest):
+    """Dados natais e data compartilhados por todas as sub-requisições do lote."""
+
+    requests: List[BatchSubRequest] = Field(..., min_length=1, max_length=MAX_BATCH_ITEMS)
+
+
+class BatchItemResult(BaseModel):
+    id: str
+    path: str
+    status: int
+    body: Optional[Any] = None
+    error: Optional[str] = None
+
+
+class BatchResponse(BaseModel):
+    results: List[BatchItemResult]
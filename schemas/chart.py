@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Optional, Any
+from typing import Optional, Any, List, Literal
 from pydantic import BaseModel, Field, AliasChoices, model_validator, ConfigDict
 from .common import HouseSystem, ZodiacType
 
@@ -185,3 +185,52 @@ class RenderDataRequest(BaseModel):
                     detail="render-data expects year/month/day/hour/minute/second...",
                 )
         return data
+
+
+RectificationCategory = Literal[
+    "career", "relationship", "marriage", "divorce", "child", "relocation",
+    "health", "accident", "loss", "education", "finance", "other",
+]
+
+
+class RectificationEventInput(BaseModel):
+    """Evento de vida usado na retificação."""
+    date: str = Field(..., description="YYYY-MM-DD")
+    category: RectificationCategory = Field(default="other")
+    label: Optional[str] = Field(default=None, max_length=120)
+
+
+class RectificationRequest(BaseModel):
+    """Retificação do horário de nascimento a partir de eventos de vida."""
+    model_config = ConfigDict(populate_by_name=True)
+
+    birth_date: str = Field(..., validation_alias=AliasChoices("birth_date", "birthDate"), description="YYYY-MM-DD")
+    lat: float = Field(..., ge=-89.9999, le=89.9999, validation_alias=AliasChoices("lat", "latitude"))
+    lng: float = Field(..., ge=-180, le=180, validation_alias=AliasChoices("lng", "longitude"))
+    tz_offset_minutes: Optional[int] = Field(None, ge=-840, le=840)
+    timezone: Optional[str] = Field(None, description="Timezone IANA (ex.: America/Sao_Paulo).")
+    house_system: HouseSystem = Field(default=HouseSystem.PLACIDUS)
+    zodiac_type: ZodiacType = Field(default=ZodiacType.TROPICAL)
+    ayanamsa: Optional[str] = Field(default=None)
+    events: List[RectificationEventInput] = Field(..., min_length=1, max_length=20)
+    window_start: str = Field(default="00:00", pattern=r"^([01]\d|2[0-3]):[0-5]\d$", description="Início da janela local (HH:MM).")
+    window_end: str = Field(default="23:59", pattern=r"^([01]\d|2[0-3]):[0-5]\d$", description="Fim da janela local (HH:MM), inclusive.")
+    step_minutes: int = Field(default=1, ge=1, le=60)
+    top: int = Field(default=5, ge=1, le=10)
+
+    @property
+    def window_minutes(self) -> tuple[int, int]:
+        start_hour, start_minute = self.window_start.split(":")
+        end_hour, end_minute = self.window_end.split(":")
+        return int(start_hour) * 60 + int(start_minute), int(end_hour) * 60 + int(end_minute)
+
+
+class AstrocartographyRequest(NatalChartRequest):
+    """Linhas de astrocartografia do instante natal."""
+    planets: Optional[List[str]] = Field(default=None, description="Planetas (ex.: Sun, Venus). Padrão: todos.")
+    method: Literal["mundo", "zodiacal"] = Field(default="mundo")
+    lat_step: float = Field(default=1.0, ge=0.1, le=5.0, description="Passo em latitude das linhas ASC/DSC.")
+    lat_limit: float = Field(default=80.0, ge=10.0, le=89.0)
+    polyline_format: Literal["encoded", "coords"] = Field(
+        default="encoded", description="encoded: Encoded Polyline (precisão 5); coords: [[lat, lng], ...]."
+    )
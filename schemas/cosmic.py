@@ -30,3 +30,29 @@ class CosmicDecisionResponse(BaseModel):
     key_influences: List[str]
     reflective_guidance: str
     suggested_reflection: str
+
+
+class CosmicElectionRequest(TransitsRequest):
+    question: str = Field(..., min_length=4, max_length=800)
+    question_type: Optional[QuestionType] = None
+    target_date: str = Field(default_factory=lambda: date.today().isoformat(), description="Início da janela (YYYY-MM-DD).")
+    window_days: int = Field(default=60, ge=1, le=90)
+    step_minutes: Literal[15, 30, 60] = 60
+    top: int = Field(default=5, ge=1, le=10)
+
+
+class CosmicElectionWindow(BaseModel):
+    start: str
+    end: str
+    peak: str
+    score: float
+    key_influences: List[str]
+
+
+class CosmicElectionResponse(BaseModel):
+    question_type: str
+    window_start: str
+    window_end: str
+    step_minutes: int
+    slots_scanned: int
+    windows: List[CosmicElectionWindow]
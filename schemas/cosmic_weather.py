@@ -18,6 +18,8 @@ class CosmicWeatherResponse(BaseModel):
     text_ptbr: Optional[str] = None
     resumo_ptbr: Optional[str] = None
     moon_ptbr: Optional[Dict[str, Any]] = None
+    moon_day: Optional[Dict[str, Any]] = None
+    eclipses: Optional[List[Dict[str, Any]]] = None
     top_event: Optional[TransitEvent] = None
     trigger_event: Optional[TransitEvent] = None
     secondary_events: Optional[List[TransitEvent]] = None
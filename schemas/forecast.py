@@ -6,7 +6,7 @@ from .transits import TransitsRequest
 
 
 class PersonalForecastRequest(TransitsRequest):
-    days_ahead: int = Field(default=7, ge=1, le=30)
+    days_ahead: int = Field(default=7, ge=1, le=366, description="Até 30 dias; até 366 em streaming nos planos premium.")
 
 
 class PersonalForecastResponse(BaseModel):
@@ -100,3 +100,29 @@ class SolarReturnResponse(BaseModel):
     avisos: Optional[List[str]] = None
     idioma: Optional[str] = None
     fonte_traducao: Optional[str] = None
+
+MAX_RELOCATION_CITIES = 500
+
+class SolarReturnCity(SolarReturnLocal):
+    """Cidade candidata para a revolução solar relocalizada."""
+    id: Optional[str] = Field(default=None, max_length=64)
+    timezone: Optional[str] = Field(None, description="Timezone IANA da cidade, para o horário local do retorno.")
+
+class SolarReturnRelocationCriteria(BaseModel):
+    """Critérios do ranking de cidades (planetas e signos em inglês: Sun, Jupiter, Leo)."""
+    casas_sol: List[int] = Field(default_factory=lambda: [1, 10])
+    casas_lua: List[int] = Field(default_factory=list)
+    planetas_angulares: List[str] = Field(default_factory=lambda: ["Jupiter", "Venus"])
+    evitar_angulares: List[str] = Field(default_factory=lambda: ["Saturn", "Mars"])
+    signos_asc: List[str] = Field(default_factory=list)
+    orbe_angular: float = Field(default=5.0, gt=0, le=15)
+
+class SolarReturnRelocationRequest(BaseModel):
+    """Compara a revolução solar de um ano em várias cidades."""
+    model_config = ConfigDict(populate_by_name=True)
+    natal: SolarReturnNatal
+    ano: int = Field(..., ge=1800, le=2200, validation_alias=AliasChoices("ano", "year"))
+    cidades: List[SolarReturnCity] = Field(..., min_length=1, max_length=MAX_RELOCATION_CITIES)
+    criterios: SolarReturnRelocationCriteria = Field(default_factory=SolarReturnRelocationCriteria)
+    preferencias: Optional[SolarReturnPreferencias] = None
+    limit: int = Field(default=10, ge=1, le=50)
@@ -137,3 +137,39 @@ class SynastryCompareResponse(BaseModel):
     # Backward-compatible raw charts for advanced UIs
     person_a: Optional[Dict[str, Any]] = None
     person_b: Optional[Dict[str, Any]] = None
+
+
+MAX_RANKING_PARTNERS = 500
+
+
+class SynastryPartnerInput(SynastryPersonInput):
+    id: Optional[str] = Field(default=None, max_length=128)
+
+
+class SynastryRankingRequest(BaseModel):
+    person: SynastryPersonInput = Field(..., validation_alias=AliasChoices("person", "person_a", "personA"))
+    partners: List[SynastryPartnerInput] = Field(..., min_length=1, max_length=MAX_RANKING_PARTNERS)
+    limit: int = Field(default=10, ge=1, le=50, description="Quantos parceiros do topo recebem o resumo completo.")
+
+
+class SynastryRankingItem(BaseModel):
+    rank: int
+    index: int
+    id: Optional[str] = None
+    name: str
+    score: int
+    harmony: float
+    tension: float
+    aspect_count: int
+    overview: str
+    strengths: List[str]
+    growth_areas: List[str]
+    key_aspects: List[SynastryAspectOut]
+    # sistema de casas trocado para este parceiro (ex.: Porphyrius acima do círculo polar)
+    warning: Optional[str] = None
+
+
+class SynastryRankingResponse(BaseModel):
+    person: Dict[str, Any]
+    total_partners: int
+    ranking: List[SynastryRankingItem]
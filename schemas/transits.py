@@ -186,6 +186,26 @@ class TransitsEventsRequest(TransitsRequest):
     range: TransitDateRange
     preferencias: Optional[PreferenciasPerfil] = None
 
+class TransitsIngressesRequest(TransitsRequest):
+    """Modelo para requisição de ingressos em signos e casas natais em um intervalo."""
+    target_date: Optional[str] = Field(
+        default=None, description="Campo opcional (ignorado quando range é fornecido)."
+    )
+    range: TransitDateRange
+    planets: Optional[List[str]] = Field(
+        default=None, description="Planetas em trânsito (padrão: Sol a Plutão, sem a Lua)."
+    )
+
+class TransitsEclipsesRequest(TransitsRequest):
+    """Modelo para requisição de eclipses com contatos no mapa natal."""
+    target_date: Optional[str] = Field(
+        default=None, description="Campo opcional (ignorado quando range é fornecido)."
+    )
+    range: TransitDateRange
+    kinds: Optional[List[Literal["solar", "lunar"]]] = Field(
+        default=None, description="Tipos de eclipse (padrão: solar e lunar)."
+    )
+
 class TransitEventDateRange(BaseModel):
     """Modelo para o intervalo de tempo de um evento de trânsito."""
     start_utc: str
@@ -0,0 +1,59 @@
+"""Gera a tabela binária de efemérides usada pelo backend ``EPHEMERIS_BACKEND=table``.
+
+Uso:
+    python scripts/build_ephemeris_table.py --out data/ephemeris_1800_2100.bin
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from astro.ephemeris import PLANETS  # noqa: E402
+from astro.ephemeris_tables import (  # noqa: E402
+    DEFAULT_END_YEAR,
+    DEFAULT_START_YEAR,
+    DEFAULT_STEP_DAYS,
+    DEFAULT_TABLE_PATH,
+    EphemerisTable,
+    build_ephemeris_table,
+    max_table_error,
+)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--out", default=DEFAULT_TABLE_PATH)
+    parser.add_argument("--start-year", type=int, default=DEFAULT_START_YEAR)
+    parser.add_argument("--end-year", type=int, default=DEFAULT_END_YEAR)
+    parser.add_argument("--step-days", type=float, default=DEFAULT_STEP_DAYS)
+    parser.add_argument("--check-samples", type=int, default=2000)
+    parser.add_argument("--tolerance-deg", type=float, default=0.002)
+    args = parser.parse_args()
+
+    started = time.time()
+    build_ephemeris_table(
+        args.out,
+        list(PLANETS.values()),
+        start_year=args.start_year,
+        end_year=args.end_year,
+        step_days=args.step_days,
+    )
+    print(f"tabela gerada em {time.time() - started:.1f}s: {args.out}")
+
+    table = EphemerisTable(args.out)
+    rng = random.Random(42)
+    samples = [rng.uniform(table.jd_start, table.jd_end) for _ in range(args.check_samples)]
+    worst = max_table_error(table, PLANETS.values(), samples)
+    table.close()
+    print(f"erro máximo vs swe.calc_ut: {worst:.6f}°")
+    return 0 if worst <= args.tolerance_deg else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,50 @@
+"""Gera um dos índices de eventos pré-calculados (1800-2100).
+
+Uso:
+    python scripts/build_event_index.py eclipses
+    python scripts/build_event_index.py lunations --out data/lunations_1800_2100.npz
+
+O arquivo padrão e a variável de ambiente que o serviço lê vêm do índice
+compartilhado de cada tipo.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from astro import eclipse_index, ingress_index, lunation_index, moon_index, stations  # noqa: E402
+from astro.event_index import INDEX_END_YEAR, INDEX_START_YEAR  # noqa: E402
+
+INDEXES = {
+    "eclipses": eclipse_index.shared_index,
+    "ingresses": ingress_index.shared_index,
+    "lunations": lunation_index.shared_index,
+    "moon": moon_index.shared_index,
+    "stations": stations.shared_index,
+}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("kind", choices=sorted(INDEXES))
+    parser.add_argument("--out", default=None)
+    parser.add_argument("--start-year", type=int, default=INDEX_START_YEAR)
+    parser.add_argument("--end-year", type=int, default=INDEX_END_YEAR)
+    args = parser.parse_args()
+
+    shared = INDEXES[args.kind]
+    out = args.out or shared.default_path
+    started = time.time()
+    index = shared.index_cls().build(args.start_year, args.end_year)
+    index.save(out)
+    print(f"{len(index)} eventos ({args.kind}) gerados em {time.time() - started:.1f}s: {out} ({shared.env_var})")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
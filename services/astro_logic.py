@@ -3,7 +3,9 @@ import hashlib
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Literal
 
-from astro.ephemeris import PLANETS, compute_chart, compute_transits, compute_moon_only
+import numpy as np
+
+from astro.ephemeris import PLANETS, compute_chart, compute_moon_only
 from schemas.alerts import SystemAlert
 from astro.i18n_ptbr import (
     aspect_to_ptbr,
@@ -11,7 +13,9 @@ from astro.i18n_ptbr import (
     sign_to_ptbr,
     format_degree_ptbr,
 )
-from astro.utils import angle_diff, sign_to_pt, ZODIAC_SIGNS, ZODIAC_SIGNS_PT
+from astro.ephemeris_tables import calc_position
+from astro.stations import get_station_index
+from astro.utils import angle_diff, from_julian_day, sign_to_pt, to_julian_day, ZODIAC_SIGNS, ZODIAC_SIGNS_PT
 from schemas.transits import (
     TransitEvent,
     TransitEventDateRange,
@@ -99,6 +103,11 @@ def get_house_for_lon(cusps: List[float], lon: float) -> int:
             return idx + 1
     return 12
 
+def houses_of(cusps: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """Casa (1-12) de cada longitude (n, p) para as cúspides (n, 12) da mesma linha."""
+    forward = (lons[:, :, None] - cusps[:, None, :]) % 360.0
+    return np.argmin(forward, axis=2) + 1
+
 def calculate_distributions(chart: Dict[str, Any], metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     Calcula o equilíbrio de elementos (Fogo, Terra, Ar, Água) e modalidades (Cardinal, Fixo, Mutável).
@@ -260,8 +269,17 @@ def _build_risk_copy(transit_planet: str, aspect_key: str) -> str:
         return "Risco de excesso de confianca; cheque limites de tempo, energia e recursos."
     return "Risco de dispersao; mantenha criterio para nao perder foco no essencial."
 
-def build_transit_event(aspect: Dict[str, Any], date_str: str, natal_chart: Dict[str, Any], orb_max: float) -> TransitEvent:
-    """Constrói um objeto TransitEvent a partir de um aspecto calculado."""
+def build_transit_event(
+    aspect: Dict[str, Any],
+    date_str: str,
+    natal_chart: Dict[str, Any],
+    orb_max: float,
+    date_range: Optional[TransitEventDateRange] = None,
+) -> TransitEvent:
+    """Constrói um objeto TransitEvent a partir de um aspecto calculado.
+
+    Sem ``date_range``, o evento ocupa o dia ``date_str`` inteiro (pico ao meio-dia).
+    """
     transit_planet = aspect["transit_planet"]
     natal_planet = aspect["natal_planet"]
     aspect_key = aspect["aspect"]
@@ -277,9 +295,12 @@ def build_transit_event(aspect: Dict[str, Any], date_str: str, natal_chart: Dict
         f"{date_str}:{transit_planet}:{natal_planet}:{aspect_key}:{round(orb_deg,2)}".encode("utf-8")
     ).hexdigest()
 
-    date_start = f"{date_str}T00:00:00Z"
-    date_peak = f"{date_str}T12:00:00Z"
-    date_end = f"{date_str}T23:59:59Z"
+    if date_range is None:
+        date_range = TransitEventDateRange(
+            start_utc=f"{date_str}T00:00:00Z",
+            peak_utc=f"{date_str}T12:00:00Z",
+            end_utc=f"{date_str}T23:59:59Z",
+        )
 
     natal_cusps = natal_chart.get("houses", {}).get("cusps", [])
     natal_lon = float(natal_chart.get("planets", {}).get(natal_planet, {}).get("lon", 0.0))
@@ -293,7 +314,7 @@ def build_transit_event(aspect: Dict[str, Any], date_str: str, natal_chart: Dict
 
     return TransitEvent(
         event_id=event_hash,
-        date_range=TransitEventDateRange(start_utc=date_start, peak_utc=date_peak, end_utc=date_end),
+        date_range=date_range,
         transitando=transitando_pt,
         alvo_tipo="PLANETA_NATAL",
         alvo=alvo_pt,
@@ -534,18 +555,24 @@ def get_mercury_retrograde_alert(date_str: str, lat: float, lng: float, tz_offse
     """Verifica e retorna um alerta se Mercúrio estiver retrógrado."""
     from services.time_utils import parse_date_yyyy_mm_dd
     y, m, d = parse_date_yyyy_mm_dd(date_str)
-    chart = compute_transits(target_year=y, target_month=m, target_day=d, lat=lat, lng=lng, tz_offset_minutes=tz_offset)
-    mercury = chart.get("planets", {}).get("Mercury")
-    if not mercury or mercury.get("speed") is None:
+    jd_ut = to_julian_day(datetime(y, m, d, 12, 0, 0) - timedelta(minutes=tz_offset))
+    period = get_station_index().period_at(PLANETS["Mercury"], jd_ut)
+    if period is None:
         return None
 
-    if mercury.get("retrograde"):
-        return SystemAlert(
-            id="mercury_retrograde",
-            severity="medium",
-            title="Mercúrio retrógrado",
-            body="Mercúrio está em retrogradação. Revise comunicações e contratos com atenção.",
-            technical={"mercury_speed": mercury.get("speed"), "mercury_lon": mercury.get("lon")},
-        )
-    return None
+    lon, speed = calc_position(jd_ut, PLANETS["Mercury"])
+    return SystemAlert(
+        id="mercury_retrograde",
+        severity="medium",
+        title="Mercúrio retrógrado",
+        body="Mercúrio está em retrogradação. Revise comunicações e contratos com atenção.",
+        technical={
+            "mercury_speed": round(speed, 6),
+            "mercury_lon": round(lon, 6),
+            "station_retrograde_utc": from_julian_day(period.station_retrograde).isoformat(timespec="seconds"),
+            "station_direct_utc": from_julian_day(period.station_direct).isoformat(timespec="seconds"),
+            "shadow_start_utc": from_julian_day(period.shadow_start).isoformat(timespec="seconds"),
+            "shadow_end_utc": from_julian_day(period.shadow_end).isoformat(timespec="seconds"),
+        },
+    )
 
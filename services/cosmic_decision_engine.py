@@ -1,10 +1,13 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
-from astro.aspects import compute_transit_aspects, get_aspects_profile
-from services.astro_logic import get_house_for_lon
+import numpy as np
+
+from astro.aspects import CompiledAspects, aspect_tensor, compute_transit_aspects, get_aspects_profile
+from astro.ephemeris import compute_sky_track
+from services.astro_logic import get_house_for_lon, houses_of
 
 QUESTION_RULES: Dict[str, Dict[str, Any]] = {
     "career": {
@@ -53,6 +56,10 @@ INFLUENCE_LABELS = {
     "adjusting": "ajuste",
 }
 
+MAX_INFLUENCES = 6
+SLOW_PLANETS = {"Saturn", "Pluto", "Neptune", "Uranus"}
+LUMINARIES = {"Sun", "Moon"}
+
 
 @dataclass
 class InfluenceItem:
@@ -110,28 +117,19 @@ def _score_aspect(
         if activated in rules["houses"]:
             base += 3.0
 
-    if t_planet in {"Saturn", "Pluto", "Neptune", "Uranus"}:
+    if t_planet in SLOW_PLANETS:
         base += 2.0
-    if t_planet in {"Sun", "Moon"} or n_planet in {"Sun", "Moon"}:
+    if t_planet in LUMINARIES or n_planet in LUMINARIES:
         base += 2.0
 
     return round(base, 2)
 
 
-def _extract_active_influences(
-    user_chart: Dict[str, Any],
-    current_transits: Dict[str, Any],
-    question_type: str,
+def _influences_from_aspects(
+    aspects: List[Dict[str, Any]],
+    rules: Dict[str, Any],
+    houses: List[float],
 ) -> List[InfluenceItem]:
-    _, aspects_profile = get_aspects_profile()
-    aspects = compute_transit_aspects(
-        transit_planets=current_transits.get("planets", {}),
-        natal_planets=user_chart.get("planets", {}),
-        aspects=aspects_profile,
-    )
-    rules = QUESTION_RULES[question_type]
-    houses = user_chart.get("houses", {}).get("cusps", [])
-
     items: List[InfluenceItem] = []
     for asp in aspects:
         score = _score_aspect(asp, rules, houses)
@@ -144,7 +142,26 @@ def _extract_active_influences(
         items.append(InfluenceItem(title=title, score=score, text=text))
 
     items.sort(key=lambda item: item.score, reverse=True)
-    return items[:6]
+    return items[:MAX_INFLUENCES]
+
+
+def _extract_active_influences(
+    user_chart: Dict[str, Any],
+    current_transits: Dict[str, Any],
+    question_type: str,
+) -> List[InfluenceItem]:
+    _, aspects_profile = get_aspects_profile()
+    transit_planets = current_transits.get("planets", {})
+    aspects = compute_transit_aspects(
+        transit_planets=transit_planets,
+        natal_planets=user_chart.get("planets", {}),
+        aspects=aspects_profile,
+    )
+    for asp in aspects:
+        asp["transit_lon"] = transit_planets[asp["transit_planet"]]["lon"]
+    rules = QUESTION_RULES[question_type]
+    houses = user_chart.get("houses", {}).get("cusps", [])
+    return _influences_from_aspects(aspects, rules, houses)
 
 
 def _extract_slow_cycles(active_life_cycles: Optional[Dict[str, Any]]) -> List[str]:
@@ -219,3 +236,141 @@ def analyze_context(
         "suggested_reflection": suggested_reflection,
         "question_type": question_type,
     }
+
+
+# Busca eletiva: cada horário candidato recebe as mesmas influências de
+# ``_extract_active_influences`` (mesmo score, corte e limite), pesadas pelo tom.
+ELECTION_TONE = {"supportive": 1.0, "subtle": 0.5, "intense": 0.5, "adjusting": 0.0, "challenging": -1.0}
+ELECTION_CHUNK_SLOTS = 1000
+WINDOW_RETENTION = 0.8  # fração do pico que ainda conta como a mesma janela
+
+
+@dataclass
+class ElectionWindow:
+    start_jd: float
+    end_jd: float
+    peak_jd: float
+    score: float
+    influences: List[InfluenceItem] = field(default_factory=list)
+
+
+@dataclass
+class ElectionSlots:
+    jd: np.ndarray
+    values: np.ndarray
+    transit_names: Tuple[str, ...]
+    transit_lons: np.ndarray
+
+
+def _election_chunk(
+    track: np.ndarray,
+    transit_names: Sequence[str],
+    natal_names: Sequence[str],
+    natal_lons: Sequence[float],
+    cusps: List[float],
+    rules: Dict[str, Any],
+    compiled: CompiledAspects,
+) -> np.ndarray:
+    """Valor de cada linha de ``track``: ``_score_aspect`` vetorizado sobre (slot, trânsito, natal, aspecto)."""
+    orb, mask = aspect_tensor(natal_lons, track, compiled)
+    orb = np.round(orb, 4)
+    t_rule = np.array([name in rules["planets"] for name in transit_names])
+    n_rule = np.array([name in rules["planets"] for name in natal_names])
+    t_light = np.array([name in LUMINARIES for name in transit_names])
+    n_light = np.array([name in LUMINARIES for name in natal_names])
+    t_slow = np.array([name in SLOW_PLANETS for name in transit_names])
+
+    score = np.maximum(0.0, 10.0 - orb)
+    score += (5.0 * (t_rule[:, None] | n_rule[None, :]) + 2.0 * t_slow[:, None] + 2.0 * (t_light[:, None] | n_light[None, :]))[None, :, :, None]
+    if cusps:
+        houses = houses_of(np.broadcast_to(np.asarray(cusps, dtype=float), (len(track), 12)), track)
+        score += 3.0 * np.isin(houses, sorted(rules["houses"]))[:, :, None, None]
+    score = np.round(score, 2)
+
+    # mesma ordem de _influences_from_aspects: aspectos por orbe e depois score (ordenação estável)
+    n = len(track)
+    keep = (mask & (score >= 5.0)).reshape(n, -1)
+    flat_score = np.where(keep, score.reshape(n, -1), -np.inf)
+    flat_orb = orb.reshape(n, -1)
+    order = np.lexsort((np.broadcast_to(np.arange(flat_score.shape[1]), flat_score.shape), flat_orb, -flat_score), axis=-1)
+    top = order[:, :MAX_INFLUENCES]
+    tone = np.array([ELECTION_TONE.get(str(info.get("influence", "")).lower(), 0.0) for _, _, info in compiled.entries])
+    flat_tone = np.broadcast_to(tone, score.shape).reshape(n, -1)
+    picked = np.take_along_axis(flat_score, top, axis=1)
+    weights = np.take_along_axis(flat_tone, top, axis=1)
+    return np.where(np.isfinite(picked), picked * weights, 0.0).sum(axis=1)
+
+
+def score_election_slots(
+    user_chart: Dict[str, Any],
+    question_type: str,
+    jd: np.ndarray,
+    zodiac_type: str = "tropical",
+    ayanamsa: Optional[str] = None,
+) -> ElectionSlots:
+    """Valor eletivo de cada instante de ``jd`` a partir de um céu de trânsito compartilhado."""
+    rules = QUESTION_RULES[question_type]
+    _, aspects_profile = get_aspects_profile()
+    compiled = CompiledAspects({"": aspects_profile})
+    natal = user_chart.get("planets", {})
+    natal_names = list(natal)
+    natal_lons = [natal[name]["lon"] for name in natal_names]
+    cusps = user_chart.get("houses", {}).get("cusps", [])
+
+    transit_names, track = compute_sky_track(jd, zodiac_type, ayanamsa)
+    values = np.concatenate([
+        _election_chunk(track[start:start + ELECTION_CHUNK_SLOTS], transit_names, natal_names, natal_lons, cusps, rules, compiled)
+        for start in range(0, len(jd), ELECTION_CHUNK_SLOTS)
+    ])
+    return ElectionSlots(jd=jd, values=values, transit_names=transit_names, transit_lons=track)
+
+
+def search_election_windows(
+    user_chart: Dict[str, Any],
+    question_type: str,
+    jd_start: float,
+    jd_end: float,
+    step_minutes: int = 60,
+    zodiac_type: str = "tropical",
+    ayanamsa: Optional[str] = None,
+    top: int = 5,
+) -> Tuple[List[ElectionWindow], int]:
+    """Melhores janelas em [jd_start, jd_end) e o número de horários avaliados.
+
+    Cada janela parte de um pico e cresce enquanto os horários vizinhos mantêm
+    ``WINDOW_RETENTION`` do valor do pico; janelas não se sobrepõem.
+    """
+    jd = np.arange(jd_start, jd_end, step_minutes / 1440.0)
+    slots = score_election_slots(user_chart, question_type, jd, zodiac_type, ayanamsa)
+    values = slots.values
+    rules = QUESTION_RULES[question_type]
+    houses = user_chart.get("houses", {}).get("cusps", [])
+    _, aspects_profile = get_aspects_profile()
+
+    covered = np.zeros(len(jd), dtype=bool)
+    windows: List[ElectionWindow] = []
+    for row in np.argsort(-values, kind="stable"):
+        if len(windows) >= top or values[row] <= 0:
+            break
+        if covered[row]:
+            continue
+        threshold = WINDOW_RETENTION * values[row]
+        lo = hi = int(row)
+        while lo > 0 and not covered[lo - 1] and values[lo - 1] >= threshold:
+            lo -= 1
+        while hi < len(jd) - 1 and not covered[hi + 1] and values[hi + 1] >= threshold:
+            hi += 1
+        covered[lo:hi + 1] = True
+
+        transit = {name: {"lon": float(slots.transit_lons[row, col])} for col, name in enumerate(slots.transit_names)}
+        aspects = compute_transit_aspects(transit, user_chart.get("planets", {}), aspects_profile)
+        for asp in aspects:
+            asp["transit_lon"] = transit[asp["transit_planet"]]["lon"]
+        windows.append(ElectionWindow(
+            start_jd=float(jd[lo]),
+            end_jd=float(jd[hi]) + step_minutes / 1440.0,
+            peak_jd=float(jd[row]),
+            score=round(float(values[row]), 2),
+            influences=_influences_from_aspects(aspects, rules, houses),
+        ))
+    return windows, len(jd)
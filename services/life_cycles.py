@@ -1,15 +1,31 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import hashlib
+import math
+from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
-from astro.aspects import compute_transit_aspects, get_aspects_profile
-from astro.ephemeris import compute_chart, compute_transits
+from astro.aspects import get_aspects_profile
+from astro.ephemeris import PLANETS, compute_chart
+from astro.ephemeris_session import EphemerisSession
+from astro.transit_events import find_aspect_events
+from astro.utils import from_julian_day, to_julian_day
+from core.cache import cache
+from services.cache_keys import canonical_json
 
 SLOW_PLANETS = {"Saturn", "Uranus", "Neptune", "Pluto"}
 MAJOR_ASPECTS = {"conjunction", "opposition", "square", "trine", "sextile"}
 
+CYCLE_ORB = 3.0
+# Planetas lentos: a grade grossa é segura porque as estações são refinadas
+CYCLE_STEP_DAYS = {name: 10.0 for name in SLOW_PLANETS}
+LIFE_SPAN_YEARS = 100
+DECADE_YEARS = 10
+DECADE_DAYS = DECADE_YEARS * 365.25
+WINDOW_YEARS = 5
+TTL_LIFE_CYCLES_SECONDS = 24 * 3600
+
 
 @dataclass
 class CycleEvent:
@@ -20,6 +36,9 @@ class CycleEvent:
     orb: float
     life_theme: str
     interpretation: str
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    exact_dates: List[date] = field(default_factory=list)
 
 
 def _theme_for(planet: str, target: str, aspect: str) -> Tuple[str, str]:
@@ -252,63 +271,134 @@ def _theme_for(planet: str, target: str, aspect: str) -> Tuple[str, str]:
     return base_theme, base_text
 
 
+def _local_date(jd_ut: float, tz_offset_minutes: int) -> date:
+    return (from_julian_day(jd_ut) + timedelta(minutes=tz_offset_minutes)).date()
+
+
+def _cycle_aspects() -> Dict[str, dict]:
+    _, aspects_profile = get_aspects_profile()
+    return {
+        name: {**info, "orb": min(float(info["orb"]), CYCLE_ORB)}
+        for name, info in aspects_profile.items()
+        if name in MAJOR_ASPECTS
+    }
+
+
 def _scan_cycle_events(
     natal_chart: Dict[str, Any],
-    lat: float,
-    lng: float,
     tz_offset_minutes: int,
     zodiac_type: str,
     ayanamsa: str | None,
-    from_date: date,
-    to_date: date,
+    jd_start: float,
+    jd_end: float,
+) -> List[Tuple[CycleEvent, float]]:
+    """Passagens de Saturno a Plutão (orbe de até 3°) sobre os planetas natais.
+
+    Cada passagem traz entrada, pico e saída do orbe e todos os instantes
+    exatos, inclusive os repasses retrógrados.
+    """
+    natal_lons = {name: float(p["lon"]) for name, p in natal_chart.get("planets", {}).items()}
+    found = find_aspect_events(
+        natal_lons,
+        _cycle_aspects(),
+        jd_start,
+        jd_end,
+        session=EphemerisSession.create(zodiac_type, ayanamsa),
+        transit_planets={name: PLANETS[name] for name in sorted(SLOW_PLANETS)},
+        step_days=CYCLE_STEP_DAYS,
+    )
+
+    events: List[Tuple[CycleEvent, float]] = []
+    for item in found:
+        theme, interpretation = _theme_for(item.transit_planet, item.natal_planet, item.aspect)
+        events.append((
+            CycleEvent(
+                planet=item.transit_planet,
+                aspect=item.aspect,
+                natal_target=item.natal_planet,
+                peak_date=_local_date(item.peak_jd, tz_offset_minutes),
+                orb=round(item.orb_at_peak, 4),
+                life_theme=theme,
+                interpretation=interpretation,
+                start_date=_local_date(item.start_jd, tz_offset_minutes),
+                end_date=_local_date(item.end_jd, tz_offset_minutes),
+                exact_dates=[_local_date(jd, tz_offset_minutes) for jd in item.exact_hits],
+            ),
+            item.peak_jd,
+        ))
+    return events
+
+
+def natal_fingerprint(natal_chart: Dict[str, Any], zodiac_type: str, ayanamsa: str | None) -> str:
+    """Hash das longitudes natais e do zodíaco; identifica o mesmo ciclo de vida."""
+    payload = {
+        "planets": {name: round(float(p["lon"]), 6) for name, p in natal_chart.get("planets", {}).items()},
+        "zodiac_type": zodiac_type,
+        "ayanamsa": ayanamsa if zodiac_type == "sidereal" else None,
+    }
+    return hashlib.sha256(canonical_json(payload).encode("utf-8")).hexdigest()
+
+
+def _decade_events(
+    natal_chart: Dict[str, Any],
+    fingerprint: str,
+    jd_birth: float,
+    decade: int,
+    tz_offset_minutes: int,
+    zodiac_type: str,
+    ayanamsa: str | None,
 ) -> List[CycleEvent]:
-    _, aspects_profile = get_aspects_profile()
-    events: Dict[Tuple[str, str, str], CycleEvent] = {}
-
-    current = from_date
-    while current <= to_date:
-        transit = compute_transits(
-            target_year=current.year,
-            target_month=current.month,
-            target_day=current.day,
-            lat=lat,
-            lng=lng,
+    cache_key = f"life-cycles:{fingerprint}:{jd_birth:.6f}:{tz_offset_minutes}:{decade}"
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    jd_start = jd_birth + decade * DECADE_DAYS
+    jd_end = jd_start + DECADE_DAYS
+    events = [
+        event
+        for event, peak_jd in _scan_cycle_events(
+            natal_chart=natal_chart,
             tz_offset_minutes=tz_offset_minutes,
             zodiac_type=zodiac_type,
             ayanamsa=ayanamsa,
+            jd_start=jd_start,
+            jd_end=jd_end,
         )
-        aspects = compute_transit_aspects(
-            transit_planets=transit.get("planets", {}),
-            natal_planets=natal_chart.get("planets", {}),
-            aspects=aspects_profile,
-        )
-        for asp in aspects:
-            t_planet = str(asp.get("transit_planet", ""))
-            aspect = str(asp.get("aspect", "")).lower()
-            n_target = str(asp.get("natal_planet", ""))
-            orb = float(abs(asp.get("orb", 99.0)))
-
-            if t_planet not in SLOW_PLANETS or aspect not in MAJOR_ASPECTS:
-                continue
-            if orb > 3.0:
-                continue
-
-            key = (t_planet, aspect, n_target)
-            theme, interpretation = _theme_for(t_planet, n_target, aspect)
-            existing = events.get(key)
-            if existing is None or orb < existing.orb:
-                events[key] = CycleEvent(
-                    planet=t_planet,
-                    aspect=aspect,
-                    natal_target=n_target,
-                    peak_date=current,
-                    orb=orb,
-                    life_theme=theme,
-                    interpretation=interpretation,
-                )
-        current += timedelta(days=7)
-
-    return list(events.values())
+        # passagens que atravessam a borda aparecem nas duas décadas; fica a do pico
+        if jd_start <= peak_jd < jd_end
+    ]
+    cache.set(cache_key, events, ttl_seconds=TTL_LIFE_CYCLES_SECONDS)
+    return events
+
+
+def life_cycle_events(
+    natal_chart: Dict[str, Any],
+    birth_utc: datetime,
+    tz_offset_minutes: int,
+    zodiac_type: str,
+    ayanamsa: str | None,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+) -> List[CycleEvent]:
+    """Ciclos lentos com pico entre ``start`` e ``end`` (padrão: do nascimento aos 100 anos).
+
+    A vida é varrida em décadas contadas do nascimento, cada uma em cache pela
+    impressão digital do mapa natal.
+    """
+    fingerprint = natal_fingerprint(natal_chart, zodiac_type, ayanamsa)
+    jd_birth = to_julian_day(birth_utc)
+    first, last = 0, LIFE_SPAN_YEARS // DECADE_YEARS - 1
+    if start is not None:
+        first = max(first, math.floor((to_julian_day(datetime.combine(start, datetime.min.time())) - jd_birth) / DECADE_DAYS))
+    if end is not None:
+        last = min(last, math.floor((to_julian_day(datetime.combine(end, datetime.max.time())) - jd_birth) / DECADE_DAYS))
+
+    events: List[CycleEvent] = []
+    for decade in range(first, last + 1):
+        events.extend(_decade_events(natal_chart, fingerprint, jd_birth, decade, tz_offset_minutes, zodiac_type, ayanamsa))
+    events.sort(key=lambda e: (e.peak_date, e.planet, e.natal_target))
+    return [e for e in events if (start is None or e.peak_date >= start) and (end is None or e.peak_date <= end)]
 
 
 def _with_window(events: List[CycleEvent]) -> List[Dict[str, Any]]:
@@ -319,9 +409,11 @@ def _with_window(events: List[CycleEvent]) -> List[Dict[str, Any]]:
                 "planet": event.planet,
                 "aspect": event.aspect,
                 "natal_target": event.natal_target,
-                "start_date": (event.peak_date - timedelta(days=60)).isoformat(),
+                "start_date": (event.start_date or event.peak_date - timedelta(days=60)).isoformat(),
                 "peak_date": event.peak_date.isoformat(),
-                "end_date": (event.peak_date + timedelta(days=60)).isoformat(),
+                "end_date": (event.end_date or event.peak_date + timedelta(days=60)).isoformat(),
+                "exact_dates": [d.isoformat() for d in event.exact_dates],
+                "orb": event.orb,
                 "life_theme": event.life_theme,
                 "interpretation": event.interpretation,
             }
@@ -344,7 +436,9 @@ def detect_life_timeline(
     zodiac_type: str,
     ayanamsa: str | None,
     target_date: str,
+    whole_life: bool = False,
 ) -> Dict[str, Any]:
+    """Linha do tempo dos ciclos lentos; ``whole_life`` devolve todos os ciclos até os 100 anos."""
     natal_chart = compute_chart(
         year=natal_year,
         month=natal_month,
@@ -359,21 +453,22 @@ def detect_life_timeline(
         zodiac_type=zodiac_type,
         ayanamsa=ayanamsa,
     )
-    target = datetime.strptime(target_date, "%Y-%m-%d").date()
-    past_from = target - timedelta(days=365 * 5)
-    future_to = target + timedelta(days=365 * 5)
-
-    events = _scan_cycle_events(
-        natal_chart=natal_chart,
-        lat=lat,
-        lng=lng,
-        tz_offset_minutes=tz_offset_minutes,
-        zodiac_type=zodiac_type,
-        ayanamsa=ayanamsa,
-        from_date=past_from,
-        to_date=future_to,
+    birth_utc = datetime(natal_year, natal_month, natal_day, natal_hour, natal_minute, natal_second) - timedelta(
+        minutes=tz_offset_minutes
     )
-    events_sorted = sorted(events, key=lambda e: e.peak_date)
+    target = datetime.strptime(target_date, "%Y-%m-%d").date()
+    if whole_life:
+        events_sorted = life_cycle_events(natal_chart, birth_utc, tz_offset_minutes, zodiac_type, ayanamsa)
+    else:
+        events_sorted = life_cycle_events(
+            natal_chart,
+            birth_utc,
+            tz_offset_minutes,
+            zodiac_type,
+            ayanamsa,
+            start=target - timedelta(days=365 * WINDOW_YEARS),
+            end=target + timedelta(days=365 * WINDOW_YEARS),
+        )
     past = [e for e in events_sorted if e.peak_date < target]
     upcoming = [e for e in events_sorted if e.peak_date >= target]
 
@@ -385,6 +480,6 @@ def detect_life_timeline(
 
     return {
         "current_cycle": current_cycle,
-        "upcoming_cycles": _with_window(upcoming[:12]),
-        "past_cycles": _with_window(past[-12:]),
+        "upcoming_cycles": _with_window(upcoming if whole_life else upcoming[:12]),
+        "past_cycles": _with_window(past if whole_life else past[-12:]),
     }
@@ -5,7 +5,7 @@ import json
 from datetime import datetime
 from typing import Any, Dict, List, Tuple
 
-from astro.aspects import get_aspects_profile, compute_transit_aspects
+from astro.aspects import compute_natal_aspects, get_aspects_profile
 from astro.ephemeris import compute_chart
 from core.cache import cache
 from services.astro_logic import get_house_for_lon
@@ -45,28 +45,16 @@ def build_positions_hash(chart: Dict[str, Any]) -> str:
 
 def _compute_natal_aspects(planets: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
     _, aspects_profile = get_aspects_profile()
-    raw = compute_transit_aspects(planets, planets, aspects_profile)
-
-    dedup: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
-    for asp in raw:
-        p1 = str(asp.get("transit_planet", ""))
-        p2 = str(asp.get("natal_planet", ""))
-        if not p1 or not p2 or p1 == p2:
-            continue
-        pair = tuple(sorted([p1, p2]))
-        key = (pair[0], pair[1], str(asp.get("aspect", "")))
-        current_orb = abs(float(asp.get("orb", 99.0)))
-        existing = dedup.get(key)
-        if existing is None or current_orb < abs(float(existing.get("orb", 99.0))):
-            dedup[key] = {
-                "planet1": pair[0],
-                "planet2": pair[1],
-                "aspect": asp.get("aspect"),
-                "orb": round(current_orb, 4),
-                "influence": asp.get("influence"),
-            }
-
-    return sorted(dedup.values(), key=lambda item: item["orb"])
+    return [
+        {
+            "planet1": asp["planet1"],
+            "planet2": asp["planet2"],
+            "aspect": asp["aspect"],
+            "orb": asp["orb"],
+            "influence": asp["influence"],
+        }
+        for asp in compute_natal_aspects(planets, aspects_profile)
+    ]
 
 
 def compute_birth_chart(input_payload: Dict[str, Any]) -> Dict[str, Any]:
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from astro.aspects import CompiledAspects, compute_transit_aspects, resolve_aspects_config
+from astro.ephemeris import compute_chart, compute_transits
+from schemas.transits import PreferenciasPerfil, TransitsRequest
+from services.astro_logic import apply_profile_defaults, apply_sign_localization
+from services.time_utils import parse_date_yyyy_mm_dd
+
+
+@dataclass(frozen=True)
+class NatalContext:
+    """Mapa natal e configuração de aspectos calculados uma vez por requisição.
+
+    Os laços diários só somam o céu de trânsito de cada data (``for_date``).
+    """
+
+    natal: Dict[str, Any]
+    lat: float
+    lng: float
+    tz_offset_minutes: int
+    zodiac_type: str
+    ayanamsa: Optional[str]
+    is_pt: Optional[bool]
+    aspects_config: Dict[str, dict]
+    aspectos_usados: List[str]
+    orbes_usados: Dict[str, float]
+    orb_max: float
+    profile: str
+    compiled: CompiledAspects = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "compiled", CompiledAspects({"": self.aspects_config}))
+
+    @classmethod
+    def from_request(
+        cls,
+        body: TransitsRequest,
+        tz_offset_minutes: int,
+        is_pt: Optional[bool] = None,
+        preferencias: Optional[PreferenciasPerfil] = None,
+        apply_profile: bool = True,
+    ) -> "NatalContext":
+        """Monta o contexto a partir de uma requisição com dados natais.
+
+        ``is_pt=None`` mantém os signos sem localização. Com ``apply_profile``
+        os padrões de perfil (aspectos, orbes e orbe máximo) são aplicados.
+        """
+        if apply_profile:
+            aspectos_hab, orbes, orb_max, profile = apply_profile_defaults(
+                body.aspectos_habilitados, body.orbes, preferencias or body.preferencias
+            )
+        else:
+            aspectos_hab, orbes, orb_max, profile = body.aspectos_habilitados, body.orbes, 8.0, "custom"
+
+        natal = compute_chart(
+            body.natal_year, body.natal_month, body.natal_day, body.natal_hour, body.natal_minute, body.natal_second,
+            body.lat, body.lng, tz_offset_minutes, body.house_system.value, body.zodiac_type.value, body.ayanamsa
+        )
+        if is_pt is not None:
+            natal = apply_sign_localization(natal, is_pt)
+        aspects_config, aspectos_usados, orbes_usados = resolve_aspects_config(aspectos_hab, orbes)
+
+        return cls(
+            natal=natal,
+            lat=body.lat,
+            lng=body.lng,
+            tz_offset_minutes=tz_offset_minutes,
+            zodiac_type=body.zodiac_type.value,
+            ayanamsa=body.ayanamsa,
+            is_pt=is_pt,
+            aspects_config=aspects_config,
+            aspectos_usados=aspectos_usados,
+            orbes_usados=orbes_usados,
+            orb_max=orb_max,
+            profile=profile,
+        )
+
+    @property
+    def planets(self) -> Dict[str, Dict[str, Any]]:
+        return self.natal["planets"]
+
+    @property
+    def cusps(self) -> List[float]:
+        return self.natal["houses"]["cusps"]
+
+    def transits_for(self, date_str: str) -> Dict[str, Any]:
+        y, m, d = parse_date_yyyy_mm_dd(date_str)
+        transit = compute_transits(y, m, d, self.lat, self.lng, self.tz_offset_minutes, self.zodiac_type, self.ayanamsa)
+        if self.is_pt is not None:
+            transit = apply_sign_localization(transit, self.is_pt)
+        return transit
+
+    def aspects_for(self, transit_planets: Dict[str, Dict[str, Any]]) -> List[dict]:
+        return compute_transit_aspects(transit_planets, self.planets, compiled=self.compiled)
+
+    def for_date(self, date_str: str) -> Dict[str, Any]:
+        """Contexto de um dia no formato de ``routes.transits._build_transits_context``."""
+        return self.with_transits(self.transits_for(date_str))
+
+    def with_transits(self, transit: Dict[str, Any]) -> Dict[str, Any]:
+        """Como ``for_date``, reaproveitando um céu de trânsito já calculado."""
+        return {
+            "natal": self.natal,
+            "transits": transit,
+            "aspects": self.aspects_for(transit["planets"]),
+            "aspectos_usados": self.aspectos_usados,
+            "orbes_usados": self.orbes_usados,
+            "orb_max": self.orb_max,
+            "profile": self.profile,
+        }
@@ -1,12 +1,28 @@
 from __future__ import annotations
 
-from datetime import datetime, timedelta
-from typing import Any, Dict, List
+from dataclasses import dataclass, replace
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, List, Mapping, Optional
 
-from astro.aspects import compute_transit_aspects, get_aspects_profile
-from astro.ephemeris import compute_transits
+from astro.aspects import get_aspects_profile
+from astro.ephemeris import CROSSING_STEP_DAYS, DEFAULT_CROSSING_STEP_DAYS, PLANETS
+from astro.ephemeris_session import EphemerisSession
+from astro.transit_events import AspectEvent, find_aspect_events
+from astro.utils import from_julian_day, to_julian_day
 
 SLOW_PLANETS = {"Saturn", "Uranus", "Neptune", "Pluto"}
+PARTNERS = ("person_a", "person_b")
+EVOLUTION_HORIZON_DAYS = 210
+EVOLUTION_ORB = 3.5
+# Mesma grade da busca de cruzamentos: as estações são refinadas, então passos
+# largos não perdem repasses e as passagens longas dos lentos saem baratas
+STEP_DAYS = {name: CROSSING_STEP_DAYS.get(body_id, DEFAULT_CROSSING_STEP_DAYS) for name, body_id in PLANETS.items()}
+
+
+@dataclass(frozen=True)
+class RelationshipEvent:
+    partner: str  # "person_a" ou "person_b"
+    event: AspectEvent
 
 
 def _phase_for(planet: str, target: str, aspect: str) -> Dict[str, str]:
@@ -34,6 +50,45 @@ def _phase_for(planet: str, target: str, aspect: str) -> Dict[str, str]:
     )
 
 
+def find_relationship_events(
+    chart_a: Dict[str, Any],
+    chart_b: Dict[str, Any],
+    aspects: Mapping[str, dict],
+    jd_start: float,
+    jd_end: float,
+    session: Optional[EphemerisSession] = None,
+    transit_planets: Optional[Mapping[str, int]] = None,
+    step_days: Optional[Mapping[str, float]] = STEP_DAYS,
+) -> List[RelationshipEvent]:
+    """Passagens no orbe dos planetas em trânsito sobre os planetas natais das duas pessoas.
+
+    Um único rastreio por planeta em trânsito cobre a união dos alvos de A e B.
+    """
+    natal_lons: Dict[str, float] = {}
+    for partner, chart in zip(PARTNERS, (chart_a, chart_b)):
+        for name, planet in chart.get("planets", {}).items():
+            natal_lons[f"{partner}:{name}"] = float(planet["lon"])
+
+    found = find_aspect_events(
+        natal_lons,
+        aspects,
+        jd_start,
+        jd_end,
+        session=session,
+        transit_planets=transit_planets,
+        step_days=step_days,
+    )
+    events = []
+    for item in found:
+        partner, natal_planet = item.natal_planet.split(":", 1)
+        events.append(RelationshipEvent(partner, replace(item, natal_planet=natal_planet)))
+    return events
+
+
+def _local_date(jd_ut: float, tz_offset_minutes: int) -> date:
+    return (from_julian_day(jd_ut) + timedelta(minutes=tz_offset_minutes)).date()
+
+
 def detect_relationship_evolution(
     *,
     chart_a: Dict[str, Any],
@@ -44,49 +99,38 @@ def detect_relationship_evolution(
     timezone: str | None,
 ) -> Dict[str, Any]:
     _, aspects_profile = get_aspects_profile()
+    aspects = {name: {**info, "orb": min(float(info["orb"]), EVOLUTION_ORB)} for name, info in aspects_profile.items()}
     today = datetime.utcnow().date()
+    jd_start = to_julian_day(datetime.combine(today, time()) - timedelta(minutes=tz_offset_minutes))
+
+    found = find_relationship_events(
+        chart_a,
+        chart_b,
+        aspects,
+        jd_start,
+        jd_start + EVOLUTION_HORIZON_DAYS,
+        transit_planets={name: PLANETS[name] for name in sorted(SLOW_PLANETS)},
+    )
 
     phases: List[Dict[str, Any]] = []
-    for offset in range(0, 210, 14):
-        day = today + timedelta(days=offset)
-        transit = compute_transits(
-            target_year=day.year,
-            target_month=day.month,
-            target_day=day.day,
-            lat=lat,
-            lng=lng,
-            tz_offset_minutes=tz_offset_minutes,
-            zodiac_type="tropical",
-            ayanamsa=None,
-        )
-        aspects_a = compute_transit_aspects(
-            transit_planets=transit.get("planets", {}),
-            natal_planets=chart_a.get("planets", {}),
-            aspects=aspects_profile,
-        )
-        aspects_b = compute_transit_aspects(
-            transit_planets=transit.get("planets", {}),
-            natal_planets=chart_b.get("planets", {}),
-            aspects=aspects_profile,
-        )
-        merged = aspects_a + aspects_b
-        merged = [a for a in merged if str(a.get("transit_planet")) in SLOW_PLANETS and float(abs(a.get("orb", 99))) <= 3.5]
-        if not merged:
-            continue
-
-        top = sorted(merged, key=lambda x: float(abs(x.get("orb", 99))))[0]
-        t_planet = str(top.get("transit_planet", ""))
-        n_target = str(top.get("natal_planet", ""))
-        asp = str(top.get("aspect", ""))
-        phase = _phase_for(t_planet, n_target, asp)
+    for item in found:
+        event = item.event
+        start = _local_date(event.start_jd, tz_offset_minutes)
+        end = _local_date(event.end_jd, tz_offset_minutes)
+        phase = _phase_for(event.transit_planet, event.natal_planet, event.aspect)
         phases.append(
             {
-                "time_window": f"{(day - timedelta(days=10)).isoformat()} até {(day + timedelta(days=10)).isoformat()}",
-                "activating_planet": t_planet,
-                "synastry_target": n_target,
+                "time_window": f"{start.isoformat()} até {end.isoformat()}",
+                "start_date": start.isoformat(),
+                "end_date": end.isoformat(),
+                "activating_planet": event.transit_planet,
+                "synastry_target": event.natal_planet,
+                "partner": item.partner,
+                "aspect": event.aspect,
                 "relationship_theme": phase["theme"],
                 "interpretation": phase["text"],
-                "peak_date": day.isoformat(),
+                "peak_date": _local_date(event.peak_jd, tz_offset_minutes).isoformat(),
+                "exact_dates": [_local_date(jd, tz_offset_minutes).isoformat() for jd in event.exact_hits],
             }
         )
 
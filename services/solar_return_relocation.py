@@ -0,0 +1,85 @@
+"""Ranking de cidades para a revolução solar relocalizada.
+
+O instante do retorno não depende do local: os planetas são os mesmos em
+todas as cidades e só casas e ângulos mudam. As cidades chegam como linhas de
+um ``ChartBatch`` e os critérios (casa do Sol e da Lua, planetas angulares,
+signo do Ascendente) são avaliados em arrays (cidades × planetas).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import List, Tuple
+
+import numpy as np
+
+from astro.ephemeris import ChartBatch
+from services.astro_logic import houses_of
+
+SUN_HOUSE_WEIGHT = 3.0
+MOON_HOUSE_WEIGHT = 2.0
+ANGULAR_WEIGHT = 2.0
+ASC_SIGN_WEIGHT = 1.0
+
+ANGLE_NAMES = ("ASC", "MC", "DSC", "IC")
+
+
+@dataclass(frozen=True)
+class RelocationCriteria:
+    sun_houses: Tuple[int, ...] = ()
+    moon_houses: Tuple[int, ...] = ()
+    favored_angular: Tuple[str, ...] = ()
+    avoided_angular: Tuple[str, ...] = ()
+    asc_signs: Tuple[int, ...] = ()  # índices 0-11 de ZODIAC_SIGNS
+    angular_orb: float = 5.0
+
+
+@dataclass(frozen=True)
+class AngularContact:
+    planet: str
+    angle: str  # ASC | MC | DSC | IC
+    orb: float
+
+
+@dataclass(frozen=True)
+class CityScore:
+    index: int  # posição da cidade na lista recebida
+    score: float
+    sun_house: int
+    moon_house: int
+    angular: List[AngularContact] = field(default_factory=list)
+
+
+def score_cities(batch: ChartBatch, criteria: RelocationCriteria) -> List[CityScore]:
+    """Pontua cada cidade de ``batch`` e devolve do maior ao menor score (empates pela ordem de entrada)."""
+    names = batch.planet_names
+    houses = houses_of(batch.cusps, batch.lon)
+    sun_house = houses[:, names.index("Sun")]
+    moon_house = houses[:, names.index("Moon")]
+
+    angles = np.column_stack([batch.asc, batch.mc, (batch.asc + 180.0) % 360.0, (batch.mc + 180.0) % 360.0])
+    diff = np.abs((batch.lon[:, :, None] - angles[:, None, :] + 180.0) % 360.0 - 180.0)
+    nearest = np.argmin(diff, axis=2)
+    orb = np.min(diff, axis=2)
+    strength = np.where(orb <= criteria.angular_orb, 1.0 - orb / max(criteria.angular_orb, 1e-9), 0.0)
+
+    favored = np.array([name in criteria.favored_angular for name in names])
+    avoided = np.array([name in criteria.avoided_angular for name in names])
+    score = (
+        SUN_HOUSE_WEIGHT * np.isin(sun_house, criteria.sun_houses)
+        + MOON_HOUSE_WEIGHT * np.isin(moon_house, criteria.moon_houses)
+        + ANGULAR_WEIGHT * (strength[:, favored].sum(axis=1) - strength[:, avoided].sum(axis=1))
+        + ASC_SIGN_WEIGHT * np.isin((batch.asc // 30.0).astype(int) % 12, criteria.asc_signs)
+    )
+
+    ranked = []
+    for row in range(len(batch)):
+        contacts = [
+            AngularContact(names[col], ANGLE_NAMES[int(nearest[row, col])], round(float(orb[row, col]), 3))
+            for col in np.argsort(orb[row], kind="stable")
+            if orb[row, col] <= criteria.angular_orb
+        ]
+        ranked.append(CityScore(row, round(float(score[row]), 4), int(sun_house[row]), int(moon_house[row]), contacts))
+    ranked.sort(key=lambda item: (-item.score, item.index))
+    return ranked
+
@@ -0,0 +1,60 @@
+"""Ranking de compatibilidade de um mapa contra muitos parceiros.
+
+As longitudes dos parceiros chegam empilhadas numa matriz (n, planetas) e
+todos os aspectos cruzados saem de um único ``aspect_tensor``. Cada aspecto
+pesa pela proximidade do exato (1 no exato, 0 no limite do orbe) e entra em
+harmonia ou tensão com a mesma divisão de ``routes.synastry._aspect_to_out``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+from astro.aspects import CompiledAspects, aspect_tensor
+
+STRENGTH_INFLUENCES = frozenset({"supportive", "subtle", "adjusting"})
+
+
+@dataclass(frozen=True)
+class PartnerScore:
+    index: int  # posição do parceiro na lista recebida
+    score: int  # 0-100
+    harmony: float
+    tension: float
+    aspect_count: int
+
+    @property
+    def intensity(self) -> float:
+        return self.harmony + self.tension
+
+
+def score_partners(
+    person_lons: Sequence[float],
+    partner_lons: np.ndarray,
+    aspects: Dict[str, dict],
+) -> List[PartnerScore]:
+    """Pontua cada linha de ``partner_lons`` contra ``person_lons``, do mais ao menos compatível.
+
+    O score é a fração suavizada de harmonia, ``(h + 1) / (h + t + 2)``, para
+    que poucos aspectos não levem ninguém aos extremos; empates ficam com
+    quem tem mais aspectos e depois com a ordem de entrada.
+    """
+    compiled = CompiledAspects({"": aspects})
+    orb, mask = aspect_tensor(person_lons, partner_lons, compiled)
+    weight = np.where(mask, 1.0 - orb / np.maximum(compiled.orbs, 1e-9), 0.0)
+
+    strength = np.array([str(info.get("influence", "")).lower() in STRENGTH_INFLUENCES for _, _, info in compiled.entries])
+    harmony = weight[..., strength].sum(axis=(1, 2, 3))
+    tension = weight[..., ~strength].sum(axis=(1, 2, 3))
+    counts = mask.sum(axis=(1, 2, 3))
+    scores = np.rint(100.0 * (harmony + 1.0) / (harmony + tension + 2.0)).astype(int)
+
+    ranked = [
+        PartnerScore(idx, int(scores[idx]), round(float(harmony[idx]), 3), round(float(tension[idx]), 3), int(counts[idx]))
+        for idx in range(len(scores))
+    ]
+    ranked.sort(key=lambda item: (-item.score, -item.intensity, item.index))
+    return ranked
@@ -0,0 +1,88 @@
+import random
+
+from astro.aspects import (
+    ASPECTS_PROFILES,
+    CompiledAspects,
+    aspect_matrix,
+    aspect_tensor,
+    compute_natal_aspects,
+    compute_transit_aspects,
+)
+from astro.utils import angle_diff
+
+NAMES = ["Sun", "Moon", "Mercury", "Venus", "Mars", "Jupiter", "Saturn", "Uranus", "Neptune", "Pluto"]
+
+
+def _planets(rng):
+    return {name: {"lon": round(rng.uniform(0, 360), rng.choice([0, 2, 6]))} for name in NAMES}
+
+
+def _loop_reference(transit, natal, aspects):
+    found = []
+    for t_name, t_data in transit.items():
+        for n_name, n_data in natal.items():
+            separation = angle_diff(t_data["lon"], n_data["lon"])
+            for aspect_name, info in aspects.items():
+                orb = abs(separation - info["angle"])
+                if orb <= info["orb"]:
+                    found.append((t_name, n_name, aspect_name, round(orb, 4)))
+    return found
+
+
+def test_transit_aspects_match_nested_loop():
+    rng = random.Random(7)
+    for _ in range(200):
+        transit, natal = _planets(rng), _planets(rng)
+        natal["Moon"]["lon"] = (transit["Sun"]["lon"] + 90.0) % 360.0
+        for aspects in ASPECTS_PROFILES.values():
+            result = compute_transit_aspects(transit, natal, aspects)
+            expected = sorted(_loop_reference(transit, natal, aspects), key=lambda item: item[3])
+            assert [(a["transit_planet"], a["natal_planet"], a["aspect"], a["orb"]) for a in result] == expected
+
+
+def test_natal_mode_reports_each_pair_once():
+    rng = random.Random(11)
+    planets = _planets(rng)
+    planets["Venus"]["lon"] = (planets["Mars"]["lon"] + 120.0) % 360.0
+    result = compute_natal_aspects(planets, ASPECTS_PROFILES["modern"])
+
+    pairs = [(a["planet1"], a["planet2"], a["aspect"]) for a in result]
+    assert len(pairs) == len(set(pairs))
+    assert all(a["planet1"] < a["planet2"] for a in result)
+    assert ("Mars", "Venus", "trine") in pairs
+    both_ways = _loop_reference(planets, planets, ASPECTS_PROFILES["modern"])
+    assert len(both_ways) == 2 * len(result) + len(planets)  # + conjunção de cada planeta consigo
+
+
+def test_several_profiles_in_one_pass():
+    rng = random.Random(3)
+    transit, natal = _planets(rng), _planets(rng)
+    a = [p["lon"] for p in transit.values()]
+    b = [p["lon"] for p in natal.values()]
+
+    combined = aspect_matrix(a, b, CompiledAspects(ASPECTS_PROFILES), mode="synastry")
+    assert set(combined) == set(ASPECTS_PROFILES)
+    for name, aspects in ASPECTS_PROFILES.items():
+        assert combined[name] == aspect_matrix(a, b, CompiledAspects({name: aspects}), mode="synastry")[name]
+
+
+def test_aspect_tensor_matches_transit_aspects_per_row():
+    rng = random.Random(5)
+    natal = _planets(rng)
+    partners = [_planets(rng) for _ in range(25)]
+    aspects = ASPECTS_PROFILES["modern"]
+    compiled = CompiledAspects({"": aspects})
+
+    orb, mask = aspect_tensor(
+        [p["lon"] for p in natal.values()],
+        [[p["lon"] for p in partner.values()] for partner in partners],
+        compiled,
+    )
+    assert mask.shape == (25, len(NAMES), len(NAMES), len(aspects))
+    for row, partner in enumerate(partners):
+        expected = compute_transit_aspects(partner, natal, aspects)
+        found = [
+            (NAMES[i], NAMES[j], compiled.entries[k][1], round(float(orb[row, i, j, k]), 4))
+            for i, j, k in zip(*mask[row].nonzero())
+        ]
+        assert sorted(found) == sorted((a["transit_planet"], a["natal_planet"], a["aspect"], a["orb"]) for a in expected)
@@ -0,0 +1,107 @@
+from datetime import datetime
+
+import pytest
+import swisseph as swe
+from fastapi.testclient import TestClient
+
+import main
+import routes.chart as chart_routes
+from astro.astrocartography import compute_astrocartography, decode_polyline, encode_polyline
+from astro.ephemeris import PLANETS
+from astro.ephemeris_tables import calc_position
+from astro.utils import to_julian_day
+
+
+@pytest.fixture(autouse=True)
+def _set_env(monkeypatch):
+    monkeypatch.setenv("API_KEY", "test-key")
+    monkeypatch.setenv("OPENAI_API_KEY", "dummy")
+    yield
+
+
+def _auth_headers():
+    return {"Authorization": "Bearer test-key", "X-User-Id": "u1"}
+
+
+JD = to_julian_day(datetime(1995, 11, 8, 1, 56))
+
+
+def _wrap(value):
+    return (value + 180.0) % 360.0 - 180.0
+
+
+def test_zodiacal_lines_match_local_angles():
+    astro_map = compute_astrocartography(JD, method="zodiacal", lat_step=2.0)
+    for line in astro_map.lines:
+        lon = calc_position(JD, PLANETS[line.planet])[0]
+        for segment in line.segments:
+            for lat, lng in segment:
+                lat = max(min(lat, 60.0), -60.0)
+                if abs(lat) == 60.0 and line.kind in ("ASC", "DSC") or abs(lng) == 180.0:
+                    continue
+                _, ascmc = swe.houses_ex(JD, lat, lng, b"O", 0)
+                angle = {"ASC": ascmc[0], "MC": ascmc[1], "DSC": ascmc[0] + 180.0, "IC": ascmc[1] + 180.0}[line.kind]
+                assert abs(_wrap(angle - lon)) < 1e-6
+
+
+def test_mundo_horizon_lines_have_zero_altitude():
+    astro_map = compute_astrocartography(JD, names=("Moon", "Pluto"), lat_step=5.0)
+    for line in astro_map.lines:
+        if line.kind not in ("ASC", "DSC"):
+            continue
+        xx = swe.calc_ut(JD, PLANETS[line.planet], swe.FLG_SWIEPH)[0]
+        for segment in line.segments:
+            for lat, lng in segment:
+                if abs(lng) == 180.0:
+                    continue  # corte interpolado no antimeridiano
+                altitude = swe.azalt(JD, swe.ECL2HOR, (lng, lat, 0.0), 0.0, 10.0, xx)[1]
+                assert abs(altitude) < 1e-6
+
+
+def test_polyline_round_trip():
+    points = [(38.5, -120.2), (40.7, -120.95), (43.252, -126.453), (-12.34567, 179.99999)]
+    assert encode_polyline(points[:3]) == "_p~iF~ps|U_ulLnnqC_mqNvxq`@"
+    decoded = decode_polyline(encode_polyline(points))
+    assert all(abs(a - b) < 1e-5 for p, q in zip(points, decoded) for a, b in zip(p, q))
+
+
+def test_astrocartography_route_is_cached_by_instant(monkeypatch):
+    calls = []
+    original = chart_routes.compute_astrocartography
+
+    def counting(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(chart_routes, "compute_astrocartography", counting)
+    client = TestClient(main.app)
+    payload = {
+        "natal_year": 1987, "natal_month": 6, "natal_day": 3, "natal_hour": 9, "natal_minute": 41,
+        "lat": -23.5505, "lng": -46.6333, "tz_offset_minutes": -180,
+    }
+    first = client.post("/v1/chart/astrocartography", json=payload, headers=_auth_headers())
+    assert first.status_code == 200
+    data = first.json()
+    assert len(data["lines"]) == 4 * len(PLANETS)
+    assert {line["kind"] for line in data["lines"]} == {"MC", "IC", "ASC", "DSC"}
+    assert all(isinstance(segment, str) for line in data["lines"] for segment in line["segments"])
+
+    # mesmo instante UT em outro local: mesmas linhas, sem recalcular
+    moved = {**payload, "natal_hour": 13, "lat": 51.5, "lng": -0.12, "tz_offset_minutes": 60}
+    second = client.post("/v1/chart/astrocartography", json=moved, headers=_auth_headers())
+    assert second.json()["lines"] == data["lines"]
+    assert len(calls) == 1
+
+
+def test_astrocartography_rejects_unknown_planet():
+    client = TestClient(main.app)
+    resp = client.post(
+        "/v1/chart/astrocartography",
+        json={
+            "natal_year": 1987, "natal_month": 6, "natal_day": 3, "natal_hour": 9,
+            "lat": -23.5505, "lng": -46.6333, "tz_offset_minutes": -180,
+            "planets": ["Sun", "Chiron"], "polyline_format": "coords",
+        },
+        headers=_auth_headers(),
+    )
+    assert resp.status_code == 422
@@ -0,0 +1,125 @@
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from core import limits
+from routes import batch as batch_route
+from services.natal_context import NatalContext
+
+
+@pytest.fixture(autouse=True)
+def _set_env(monkeypatch):
+    monkeypatch.setenv("API_KEY", "test-key")
+    monkeypatch.setenv("OPENAI_API_KEY", "dummy")
+    limits.configure_rate_limit_store(limits.InMemoryRateLimitStore())
+    yield
+    limits.reset_rate_limit_store()
+
+
+def _auth_headers():
+    return {"Authorization": "Bearer test-key", "X-User-Id": "u1"}
+
+
+NATAL = {
+    "natal_year": 1995,
+    "natal_month": 11,
+    "natal_day": 7,
+    "natal_hour": 22,
+    "natal_minute": 0,
+    "natal_second": 0,
+    "lat": -23.5505,
+    "lng": -46.6333,
+    "timezone": "America/Sao_Paulo",
+    "target_date": "2026-01-01",
+}
+
+ALL_PATHS = [
+    "/v1/insights/dominant-theme",
+    "/v1/insights/areas-activated",
+    "/v1/insights/care-suggestion",
+    "/v1/daily/summary",
+    "/v1/alerts/system",
+]
+
+
+def _batch(client, paths, lang=None):
+    body = {**NATAL, "requests": [{"id": f"r{i}", "path": path} for i, path in enumerate(paths)]}
+    url = "/v1/batch" + (f"?lang={lang}" if lang else "")
+    return client.post(url, json=body, headers=_auth_headers())
+
+
+def test_batch_matches_individual_routes():
+    client = TestClient(main.app)
+    resp = _batch(client, ALL_PATHS, lang="pt-BR")
+    assert resp.status_code == 200
+    results = resp.json()["results"]
+    assert [r["id"] for r in results] == ["r0", "r1", "r2", "r3", "r4"]
+    assert all(r["status"] == 200 for r in results)
+
+    for path in ALL_PATHS[:3]:
+        direct = client.post(f"{path}?lang=pt-BR", json=NATAL, headers=_auth_headers())
+        assert direct.status_code == 200
+        assert results[ALL_PATHS.index(path)]["body"] == direct.json()
+
+    daily = client.get(
+        "/v1/daily/summary",
+        params={
+            "date": NATAL["target_date"], "timezone": NATAL["timezone"], "lat": NATAL["lat"], "lng": NATAL["lng"],
+            "natal_year": 1995, "natal_month": 11, "natal_day": 7, "natal_hour": 22, "lang": "pt-BR",
+        },
+        headers=_auth_headers(),
+    )
+    assert results[3]["body"] == daily.json()
+
+    alerts = client.get(
+        "/v1/alerts/system",
+        params={"date": NATAL["target_date"], "timezone": NATAL["timezone"], "lat": NATAL["lat"], "lng": NATAL["lng"]},
+        headers=_auth_headers(),
+    )
+    assert results[4]["body"] == alerts.json()
+
+
+def test_batch_builds_natal_chart_once(monkeypatch):
+    calls = []
+    original = NatalContext.from_request.__func__
+
+    def counting(cls, *args, **kwargs):
+        calls.append(1)
+        return original(cls, *args, **kwargs)
+
+    monkeypatch.setattr(NatalContext, "from_request", classmethod(counting))
+    resp = _batch(TestClient(main.app), ALL_PATHS)
+    assert resp.status_code == 200
+    assert len(calls) == 1
+
+
+def test_batch_reports_status_per_item(monkeypatch):
+    def fake_check(user_id, endpoint, plan):
+        if endpoint == "/v1/insights/areas-activated":
+            return False, "Limite diário atingido para este recurso (50/dia)."
+        return True, ""
+
+    monkeypatch.setattr(batch_route, "check_and_inc", fake_check)
+    resp = _batch(TestClient(main.app), ["/v1/insights/dominant-theme", "/v1/insights/areas-activated", "/v1/chart/natal"])
+    assert resp.status_code == 200
+    statuses = [(r["id"], r["status"]) for r in resp.json()["results"]]
+    assert statuses == [("r0", 200), ("r1", 429), ("r2", 404)]
+    assert "Limite" in resp.json()["results"][1]["error"]
+
+
+def test_batch_reports_shared_state_failure_per_item(monkeypatch):
+    def failing(cls, *args, **kwargs):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(NatalContext, "from_request", classmethod(failing))
+    resp = _batch(TestClient(main.app), ALL_PATHS)
+    assert resp.status_code == 200
+    statuses = [r["status"] for r in resp.json()["results"]]
+    # só a sugestão de cuidado (Lua) e os alertas não dependem do mapa natal
+    assert statuses == [500, 500, 200, 500, 200]
+
+
+def test_batch_rejects_empty_request_list():
+    client = TestClient(main.app)
+    resp = client.post("/v1/batch", json={**NATAL, "requests": []}, headers=_auth_headers())
+    assert resp.status_code == 422
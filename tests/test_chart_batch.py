@@ -0,0 +1,51 @@
+from datetime import datetime
+
+import pytest
+
+from astro.ephemeris import BatchChartInput, compute_chart, compute_charts_batch
+from astro.utils import to_julian_day
+
+
+CASES = [
+    (datetime(1995, 11, 7, 22, 56, 0), -23.5505, -46.6333, "P", "tropical", None),
+    (datetime(2024, 3, 20, 12, 0, 0), 0.0, 0.0, "K", "sidereal", "lahiri"),
+    (datetime(2010, 6, 1, 3, 30, 0), 51.5074, -0.1278, "R", "tropical", None),
+]
+
+
+def test_batch_matches_compute_chart_at_response_edge():
+    batch = compute_charts_batch([
+        BatchChartInput(instant=dt, lat=lat, lng=lng, house_system=hs, zodiac_type=zt, ayanamsa=ay)
+        for dt, lat, lng, hs, zt, ay in CASES
+    ])
+
+    assert len(batch) == len(CASES)
+    assert batch.lon.shape == (len(CASES), 10)
+    assert batch.cusps.shape == (len(CASES), 12)
+
+    for idx, (dt, lat, lng, hs, zt, ay) in enumerate(CASES):
+        expected = compute_chart(
+            dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second, lat, lng,
+            tz_offset_minutes=0, house_system=hs, zodiac_type=zt, ayanamsa=ay,
+        )
+        actual = batch.to_chart_dict(idx)
+        assert actual["houses"] == expected["houses"]
+        assert actual["utc_datetime"] == expected["utc_datetime"]
+        for name, planet in expected["planets"].items():
+            assert actual["planets"][name]["sign"] == planet["sign"]
+            assert actual["planets"][name]["retrograde"] == planet["retrograde"]
+            assert actual["planets"][name]["lon"] == pytest.approx(planet["lon"], abs=1e-6)
+
+
+def test_batch_accepts_julian_day_and_exposes_columns():
+    dt = datetime(2024, 1, 1, 12, 0, 0)
+    batch = compute_charts_batch([
+        BatchChartInput(instant=to_julian_day(dt), lat=10.0, lng=20.0),
+        BatchChartInput(instant=dt, lat=-10.0, lng=20.0),
+    ])
+
+    sun = batch.planet_column("Sun")
+    assert sun[0] == sun[1]
+    assert batch.asc[0] != batch.asc[1]
+    assert batch.utc_datetimes[0] == dt
+    assert batch.sign_index()[0, 0] == 9  # Sol em Capricórnio
@@ -0,0 +1,103 @@
+import asyncio
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+import main
+from core.compute import get_compute_executor, run_compute, shutdown_compute_executor
+
+
+@pytest.fixture(autouse=True)
+def _small_pool(monkeypatch):
+    monkeypatch.setenv("API_KEY", "test-key")
+    monkeypatch.setenv("COMPUTE_POOL_SIZE", "1")
+    monkeypatch.setenv("COMPUTE_QUEUE_SIZE", "1")
+    shutdown_compute_executor()
+    yield
+    shutdown_compute_executor()
+
+
+def test_run_compute_executes_off_the_event_loop():
+    async def _run():
+        loop_thread = threading.get_ident()
+        worker_thread = await run_compute(threading.get_ident)
+        total = await run_compute(sum, [1, 2, 3])
+        return loop_thread, worker_thread, total
+
+    loop_thread, worker_thread, total = asyncio.run(_run())
+    assert worker_thread != loop_thread
+    assert total == 6
+
+
+def test_run_compute_rejects_when_queue_is_full():
+    release = threading.Event()
+
+    async def _run():
+        running = asyncio.ensure_future(run_compute(release.wait, 5))
+        queued = asyncio.ensure_future(run_compute(release.wait, 5))
+        await asyncio.sleep(0.05)
+        with pytest.raises(HTTPException) as exc:
+            await run_compute(sum, [1])
+        release.set()
+        await asyncio.gather(running, queued)
+        return exc.value.status_code, await run_compute(sum, [1])
+
+    status_code, after = asyncio.run(_run())
+    assert status_code == 503
+    assert after == 1
+
+
+NATAL_PAYLOAD = {
+    "natal_year": 1990,
+    "natal_month": 5,
+    "natal_day": 10,
+    "natal_hour": 14,
+    "natal_minute": 30,
+    "natal_second": 0,
+    "lat": -23.55,
+    "lng": -46.63,
+    "timezone": "America/Sao_Paulo",
+}
+
+
+def test_natal_route_uses_compute_pool():
+    client = TestClient(main.app)
+    resp = client.post(
+        "/v1/chart/natal",
+        json=NATAL_PAYLOAD,
+        headers={"Authorization": "Bearer test-key", "X-User-Id": "u1"},
+    )
+    assert resp.status_code == 200
+    assert "Sun" in resp.json()["planets"]
+
+
+PROCESS_MODE_CALLS = [
+    ("post", "/v1/chart/natal", {"json": NATAL_PAYLOAD}),
+    ("get", "/v1/cosmic-weather/range", {"params": {"from": "2026-01-01", "to": "2026-01-03", "timezone": "UTC"}}),
+    ("post", "/v1/insights/dominant-theme", {"json": {**NATAL_PAYLOAD, "target_date": "2026-01-01"}}),
+    ("post", "/v1/batch", {"json": {
+        **NATAL_PAYLOAD,
+        "target_date": "2026-01-01",
+        "requests": [{"id": "a", "path": "/v1/daily/summary"}, {"id": "b", "path": "/v1/insights/care-suggestion"}],
+    }}),
+]
+
+
+@pytest.mark.parametrize("method, path, kwargs", PROCESS_MODE_CALLS)
+def test_routes_run_in_process_executor(monkeypatch, method, path, kwargs):
+    monkeypatch.setenv("COMPUTE_POOL_SIZE", "2")
+    monkeypatch.setenv("COMPUTE_QUEUE_SIZE", "8")
+    headers = {"Authorization": "Bearer test-key", "X-User-Id": "u1"}
+    client = TestClient(main.app)
+    threaded = getattr(client, method)(path, headers=headers, **kwargs)
+    assert threaded.status_code == 200
+
+    shutdown_compute_executor()
+    monkeypatch.setenv("COMPUTE_EXECUTOR", "process")
+    assert isinstance(get_compute_executor(), ProcessPoolExecutor)
+    in_process = getattr(client, method)(path, headers=headers, **kwargs)
+    assert in_process.status_code == 200
+    assert in_process.json() == threaded.json()
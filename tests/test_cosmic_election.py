@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from astro.aspects import compute_transit_aspects, get_aspects_profile
+from astro.ephemeris import compute_chart
+from services.cosmic_decision_engine import (
+    ELECTION_TONE,
+    QUESTION_RULES,
+    _extract_active_influences,
+    _score_aspect,
+    score_election_slots,
+    search_election_windows,
+)
+
+
+@pytest.fixture(autouse=True)
+def _set_env(monkeypatch):
+    monkeypatch.setenv("API_KEY", "test-key")
+    monkeypatch.setenv("OPENAI_API_KEY", "dummy")
+    yield
+
+
+def _auth_headers():
+    return {"Authorization": "Bearer test-key", "X-User-Id": "u1"}
+
+
+CHART = compute_chart(1990, 5, 17, 8, 30, 0, -23.5505, -46.6333, tz_offset_minutes=-180)
+
+
+def test_slot_values_match_per_slot_aspect_scoring():
+    jd = 2461000.5 + np.arange(0, 10 * 24) / 24.0
+    slots = score_election_slots(CHART, "career", jd)
+    _, profile = get_aspects_profile()
+    rules = QUESTION_RULES["career"]
+    for row in range(0, len(jd), 17):
+        transit = {name: {"lon": float(slots.transit_lons[row, col])} for col, name in enumerate(slots.transit_names)}
+        aspects = compute_transit_aspects(transit, CHART["planets"], profile)
+        scored = []
+        for asp in aspects:
+            asp["transit_lon"] = transit[asp["transit_planet"]]["lon"]
+            score = _score_aspect(asp, rules, CHART["houses"]["cusps"])
+            if score >= 5:
+                scored.append((score, ELECTION_TONE[asp["influence"]]))
+        scored.sort(key=lambda item: item[0], reverse=True)
+        # só o arredondamento de orbes no limite de 4 casas pode diferir
+        assert slots.values[row] == pytest.approx(sum(s * t for s, t in scored[:6]), abs=0.05)
+
+
+def test_windows_are_disjoint_and_explained_by_peak_influences():
+    jd_start = 2461000.5
+    windows, scanned = search_election_windows(CHART, "relationship", jd_start, jd_start + 30, step_minutes=30, top=4)
+    assert scanned == 30 * 48
+    assert 1 <= len(windows) <= 4
+    assert [w.score for w in windows] == sorted((w.score for w in windows), reverse=True)
+    spans = sorted((w.start_jd, w.end_jd) for w in windows)
+    assert all(a_end <= b_start + 1e-9 for (_, a_end), (b_start, _) in zip(spans, spans[1:]))
+    for window in windows:
+        assert window.start_jd <= window.peak_jd < window.end_jd
+        row = int(round((window.peak_jd - jd_start) * 48))
+        slots = score_election_slots(CHART, "relationship", np.array([jd_start + row / 48.0]))
+        transit = {name: {"lon": float(slots.transit_lons[0, col])} for col, name in enumerate(slots.transit_names)}
+        expected = _extract_active_influences(CHART, {"planets": transit}, "relationship")
+        assert [item.title for item in window.influences] == [item.title for item in expected]
+
+
+def test_decision_windows_route():
+    client = TestClient(main.app)
+    resp = client.post(
+        "/v1/cosmic/decision/windows",
+        json={
+            "natal_year": 1990, "natal_month": 5, "natal_day": 17, "natal_hour": 8, "natal_minute": 30,
+            "lat": -23.5505, "lng": -46.6333, "timezone": "America/Sao_Paulo",
+            "question": "Quando assinar o contrato do novo trabalho?",
+            "target_date": "2026-03-01", "window_days": 14, "step_minutes": 30, "top": 3,
+        },
+        headers=_auth_headers(),
+    )
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["question_type"] == "career"
+    assert data["slots_scanned"] == 14 * 48
+    assert 1 <= len(data["windows"]) <= 3
+    first = data["windows"][0]
+    assert data["window_start"] <= first["start"] <= first["peak"] < first["end"] <= data["window_end"]
+    assert first["start"].endswith(("00:00", "30:00"))
+    assert first["key_influences"]
@@ -0,0 +1,44 @@
+from datetime import datetime
+
+import swisseph as swe
+
+from astro.crossings import find_crossings, wrap180
+from astro.ephemeris_tables import calc_position
+from astro.utils import to_julian_day
+
+
+def _position(body_id):
+    return lambda jd_ut: calc_position(jd_ut, body_id)
+
+
+def test_crossings_are_refined_to_the_second():
+    jd_start = to_julian_day(datetime(2024, 1, 1))
+    jd_end = to_julian_day(datetime(2024, 12, 31))
+    crossings = find_crossings(_position(swe.SUN), [0.0, 90.0, 180.0, 270.0], jd_start, jd_end)
+
+    assert [c.target for c in crossings] == [0.0, 90.0, 180.0, 270.0]
+    for crossing in crossings:
+        lon = calc_position(crossing.jd_ut, swe.SUN)[0]
+        assert abs(wrap180(lon - crossing.target)) < 1e-4
+        assert crossing.direction == 1
+
+
+def test_retrograde_planet_crosses_the_same_degree_three_times():
+    # Mercúrio retrógrado de abril de 2024 (aprox. 27°13' → 15°58' Áries)
+    jd_start = to_julian_day(datetime(2024, 3, 20))
+    jd_end = to_julian_day(datetime(2024, 5, 20))
+    crossings = find_crossings(_position(swe.MERCURY), [20.0], jd_start, jd_end)
+
+    assert [c.direction for c in crossings] == [1, -1, 1]
+    assert crossings[0].jd_ut < crossings[1].jd_ut < crossings[2].jd_ut
+
+
+def test_repass_inside_one_grid_step_is_split_at_the_station():
+    # 0,01° antes do grau da estação retrógrada de 2024-04-01: ida e volta no mesmo passo da grade
+    jd_start = to_julian_day(datetime(2024, 3, 1))
+    jd_end = to_julian_day(datetime(2024, 6, 1))
+    station_lon = calc_position(to_julian_day(datetime(2024, 4, 1, 22, 0)), swe.MERCURY)[0]
+    crossings = find_crossings(_position(swe.MERCURY), [station_lon - 0.01], jd_start, jd_end, step_days=10.0)
+
+    assert [c.direction for c in crossings] == [1, -1, 1]
+    assert crossings[1].jd_ut - crossings[0].jd_ut < 10.0
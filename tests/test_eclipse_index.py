@@ -0,0 +1,96 @@
+from datetime import datetime
+
+import pytest
+import swisseph as swe
+from fastapi.testclient import TestClient
+
+import main
+from astro.aspects import CompiledAspects, resolve_aspects_config
+from astro.eclipse_index import EclipseIndex, get_eclipse_index, natal_contacts
+from astro.utils import to_julian_day
+
+
+@pytest.fixture(autouse=True)
+def _set_env(monkeypatch):
+    monkeypatch.setenv("API_KEY", "test-key")
+    monkeypatch.setenv("OPENAI_API_KEY", "dummy")
+    yield
+
+
+def _auth_headers():
+    return {"Authorization": "Bearer test-key", "X-User-Id": "u1"}
+
+
+JAN_2024 = to_julian_day(datetime(2024, 1, 1))
+JAN_2025 = to_julian_day(datetime(2025, 1, 1))
+
+
+def test_catalog_matches_known_eclipses_of_2024():
+    events = EclipseIndex().between(JAN_2024, JAN_2025)
+    assert [(e.kind, e.eclipse_type, e.sign) for e in events] == [
+        ("lunar", "penumbral", "Libra"),
+        ("solar", "total", "Aries"),
+        ("lunar", "partial", "Pisces"),
+        ("solar", "annular", "Libra"),
+    ]
+    total = events[1]
+    assert total.utc_datetime.strftime("%Y-%m-%d %H:%M") == "2024-04-08 18:17"
+    assert total.deg_in_sign == pytest.approx(19.4, abs=0.05)
+    assert total.saros_series == 139
+    # o catálogo devolve os mesmos máximos da busca direta do Swiss Ephemeris
+    assert total.jd_ut == pytest.approx(swe.sol_eclipse_when_glob(JAN_2024 + 90, swe.FLG_SWIEPH, 0, False)[1][0], abs=1e-9)
+
+
+def test_index_round_trips_through_file(tmp_path):
+    index = EclipseIndex().build(2020, 2030)
+    loaded = EclipseIndex.load(index.save(str(tmp_path / "eclipses.npz")))
+    jd_end = to_julian_day(datetime(2031, 1, 1))
+    start = to_julian_day(datetime(2020, 1, 1))
+    assert loaded.between(start, jd_end) == index.between(start, jd_end)
+    assert loaded.next(JAN_2024) == index.between(JAN_2024, JAN_2025)[0]
+
+
+def test_natal_contacts_use_aspect_orbs():
+    eclipse = get_eclipse_index().between(JAN_2024, JAN_2025, ["solar"])[0]
+    aspects, _, _ = resolve_aspects_config(["conj", "opos"], {"conj": 3.0, "opos": 3.0})
+    points = {"Sun": (eclipse.lon + 1.0) % 360.0, "Mars": (eclipse.lon + 181.5) % 360.0, "Venus": (eclipse.lon + 90.0) % 360.0}
+    contacts = natal_contacts([eclipse], points, CompiledAspects({"": aspects}))
+    assert [(c.point, c.aspect, c.orb) for c in contacts] == [
+        ("Sun", "conjunction", pytest.approx(1.0, abs=1e-3)),
+        ("Mars", "opposition", pytest.approx(1.5, abs=1e-3)),
+    ]
+    # no zodíaco sideral o grau do eclipse recua pela ayanamsa
+    assert natal_contacts([eclipse], {"Sun": (eclipse.lon - 24.0) % 360.0}, CompiledAspects({"": aspects}), [24.0])[0].orb == 0.0
+
+
+def test_eclipses_routes():
+    client = TestClient(main.app)
+    catalog = client.get(
+        "/v1/eclipses", params={"from": "2025-01-01", "to": "2025-12-31", "kind": "lunar"}, headers=_auth_headers()
+    )
+    assert catalog.status_code == 200
+    assert [(e["type"], e["date"]) for e in catalog.json()["eclipses"]] == [("total", "2025-03-14"), ("total", "2025-09-07")]
+
+    natal = client.post(
+        "/v1/transits/eclipses",
+        json={
+            "natal_year": 2024, "natal_month": 4, "natal_day": 8, "natal_hour": 18, "natal_minute": 17,
+            "lat": 30.0, "lng": -100.0, "tz_offset_minutes": 0,
+            "range": {"from": "2024-01-01", "to": "2024-12-31"},
+        },
+        headers=_auth_headers(),
+    )
+    assert natal.status_code == 200
+    eclipses = natal.json()["eclipses"]
+    assert len(eclipses) == 4
+    contacts = {(c["point"], c["aspect"]) for c in eclipses[1]["natal_contacts"]}
+    assert {("Sun", "conjunction"), ("Moon", "conjunction")} <= contacts
+
+    day = client.get("/v1/cosmic-weather", params={"date": "2024-04-08", "timezone": "UTC"}, headers=_auth_headers())
+    assert [(e["kind"], e["type"]) for e in day.json()["eclipses"]] == [("solar", "total")]
+
+
+def test_eclipses_route_rejects_range_outside_catalog():
+    client = TestClient(main.app)
+    resp = client.get("/v1/eclipses", params={"from": "1750-01-01", "to": "1760-01-01"}, headers=_auth_headers())
+    assert resp.status_code == 400
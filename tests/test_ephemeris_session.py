@@ -0,0 +1,72 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import swisseph as swe
+
+from astro.ephemeris import compute_chart
+from astro.ephemeris_session import EphemerisSession
+from astro.utils import to_julian_day
+
+
+def _delta(a: float, b: float) -> float:
+    return abs((a - b + 180.0) % 360.0 - 180.0)
+
+
+def test_sidereal_session_matches_swiss_sidereal_flag():
+    jd_ut = to_julian_day(datetime(1987, 11, 3, 4, 20, 0))
+    for ayanamsa, sid_mode in (("lahiri", swe.SIDM_LAHIRI), ("fagan_bradley", swe.SIDM_FAGAN_BRADLEY)):
+        session = EphemerisSession.create("sidereal", ayanamsa)
+        swe.set_sid_mode(sid_mode)
+        for body_id in (swe.SUN, swe.MOON, swe.MARS, swe.PLUTO):
+            expected, _ = swe.calc_ut(jd_ut, body_id, swe.FLG_SWIEPH | swe.FLG_SPEED | swe.FLG_SIDEREAL)
+            lon, speed = session.position(jd_ut, body_id)
+            assert _delta(lon, expected[0]) < 0.002
+            assert abs(speed - expected[3]) < 1e-4
+
+        cusps, asc, mc = session.houses(jd_ut, -23.55, -46.63, b"P")
+        expected_cusps, expected_ascmc = swe.houses_ex(jd_ut, -23.55, -46.63, b"P", swe.FLG_SIDEREAL)
+        assert max(_delta(a, b) for a, b in zip(cusps, expected_cusps)) < 1e-6
+        assert _delta(asc, expected_ascmc[0]) < 1e-6
+        assert _delta(mc, expected_ascmc[1]) < 1e-6
+
+
+def test_sidereal_sign_based_houses_start_at_sidereal_sign_boundaries():
+    jd_ut = to_julian_day(datetime(1987, 11, 3, 4, 20, 0))
+    session = EphemerisSession.create("sidereal", "lahiri")
+    swe.set_sid_mode(swe.SIDM_LAHIRI)
+    for system in (b"W", b"N", b"E"):
+        cusps, asc, _ = session.houses(jd_ut, -23.55, -46.63, system)
+        expected_cusps, expected_ascmc = swe.houses_ex(jd_ut, -23.55, -46.63, system, swe.FLG_SIDEREAL)
+        assert max(_delta(a, b) for a, b in zip(cusps, expected_cusps)) < 1e-6, system
+        assert _delta(asc, expected_ascmc[0]) < 1e-6
+
+    cusps, asc, _ = session.houses(jd_ut, -23.55, -46.63, b"W")
+    assert cusps[0] == (asc // 30.0) * 30.0
+    assert all(c % 30.0 == 0.0 for c in cusps)
+
+
+def test_tropical_session_ignores_global_sidereal_mode():
+    jd_ut = to_julian_day(datetime(2024, 1, 1, 0, 0, 0))
+    session = EphemerisSession.create()
+    swe.set_sid_mode(swe.SIDM_LAHIRI)
+    assert session.ayanamsa(jd_ut) == 0.0
+    assert session.flags & swe.FLG_SIDEREAL == 0
+    expected, _ = swe.calc_ut(jd_ut, swe.SUN, swe.FLG_SWIEPH)
+    assert _delta(session.longitude(jd_ut, swe.SUN), expected[0]) < 0.002
+
+
+def test_concurrent_mixed_zodiac_charts_are_consistent():
+    configs = [("tropical", None), ("sidereal", "lahiri"), ("sidereal", "fagan_bradley"), ("sidereal", "krishnamurti")]
+
+    def _chart(config):
+        zodiac_type, ayanamsa = config
+        return compute_chart(1990, 5, 10, 14, 30, 0, -23.55, -46.63, -180, zodiac_type=zodiac_type, ayanamsa=ayanamsa)
+
+    expected = [_chart(config) for config in configs]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(_chart, configs * 25))
+
+    for idx, result in enumerate(results):
+        reference = expected[idx % len(configs)]
+        assert result["planets"] == reference["planets"]
+        assert result["houses"] == reference["houses"]
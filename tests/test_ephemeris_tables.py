@@ -0,0 +1,92 @@
+import random
+from datetime import datetime
+
+import pytest
+import swisseph as swe
+
+from astro import ephemeris_tables
+from astro.ephemeris import PLANETS, clear_sky_cache, compute_chart, compute_transits
+from astro.ephemeris_tables import (
+    EphemerisTable,
+    build_ephemeris_table,
+    calc_position,
+    max_table_error,
+    reset_ephemeris_table,
+)
+from astro.utils import to_julian_day
+
+TOLERANCE_DEG = 0.002
+
+
+@pytest.fixture(scope="module")
+def table_path(tmp_path_factory):
+    path = tmp_path_factory.mktemp("ephe") / "ephemeris.bin"
+    return str(build_ephemeris_table(str(path), list(PLANETS.values()), start_year=2023, end_year=2025))
+
+
+@pytest.fixture
+def table_backend(monkeypatch, table_path):
+    monkeypatch.setenv("EPHEMERIS_BACKEND", "table")
+    monkeypatch.setenv("EPHEMERIS_TABLE_PATH", table_path)
+    reset_ephemeris_table()
+    clear_sky_cache()
+    yield
+    reset_ephemeris_table()
+    clear_sky_cache()
+
+
+def test_table_matches_swiss_ephemeris_within_tolerance(table_path):
+    table = EphemerisTable(table_path)
+    rng = random.Random(7)
+    samples = [rng.uniform(table.jd_start, table.jd_end) for _ in range(400)]
+    try:
+        assert max_table_error(table, PLANETS.values(), samples) <= TOLERANCE_DEG
+    finally:
+        table.close()
+
+
+def test_table_speed_sign_matches_swiss_ephemeris(table_path):
+    table = EphemerisTable(table_path)
+    jd_ut = to_julian_day(datetime(2024, 4, 10, 0, 0, 0))  # Mercúrio retrógrado
+    try:
+        lon, speed = table.position(jd_ut, swe.MERCURY)
+        result, _ = swe.calc_ut(jd_ut, swe.MERCURY, swe.FLG_SWIEPH | swe.FLG_SPEED)
+        assert speed < 0
+        assert abs(speed - result[3]) < 0.01
+        assert table.position(to_julian_day(datetime(1990, 1, 1)), swe.MERCURY) is None
+    finally:
+        table.close()
+
+
+def test_calc_position_uses_table_and_falls_back_outside_range(table_backend):
+    assert ephemeris_tables.get_ephemeris_table() is not None
+
+    inside = to_julian_day(datetime(2024, 6, 1, 12, 0, 0))
+    outside = to_julian_day(datetime(1950, 6, 1, 12, 0, 0))
+    for jd_ut in (inside, outside):
+        lon, _ = calc_position(jd_ut, swe.MOON)
+        result, _ = swe.calc_ut(jd_ut, swe.MOON)
+        assert abs((lon - result[0] + 180) % 360 - 180) <= TOLERANCE_DEG
+
+    transits = compute_transits(2024, 6, 1, -23.55, -46.63, tz_offset_minutes=-180)
+    assert transits["planets"]["Moon"]["sign"]
+
+
+def test_charts_use_exact_positions_with_table_backend(table_backend):
+    chart = compute_chart(2024, 6, 1, 15, 37, 11, -23.55, -46.63, tz_offset_minutes=-180)
+    jd_ut = chart["jd_ut"]
+    for name, body_id in PLANETS.items():
+        result, _ = swe.calc_ut(jd_ut, body_id, swe.FLG_SWIEPH | swe.FLG_SPEED)
+        assert chart["planets"][name]["lon"] == round(result[0] % 360.0, 6)
+    # a busca continua usando a tabela
+    assert calc_position(jd_ut, swe.MOON) == ephemeris_tables.get_ephemeris_table().position(jd_ut, swe.MOON)
+
+
+def test_live_backend_switch_disables_table(monkeypatch, table_path):
+    monkeypatch.setenv("EPHEMERIS_BACKEND", "live")
+    monkeypatch.setenv("EPHEMERIS_TABLE_PATH", table_path)
+    reset_ephemeris_table()
+    try:
+        assert ephemeris_tables.get_ephemeris_table() is None
+    finally:
+        reset_ephemeris_table()
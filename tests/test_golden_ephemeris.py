@@ -1,10 +1,16 @@
 import math
 from datetime import datetime, timedelta
 
+import pytest
 import swisseph as swe
 
-from astro.ephemeris import compute_chart, compute_moon_only
-from main import _tz_offset_for
+from astro.ephemeris import PLANETS, clear_sky_cache, compute_chart, compute_moon_only
+from astro.ephemeris_tables import build_ephemeris_table, reset_ephemeris_table
+from services.time_utils import get_tz_offset_minutes
+
+
+def _tz_offset_for(local_dt: datetime, timezone: str, fallback_minutes=None) -> int:
+    return get_tz_offset_minutes(local_dt, timezone, fallback_minutes)
 
 
 def _julian_day(utc_dt: datetime) -> float:
@@ -44,7 +50,21 @@ GOLDEN_CASES = [
 ]
 
 
-def test_compute_chart_matches_swiss_ephemeris_moon_longitude():
+@pytest.fixture(params=["live", "table"])
+def ephemeris_backend(request, monkeypatch, tmp_path_factory):
+    monkeypatch.setenv("EPHEMERIS_BACKEND", request.param)
+    if request.param == "table":
+        path = tmp_path_factory.mktemp("golden") / "ephemeris.bin"
+        build_ephemeris_table(str(path), list(PLANETS.values()), start_year=2023, end_year=2024)
+        monkeypatch.setenv("EPHEMERIS_TABLE_PATH", str(path))
+    reset_ephemeris_table()
+    clear_sky_cache()
+    yield request.param
+    reset_ephemeris_table()
+    clear_sky_cache()
+
+
+def test_compute_chart_matches_swiss_ephemeris_moon_longitude(ephemeris_backend):
     """Validate moon longitude against Swiss Ephemeris for fixed golden cases."""
 
     for case in GOLDEN_CASES:
@@ -69,7 +89,7 @@ def test_compute_chart_matches_swiss_ephemeris_moon_longitude():
         assert math.isclose(moon_payload_lon, golden_moon_lon, rel_tol=0, abs_tol=0.01), case["label"]
 
 
-def test_compute_moon_only_sign_matches_chart_sign():
+def test_compute_moon_only_sign_matches_chart_sign(ephemeris_backend):
     """compute_moon_only should align with full chart for the same date/offset."""
 
     for case in GOLDEN_CASES:
@@ -0,0 +1,88 @@
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from astro.ephemeris import PLANETS, compute_chart
+from astro.ephemeris_tables import calc_position
+from astro.ingress_index import IngressIndex, compute_house_ingresses
+from astro.utils import deg_to_sign, to_julian_day
+from services.astro_logic import get_house_for_lon
+
+
+@pytest.fixture(autouse=True)
+def _set_env(monkeypatch):
+    monkeypatch.setenv("API_KEY", "test-key")
+    monkeypatch.setenv("OPENAI_API_KEY", "dummy")
+    yield
+
+
+def _auth_headers():
+    return {"Authorization": "Bearer test-key", "X-User-Id": "u1"}
+
+
+def test_mercury_2024_sign_ingresses_include_the_retrograde_reentry():
+    index = IngressIndex()
+    events = index.between(to_julian_day(datetime(2024, 7, 1)), to_julian_day(datetime(2024, 10, 1)), ["Mercury"])
+
+    assert [(e.sign, e.retrograde) for e in events] == [
+        ("Leo", False),
+        ("Virgo", False),
+        ("Leo", True),
+        ("Virgo", False),
+        ("Libra", False),
+    ]
+    for event in events:
+        after = calc_position(event.jd_ut + 1e-3, PLANETS["Mercury"])[0]
+        assert deg_to_sign(after)["sign"] == event.sign
+
+
+def test_house_ingresses_match_daily_house_lookup():
+    natal = compute_chart(1995, 11, 7, 22, 56, 0, -23.5505, -46.6333, -180, "P", "tropical", None)
+    cusps = natal["houses"]["cusps"]
+    jd_start = to_julian_day(datetime(2024, 1, 1))
+    jd_end = to_julian_day(datetime(2025, 1, 1))
+    events = compute_house_ingresses(cusps, jd_start, jd_end, ["Sun", "Mars"])
+
+    for planet in ("Sun", "Mars"):
+        changes = []
+        previous = None
+        for k in range(int(jd_end - jd_start) * 4):
+            house = get_house_for_lon(cusps, calc_position(jd_start + k / 4.0, PLANETS[planet])[0])
+            if previous is not None and house != previous:
+                changes.append(house)
+            previous = house
+        assert [e.house for e in events if e.planet == planet] == changes
+
+
+def test_ingresses_endpoint_lists_sign_and_house_events():
+    client = TestClient(main.app)
+    payload = {
+        "natal_year": 1995,
+        "natal_month": 11,
+        "natal_day": 7,
+        "natal_hour": 22,
+        "natal_minute": 56,
+        "natal_second": 0,
+        "lat": -23.5505,
+        "lng": -46.6333,
+        "timezone": "America/Sao_Paulo",
+        "house_system": "P",
+        "zodiac_type": "tropical",
+        "range": {"from": "2024-01-01", "to": "2024-12-31"},
+        "planets": ["Mars"],
+    }
+
+    resp = client.post("/v1/transits/ingresses?lang=pt-BR", json=payload, headers=_auth_headers())
+    assert resp.status_code == 200
+    body = resp.json()
+    assert [item["sign_en"] for item in body["sign_ingresses"]] == [
+        "Capricorn", "Aquarius", "Pisces", "Aries", "Taurus", "Gemini", "Cancer", "Leo",
+    ]
+    assert body["sign_ingresses"][0]["sign"] == "Capricórnio"
+    assert body["house_ingresses"]
+    assert all(1 <= item["house"] <= 12 for item in body["house_ingresses"])
+
+    payload["planets"] = ["Chiron"]
+    assert client.post("/v1/transits/ingresses", json=payload, headers=_auth_headers()).status_code == 400
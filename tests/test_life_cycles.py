@@ -0,0 +1,95 @@
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+import services.life_cycles as life_cycles
+from astro.crossings import wrap180
+from astro.ephemeris import PLANETS, compute_chart
+from astro.ephemeris_tables import calc_position
+from astro.utils import to_julian_day
+from core.cache import cache
+
+
+@pytest.fixture(autouse=True)
+def _set_env(monkeypatch):
+    monkeypatch.setenv("API_KEY", "test-key")
+    monkeypatch.setenv("OPENAI_API_KEY", "dummy")
+    yield
+
+
+def _auth_headers():
+    return {"Authorization": "Bearer test-key", "X-User-Id": "u1"}
+
+
+def _natal():
+    return compute_chart(1995, 11, 7, 22, 56, 0, -23.5505, -46.6333, -180, "P", "tropical", None)
+
+
+def test_cycle_peaks_are_exact_and_include_retrograde_repasses():
+    natal = _natal()
+    jd_start = to_julian_day(datetime(2020, 1, 1))
+    found = life_cycles._scan_cycle_events(natal, -180, "tropical", None, jd_start, jd_start + 3652.5)
+    angles = {"conjunction": 0.0, "sextile": 60.0, "square": 90.0, "trine": 120.0, "opposition": 180.0}
+
+    assert {event.planet for event, _ in found} <= life_cycles.SLOW_PLANETS
+    assert any(len(event.exact_dates) == 3 for event, _ in found)
+    for event, peak_jd in found:
+        assert event.start_date <= event.peak_date <= event.end_date
+        if not event.exact_dates:
+            continue
+        transit_lon = calc_position(peak_jd, PLANETS[event.planet])[0]
+        separation = abs(wrap180(transit_lon - natal["planets"][event.natal_target]["lon"]))
+        assert abs(separation - angles[event.aspect]) < 1e-4
+
+
+def test_life_timeline_is_cached_per_natal_fingerprint(monkeypatch):
+    cache._store.clear()
+    calls = []
+    original = life_cycles.find_aspect_events
+
+    def counting(*args, **kwargs):
+        calls.append(args[2])
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(life_cycles, "find_aspect_events", counting)
+    kwargs = dict(
+        natal_year=1995, natal_month=11, natal_day=7, natal_hour=22, natal_minute=56, natal_second=0,
+        lat=-23.5505, lng=-46.6333, tz_offset_minutes=-180, house_system="P",
+        zodiac_type="tropical", ayanamsa=None,
+    )
+
+    first = life_cycles.detect_life_timeline(target_date="2026-01-09", **kwargs)
+    scanned = len(calls)
+    again = life_cycles.detect_life_timeline(target_date="2026-02-01", **kwargs)
+
+    assert 1 <= scanned <= 3
+    assert len(calls) == scanned
+    assert first["current_cycle"] is not None
+    assert again["upcoming_cycles"]
+
+
+def test_life_timeline_endpoint_supports_whole_life_span():
+    client = TestClient(main.app)
+    payload = {
+        "natal_year": 1995,
+        "natal_month": 11,
+        "natal_day": 7,
+        "natal_hour": 22,
+        "natal_minute": 56,
+        "natal_second": 0,
+        "lat": -23.5505,
+        "lng": -46.6333,
+        "timezone": "America/Sao_Paulo",
+        "target_date": "2026-01-09",
+    }
+
+    decade = client.post("/v1/cycles/life-timeline", json=payload, headers=_auth_headers()).json()
+    life = client.post("/v1/cycles/life-timeline?span=life", json=payload, headers=_auth_headers()).json()
+
+    assert len(decade["past_cycles"]) <= 12
+    assert len(life["past_cycles"]) > len(decade["past_cycles"])
+    assert life["past_cycles"][0]["peak_date"] >= "1995-11-07"
+    assert life["upcoming_cycles"][-1]["peak_date"] <= "2095-11-08"
+    assert "exact_dates" in life["upcoming_cycles"][0]
@@ -3,7 +3,7 @@ from zoneinfo import ZoneInfo
 
 import swisseph as swe
 
-from astro.ephemeris import PLANETS, compute_chart, find_longitude_match
+from astro.ephemeris import PLANETS, compute_chart, find_longitude_crossings, find_longitude_match
 from astro.utils import angle_diff, to_julian_day
 
 
@@ -164,3 +164,17 @@ def test_longitude_match_within_tolerance():
     lon = _planet_longitude(utc_dt, PLANETS["Moon"])
     delta = angle_diff(lon, target_lon)
     assert delta < 0.1
+
+
+def test_longitude_crossings_cover_several_planets_and_retrograde_repasses():
+    jd_start = to_julian_day(datetime(2024, 1, 1))
+    jd_end = to_julian_day(datetime(2025, 1, 1))
+    crossings = find_longitude_crossings(["Sun", "Mercury"], [0.0, 20.0], jd_start, jd_end)
+
+    mercury_20 = [c for c in crossings if c.planet == "Mercury" and c.target_lon == 20.0]
+    assert [c.direction for c in mercury_20] == [1, -1, 1]
+    assert [c.target_lon for c in crossings if c.planet == "Sun"] == [0.0, 20.0]
+    assert [c.jd_ut for c in crossings] == sorted(c.jd_ut for c in crossings)
+    for crossing in crossings:
+        lon = _planet_longitude(crossing.utc_datetime, PLANETS[crossing.planet])
+        assert angle_diff(lon, crossing.target_lon) < 1e-3
@@ -0,0 +1,75 @@
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from astro.lunation_index import LunationIndex, elongation
+from astro.utils import from_julian_day, to_julian_day
+
+
+@pytest.fixture(autouse=True)
+def _set_env(monkeypatch):
+    monkeypatch.setenv("API_KEY", "test-key")
+    monkeypatch.setenv("OPENAI_API_KEY", "dummy")
+    yield
+
+
+def _auth_headers():
+    return {"Authorization": "Bearer test-key", "X-User-Id": "u1"}
+
+
+def test_january_2024_lunations_are_exact():
+    index = LunationIndex()
+    events = index.between(to_julian_day(datetime(2024, 1, 1)), to_julian_day(datetime(2024, 2, 1)))
+    expected = [
+        ("last_quarter", datetime(2024, 1, 4, 3, 30), "Libra"),
+        ("new_moon", datetime(2024, 1, 11, 11, 57), "Capricorn"),
+        ("first_quarter", datetime(2024, 1, 18, 3, 53), "Aries"),
+        ("full_moon", datetime(2024, 1, 25, 17, 54), "Leo"),
+    ]
+    assert [e.phase for e in events] == [phase for phase, _, _ in expected]
+    for event, (_, when, sign) in zip(events, expected):
+        assert abs((from_julian_day(event.jd_ut) - when).total_seconds()) < 120
+        assert event.moon_sign == sign
+        target = {"new_moon": 0.0, "first_quarter": 90.0, "full_moon": 180.0, "last_quarter": 270.0}[event.phase]
+        assert abs((elongation(event.jd_ut)[0] - target + 180.0) % 360.0 - 180.0) < 1e-4
+
+    nxt = index.next(events[-1].jd_ut)
+    assert nxt.phase == "last_quarter"
+    assert index.previous(nxt.jd_ut - 1e-6) == events[-1]
+
+
+def test_lunation_index_roundtrip(tmp_path):
+    index = LunationIndex().build(2020, 2021)
+    loaded = LunationIndex.load(index.save(str(tmp_path / "lunations.npz")))
+    jd_start, jd_end = to_julian_day(datetime(2020, 1, 1)), to_julian_day(datetime(2022, 1, 1))
+    assert loaded.between(jd_start, jd_end) == index.between(jd_start, jd_end)
+    assert len(index.between(jd_start, jd_end)) in range(98, 101)
+
+
+def test_lunar_calendar_lists_every_exact_phase_of_month():
+    client = TestClient(main.app)
+    resp = client.get("/api/lunar-calendar", params={"month": 8, "year": 2023}, headers=_auth_headers())
+    assert resp.status_code == 200
+    phases = resp.json()["phases"]
+    # agosto de 2023 teve duas luas cheias
+    assert [p["type"] for p in phases].count("full_moon") == 2
+    assert phases[0]["date"] == "2023-08-01"
+    assert phases[0]["exact_utc"].startswith("2023-08-01T18:3")
+
+
+def test_professional_lunar_phases_uses_local_dates():
+    client = TestClient(main.app)
+    resp = client.post(
+        "/v1/astro/lunar-phases",
+        json={"date": "2024-01-01", "timezone": "America/Sao_Paulo", "tz_offset_minutes": -180},
+        headers=_auth_headers(),
+    )
+    assert resp.status_code == 200
+    items = resp.json()["data"]["items"]
+    assert [item["phase_code"] for item in items[:4]] == ["last_quarter", "new_moon", "first_quarter", "full_moon"]
+    assert items[0]["date"] == "2024-01-04"
+    assert items[0]["exact_local"].startswith("2024-01-04T00:30")
+    assert items[3]["moon_sign_code"] == "leo"
+    assert items[3]["moon_sign_ptbr"] == "Leão"
@@ -0,0 +1,105 @@
+from datetime import datetime
+
+import pytest
+import swisseph as swe
+from fastapi.testclient import TestClient
+
+import main
+from astro.ephemeris import PLANETS
+from astro.ephemeris_tables import calc_position
+from astro.moon_index import MoonIndex, compute_moon_aspects, get_moon_index
+from astro.utils import from_julian_day, to_julian_day
+
+
+@pytest.fixture(autouse=True)
+def _set_env(monkeypatch):
+    monkeypatch.setenv("API_KEY", "test-key")
+    monkeypatch.setenv("OPENAI_API_KEY", "dummy")
+    yield
+
+
+def _auth_headers():
+    return {"Authorization": "Bearer test-key", "X-User-Id": "u1"}
+
+
+JAN_2026 = to_julian_day(datetime(2026, 1, 1))
+ASPECT_ANGLES = {"conjunction": 0.0, "sextile": 60.0, "square": 90.0, "trine": 120.0, "opposition": 180.0}
+
+
+def _moon(jd):
+    return calc_position(jd, swe.MOON)[0]
+
+
+def test_ingresses_and_last_aspects_are_exact():
+    events = MoonIndex().between(JAN_2026, JAN_2026 + 60)
+    assert len(events) in (26, 27)
+    for event in events:
+        assert abs((_moon(event.jd_ut) - event.sign_index * 30.0 + 180.0) % 360.0 - 180.0) < 1e-3
+        aspect = event.last_aspect
+        assert event.previous_jd <= aspect.jd_ut < event.jd_ut
+        assert event.void_start_jd == aspect.jd_ut
+        separation = abs((_moon(aspect.jd_ut) - calc_position(aspect.jd_ut, PLANETS[aspect.planet])[0]) % 360.0)
+        assert min(abs(separation - ASPECT_ANGLES[aspect.aspect]), abs(360.0 - separation - ASPECT_ANGLES[aspect.aspect])) < 1e-3
+        # nenhum outro aspecto maior entre o último e o ingresso
+        between = compute_moon_aspects(aspect.jd_ut + 1e-4, event.jd_ut)
+        assert between == []
+
+
+AUG_2002 = to_julian_day(datetime(2002, 8, 1))
+
+
+def test_aspect_from_the_previous_sign_is_not_reported():
+    # 2002-08-05 08:42 UTC a Lua aperfeiçoa o último aspecto em Gêmeos; às 12:01 entra em Câncer
+    index = MoonIndex()
+    cancer, leo = index.between(AUG_2002 + 4, AUG_2002 + 7)
+    assert (cancer.sign, leo.sign) == ("Cancer", "Leo")
+    assert cancer.last_aspect.jd_ut < leo.previous_jd == cancer.jd_ut
+    assert leo.last_aspect is None
+
+
+def test_sign_without_aspect_is_void_from_ingress_to_ingress():
+    index = MoonIndex()
+    leo = index.next(AUG_2002 + 6)
+    assert leo.void_start_jd == leo.previous_jd
+    # a Lua passa 2002-08-06 inteiro fora de curso em Câncer
+    mid_sign = to_julian_day(datetime(2002, 8, 6))
+    assert index.void_of_course(mid_sign, mid_sign + 1) == [leo]
+
+
+def test_index_round_trips_through_file(tmp_path):
+    index = MoonIndex().build(2026, 2026)
+    path = index.save(str(tmp_path / "moon.npz"))
+    loaded = MoonIndex.load(path)
+    jd_end = to_julian_day(datetime(2027, 1, 1))
+    assert loaded.between(JAN_2026, jd_end) == index.between(JAN_2026, jd_end)
+
+
+def test_cosmic_weather_reports_intraday_moon_changes():
+    event = get_moon_index().between(JAN_2026 + 10, JAN_2026 + 20)[0]
+    local = from_julian_day(event.jd_ut)
+    client = TestClient(main.app)
+    resp = client.get(
+        "/v1/cosmic-weather",
+        params={"date": local.strftime("%Y-%m-%d"), "timezone": "UTC"},
+        headers=_auth_headers(),
+    )
+    assert resp.status_code == 200
+    day = resp.json()["moon_day"]
+    assert day["signo_inicio"] == event.previous_sign
+    assert day["signo_fim"] == event.sign
+    assert [item["signo"] for item in day["ingressos"]] == [event.sign]
+    assert day["ingressos"][0]["hora_local"].startswith(local.strftime("%Y-%m-%dT%H:"))
+    assert day["fora_de_curso"][-1]["fim"] == day["ingressos"][0]["hora_local"]
+    assert day["fora_de_curso"][-1]["ultimo_aspecto"]["planeta"] == event.last_aspect.planet
+
+
+def test_cosmic_weather_reports_whole_sign_void():
+    client = TestClient(main.app)
+    resp = client.get(
+        "/v1/cosmic-weather", params={"date": "2002-08-06", "timezone": "UTC"}, headers=_auth_headers()
+    )
+    assert resp.status_code == 200
+    (void,) = resp.json()["moon_day"]["fora_de_curso"]
+    assert void["inicio"].startswith("2002-08-05T12:0")
+    assert void["fim"].startswith("2002-08-07T16:2")
+    assert void["ultimo_aspecto"] is None
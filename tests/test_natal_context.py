@@ -0,0 +1,72 @@
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+import services.natal_context as natal_context_module
+from astro.aspects import compute_transit_aspects, resolve_aspects_config
+from astro.ephemeris import compute_chart, compute_transits
+from schemas.transits import TransitsRequest
+from services.natal_context import NatalContext
+
+
+@pytest.fixture(autouse=True)
+def _set_env(monkeypatch):
+    monkeypatch.setenv("API_KEY", "test-key")
+    monkeypatch.setenv("OPENAI_API_KEY", "dummy")
+    yield
+
+
+def _auth_headers():
+    return {"Authorization": "Bearer test-key", "X-User-Id": "u1"}
+
+
+def _payload(**extra):
+    payload = {
+        "natal_year": 1995,
+        "natal_month": 11,
+        "natal_day": 7,
+        "natal_hour": 22,
+        "natal_minute": 56,
+        "natal_second": 0,
+        "lat": -23.5505,
+        "lng": -46.6333,
+        "timezone": "America/Sao_Paulo",
+        "target_date": "2026-11-07",
+        "house_system": "P",
+        "zodiac_type": "tropical",
+    }
+    payload.update(extra)
+    return payload
+
+
+def test_for_date_matches_per_day_computation():
+    body = TransitsRequest(**_payload())
+    ctx = NatalContext.from_request(body, -180, apply_profile=False)
+
+    for day in ("2026-11-07", "2026-11-08", "2027-03-01"):
+        y, m, d = map(int, day.split("-"))
+        natal = compute_chart(1995, 11, 7, 22, 56, 0, body.lat, body.lng, -180, "P", "tropical", None)
+        transit = compute_transits(y, m, d, body.lat, body.lng, -180, "tropical", None)
+        aspects_config, _, _ = resolve_aspects_config(None, None)
+        expected = compute_transit_aspects(transit["planets"], natal["planets"], aspects_config)
+
+        context = ctx.for_date(day)
+        assert context["natal"] == natal
+        assert context["transits"] == transit
+        assert context["aspects"] == expected
+
+
+def test_forecast_computes_natal_chart_once(monkeypatch):
+    calls = []
+    original = natal_context_module.compute_chart
+
+    def counting(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(natal_context_module, "compute_chart", counting)
+    client = TestClient(main.app)
+    resp = client.post("/v1/forecast/personal", json=_payload(days_ahead=5), headers=_auth_headers())
+
+    assert resp.status_code == 200
+    assert len(calls) == 1
@@ -0,0 +1,123 @@
+from datetime import datetime
+
+import numpy as np
+import pytest
+import swisseph as swe
+from fastapi.testclient import TestClient
+
+import main
+from astro.ephemeris import PLANETS, compute_chart, find_longitude_crossings
+from astro.ephemeris_session import EphemerisSession
+from astro.rectification import LifeEvent, candidate_houses, houses_from_armc, rectify_birth_time
+from astro.utils import from_julian_day, to_julian_day
+
+
+@pytest.fixture(autouse=True)
+def _set_env(monkeypatch):
+    monkeypatch.setenv("API_KEY", "test-key")
+    monkeypatch.setenv("OPENAI_API_KEY", "dummy")
+    yield
+
+
+def _auth_headers():
+    return {"Authorization": "Bearer test-key", "X-User-Id": "u1"}
+
+
+@pytest.mark.parametrize("house_system", ["P", "K", "R"])
+@pytest.mark.parametrize("lat", [-23.5505, 0.0, 51.5074, 66.3, 70.0])
+def test_vectorized_houses_match_swiss_ephemeris(house_system, lat):
+    jd = to_julian_day(datetime(1995, 11, 7, 0, 0)) + np.arange(0, 1440, 37) / 1440.0
+    armc = np.array([swe.houses_ex(float(j), lat, -46.6333, b"O", 0)[1][2] for j in jd])
+    eps = swe.calc_ut(float(jd[0]), swe.ECL_NUT)[0][0]
+    # Placidus e Koch não existem acima do círculo polar: Porphyry
+    reference = b"O" if house_system in "PK" and abs(lat) >= 90.0 - eps else house_system.encode("ascii")
+
+    cusps, asc, mc = houses_from_armc(armc, lat, eps, house_system)
+    for row, a in enumerate(armc):
+        expected, ascmc = swe.houses_armc(float(a), lat, eps, reference)
+        assert np.allclose((cusps[row] - np.array(expected[:12]) + 180.0) % 360.0 - 180.0, 0.0, atol=1e-5)
+        assert abs((asc[row] - ascmc[0] + 180.0) % 360.0 - 180.0) < 1e-6
+        assert abs((mc[row] - ascmc[1] + 180.0) % 360.0 - 180.0) < 1e-6
+
+
+@pytest.mark.parametrize("house_system", ["W", "P"])
+def test_sidereal_candidate_houses_match_session_houses(house_system):
+    session = EphemerisSession.create("sidereal", "lahiri")
+    jd = to_julian_day(datetime(1995, 11, 7, 3, 0)) + np.arange(0, 1440, 120) / 1440.0
+    cusps, asc, _ = candidate_houses(jd, -23.5505, -46.6333, house_system, session)
+    for row, j in enumerate(jd):
+        expected, expected_asc, _ = session.houses(float(j), -23.5505, -46.6333, house_system.encode("ascii"))
+        # a ayanamsa do meio do dia vale para todos os candidatos (varia ~1e-4° por dia)
+        assert np.allclose((cusps[row] - np.array(expected) + 180.0) % 360.0 - 180.0, 0.0, atol=1e-3)
+        assert abs((asc[row] - expected_asc + 180.0) % 360.0 - 180.0) < 1e-3
+    if house_system == "W":
+        assert np.all(cusps % 30.0 == 0.0)
+
+
+@pytest.mark.parametrize("hour, minute", [(14, 30), (3, 10)])
+def test_scan_recovers_birth_time_from_angle_contacts(hour, minute):
+    lat, lng = -23.5505, -46.6333
+    chart = compute_chart(1980, 4, 12, hour, minute, 0, lat, lng, tz_offset_minutes=-180)
+    angles = [chart["houses"]["asc"], chart["houses"]["mc"]]
+
+    crossings = find_longitude_crossings(
+        {name: PLANETS[name] for name in ("Jupiter", "Saturn", "Uranus", "Pluto")},
+        angles,
+        to_julian_day(datetime(1990, 1, 1)),
+        to_julian_day(datetime(2025, 1, 1)),
+    )
+    days = sorted({from_julian_day(crossing.jd_ut).date() for crossing in crossings})
+    assert len(days) >= 10
+    events = [LifeEvent(to_julian_day(datetime(day.year, day.month, day.day, 15)), "career") for day in days]
+
+    best = rectify_birth_time(to_julian_day(datetime(1980, 4, 12, 3, 0)), lat, lng, events, top=3)
+    assert abs(best[0].minute - (hour * 60 + minute)) <= 5
+    assert [c.score for c in best] == sorted((c.score for c in best), reverse=True)
+    assert any(hit.technique == "transit" and hit.point in ("ASC", "MC") for hit in best[0].hits[:3])
+
+
+def test_rectification_route_returns_ranked_candidates():
+    client = TestClient(main.app)
+    resp = client.post(
+        "/v1/chart/rectification",
+        json={
+            "birth_date": "1990-03-15",
+            "lat": -22.9068,
+            "lng": -43.1729,
+            "timezone": "America/Sao_Paulo",
+            "events": [
+                {"date": "2012-05-20", "category": "marriage"},
+                {"date": "2016-09-01", "category": "career", "label": "Novo emprego"},
+                {"date": "2019-02-11", "category": "relocation"},
+            ],
+            "top": 3,
+        },
+        headers=_auth_headers(),
+    )
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["candidates_scanned"] == 1440
+    assert len(data["candidates"]) == 3
+    scores = [c["score"] for c in data["candidates"]]
+    assert scores == sorted(scores, reverse=True)
+    first = data["candidates"][0]
+    assert len(first["time"]) == 5 and first["asc"]["sign_ptbr"]
+    assert {hit["technique"] for hit in first["hits"]} <= {"transit", "progression", "direction"}
+
+
+def test_rectification_rejects_inverted_window():
+    client = TestClient(main.app)
+    resp = client.post(
+        "/v1/chart/rectification",
+        json={
+            "birth_date": "1990-03-15",
+            "lat": -22.9068,
+            "lng": -43.1729,
+            "timezone": "America/Sao_Paulo",
+            "events": [{"date": "2012-05-20"}],
+            "window_start": "18:00",
+            "window_end": "06:00",
+        },
+        headers=_auth_headers(),
+    )
+    assert resp.status_code == 422
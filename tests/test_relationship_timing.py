@@ -0,0 +1,85 @@
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+import services.relationship_cycles as relationship_cycles
+from astro.ephemeris import compute_chart
+
+
+@pytest.fixture(autouse=True)
+def _set_env(monkeypatch):
+    monkeypatch.setenv("API_KEY", "test-key")
+    monkeypatch.setenv("OPENAI_API_KEY", "dummy")
+    yield
+
+
+def _auth_headers():
+    return {"Authorization": "Bearer test-key", "X-User-Id": "u1"}
+
+
+def _payload():
+    return {
+        "person_a": {
+            "name": "Ana",
+            "birth_date": "1995-11-07",
+            "birth_time": "22:56",
+            "lat": -23.5505,
+            "lng": -46.6333,
+            "timezone": "America/Sao_Paulo",
+        },
+        "person_b": {
+            "name": "Bruno",
+            "birth_date": "1990-03-15",
+            "birth_time": "08:30",
+            "lat": -22.9068,
+            "lng": -43.1729,
+            "timezone": "America/Sao_Paulo",
+        },
+    }
+
+
+def test_relationship_events_track_each_planet_once_for_both_charts(monkeypatch):
+    chart_a = compute_chart(1995, 11, 7, 22, 56, 0, -23.5505, -46.6333, -120, "P", "tropical", None)
+    chart_b = compute_chart(1990, 3, 15, 8, 30, 0, -22.9068, -43.1729, -180, "P", "tropical", None)
+    calls = []
+    original = relationship_cycles.find_aspect_events
+
+    def counting(natal_lons, *args, **kwargs):
+        calls.append(sorted(natal_lons))
+        return original(natal_lons, *args, **kwargs)
+
+    monkeypatch.setattr(relationship_cycles, "find_aspect_events", counting)
+    payload = relationship_cycles.detect_relationship_evolution(
+        chart_a=chart_a, chart_b=chart_b, lat=-23.5505, lng=-46.6333, tz_offset_minutes=-180, timezone=None
+    )
+
+    assert len(calls) == 1
+    assert any(key.startswith("person_a:") for key in calls[0])
+    assert any(key.startswith("person_b:") for key in calls[0])
+    for phase in payload["relationship_cycles"]:
+        assert phase["activating_planet"] in relationship_cycles.SLOW_PLANETS
+        assert phase["partner"] in ("person_a", "person_b")
+        assert phase["start_date"] <= phase["peak_date"] <= phase["end_date"]
+
+
+def test_synastry_timing_reports_continuous_phases():
+    client = TestClient(main.app)
+    resp = client.post("/v1/synastry/timing", json=_payload(), headers=_auth_headers())
+    assert resp.status_code == 200
+    windows = resp.json()["relationship_timing"]
+
+    assert windows
+    assert {w["partner"] for w in windows} == {"person_a", "person_b"}
+    for window in windows:
+        assert window["start_date"] <= window["date"] <= window["end_date"]
+        assert window["phase"] in ("ativação", "integração", "ajuste")
+        assert len(window["highlights"]) == 1
+
+
+def test_synastry_evolution_endpoint():
+    client = TestClient(main.app)
+    resp = client.post("/v1/synastry/evolution", json=_payload(), headers=_auth_headers())
+    assert resp.status_code == 200
+    body = resp.json()
+    assert "current_phase" in body
+    assert "relationship_cycles" in body
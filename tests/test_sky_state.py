@@ -0,0 +1,46 @@
+from datetime import datetime
+
+import swisseph as swe
+
+from astro.ephemeris import PLANETS, compute_chart, compute_sky_state, compute_sky_track, compute_transits
+from astro.utils import to_julian_day
+
+
+def test_sky_state_matches_swiss_ephemeris():
+    jd_ut = to_julian_day(datetime(2024, 5, 10, 15, 0, 0))
+    sky = compute_sky_state(jd_ut)
+
+    for name, planet_id in PLANETS.items():
+        result, _ = swe.calc_ut(jd_ut, planet_id, swe.FLG_SWIEPH | swe.FLG_SPEED)
+        assert abs(sky.lon(name) - result[0] % 360.0) < 1e-9
+        assert abs(sky.speed(name) - result[3]) < 1e-9
+
+
+def test_sky_state_is_shared_across_locations():
+    sao_paulo = compute_transits(2024, 5, 10, -23.55, -46.63, tz_offset_minutes=-180)
+    lisbon = compute_transits(2024, 5, 10, 38.72, -9.14, tz_offset_minutes=-180)
+
+    assert sao_paulo["planets"] == lisbon["planets"]
+    assert sao_paulo["houses"]["asc"] != lisbon["houses"]["asc"]
+
+    jd_ut = to_julian_day(datetime(2024, 5, 10, 15, 0, 0))
+    assert compute_sky_state(jd_ut) is compute_sky_state(jd_ut)
+
+
+def test_sidereal_sky_state_is_keyed_separately():
+    jd_ut = to_julian_day(datetime(2024, 3, 20, 12, 0, 0))
+    tropical = compute_sky_state(jd_ut)
+    sidereal = compute_sky_state(jd_ut, zodiac_type="sidereal", ayanamsa="lahiri")
+
+    delta = (tropical.lon("Sun") - sidereal.lon("Sun")) % 360
+    assert 20 < delta < 30
+
+    chart = compute_chart(2024, 3, 20, 12, 0, 0, 0.0, 0.0, zodiac_type="sidereal", ayanamsa="lahiri")
+    assert chart["planets"]["Sun"]["lon"] == round(sidereal.lon("Sun"), 6)
+
+
+def test_sky_track_accepts_empty_input():
+    names, track = compute_sky_track([])
+
+    assert names == tuple(PLANETS)
+    assert track.shape == (0, len(PLANETS))
@@ -0,0 +1,109 @@
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from services.astro_logic import get_house_for_lon
+
+
+@pytest.fixture(autouse=True)
+def _set_env(monkeypatch):
+    monkeypatch.setenv("API_KEY", "test-key")
+    monkeypatch.setenv("OPENAI_API_KEY", "dummy")
+    monkeypatch.setenv("SOLAR_RETURN_ENGINE", "v2")
+    yield
+
+
+def _auth_headers():
+    return {"Authorization": "Bearer test-key", "X-User-Id": "u1"}
+
+
+NATAL = {
+    "data": "1995-11-07",
+    "hora": "22:56:00",
+    "timezone": "America/Sao_Paulo",
+    "local": {"nome": "São Paulo, BR", "lat": -23.5505, "lon": -46.6333},
+}
+
+CITIES = [
+    {"id": "sp", "nome": "São Paulo", "lat": -23.5505, "lon": -46.6333, "timezone": "America/Sao_Paulo"},
+    {"id": "lis", "nome": "Lisboa", "lat": 38.7223, "lon": -9.1393, "timezone": "Europe/Lisbon"},
+    {"id": "tyo", "nome": "Tóquio", "lat": 35.6762, "lon": 139.6503, "timezone": "Asia/Tokyo"},
+    {"id": "nyc", "nome": "Nova York", "lat": 40.7128, "lon": -74.0060, "timezone": "America/New_York"},
+    {"id": "syd", "nome": "Sydney", "lat": -33.8688, "lon": 151.2093},
+] + [{"nome": f"Grade {lng}", "lat": 0.0, "lon": float(lng)} for lng in range(-180, 180, 15)]
+
+
+def test_relocation_ranking_matches_calculate_for_each_city():
+    client = TestClient(main.app)
+    resp = client.post(
+        "/v1/solar-return/relocation",
+        json={"natal": NATAL, "ano": 2026, "cidades": CITIES, "criterios": {"casas_sol": [10]}, "limit": 4},
+        headers=_auth_headers(),
+    )
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["total_cidades"] == len(CITIES)
+    scores = [item["score"] for item in data["ranking"]]
+    assert scores == sorted(scores, reverse=True)
+    assert data["ranking"][0]["casa_sol"] == 10
+
+    for item in data["ranking"]:
+        city = CITIES[item["index"]]
+        calculate = client.post(
+            "/v1/solar-return/calculate",
+            json={
+                "natal": NATAL,
+                "alvo": {"ano": 2026, "timezone": city.get("timezone", "UTC"), "local": {"lat": city["lat"], "lon": city["lon"]}},
+                "preferencias": {"zodiaco": "tropical", "sistema_casas": "P"},
+            },
+            headers=_auth_headers(),
+        ).json()
+        casas = calculate["mapa_revolucao"]["casas"]
+        planetas = calculate["mapa_revolucao"]["planetas"]
+        assert item["asc"]["lon"] == pytest.approx(casas["asc"], abs=1e-6)
+        assert item["mc"]["lon"] == pytest.approx(casas["mc"], abs=1e-6)
+        assert item["casa_sol"] == get_house_for_lon(casas["cusps"], planetas["Sun"]["lon"])
+        assert item["casa_lua"] == get_house_for_lon(casas["cusps"], planetas["Moon"]["lon"])
+
+
+def test_relocation_scores_favored_angular_planets():
+    client = TestClient(main.app)
+    resp = client.post(
+        "/v1/solar-return/relocation",
+        json={
+            "natal": NATAL,
+            "ano": 2026,
+            "cidades": CITIES,
+            "criterios": {"casas_sol": [], "planetas_angulares": ["Jupiter"], "evitar_angulares": [], "orbe_angular": 8},
+            "limit": 1,
+        },
+        headers=_auth_headers(),
+    )
+    top = resp.json()["ranking"][0]
+    assert top["score"] > 0
+    assert any(contact["planeta"] == "Jupiter" for contact in top["planetas_angulares"])
+
+
+def test_relocation_flags_polar_cities_instead_of_failing():
+    client = TestClient(main.app)
+    tromso = {"id": "tos", "nome": "Tromsø", "lat": 69.6492, "lon": 18.9553, "timezone": "Europe/Oslo"}
+    resp = client.post(
+        "/v1/solar-return/relocation",
+        json={"natal": NATAL, "ano": 2026, "cidades": [CITIES[0], tromso], "criterios": {"casas_sol": []}, "limit": 2},
+        headers=_auth_headers(),
+    )
+    assert resp.status_code == 200
+    by_id = {item["id"]: item for item in resp.json()["ranking"]}
+    assert by_id["tos"]["sistema_casas"] == "O"
+    assert "círculo polar" in by_id["tos"]["aviso"]
+    assert "aviso" not in by_id["sp"]
+
+
+def test_relocation_rejects_unknown_criteria():
+    client = TestClient(main.app)
+    resp = client.post(
+        "/v1/solar-return/relocation",
+        json={"natal": NATAL, "ano": 2026, "cidades": CITIES[:2], "criterios": {"signos_asc": ["Ophiuchus"]}},
+        headers=_auth_headers(),
+    )
+    assert resp.status_code == 422
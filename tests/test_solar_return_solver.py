@@ -0,0 +1,64 @@
+from datetime import datetime, timedelta
+
+import pytest
+import swisseph as swe
+from fastapi.testclient import TestClient
+
+import main
+from astro.ephemeris import solar_return_datetime, solar_returns_batch, solve_solar_return, sun_longitude_at
+from astro.ephemeris_tables import calc_position
+from astro.utils import angle_diff, to_julian_day
+
+
+@pytest.fixture(autouse=True)
+def _set_env(monkeypatch):
+    monkeypatch.setenv("API_KEY", "test-key")
+    monkeypatch.setenv("OPENAI_API_KEY", "dummy")
+    yield
+
+
+def test_newton_solver_converges_in_few_evaluations():
+    natal_lon = sun_longitude_at(datetime(1990, 7, 14, 9, 30))
+    calls = []
+
+    def position(jd_ut):
+        calls.append(jd_ut)
+        return calc_position(jd_ut, swe.SUN)
+
+    jd_ut = solve_solar_return(natal_lon, to_julian_day(datetime(2030, 7, 15, 9, 30)), position=position)
+    assert jd_ut is not None
+    assert len(calls) <= 5
+    assert abs(angle_diff(calc_position(jd_ut, swe.SUN)[0], natal_lon)) < 1e-6
+
+
+def test_v1_keeps_hourly_grid_result():
+    natal_dt = datetime(1985, 3, 21, 16, 45)
+    v1 = solar_return_datetime(natal_dt, 2020, tz_offset_minutes=-180, engine="v1")
+    v2 = solar_return_datetime(natal_dt, 2020, tz_offset_minutes=-180, engine="v2")
+    assert (v1.minute, v1.second, v1.microsecond) == (natal_dt.minute, 0, 0)
+    assert abs((v1 - v2).total_seconds()) <= 1800
+
+
+def test_batch_matches_single_year_solver():
+    natal_dt = datetime(1960, 2, 29, 3, 0)
+    returns = solar_returns_batch(natal_dt, 1961, 2040, tz_offset_minutes=-180)
+    assert [year for year, _ in returns] == list(range(1961, 2041))
+    for year, sr_utc in returns[::13]:
+        assert sr_utc == solar_return_datetime(natal_dt, year, tz_offset_minutes=-180, engine="v2")
+
+
+def test_solar_returns_endpoint():
+    client = TestClient(main.app)
+    headers = {"Authorization": "Bearer test-key", "X-User-Id": "u1"}
+    base = {"year": 1990, "month": 7, "day": 14, "hour": 9, "lat": -23.55, "lng": -46.63, "tz_offset_minutes": -180}
+
+    resp = client.post("/v1/astro/solar-returns", json={**base, "start_year": 2000, "end_year": 2079}, headers=headers)
+    assert resp.status_code == 200
+    items = resp.json()["data"]["items"]
+    assert len(items) == 80
+    first = datetime.fromisoformat(items[0]["solar_return_datetime_utc"])
+    local = datetime.fromisoformat(items[0]["solar_return_datetime_local"])
+    assert local - first == timedelta(minutes=-180)
+
+    resp = client.post("/v1/astro/solar-returns", json={**base, "start_year": 2010, "end_year": 2000}, headers=headers)
+    assert resp.status_code == 422
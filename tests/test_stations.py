@@ -0,0 +1,81 @@
+from datetime import datetime
+
+import pytest
+import swisseph as swe
+from fastapi.testclient import TestClient
+
+import main
+from astro.ephemeris_tables import calc_position
+from astro.stations import StationIndex, compute_retrograde_periods, find_stations
+from astro.utils import from_julian_day, to_julian_day
+
+
+@pytest.fixture(autouse=True)
+def _set_env(monkeypatch):
+    monkeypatch.setenv("API_KEY", "test-key")
+    monkeypatch.setenv("OPENAI_API_KEY", "dummy")
+    yield
+
+
+def _minutes(a: datetime, b: datetime) -> float:
+    return abs((a - b).total_seconds()) / 60.0
+
+
+def test_mercury_april_2024_stations_and_shadow():
+    jd_start = to_julian_day(datetime(2024, 3, 1))
+    jd_end = to_julian_day(datetime(2024, 4, 15))
+    (period,) = compute_retrograde_periods(swe.MERCURY, jd_start, jd_end)
+
+    assert _minutes(from_julian_day(period.station_retrograde), datetime(2024, 4, 1, 22, 14)) < 5
+    assert _minutes(from_julian_day(period.station_direct), datetime(2024, 4, 25, 12, 54)) < 5
+    assert from_julian_day(period.shadow_start).date().isoformat() in {"2024-03-18", "2024-03-19"}
+    assert from_julian_day(period.shadow_end).date().isoformat() == "2024-05-13"
+
+    # a sombra começa quando Mercúrio passa pelo grau da estação direta
+    lon_at_start = calc_position(period.shadow_start, swe.MERCURY)[0]
+    assert abs(lon_at_start - period.lon_direct) < 1e-4
+    for jd, _ in find_stations(swe.MERCURY, jd_start, jd_end + 30):
+        assert abs(calc_position(jd, swe.MERCURY)[1]) < 1e-3
+
+
+def test_station_index_queries_and_roundtrip(tmp_path):
+    index = StationIndex().build(2023, 2025)
+    jd_mid = to_julian_day(datetime(2024, 4, 10))
+
+    period = index.period_at(swe.MERCURY, jd_mid)
+    assert period is not None and period.is_retrograde(jd_mid)
+    assert index.period_at(swe.MERCURY, to_julian_day(datetime(2024, 6, 1))) is None
+    assert index.shadow_at(swe.MERCURY, to_julian_day(datetime(2024, 5, 5))) == period
+    assert index.next_period(swe.MERCURY, period.station_direct).station_retrograde > period.station_direct
+
+    loaded = StationIndex.load(index.save(str(tmp_path / "stations.npz")))
+    jd_start = to_julian_day(datetime(2023, 1, 1))
+    jd_end = to_julian_day(datetime(2025, 12, 31))
+    for body_id in (swe.MERCURY, swe.MARS, swe.SATURN):
+        assert loaded.periods_between(body_id, jd_start, jd_end) == index.periods_between(body_id, jd_start, jd_end)
+
+
+def test_mercury_retrograde_insight_reports_station_dates():
+    client = TestClient(main.app)
+    resp = client.post(
+        "/v1/insights/mercury-retrograde",
+        json={"target_date": "2024-04-10", "lat": -23.55, "lng": -46.63, "timezone": "America/Sao_Paulo"},
+        headers={"Authorization": "Bearer test-key", "X-User-Id": "u1"},
+    )
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["retrograde"] is True
+    assert body["speed"] < 0
+    assert body["in_shadow"] is True
+    assert body["start_date"] == "2024-04-01"
+    assert body["end_date"] == "2024-04-25"
+    assert body["shadow_end"] == "2024-05-13"
+
+
+def test_retrogrades_endpoint_lists_mercury_with_shadow():
+    client = TestClient(main.app)
+    resp = client.get("/v1/alerts/retrogrades", params={"date": "2024-04-10", "timezone": "Etc/UTC"})
+    assert resp.status_code == 200
+    mercury = next(item for item in resp.json()["retrogrades"] if item["planet"] == "mercury")
+    assert mercury["start_date"] == "2024-04-01"
+    assert mercury["shadow_end"] == "2024-05-13"
@@ -0,0 +1,117 @@
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+
+
+@pytest.fixture(autouse=True)
+def _set_env(monkeypatch):
+    monkeypatch.setenv("API_KEY", "test-key")
+    monkeypatch.setenv("OPENAI_API_KEY", "dummy")
+    yield
+
+
+def _auth_headers(accept=None):
+    headers = {"Authorization": "Bearer test-key", "X-User-Id": "u1"}
+    if accept:
+        headers["Accept"] = accept
+    return headers
+
+
+def _ndjson(resp):
+    return [json.loads(line) for line in resp.text.splitlines() if line.strip()]
+
+
+def _natal_payload(**extra):
+    payload = {
+        "natal_year": 1995,
+        "natal_month": 11,
+        "natal_day": 7,
+        "natal_hour": 22,
+        "natal_minute": 56,
+        "natal_second": 0,
+        "lat": -23.5505,
+        "lng": -46.6333,
+        "timezone": "America/Sao_Paulo",
+        "target_date": "2026-01-01",
+    }
+    payload.update(extra)
+    return payload
+
+
+def test_cosmic_weather_range_streams_ndjson_for_a_full_year():
+    client = TestClient(main.app)
+    resp = client.get(
+        "/v1/cosmic-weather/range",
+        params={"from": "2024-01-01", "to": "2024-12-31", "timezone": "Etc/UTC"},
+        headers=_auth_headers("application/x-ndjson"),
+    )
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    records = _ndjson(resp)
+
+    assert records[0]["event"] == "meta"
+    items = [r["data"] for r in records if r["event"] == "item"]
+    assert len(items) == 366
+    assert items[0]["date"] == "2024-01-01" and items[-1]["date"] == "2024-12-31"
+    assert records[-1] == {"event": "end", "data": {"count": 366}}
+
+
+def test_streaming_year_is_premium_only(monkeypatch):
+    monkeypatch.setenv("DEV_AUTO_PREMIUM", "false")
+    monkeypatch.setenv("FREE_USER_IDS", "u1")
+    client = TestClient(main.app)
+    resp = client.get(
+        "/v1/cosmic-weather/range",
+        params={"from": "2024-01-01", "to": "2024-12-31", "timezone": "Etc/UTC"},
+        headers=_auth_headers("application/x-ndjson"),
+    )
+    assert resp.status_code == 422
+    assert resp.json()["detail"] == "Range too large. Max 90 days. Use smaller windows."
+
+
+def test_moon_timeline_streams_server_sent_events():
+    client = TestClient(main.app)
+    resp = client.get(
+        "/v1/moon/timeline",
+        params={"from": "2024-01-01", "to": "2024-01-03", "timezone": "Etc/UTC"},
+        headers=_auth_headers("text/event-stream"),
+    )
+    assert resp.status_code == 200
+    blocks = [block for block in resp.text.split("\n\n") if block.strip()]
+    events = [block.splitlines()[0] for block in blocks]
+    assert events == ["event: meta", "event: item", "event: item", "event: item", "event: end"]
+    assert json.loads(blocks[1].splitlines()[1][len("data: "):])["date"] == "2024-01-01"
+
+
+def test_transit_events_stream_matches_buffered_response():
+    client = TestClient(main.app)
+    payload = _natal_payload(range={"from": "2026-01-01", "to": "2026-03-15"})
+    buffered = client.post("/v1/transits/events", json=payload, headers=_auth_headers()).json()
+    streamed = client.post("/v1/transits/events", json=payload, headers=_auth_headers("application/x-ndjson"))
+
+    assert streamed.status_code == 200
+    records = _ndjson(streamed)
+    items = [r["data"] for r in records if r["event"] == "item"]
+    key = lambda e: (e["transitando"], e["alvo"], e["aspecto"], e["date_range"]["peak_utc"])
+    assert sorted(map(key, items)) == sorted(map(key, buffered["events"]))
+    assert records[0]["data"]["perfil"] == buffered["metadados"]["perfil"]
+
+
+def test_forecast_streams_days_then_summary():
+    client = TestClient(main.app)
+    payload = _natal_payload(days_ahead=45)
+    assert client.post("/v1/forecast/personal", json=payload, headers=_auth_headers()).status_code == 422
+
+    resp = client.post("/v1/forecast/personal", json=payload, headers=_auth_headers("application/x-ndjson"))
+    assert resp.status_code == 200
+    records = _ndjson(resp)
+    assert [r["event"] for r in records] == ["item"] * 45 + ["summary", "end"]
+    assert records[-2]["data"]["weekly_themes"]
+
+    buffered = client.post("/v1/forecast/personal", json=_natal_payload(days_ahead=5), headers=_auth_headers()).json()
+    streamed = _ndjson(client.post("/v1/forecast/personal", json=_natal_payload(days_ahead=5), headers=_auth_headers("application/x-ndjson")))
+    assert [r["data"] for r in streamed if r["event"] == "item"] == buffered["daily_influences"]
+    assert streamed[-2]["data"]["weekly_themes"] == buffered["weekly_themes"]
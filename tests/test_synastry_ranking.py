@@ -0,0 +1,85 @@
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+
+
+@pytest.fixture(autouse=True)
+def _set_env(monkeypatch):
+    monkeypatch.setenv("API_KEY", "test-key")
+    monkeypatch.setenv("OPENAI_API_KEY", "dummy")
+    yield
+
+
+def _auth_headers():
+    return {"Authorization": "Bearer test-key", "X-User-Id": "u1"}
+
+
+PERSON = {
+    "name": "Ana",
+    "birth_date": "1995-11-07",
+    "birth_time": "22:56",
+    "lat": -23.5505,
+    "lng": -46.6333,
+    "timezone": "America/Sao_Paulo",
+}
+
+
+def _partner(idx):
+    return {
+        "id": f"p{idx}",
+        "name": f"Parceiro {idx}",
+        "birth_date": f"{1975 + idx % 30}-{1 + idx % 12:02d}-{1 + (idx * 7) % 28:02d}",
+        "birth_time": f"{(idx * 5) % 24:02d}:{(idx * 13) % 60:02d}",
+        "lat": -22.9068,
+        "lng": -43.1729,
+        "timezone": "America/Sao_Paulo",
+    }
+
+
+def test_ranking_is_sorted_and_matches_pairwise_compare():
+    client = TestClient(main.app)
+    partners = [_partner(i) for i in range(40)]
+    resp = client.post(
+        "/v1/synastry/ranking",
+        json={"person": PERSON, "partners": partners, "limit": 3},
+        headers=_auth_headers(),
+    )
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["total_partners"] == 40
+    ranking = data["ranking"]
+    assert [item["rank"] for item in ranking] == [1, 2, 3]
+    scores = [item["score"] for item in ranking]
+    assert scores == sorted(scores, reverse=True)
+
+    for item in ranking:
+        compare = client.post(
+            "/v1/synastry/compare",
+            json={"person_a": PERSON, "person_b": partners[item["index"]]},
+            headers=_auth_headers(),
+        ).json()
+        assert item["id"] == partners[item["index"]]["id"]
+        assert item["key_aspects"] == compare["key_aspects"]
+        assert item["strengths"] == compare["strengths"]
+        assert min(item["aspect_count"], 20) == len(compare["aspects"])
+
+
+def test_ranking_handles_polar_partner_on_its_own():
+    client = TestClient(main.app)
+    polar = {**_partner(1), "id": "polar", "lat": 69.6492, "lng": 18.9553, "timezone": "Europe/Oslo", "house_system": "K"}
+    resp = client.post(
+        "/v1/synastry/ranking",
+        json={"person": PERSON, "partners": [_partner(0), polar], "limit": 2},
+        headers=_auth_headers(),
+    )
+    assert resp.status_code == 200
+    by_id = {item["id"]: item for item in resp.json()["ranking"]}
+    assert "círculo polar" in by_id["polar"]["warning"]
+    assert by_id["p0"]["warning"] is None
+
+
+def test_ranking_rejects_empty_partner_list():
+    client = TestClient(main.app)
+    resp = client.post("/v1/synastry/ranking", json={"person": PERSON, "partners": []}, headers=_auth_headers())
+    assert resp.status_code == 422
@@ -33,3 +33,41 @@ def test_solar_return_timeline_year_has_items():
     body = resp.json()
     assert "year_timeline" in body
     assert len(body["year_timeline"]) >= 1
+
+
+def test_solar_return_timeline_items_have_exact_peaks_and_orb_windows():
+    from datetime import datetime
+
+    import swisseph as swe
+
+    from astro.crossings import wrap180
+    from astro.ephemeris import compute_chart
+    from astro.ephemeris_tables import calc_position
+    from astro.utils import to_julian_day
+
+    client = TestClient(main.app)
+    payload = {
+        "natal": {
+            "data": "1995-11-07",
+            "hora": "22:56:00",
+            "timezone": "America/Sao_Paulo",
+            "local": {"nome": "São Paulo", "lat": -23.5505, "lon": -46.6333, "alt_m": 760},
+        },
+        "year": 2026,
+        "preferencias": {"perfil": "padrao"},
+    }
+
+    resp = client.post("/v1/solar-return/timeline", json=payload, headers=_auth_headers())
+    assert resp.status_code == 200
+    items = resp.json()["year_timeline"]
+    natal_sun = compute_chart(1995, 11, 7, 22, 56, 0, -23.5505, -46.6333, -120, "P", "tropical", None)["planets"]["Sun"]["lon"]
+
+    squares = [item for item in items if item["trigger"] == "Sol em Quadratura com Sol"]
+    assert len(squares) == 2
+    for item in items:
+        assert item["start"] < item["peak"] < item["end"]
+        assert item["peak"].startswith("2026")
+    for item in squares:
+        peak = datetime.strptime(item["peak_utc"], "%Y-%m-%dT%H:%M:%SZ")
+        sun_lon = calc_position(to_julian_day(peak), swe.SUN)[0]
+        assert abs(abs(wrap180(sun_lon - natal_sun)) - 90.0) < 1e-3
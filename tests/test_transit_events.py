@@ -42,3 +42,48 @@ def test_transit_events_shape_and_score():
         event = body["events"][0]
         assert 0 <= event["impact_score"] <= 100
         assert event["aspecto"] in {"Conjunção", "Oposição", "Quadratura", "Trígono", "Sextil"}
+
+
+def _events_payload(range_from, range_to):
+    return {
+        "natal_year": 1995,
+        "natal_month": 11,
+        "natal_day": 7,
+        "natal_hour": 22,
+        "natal_minute": 56,
+        "natal_second": 0,
+        "lat": -23.5505,
+        "lng": -46.6333,
+        "timezone": "America/Sao_Paulo",
+        "range": {"from": range_from, "to": range_to},
+        "preferencias": {"perfil": "padrao"},
+    }
+
+
+def test_transit_events_report_exact_window_once_per_pass():
+    client = TestClient(main.app)
+    resp = client.post("/v1/transits/events", json=_events_payload("2026-01-01", "2026-03-31"), headers=_auth_headers())
+    assert resp.status_code == 200
+    events = resp.json()["events"]
+    assert events
+
+    keys = set()
+    for event in events:
+        window = event["date_range"]
+        assert window["start_utc"] <= window["peak_utc"] <= window["end_utc"]
+        key = (event["transitando"], event["alvo"], event["aspecto"], window["start_utc"])
+        assert key not in keys
+        keys.add(key)
+
+    assert any(not e["date_range"]["peak_utc"].endswith("T12:00:00Z") for e in events)
+
+    # a Lua completa vários ciclos no intervalo e seus eventos duram menos de um dia
+    moon = [e for e in events if e["transitando"] == "Lua"]
+    assert len(moon) > 50
+    assert any(e["orb_graus"] == 0.0 for e in moon)
+
+
+def test_transit_events_rejects_ranges_longer_than_a_year():
+    client = TestClient(main.app)
+    resp = client.post("/v1/transits/events", json=_events_payload("2026-01-01", "2027-06-01"), headers=_auth_headers())
+    assert resp.status_code == 400